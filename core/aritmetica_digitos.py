@@ -0,0 +1,414 @@
+"""
+Aritmética sobre vectores de dígitos en cualquier base (2-36).
+
+Los números son array('B') de dígitos con el menos significativo primero
+(digitos[i] pesa B^i), sin ceros a la izquierda (el cero es [0]). Las
+operaciones trabajan columna a columna como se hacen a mano, de modo que
+pueden devolver la traza de acarreos / préstamos que muestran los
+ejercicios:
+
+    sumar        acarreo de cada columna                      O(n)
+    restar       préstamo de cada columna (minuendo >= sustraendo)  O(n)
+    multiplicar  escolar por columnas; Karatsuba a partir de
+                 KARATSUBA_UMBRAL dígitos (sin traza)          O(n^1.585)
+    dividir      división larga, dígito a dígito, con traza; sin ella,
+                 divmod sobre int (conversión por divide y vencerás)
+
+Con traza=True la multiplicación es siempre la escolar (productos
+parciales sumados desplazados), que es la que se explica en clase.
+
+Texto ↔ dígitos se traduce con bytes.translate (sin bucles en Python), así
+que los generadores y la web pueden operar con operandos de miles de
+dígitos sin pasar por int() en cada paso.
+
+Ejemplo:
+    r = operar('1011', '111', 2, 'add', traza=True)
+    r.texto()                → '10010'
+    linea_acarreos(r)        → '1111'    (acarreo de salida de cada columna)
+    operar('FF', '10', 16, 'divide').texto(), _.texto_resto()  → 'F', 'F'
+"""
+
+from array import array
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Union
+
+from core.conversion_enteros_grandes import (
+    ALFABETO_MAYUSCULAS,
+    digitos_a_entero,
+    entero_a_digitos,
+    primer_digito_invalido,
+)
+
+# A partir de este número de dígitos (del operando menor) multiplicar usa Karatsuba
+KARATSUBA_UMBRAL = 32
+
+OPERACIONES = ('add', 'subtract', 'multiply', 'divide')
+
+# Carácter ASCII → valor de dígito (255 = no es dígito) y valor → carácter
+_VALORES = bytearray([255]) * 256
+for _valor_digito, _caracter in enumerate(ALFABETO_MAYUSCULAS):
+    _VALORES[ord(_caracter)] = _VALORES[ord(_caracter.lower())] = _valor_digito
+_VALORES = bytes(_VALORES)
+_CARACTERES = ALFABETO_MAYUSCULAS.encode('ascii').ljust(256, b'?')
+
+Digitos = array
+
+
+class ResultadoAritmetico(NamedTuple):
+    """Resultado de una operación: dígitos (y resto en la división), con la traza si se pidió."""
+    base: int
+    digitos: Digitos
+    resto: Optional[Digitos] = None
+    pasos: Optional[List[Dict[str, Any]]] = None
+
+    def texto(self) -> str:
+        return a_texto(self.digitos)
+
+    def texto_resto(self) -> Optional[str]:
+        return a_texto(self.resto) if self.resto is not None else None
+
+
+# ============================================================================
+# CONVERSIÓN
+# ============================================================================
+
+def _validar_base(base: int) -> None:
+    if not (isinstance(base, int) and 2 <= base <= 36):
+        raise ValueError(f"Base debe estar entre 2 y 36, recibido: {base}")
+
+
+def _normalizar(digitos: Sequence[int]) -> Digitos:
+    """array('B') sin ceros a la izquierda (al menos un dígito)."""
+    fin = len(digitos)
+    while fin > 1 and digitos[fin - 1] == 0:
+        fin -= 1
+    return array('B', digitos[:fin] if fin else [0])
+
+
+def desde_texto(texto: str, base: int) -> Digitos:
+    """Cadena de dígitos en la base (mayúsculas o minúsculas) → vector de dígitos."""
+    _validar_base(base)
+    if not texto:
+        raise ValueError("El número no puede estar vacío")
+    invalido = primer_digito_invalido(texto, base)
+    if invalido is not None:
+        raise ValueError(f"Dígito inválido para base {base}: '{invalido}'")
+    valores = texto.encode('ascii').translate(_VALORES)
+    return _normalizar(array('B', valores[::-1]))
+
+
+def desde_entero(numero: int, base: int) -> Digitos:
+    """Entero no negativo → vector de dígitos."""
+    return desde_texto(entero_a_digitos(numero, base), base)
+
+
+def a_texto(digitos: Digitos) -> str:
+    """Vector de dígitos → cadena (letras en mayúsculas)."""
+    return bytes(digitos[::-1]).translate(_CARACTERES).decode('ascii')
+
+
+def _como_digitos(valor: Union[str, int, Sequence[int]], base: int) -> Digitos:
+    if isinstance(valor, str):
+        return desde_texto(valor, base)
+    if isinstance(valor, int):
+        return desde_entero(valor, base)
+    _validar_base(base)
+    if any(not 0 <= d < base for d in valor):
+        raise ValueError(f"Dígitos fuera de la base {base}")
+    return _normalizar(valor)
+
+
+def comparar(a: Sequence[int], b: Sequence[int]) -> int:
+    """-1, 0 o 1 según a <, = o > b (vectores normalizados)."""
+    if len(a) != len(b):
+        return -1 if len(a) < len(b) else 1
+    for i in range(len(a) - 1, -1, -1):
+        if a[i] != b[i]:
+            return -1 if a[i] < b[i] else 1
+    return 0
+
+
+# ============================================================================
+# NÚCLEO (listas de enteros, sin validar)
+# ============================================================================
+
+def _sumar(a: Sequence[int], b: Sequence[int], base: int) -> List[int]:
+    if len(a) < len(b):
+        a, b = b, a
+    resultado = list(a)
+    acarreo = 0
+    for i, d in enumerate(b):
+        s = resultado[i] + d + acarreo
+        if s >= base:
+            resultado[i], acarreo = s - base, 1
+        else:
+            resultado[i], acarreo = s, 0
+    i = len(b)
+    while acarreo:
+        if i == len(resultado):
+            resultado.append(1)
+            break
+        s = resultado[i] + 1
+        if s == base:
+            resultado[i] = 0
+        else:
+            resultado[i], acarreo = s, 0
+        i += 1
+    return resultado
+
+
+def _restar(a: Sequence[int], b: Sequence[int], base: int) -> List[int]:
+    """a - b con a >= b."""
+    resultado = list(a)
+    prestamo = 0
+    for i, d in enumerate(b):
+        s = resultado[i] - d - prestamo
+        if s < 0:
+            resultado[i], prestamo = s + base, 1
+        else:
+            resultado[i], prestamo = s, 0
+    i = len(b)
+    while prestamo:
+        if resultado[i]:
+            resultado[i] -= 1
+            prestamo = 0
+        else:
+            resultado[i] = base - 1
+        i += 1
+    while len(resultado) > 1 and resultado[-1] == 0:
+        resultado.pop()
+    return resultado
+
+
+def _sumar_en(destino: List[int], sumando: Sequence[int], desplazamiento: int, base: int) -> None:
+    """destino += sumando · B^desplazamiento (destino tiene sitio para el acarreo)."""
+    acarreo = 0
+    k = desplazamiento
+    for d in sumando:
+        s = destino[k] + d + acarreo
+        if s >= base:
+            destino[k], acarreo = s - base, 1
+        else:
+            destino[k], acarreo = s, 0
+        k += 1
+    while acarreo:
+        s = destino[k] + 1
+        if s == base:
+            destino[k] = 0
+        else:
+            destino[k], acarreo = s, 0
+        k += 1
+
+
+def _por_digito(a: Sequence[int], d: int, base: int) -> List[int]:
+    resultado = []
+    acarreo = 0
+    for x in a:
+        acarreo, digito = divmod(x * d + acarreo, base)
+        resultado.append(digito)
+    while acarreo:
+        acarreo, digito = divmod(acarreo, base)
+        resultado.append(digito)
+    return resultado
+
+
+def _multiplicar_escolar(a: Sequence[int], b: Sequence[int], base: int) -> List[int]:
+    resultado = [0] * (len(a) + len(b))
+    for j, bj in enumerate(b):
+        if not bj:
+            continue
+        acarreo = 0
+        k = j
+        for ai in a:
+            t = resultado[k] + ai * bj + acarreo
+            acarreo = t // base
+            resultado[k] = t - acarreo * base
+            k += 1
+        while acarreo:
+            t = resultado[k] + acarreo
+            acarreo = t // base
+            resultado[k] = t - acarreo * base
+            k += 1
+    return resultado
+
+
+def _multiplicar(a: Sequence[int], b: Sequence[int], base: int) -> List[int]:
+    """Karatsuba sobre dígitos: 3 productos de la mitad de tamaño en lugar de 4."""
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) < KARATSUBA_UMBRAL:
+        return _multiplicar_escolar(a, b, base)
+
+    resultado = [0] * (len(a) + len(b) + 1)
+    m = len(a) // 2
+    if len(b) <= m:
+        # Operandos desequilibrados: trozos de a del tamaño de b
+        for inicio in range(0, len(a), len(b)):
+            _sumar_en(resultado, _multiplicar(a[inicio:inicio + len(b)], b, base), inicio, base)
+        return resultado[:len(a) + len(b)]
+
+    a0, a1 = a[:m], a[m:]
+    b0, b1 = b[:m], b[m:]
+    z0 = _multiplicar(a0, b0, base)
+    z2 = _multiplicar(a1, b1, base)
+    z1 = _multiplicar(_sumar(a0, a1, base), _sumar(b0, b1, base), base)
+    z1 = _restar(_restar(_normalizado(z1), _normalizado(z0), base), _normalizado(z2), base)
+    _sumar_en(resultado, z0, 0, base)
+    _sumar_en(resultado, z1, m, base)
+    _sumar_en(resultado, z2, 2 * m, base)
+    return resultado[:len(a) + len(b)]
+
+
+def _normalizado(digitos: List[int]) -> List[int]:
+    fin = len(digitos)
+    while fin > 1 and digitos[fin - 1] == 0:
+        fin -= 1
+    return digitos[:fin]
+
+
+# ============================================================================
+# OPERACIONES
+# ============================================================================
+
+def sumar(a, b, base: int, traza: bool = False) -> ResultadoAritmetico:
+    """a + b; con traza, un paso por columna con su acarreo de entrada y de salida."""
+    a, b = _como_digitos(a, base), _como_digitos(b, base)
+    if not traza:
+        return ResultadoAritmetico(base, array('B', _sumar(a, b, base)))
+
+    pasos = []
+    resultado = array('B')
+    acarreo = 0
+    for i in range(max(len(a), len(b))):
+        d1 = a[i] if i < len(a) else 0
+        d2 = b[i] if i < len(b) else 0
+        s = d1 + d2 + acarreo
+        pasos.append({'posicion': i, 'digito1': d1, 'digito2': d2, 'acarreo_entrada': acarreo,
+                      'suma': s, 'digito': s % base, 'acarreo_salida': s // base})
+        resultado.append(s % base)
+        acarreo = s // base
+    if acarreo:
+        resultado.append(acarreo)
+    return ResultadoAritmetico(base, resultado, pasos=pasos)
+
+
+def restar(a, b, base: int, traza: bool = False) -> ResultadoAritmetico:
+    """a - b (a >= b); con traza, un paso por columna con su préstamo de entrada y de salida."""
+    a, b = _como_digitos(a, base), _como_digitos(b, base)
+    if comparar(a, b) < 0:
+        raise ValueError("El minuendo debe ser mayor o igual que el sustraendo")
+    if not traza:
+        return ResultadoAritmetico(base, array('B', _restar(a, b, base)))
+
+    pasos = []
+    resultado = []
+    prestamo = 0
+    for i in range(len(a)):
+        d2 = b[i] if i < len(b) else 0
+        s = a[i] - d2 - prestamo
+        salida = 1 if s < 0 else 0
+        pasos.append({'posicion': i, 'digito1': a[i], 'digito2': d2, 'prestamo_entrada': prestamo,
+                      'digito': s + salida * base, 'prestamo_salida': salida})
+        resultado.append(s + salida * base)
+        prestamo = salida
+    return ResultadoAritmetico(base, _normalizar(resultado), pasos=pasos)
+
+
+def multiplicar(a, b, base: int, traza: bool = False) -> ResultadoAritmetico:
+    """
+    a · b.
+
+    Con traza se usa el método escolar: un paso por dígito del
+    multiplicador con su producto parcial y el acumulado desplazado.
+    """
+    a, b = _como_digitos(a, base), _como_digitos(b, base)
+    if not traza:
+        return ResultadoAritmetico(base, _normalizar(_multiplicar(a, b, base)))
+
+    pasos = []
+    acumulado = [0] * (len(a) + len(b) + 1)
+    for j, bj in enumerate(b):
+        parcial = _por_digito(a, bj, base)
+        _sumar_en(acumulado, parcial, j, base)
+        pasos.append({'posicion': j, 'digito': bj, 'parcial': a_texto(_normalizar(parcial)),
+                      'acumulado': a_texto(_normalizar(acumulado))})
+    return ResultadoAritmetico(base, _normalizar(acumulado), pasos=pasos)
+
+
+def dividir(a, b, base: int, traza: bool = False) -> ResultadoAritmetico:
+    """
+    Cociente y resto de a / b.
+
+    Con traza, división larga: cada dígito del cociente se estima con los
+    dos dígitos altos del divisor y se corrige (a lo sumo un par de veces)
+    comparando vectores, y hay un paso por dígito bajado del dividendo. Es
+    cuadrática en Python, así que sin traza se usa divmod sobre int.
+    """
+    a, b = _como_digitos(a, base), _como_digitos(b, base)
+    if len(b) == 1 and b[0] == 0:
+        raise ValueError("División por cero")
+    if not traza:
+        cociente, resto = divmod(digitos_a_entero(a_texto(a), base), digitos_a_entero(a_texto(b), base))
+        return ResultadoAritmetico(base, desde_entero(cociente, base), desde_entero(resto, base))
+
+    n = len(b)
+    cociente = []
+    pasos = [] if traza else None
+    resto: List[int] = []
+    for posicion in range(len(a) - 1, -1, -1):
+        # Bajar el siguiente dígito del dividendo
+        resto.insert(0, a[posicion])
+        resto = _normalizado(resto)
+        if len(resto) < n or (len(resto) == n and comparar(resto, b) < 0):
+            q, producto = 0, [0]
+        else:
+            if n == 1:
+                q = _valor(resto, base) // b[0]
+            else:
+                alto = _valor(resto[n - 2:], base)
+                q = min(base - 1, alto // (b[-1] * base + b[-2]))
+            producto = _normalizado(_por_digito(b, q, base))
+            while comparar(producto, resto) > 0:
+                q -= 1
+                producto = _normalizado(_por_digito(b, q, base))
+            while comparar(_restar(resto, producto, base), b) >= 0:
+                q += 1
+                producto = _normalizado(_por_digito(b, q, base))
+        if traza:
+            pasos.append({'posicion': len(a) - 1 - posicion, 'parcial': a_texto(array('B', resto)),
+                          'digito': q, 'producto': a_texto(array('B', producto))})
+        resto = _restar(resto, producto, base) if q else resto
+        if traza:
+            pasos[-1]['resto'] = a_texto(array('B', _normalizado(resto)))
+        cociente.append(q)
+    return ResultadoAritmetico(base, _normalizar(cociente[::-1]), _normalizar(resto), pasos)
+
+
+def _valor(digitos: Sequence[int], base: int) -> int:
+    """Valor de unos pocos dígitos (los de la estimación del cociente)."""
+    valor = 0
+    for d in reversed(digitos):
+        valor = valor * base + d
+    return valor
+
+
+def operar(a, b, base: int, operacion: str, traza: bool = False) -> ResultadoAritmetico:
+    """
+    Operación por nombre ('add', 'subtract', 'multiply', 'divide').
+
+    Los operandos pueden ser cadenas en la base, enteros o vectores de dígitos.
+    """
+    funciones = {'add': sumar, 'subtract': restar, 'multiply': multiplicar, 'divide': dividir}
+    if operacion not in funciones:
+        raise ValueError(f"Operación desconocida: {operacion}. Operaciones: {', '.join(OPERACIONES)}")
+    return funciones[operacion](a, b, base, traza)
+
+
+def linea_acarreos(resultado: ResultadoAritmetico) -> Optional[str]:
+    """
+    Acarreos (suma) o préstamos (resta) de salida de cada columna, de la más
+    significativa a la menos, alineados con los operandos; None sin traza.
+    """
+    if not resultado.pasos or 'digito1' not in resultado.pasos[0]:
+        return None
+    clave = 'acarreo_salida' if 'acarreo_salida' in resultado.pasos[0] else 'prestamo_salida'
+    return ''.join(str(paso[clave]) for paso in reversed(resultado.pasos))
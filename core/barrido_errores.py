@@ -0,0 +1,401 @@
+"""
+Barridos de error de representación sobre muchos valores a la vez.
+
+Para cada muestra x: valor cuantizado q(x), error absoluto |q - x|, error
+relativo |q - x| / |x| y si la muestra desborda el formato. Formatos:
+
+    Punto fijo     FixedPointUnified, FixedPointSignedMS/Complement, FixedFormat
+                   (sin signo, M&S, complemento): n = redondeo(x · B^F)
+    Punto flotante FixedPointFloating: x = m · B^e, m ∈ [1, B) con F_M cifras
+    IEEE 754       IEEE754Gen: encode_many + decode_many
+
+Cada muestra float se toma por su representación decimal más corta, como
+FixedFormat.quantize: 2.55 es 255/100 y no el binario más cercano. Sin NumPy
+se cuantiza valor a valor con esa fracción exacta (aritmética entera de
+core.punto_fijo_raw). Con NumPy se redondea sobre arrays float64, y las
+muestras cuyo redondeo en float64 puede diferir del exacto (a unos ulp de
+una frontera de redondeo: entero en los modos dirigidos, semientero en los
+modos al más cercano) se recalculan con la ruta exacta, igual que los
+crudos que ya no son enteros exactos en float64 (|x · B^F| >= 2^53) y, con
+'wrap', los que desbordan; las dos rutas dan el mismo resultado bit a bit.
+En punto fijo y punto flotante las muestras no finitas (inf, nan) se
+rechazan con ValueError en las dos rutas; IEEE 754 las representa.
+
+Desbordamiento (overflow) en punto fijo: 'saturate' (por defecto), 'wrap' o
+'raise', como en FixedFormat. En punto flotante los valores por encima del
+máximo se saturan y los menores que el mínimo positivo se anulan (underflow).
+Las estadísticas de error solo usan las muestras que no desbordan; los
+desbordamientos se cuentan aparte.
+
+Ejemplo:
+    fp = FixedPointUnified(E=4, F=4, signed=True, representation='complement')
+    error_summary(fp, np.random.uniform(-16, 16, 10**6))
+    → {'count': 1000000, 'max_abs_error': 0.03125, 'rms_abs_error': ..., 'overflow': 0, ...}
+    compare_formats({'Q4.4': fp, 'FP': FixedPointFloating(4, 3)}, muestras)
+"""
+
+from fractions import Fraction
+from typing import Dict, Iterable, Mapping, Optional, Sequence, Union
+import math
+
+from core.ieee754 import IEEE754Gen, ROUNDING_MODES
+from core.punto_fijo_raw import OVERFLOW_MODES, FixedFormat, FixedPointOverflowError, round_div
+from core.punto_flotante import FixedPointFloating
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Cota relativa del error de y = x · B^F (o de la mantisa) calculado en float64
+# frente al valor decimal exacto: unos pocos redondeos de 2^-53 cada uno
+_TOLERANCIA_FRONTERA = 2.0 ** -45
+
+# A partir de 2^53 float64 ya no representa todos los enteros
+_ENTERO_EXACTO = 2.0 ** 53
+
+SUMMARY_KEYS = ('count', 'max_abs_error', 'mean_abs_error', 'rms_abs_error',
+                'max_rel_error', 'mean_rel_error', 'rms_rel_error', 'overflow', 'underflow')
+
+
+def _validar_modos(rounding: str, overflow: str) -> None:
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Modo de redondeo desconocido: {rounding}. Modos: {', '.join(ROUNDING_MODES)}")
+    if overflow not in OVERFLOW_MODES:
+        raise ValueError(f"Modo de desbordamiento desconocido: {overflow}. Modos: {', '.join(OVERFLOW_MODES)}")
+
+
+def _raw_format(fmt) -> Optional[FixedFormat]:
+    """FixedFormat del formato de punto fijo (o None si no es de punto fijo)."""
+    if isinstance(fmt, FixedFormat):
+        return fmt
+    return getattr(fmt, 'raw_format', None)
+
+
+# ============================================================================
+# REDONDEO VECTORIZADO
+# ============================================================================
+
+def _round_array(y, rounding: str):
+    """Redondeo a entero de un array float64 en cualquiera de ROUNDING_MODES."""
+    if rounding == 'nearest_even':
+        return np.rint(y)
+    if rounding == 'toward_zero':
+        return np.trunc(y)
+    if rounding == 'toward_positive':
+        return np.ceil(y)
+    if rounding == 'toward_negative':
+        return np.floor(y)
+    # nearest_away: y - trunc(y) es exacto, así que el empate se detecta sin error
+    entero = np.trunc(y)
+    return entero + np.where(np.abs(y - entero) >= 0.5, np.sign(y), 0.0)
+
+
+def _cerca_de_frontera(y, rounding: str):
+    """Máscara de los y (float64) cuyo redondeo puede cambiar con un error de unos ulp."""
+    if rounding in ('nearest_even', 'nearest_away'):
+        distancia = np.abs(np.abs(y - np.floor(y)) - 0.5)  # Empates: semienteros
+    else:
+        distancia = np.abs(y - np.rint(y))  # Modos dirigidos: enteros
+    return distancia <= np.abs(y) * _TOLERANCIA_FRONTERA
+
+
+def _rechazar_no_finitos(x) -> None:
+    no_finitos = ~np.isfinite(x)
+    if no_finitos.any():
+        raise ValueError(f"Valor no finito: {float(x[np.argmax(no_finitos)])}")
+
+
+def _max_exponente_exacto(base: int) -> float:
+    """Mayor k con B^k exacto en float64 (infinito si B es potencia de 2)."""
+    if base & (base - 1) == 0:
+        return math.inf
+    k = 0
+    while base ** (k + 1) < 1 << 53:
+        k += 1
+    return k
+
+
+# ============================================================================
+# CUANTIZACIÓN POR FORMATO (NumPy)
+# ============================================================================
+
+def _fixed_numpy(raw_fmt: FixedFormat, x, rounding: str, overflow: str):
+    _rechazar_no_finitos(x)
+    scale = float(raw_fmt.scale)
+    with np.errstate(over='ignore'):
+        y = x * scale
+    raw = _round_array(y, rounding)
+    dudosos = _cerca_de_frontera(y, rounding) & (x != 0)
+    if overflow != 'wrap':
+        # Fuera de rango el crudo exacto no importa: se satura o se rechaza igual
+        dudosos &= (y > raw_fmt.raw_min - 2) & (y < raw_fmt.raw_max + 2)
+    for i in np.flatnonzero(dudosos):
+        raw[i] = raw_fmt.quantize(float(x[i]), rounding)
+    desborda = (raw < raw_fmt.raw_min) | (raw > raw_fmt.raw_max)
+
+    # Crudos que no son enteros exactos en float64 (o B^F inexacto) y, con
+    # 'wrap', todos los que se pliegan: aritmética entera de FixedFormat
+    if raw_fmt.scale > _ENTERO_EXACTO:
+        exactos = np.ones_like(desborda)
+    else:
+        exactos = np.abs(y) >= _ENTERO_EXACTO
+    if overflow == 'wrap':
+        exactos |= desborda
+    q = raw / scale
+    for i in np.flatnonzero(exactos):
+        crudo = raw_fmt.quantize(float(x[i]), rounding)
+        desborda[i] = not raw_fmt.raw_min <= crudo <= raw_fmt.raw_max
+        if overflow != 'raise':
+            crudo = raw_fmt.fit(crudo, overflow, "Cuantización")
+        q[i] = raw_fmt.to_float(crudo)
+
+    if desborda.any():
+        if overflow == 'raise':
+            indice = int(np.argmax(desborda))
+            low, high = raw_fmt.range
+            raise FixedPointOverflowError(f"Valor {x[indice]} fuera de rango [{low}, {high}]")
+        if overflow == 'saturate':
+            saturado = np.where(raw > raw_fmt.raw_max, raw_fmt.to_float(raw_fmt.raw_max),
+                                raw_fmt.to_float(raw_fmt.raw_min))
+            q = np.where(desborda & ~exactos, saturado, q)
+    return q, desborda, np.zeros_like(desborda)
+
+
+def _floating_numpy(fp: FixedPointFloating, x, rounding: str):
+    _rechazar_no_finitos(x)
+    base = float(fp.base)
+    escala = float(fp.base) ** fp.F_M
+    a = np.abs(x)
+    no_cero = a > 0
+    seguro = np.where(no_cero, a, 1.0)
+
+    # e = floor(log_B |x|), corregido con una comparación exacta de la mantisa.
+    # Si B^e no cabe en float64, |k| supera _max_exponente_exacto y la muestra
+    # se rehace con la ruta exacta
+    with np.errstate(divide='ignore', over='ignore', invalid='ignore'):
+        e = np.floor(np.log(seguro) / math.log(base))
+        potencia = np.power(base, e)
+        e = np.where(seguro / potencia >= base, e + 1, np.where(seguro < potencia, e - 1, e))
+        potencia = np.power(base, e)
+
+        # Mantisa entera n ∈ [B^F_M, B^(F_M+1)); si el redondeo llega a B^(F_M+1), acarreo al exponente
+        m = seguro / potencia * escala
+    n = _round_array(np.copysign(m, x), rounding)
+    # Redondeos dudosos (frontera a unos ulp, o |x| casi B^e): se rehacen con la ruta exacta
+    tolerancia = m * _TOLERANCIA_FRONTERA
+    dudosos = no_cero & (_cerca_de_frontera(m, rounding)
+                         | (np.abs(m - escala) <= tolerancia) | (np.abs(m - base * escala) <= tolerancia))
+    acarreo = np.abs(n) >= base * escala
+    n = np.where(acarreo, n / base, n)
+    e = e + acarreo
+
+    # q = n · B^k con k = e - F_M: un solo redondeo si B^|k| es exacto en float64
+    k = e - fp.F_M
+    dudosos |= no_cero & (np.abs(k) > _max_exponente_exacto(fp.base))
+    with np.errstate(over='ignore'):
+        q = np.where(k >= 0, n * np.power(base, np.abs(k)), n / np.power(base, np.abs(k)))
+    q = np.where(no_cero, q, x)
+
+    desborda = no_cero & (e > fp.E_max)
+    anula = no_cero & (e < fp.E_min) & ~desborda
+    q = np.where(desborda, np.copysign(float(fp.max_value), x), q)
+    if not fp.signed:
+        # Sin signo: los negativos desbordan por debajo y se saturan a 0
+        negativos = x < 0
+        desborda |= negativos
+        anula &= ~negativos
+        q = np.where(negativos, 0.0, q)
+    q = np.where(anula, 0.0, q)
+    for i in np.flatnonzero(dudosos):
+        q[i], desborda[i], anula[i] = _quantize_one(fp, float(x[i]), rounding, 'saturate')
+    return q, desborda, anula
+
+
+def _ieee_numpy(ieee: IEEE754Gen, x, rounding: str):
+    q = np.asarray(ieee.decode_many(ieee.encode_many(x, rounding)), dtype=np.float64)
+    desborda = np.isinf(q) & np.isfinite(x)
+    anula = (q == 0) & (x != 0)
+    return q, desborda, anula
+
+
+# ============================================================================
+# CUANTIZACIÓN POR FORMATO (Python)
+# ============================================================================
+
+def _quantize_one(fmt, x: float, rounding: str, overflow: str):
+    """(q, desborda, anula) de un valor, sin NumPy."""
+    raw_fmt = _raw_format(fmt)
+    if raw_fmt is not None:
+        raw = raw_fmt.quantize(x, rounding)
+        desborda = not raw_fmt.raw_min <= raw <= raw_fmt.raw_max
+        if desborda:
+            raw = raw_fmt.fit(raw, overflow, "Cuantización")
+        return raw_fmt.to_float(raw), desborda, False
+
+    if isinstance(fmt, IEEE754Gen):
+        q = fmt.decode(*fmt.unpack(fmt.encode(x, rounding)))
+        q = math.nan if isinstance(q, str) else q
+        return q, math.isinf(q) and math.isfinite(x), q == 0 and x != 0
+
+    # Punto flotante: |x| = m · B^e con m ∈ [1, B), mantisa redondeada a F_M cifras
+    if not math.isfinite(x):
+        raise ValueError(f"Valor no finito: {x}")
+    if x == 0:
+        return x, False, False
+    a = Fraction(repr(abs(x)))  # Decimal más corto, como FixedFormat.quantize
+    base = Fraction(fmt.base)
+    e = math.floor(math.log(abs(x), fmt.base))
+    while a >= base ** (e + 1):
+        e += 1
+    while a < base ** e:
+        e -= 1
+    escala = fmt.base ** fmt.F_M
+    m = a / base ** e * escala
+    n = abs(round_div(m.numerator if x > 0 else -m.numerator, m.denominator, rounding))
+    if n >= fmt.base * escala:
+        n //= fmt.base
+        e += 1
+    if not fmt.signed and x < 0:
+        return 0.0, True, False
+    if e > fmt.E_max:
+        return math.copysign(float(fmt.max_value), x), True, False
+    if e < fmt.E_min:
+        return 0.0, False, True
+    return math.copysign(float(n * base ** (e - fmt.F_M)), x), False, False
+
+
+# ============================================================================
+# API
+# ============================================================================
+
+def _as_samples(values):
+    if HAS_NUMPY:
+        return np.asarray(values, dtype=np.float64).ravel()
+    return [float(v) for v in values]
+
+
+def _quantize(fmt, x, rounding: str, overflow: str):
+    if HAS_NUMPY:
+        if _raw_format(fmt) is not None:
+            return _fixed_numpy(_raw_format(fmt), x, rounding, overflow)
+        if isinstance(fmt, FixedPointFloating):
+            return _floating_numpy(fmt, x, rounding)
+        if isinstance(fmt, IEEE754Gen):
+            return _ieee_numpy(fmt, x, rounding)
+    elif isinstance(fmt, (FixedPointFloating, IEEE754Gen)) or _raw_format(fmt) is not None:
+        columnas = list(zip(*(_quantize_one(fmt, v, rounding, overflow) for v in x))) or [(), (), ()]
+        return tuple(list(c) for c in columnas)
+    raise TypeError(f"Formato no soportado: {type(fmt).__name__}")
+
+
+def quantize_many(fmt, values: Iterable[float], rounding: str = 'nearest_even',
+                  overflow: str = 'saturate'):
+    """
+    Valores cuantizados al formato.
+
+    Returns:
+        numpy.ndarray float64 (con NumPy) o lista de float
+    """
+    _validar_modos(rounding, overflow)
+    return _quantize(fmt, _as_samples(values), rounding, overflow)[0]
+
+
+def _errores(x, q):
+    if HAS_NUMPY:
+        with np.errstate(over='ignore', invalid='ignore'):  # Como en Python: inf y nan
+            absoluto = np.abs(q - x)
+            relativo = np.divide(absoluto, np.abs(x), out=np.zeros_like(absoluto), where=x != 0)
+        return absoluto, relativo
+    absoluto = [abs(b - a) for a, b in zip(x, q)]
+    return absoluto, [e / abs(a) if a != 0 else 0.0 for a, e in zip(x, absoluto)]
+
+
+def error_many(fmt, values: Iterable[float], rounding: str = 'nearest_even',
+               overflow: str = 'saturate') -> Dict[str, object]:
+    """
+    Errores de representación por muestra.
+
+    Returns:
+        Dict de columnas: 'value', 'quantized', 'abs_error', 'rel_error'
+        (0 para x = 0), 'overflow' y 'underflow' (máscaras booleanas)
+    """
+    _validar_modos(rounding, overflow)
+    x = _as_samples(values)
+    return _error_columns(fmt, x, rounding, overflow)
+
+
+def _error_columns(fmt, x, rounding: str, overflow: str) -> Dict[str, object]:
+    q, desborda, anula = _quantize(fmt, x, rounding, overflow)
+    absoluto, relativo = _errores(x, q)
+    return {'value': x, 'quantized': q, 'abs_error': absoluto, 'rel_error': relativo,
+            'overflow': desborda, 'underflow': anula}
+
+
+def summarize_errors(columns: Dict[str, object]) -> Dict[str, Union[int, float]]:
+    """Estadísticas (claves SUMMARY_KEYS) de las columnas devueltas por error_many."""
+    if HAS_NUMPY:
+        validos = ~columns['overflow']
+        absoluto = columns['abs_error'][validos]
+        relativo = columns['rel_error'][validos]
+        n = int(validos.sum())
+        estadisticas = {
+            'count': n,
+            'max_abs_error': float(absoluto.max()) if n else 0.0,
+            'mean_abs_error': float(absoluto.mean()) if n else 0.0,
+            'rms_abs_error': float(np.sqrt(np.mean(absoluto * absoluto))) if n else 0.0,
+            'max_rel_error': float(relativo.max()) if n else 0.0,
+            'mean_rel_error': float(relativo.mean()) if n else 0.0,
+            'rms_rel_error': float(np.sqrt(np.mean(relativo * relativo))) if n else 0.0,
+            'overflow': int(columns['overflow'].sum()),
+            'underflow': int(np.sum(columns['underflow'])),
+        }
+        return estadisticas
+
+    pares = [(a, r) for a, r, o in zip(columns['abs_error'], columns['rel_error'], columns['overflow']) if not o]
+    n = len(pares)
+    absoluto = [a for a, _ in pares]
+    relativo = [r for _, r in pares]
+    return {
+        'count': n,
+        'max_abs_error': max(absoluto, default=0.0),
+        'mean_abs_error': math.fsum(absoluto) / n if n else 0.0,
+        'rms_abs_error': math.sqrt(math.fsum(a * a for a in absoluto) / n) if n else 0.0,
+        'max_rel_error': max(relativo, default=0.0),
+        'mean_rel_error': math.fsum(relativo) / n if n else 0.0,
+        'rms_rel_error': math.sqrt(math.fsum(r * r for r in relativo) / n) if n else 0.0,
+        'overflow': sum(columns['overflow']),
+        'underflow': sum(columns['underflow']),
+    }
+
+
+def error_summary(fmt, values: Iterable[float], rounding: str = 'nearest_even',
+                  overflow: str = 'saturate') -> Dict[str, Union[int, float]]:
+    """
+    Estadísticas del error (claves SUMMARY_KEYS).
+
+    count y los errores se refieren a las muestras que no desbordan;
+    overflow/underflow cuentan las que sí.
+    """
+    return summarize_errors(error_many(fmt, values, rounding, overflow))
+
+
+def compare_formats(formats: Union[Mapping[str, object], Sequence[object]], values: Iterable[float],
+                    rounding: str = 'nearest_even', overflow: str = 'saturate') -> Dict[str, Dict]:
+    """
+    Estadísticas de error de N formatos sobre la misma muestra en una pasada:
+    la muestra se convierte una sola vez y cada formato la cuantiza entera.
+
+    Args:
+        formats: dict nombre → formato, o lista (nombre = str(formato))
+
+    Returns:
+        Dict nombre → error_summary
+    """
+    _validar_modos(rounding, overflow)
+    if not isinstance(formats, Mapping):
+        formats = {str(fmt): fmt for fmt in formats}
+    x = _as_samples(values)
+    return {nombre: summarize_errors(_error_columns(fmt, x, rounding, overflow)) for nombre, fmt in formats.items()}
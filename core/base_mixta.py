@@ -0,0 +1,243 @@
+"""
+Sistemas posicionales de base mixta (tiempo, fechas, unidades, ...).
+
+Cada posición tiene su propia base; de la más significativa a la menos:
+
+    (None, 60, 60)        horas:minutos:segundos (horas sin límite)
+    (None, 24, 60, 60)    días:horas:minutos:segundos
+    (7, 24)               día de la semana y hora (valores < 168)
+
+El peso de cada posición es el producto de las bases a su derecha
+(segundos 1, minutos 60, horas 3600). La primera base puede ser None
+(posición sin límite); si no, el valor debe ser menor que el producto de
+todas las bases.
+
+Las conversiones por lotes precalculan el texto de cada dígito de cada
+posición (p. ej. '00'..'59'), así que formatear una tabla de valores es una
+cadena de divmod y búsquedas en tablas; con NumPy (opcional) los divmod de
+todo el lote son operaciones vectorizadas.
+
+Ejemplo:
+    tiempo = base_mixta((None, 60, 60))
+    tiempo.a_digitos(3661)              → (1, 1, 1)
+    tiempo.formatear(3661)              → '01:01:01'
+    tiempo.parsear('01:01:01')          → 3661
+    tiempo.formatear_lote(range(3))     → ['00:00:00', '00:00:01', '00:00:02']
+"""
+
+from functools import cached_property, lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Lotes a partir de este tamaño usan NumPy (si está y los valores caben en int64)
+UMBRAL_NUMPY = 256
+_MAX_INT64 = 2 ** 63 - 1
+
+# Entradas máximas de la tabla de textos de las posiciones bajas
+MAX_TABLA_SUFIJOS = 1 << 16
+
+
+class BaseMixta:
+    """
+    Sistema de base mixta con bases de la posición más significativa a la menos.
+
+    Args:
+        bases: base de cada posición (la primera puede ser None: sin límite)
+        separador: separador entre posiciones en el texto
+        anchos: dígitos decimales de cada posición al formatear (por defecto
+            los de base - 1; 2 en la posición sin límite)
+    """
+
+    def __init__(self, bases: Sequence[Optional[int]], separador: str = ':',
+                 anchos: Optional[Sequence[int]] = None):
+        bases = tuple(bases)
+        if not bases:
+            raise ValueError("La base mixta necesita al menos una posición")
+        if any(b is None or b < 2 for b in bases[1:]) or (bases[0] is not None and bases[0] < 2):
+            raise ValueError(f"Las bases deben ser >= 2 (solo la primera puede ser None): {bases}")
+        if anchos is None:
+            anchos = tuple(2 if b is None else len(str(b - 1)) for b in bases)
+        elif len(anchos) != len(bases):
+            raise ValueError(f"Se esperaban {len(bases)} anchos, recibidos {len(anchos)}")
+
+        self.bases = bases
+        self.separador = separador
+        self.anchos = tuple(anchos)
+
+        # Peso de cada posición: producto de las bases a su derecha
+        pesos = [1]
+        for base in reversed(bases[1:]):
+            pesos.append(pesos[-1] * base)
+        self.pesos = tuple(reversed(pesos))
+        self.maximo = None if bases[0] is None else self.pesos[0] * bases[0] - 1
+
+    def __repr__(self) -> str:
+        return f"BaseMixta({self.bases}, separador={self.separador!r})"
+
+    # ------------------------------------------------------------------
+    # Un valor
+    # ------------------------------------------------------------------
+
+    def _validar_valor(self, valor: int) -> None:
+        if valor < 0:
+            raise ValueError(f"El valor debe ser no-negativo, recibido: {valor}")
+        if self.maximo is not None and valor > self.maximo:
+            raise ValueError(f"El valor {valor} no cabe en la base mixta {self.bases} (máximo {self.maximo})")
+
+    def a_digitos(self, valor: int) -> Tuple[int, ...]:
+        """Dígito de cada posición, de la más significativa a la menos."""
+        self._validar_valor(valor)
+        digitos = []
+        for base in reversed(self.bases[1:]):
+            valor, digito = divmod(valor, base)
+            digitos.append(digito)
+        digitos.append(valor)
+        return tuple(reversed(digitos))
+
+    def a_entero(self, digitos: Sequence[int], estricto: bool = True) -> int:
+        """
+        Valor de los dígitos.
+
+        Con estricto=False no se comprueba que cada dígito sea menor que su
+        base (p. ej. '00:75:00' → 4500 segundos).
+        """
+        if len(digitos) != len(self.bases):
+            raise ValueError(f"Se esperaban {len(self.bases)} posiciones, recibidas {len(digitos)}")
+        valor = 0
+        for posicion, (digito, base) in enumerate(zip(digitos, self.bases)):
+            if estricto and (digito < 0 or (base is not None and digito >= base)):
+                raise ValueError(f"Dígito {digito} fuera de la base {base} en la posición {posicion}")
+            valor = valor * base + digito if posicion else digito
+        return valor
+
+    def formatear(self, valor: int) -> str:
+        return self.separador.join(f"{d:0{ancho}d}" for d, ancho in zip(self.a_digitos(valor), self.anchos))
+
+    def parsear(self, texto: str, estricto: bool = True) -> int:
+        partes = texto.split(self.separador)
+        if len(partes) != len(self.bases):
+            formato = self.separador.join('X' * ancho for ancho in self.anchos)
+            raise ValueError(f"Formato debe ser {formato}")
+        return self.a_entero([int(p) for p in partes], estricto)
+
+    # ------------------------------------------------------------------
+    # Lotes
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def _tabla_sufijos(self) -> Tuple[int, int, Tuple[str, ...]]:
+        """
+        (k, módulo, textos): las posiciones k.. juntas en una tabla de textos
+        de valor % módulo ('00:00'..'59:59' en el tiempo), la mayor que quepa
+        en MAX_TABLA_SUFIJOS entradas.
+        """
+        textos, modulo = ('',), 1
+        k = len(self.bases)
+        while k > 0 and self.bases[k - 1] is not None and modulo * self.bases[k - 1] <= MAX_TABLA_SUFIJOS:
+            k -= 1
+            base, ancho = self.bases[k], self.anchos[k]
+            digitos = [f"{d:0{ancho}d}" for d in range(base)]
+            separador = self.separador if modulo > 1 else ''
+            textos = tuple(d + separador + t for d in digitos for t in textos)
+            modulo *= base
+        return k, modulo, textos
+
+    def _validar_lote(self, valores: List[int]) -> None:
+        if valores:
+            self._validar_valor(min(valores))
+            self._validar_valor(max(valores))
+
+    def a_digitos_lote(self, valores: Iterable[int]) -> List[Tuple[int, ...]]:
+        """a_digitos de cada valor; con NumPy, un divmod vectorizado por posición."""
+        valores = list(valores)
+        self._validar_lote(valores)
+        if HAS_NUMPY and len(valores) >= UMBRAL_NUMPY and (valores and max(valores) <= _MAX_INT64):
+            array = np.asarray(valores, dtype=np.int64)
+            columnas = []
+            for base in reversed(self.bases[1:]):
+                array, digito = np.divmod(array, base)
+                columnas.append(digito.tolist())
+            columnas.append(array.tolist())
+        else:
+            columnas = []
+            for base in reversed(self.bases[1:]):
+                columnas.append([v % base for v in valores])
+                valores = [v // base for v in valores]
+            columnas.append(valores)
+        return list(zip(*reversed(columnas)))
+
+    def formatear_lote(self, valores: Iterable[int]) -> List[str]:
+        """
+        formatear de cada valor: las posiciones bajas salen de la tabla de
+        sufijos (un módulo y una búsqueda) y solo las altas se formatean.
+        """
+        valores = list(valores)
+        self._validar_lote(valores)
+        k, modulo, sufijos = self._tabla_sufijos
+        if k == 0:
+            return [sufijos[v] for v in valores]
+        
+        # Posiciones altas (la primera sin límite o tablas demasiado grandes):
+        # se formatea cada valor alto distinto una sola vez
+        prefijos = BaseMixta(self.bases[:k], self.separador, self.anchos[:k])
+        altos = sorted({v // modulo for v in valores})
+        cabeza = dict(zip(altos, prefijos.formatear_lote(altos) if k > 1 else
+                          [f"{a:0{self.anchos[0]}d}" for a in altos]))
+        if k == len(self.bases):
+            return [cabeza[v] for v in valores]
+        separador = self.separador
+        return [cabeza[v // modulo] + separador + sufijos[v % modulo] for v in valores]
+
+    @cached_property
+    def _indice_sufijos(self) -> Dict[str, int]:
+        return {texto: valor for valor, texto in enumerate(self._tabla_sufijos[2])}
+
+    def parsear_lote(self, textos: Iterable[str], estricto: bool = True) -> List[int]:
+        """
+        parsear de cada texto: la parte baja con formato canónico se lee del
+        índice de la tabla de sufijos; lo demás pasa por parsear.
+        """
+        k, modulo, _ = self._tabla_sufijos
+        if k == len(self.bases):
+            return [self.parsear(texto, estricto) for texto in textos]
+        indice = self._indice_sufijos
+        largo = len(next(iter(indice)))
+        corte = largo + len(self.separador) if k else 0
+        prefijos = BaseMixta(self.bases[:k], self.separador, self.anchos[:k]) if k > 1 else None
+
+        altos: Dict[str, int] = {}  # Cada prefijo distinto se lee una vez
+        resultado = []
+        for texto in textos:
+            bajo = indice.get(texto[-largo:]) if k == 0 or texto[-corte:-largo] == self.separador else None
+            if bajo is None or (k == 0 and len(texto) != largo):
+                resultado.append(self.parsear(texto, estricto))
+            elif k == 0:
+                resultado.append(bajo)
+            else:
+                cabeza = texto[:-corte]
+                alto = altos.get(cabeza)
+                if alto is None:
+                    alto = int(cabeza) if prefijos is None else prefijos.parsear(cabeza, estricto)
+                    if estricto and alto < 0:
+                        raise ValueError(f"Dígito {alto} fuera de la base {self.bases[0]} en la posición 0")
+                    altos[cabeza] = alto
+                resultado.append(alto * modulo + bajo)
+        return resultado
+
+
+@lru_cache(maxsize=64)
+def base_mixta(bases: Tuple[Optional[int], ...], separador: str = ':',
+               anchos: Optional[Tuple[int, ...]] = None) -> BaseMixta:
+    """Base mixta compartida (misma instancia, y mismas tablas, para los mismos parámetros)."""
+    return BaseMixta(bases, separador, anchos)
+
+
+# Horas:minutos:segundos, horas sin límite
+TIEMPO = (None, 60, 60)
+# Días:horas:minutos:segundos
+DIAS_TIEMPO = (None, 24, 60, 60)
@@ -23,6 +23,8 @@ Desventaja: Menos eficiente que BCD (usa 7 bits para 10 valores, BCD usa 4)
 
 from typing import List, Tuple, Dict
 
+from core.codigos import CodigoTabla
+
 
 class BiquinaryGen:
     """
@@ -56,6 +58,15 @@ class BiquinaryGen:
         # Máscaras
         self.quinaria_mask = (1 << quinaria_bits) - 1
         self.binaria_mask = (1 << binaria_bits) - 1
+        self._codec = None
+    
+    @property
+    def codec(self) -> CodigoTabla:
+        """Tablas dígito → código y código → dígito (core.codigos), compiladas al primer uso."""
+        if self._codec is None:
+            self._codec = CodigoTabla(f"biquinario{self.total_bits}", self.total_bits,
+                                      [self.encode(d) for d in range(10)])
+        return self._codec
     
     def encode(self, digit: int) -> int:
         """
@@ -89,12 +100,12 @@ class BiquinaryGen:
         return self.decode_table[key]
     
     def encode_number(self, number: str) -> List[int]:
-        """Codificar número (string de dígitos) a biquinario."""
-        return [self.encode(int(d)) for d in number]
+        """Codificar número (string de dígitos) a biquinario, con la tabla compilada."""
+        return self.codec.encode_many(number)
     
     def decode_number(self, codes: List[int]) -> str:
-        """Decodificar lista de códigos biquinarios a número."""
-        return ''.join(str(self.decode(c)) for c in codes)
+        """Decodificar lista (o buffer de bytes) de códigos biquinarios a número."""
+        return self.codec.decode_string(codes)
     
     def __repr__(self) -> str:
         return f"BiquinaryGen(total_bits={self.total_bits}, quinaria={self.quinaria_bits}, binaria={self.binaria_bits})"
@@ -186,14 +197,6 @@ class Biquinary5Bit(BiquinaryGen):
         
         return self.decode_table[key]
     
-    def encode_number(self, number: str) -> List[int]:
-        """Codificar número (string de dígitos) a biquinario 5 bits."""
-        return [self.encode(int(d)) for d in number]
-    
-    def decode_number(self, codes: List[int]) -> str:
-        """Decodificar lista de códigos biquinarios a número."""
-        return ''.join(str(self.decode(c)) for c in codes)
-    
     def __repr__(self) -> str:
         return "Biquinary5Bit(Univac 60/120 style)"
 
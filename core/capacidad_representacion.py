@@ -0,0 +1,246 @@
+"""
+Capacidad, rango, longitud y unicidad de la representación posicional,
+con resultados memorizados (2.1.1.6.1).
+
+Para una base B y una longitud n:
+
+    capacidad(B, n) = B^n          rango(B, n) = [0, B^n - 1]
+    longitud(x, B)  = ⌊log_B(x)⌋ + 1
+
+Las potencias B^0..B^MAX_EXPONENTE_TABLA se calculan una vez por base
+(tabla_potencias) y log2(B) también. longitud(x, B) es exacta: en las bases
+potencia de 2 sale de x.bit_length(); en el resto, la estimación
+(bit_length - 1) / log2(B) se corrige comparando x con las potencias, así
+que el resultado no depende del redondeo de un logaritmo en coma flotante
+(⌊log(1000, 10)⌋ + 1 da 3 porque log(1000, 10) = 2.9999999999999996).
+
+Unicidad: las B^n cadenas de n dígitos representan cada valor de
+[0, B^n - 1] exactamente una vez. Hasta UMBRAL_ENUMERACION cadenas se
+comprueba enumerándolas; por encima, por conteo:
+
+    - hay B^n cadenas y B^n valores en el rango (Σ (B-1)·B^i = B^n - 1)
+    - la división euclídea da los dígitos de cada valor de forma única
+      (inyectividad), comprobado en muestras y en los extremos
+
+así que la aplicación cadena → valor es biyectiva sin recorrer el espacio.
+
+Ejemplo:
+    longitud(255, 2)              → 8
+    longitud(1000, 10)            → 4
+    analisis(1994, 5)['capacidad'] → 3125
+    unicidad_posicional(16, 64)['metodo'] → 'conteo'
+"""
+
+import math
+import random
+from functools import lru_cache
+from itertools import product
+from typing import Dict, Optional, Tuple
+
+from core.numeros_romanos import ROMANO_MAX, indice_romanos, tabla_romanos
+
+# Exponentes guardados en la tabla de potencias de cada base
+MAX_EXPONENTE_TABLA = 128
+
+# Espacios de hasta este número de cadenas se enumeran; los mayores se cuentan
+UMBRAL_ENUMERACION = 1 << 16
+
+# Valores comprobados por división euclídea en la prueba por conteo
+MUESTRAS_UNICIDAD = 16
+
+
+def _validar_base(base: int) -> None:
+    if base < 2:
+        raise ValueError("La base debe ser ≥ 2")
+
+
+@lru_cache(maxsize=None)
+def tabla_potencias(base: int) -> Tuple[int, ...]:
+    """B^0, B^1, ..., B^MAX_EXPONENTE_TABLA (una vez por base)."""
+    _validar_base(base)
+    potencias = [1]
+    for _ in range(MAX_EXPONENTE_TABLA):
+        potencias.append(potencias[-1] * base)
+    return tuple(potencias)
+
+
+@lru_cache(maxsize=None)
+def log2_base(base: int) -> float:
+    """log2(B), para estimar longitudes a partir de bit_length."""
+    _validar_base(base)
+    return math.log2(base)
+
+
+def potencia(base: int, exponente: int) -> int:
+    """B^exponente (de la tabla si el exponente cabe en ella)."""
+    if 0 <= exponente <= MAX_EXPONENTE_TABLA:
+        return tabla_potencias(base)[exponente]
+    return base ** exponente
+
+
+def capacidad(base: int, longitud: int) -> int:
+    """B^n: número de cadenas (y de valores) de n dígitos en base B."""
+    _validar_base(base)
+    return potencia(base, longitud)
+
+
+def rango(base: int, longitud: int) -> Tuple[int, int]:
+    """[0, B^n - 1] como (mínimo, máximo)."""
+    return (0, capacidad(base, longitud) - 1)
+
+
+def longitud(numero: int, base: int) -> int:
+    """
+    Dígitos de numero en base B, ⌊log_B(numero)⌋ + 1, con aritmética entera.
+
+    Raises:
+        ValueError: si numero < 1 o base < 2
+    """
+    if numero < 1:
+        raise ValueError("El número debe ser positivo (≥ 1)")
+    _validar_base(base)
+    bits = numero.bit_length()
+    if base & (base - 1) == 0:
+        k = base.bit_length() - 1  # B = 2^k: k bits por dígito
+        return (bits + k - 1) // k
+    # 2^(bits-1) <= numero: la estimación queda a lo sumo a un paso del exponente exacto
+    e = int((bits - 1) / log2_base(base))
+    if e < MAX_EXPONENTE_TABLA - 1:
+        potencias = tabla_potencias(base)
+        while potencias[e + 1] <= numero:
+            e += 1
+        while e > 0 and potencias[e] > numero:
+            e -= 1
+        return e + 1
+    while potencia(base, e + 1) <= numero:
+        e += 1
+    while e > 0 and potencia(base, e) > numero:
+        e -= 1
+    return e + 1
+
+
+# ============================================================================
+# ANÁLISIS MEMORIZADO
+# ============================================================================
+
+@lru_cache(maxsize=4096)
+def _analisis(numero: int, base: int, longitud_fija: Optional[int]) -> Tuple:
+    longitud_min = longitud(numero, base)
+    n = longitud_min if longitud_fija is None else longitud_fija
+    cap = capacidad(base, n)
+    return (n, longitud_min, cap, 0 <= numero <= cap - 1, f'[0, {cap - 1}]',
+            f'{base}^{n} = {cap}', f'{base}^{n} - 1 = {cap - 1}')
+
+
+def analisis(numero: int, base: int, longitud_fija: Optional[int] = None) -> Dict:
+    """
+    Capacidad, rango y longitud mínima de numero en base B (memorizado:
+    el mismo análisis no vuelve a calcular potencias ni formatear enteros).
+    """
+    n, longitud_min, cap, en_rango, texto_rango, formula_capacidad, formula_maximo = \
+        _analisis(numero, base, longitud_fija)
+    return {
+        'número': numero,
+        'base': base,
+        'longitud_fija': n,
+        'longitud_mínima': longitud_min,
+        'capacidad': cap,
+        'rango': texto_rango,
+        'rango_min': 0,
+        'rango_max': cap - 1,
+        'en_rango': en_rango,
+        'fórmula_capacidad': formula_capacidad,
+        'fórmula_rango_máximo': formula_maximo,
+    }
+
+
+# ============================================================================
+# UNICIDAD
+# ============================================================================
+
+def _digitos(valor: int, base: int, longitud_fija: int) -> Tuple[int, ...]:
+    """Dígitos de valor (de menos a más significativo) por divisiones sucesivas."""
+    digitos = []
+    for _ in range(longitud_fija):
+        valor, digito = divmod(valor, base)
+        digitos.append(digito)
+    if valor:
+        raise ValueError(f"El valor no cabe en {longitud_fija} dígitos de base {base}")
+    return tuple(digitos)
+
+
+def _valor(digitos: Tuple[int, ...], base: int) -> int:
+    valor = 0
+    for d in reversed(digitos):
+        valor = valor * base + d
+    return valor
+
+
+@lru_cache(maxsize=1024)
+def _unicidad(base: int, longitud_fija: int, umbral: int, muestras: int) -> Tuple:
+    cadenas = capacidad(base, longitud_fija)
+    if cadenas <= umbral:
+        # Enumeración: valor de cada cadena (Horner, de más a menos significativo)
+        valores = set()
+        for digitos in product(range(base), repeat=longitud_fija):
+            valor = 0
+            for d in digitos:
+                valor = valor * base + d
+            valores.add(valor)
+        distintos = len(valores)
+        unica = distintos == cadenas and min(valores) == 0 and max(valores) == cadenas - 1
+        return unica, 'enumeracion', cadenas, distintos, 0
+
+    # Conteo: el mayor valor Σ (B-1)·B^i es B^n - 1, luego el rango tiene B^n valores
+    maximo = sum((base - 1) * potencia(base, i) for i in range(longitud_fija))
+    generador = random.Random(base * 1000003 + longitud_fija)
+    comprobados = [0, maximo] + [generador.randrange(cadenas) for _ in range(muestras)]
+    inyectiva = all(_valor(_digitos(v, base, longitud_fija), base) == v for v in comprobados)
+    unica = inyectiva and maximo == cadenas - 1
+    return unica, 'conteo', cadenas, maximo + 1, len(comprobados)
+
+
+def unicidad_posicional(base: int, longitud_fija: int, umbral: int = UMBRAL_ENUMERACION,
+                        muestras: int = MUESTRAS_UNICIDAD) -> Dict:
+    """
+    ¿Cada valor de [0, B^n - 1] tiene una única cadena de n dígitos?
+
+    Returns:
+        {'base', 'longitud', 'unica', 'metodo': 'enumeracion' | 'conteo',
+         'cadenas', 'valores', 'comprobados'}
+    """
+    _validar_base(base)
+    if longitud_fija < 1:
+        raise ValueError("La longitud debe ser ≥ 1")
+    unica, metodo, cadenas, valores, comprobados = _unicidad(base, longitud_fija, umbral, muestras)
+    return {
+        'base': base,
+        'longitud': longitud_fija,
+        'unica': unica,
+        'metodo': metodo,
+        'cadenas': cadenas,
+        'valores': valores,
+        'comprobados': comprobados,
+    }
+
+
+@lru_cache(maxsize=None)
+def _unicidad_romana() -> Tuple[bool, int]:
+    tabla, indice = tabla_romanos(), indice_romanos()
+    return len(indice) == ROMANO_MAX and all(tabla[n] == r for r, n in indice.items()), len(indice)
+
+
+def unicidad_romana() -> Dict:
+    """
+    Unicidad de los romanos canónicos 1..ROMANO_MAX por conteo: la tabla
+    tiene una cadena por número y el índice inverso el mismo número de
+    cadenas distintas, luego la correspondencia es biyectiva.
+    """
+    unica, cadenas = _unicidad_romana()
+    return {'unica': unica, 'metodo': 'conteo', 'cadenas': cadenas, 'valores': ROMANO_MAX}
+
+
+def limpiar_caches() -> None:
+    """Vacía las tablas y resultados memorizados."""
+    for funcion in (tabla_potencias, log2_base, _analisis, _unicidad, _unicidad_romana):
+        funcion.cache_clear()
@@ -15,6 +15,9 @@ Operación opCB(B, cadena) = opCBm1(B, cadena) + 1
 
 from typing import Dict, Tuple, List
 
+from core.palabra import Word
+from core.tablas_representacion import tabla_representacion
+
 
 def opCB_digito(digito: str, base: int) -> str:
     """
@@ -63,26 +66,8 @@ def opCB_palabra(palabra: str, base: int) -> str:
         opCB_palabra('01239', 10) -> '98761'  (99999 - 01239 + 1)
         opCB_palabra('0101', 2)   -> '1011'   (1111 - 0101 + 1)
     """
-    longitud = len(palabra)
-    
-    # Paso 1: flip cada dígito (opCBm1)
-    flipped = ''.join(opCB_digito(d, base) for d in palabra)
-    
-    # Paso 2: sumar 1 al resultado
-    valor = int(flipped, base)
-    valor_cb = valor + 1
-    
-    # Manejar overflow (si la suma causa desbordamiento, truncar)
-    max_val = base ** longitud
-    valor_cb = valor_cb % max_val
-    
-    # Formatear resultado
-    if base == 10:
-        return str(valor_cb).zfill(longitud)
-    elif base == 2:
-        return format(valor_cb, f'0{longitud}b')
-    else:
-        return format(valor_cb, f'0{longitud}x')
+    # flip + 1 = (B^l - 1 - n) + 1 = B^l - n (módulo B^l), sobre el entero
+    return str(Word.parse(palabra, base).complement())
 
 
 def repr_CB(numero: int, base: int, longitud: int) -> str:
@@ -253,28 +238,21 @@ def suma_CB(palabra_a: str, palabra_b: str, base: int) -> dict:
         suma_CB('05', '03', 10)  -> resultado='08', valor_decimal=8
         suma_CB('95', '03', 10)  -> resultado='98', valor_decimal=-2 (pq -5+3=-2)
     """
-    longitud = len(palabra_a)
-    
-    # Convertir a decimal (valores en rango [-B^(l-1), B^(l-1)-1])
-    val_a = CB_a_decimal(palabra_a, base)
-    val_b = CB_a_decimal(palabra_b, base)
-    
-    # Suma normal
-    suma_total = val_a + val_b
-    
-    # Formatear resultado (el modulo B^l se maneja automáticamente en repr_CB)
-    resultado = repr_CB(suma_total, base, longitud)
+    return _suma_CB(Word.parse(palabra_a, base), Word.parse(palabra_b, base))
+
+
+def _suma_CB(a: Word, b: Word) -> dict:
+    """suma_CB sobre palabras enteras: la suma natural módulo B^l."""
+    resultado, _ = a.add(b)
     
-    # Detectar overflow: si suma_total está fuera de rango
-    max_val = base ** longitud
-    rango_min = -(max_val // 2)
-    rango_max = (max_val // 2) - 1
-    llevo = suma_total < rango_min or suma_total > rango_max
+    # Detectar overflow: si la suma de los valores está fuera de [-B^l/2, B^l/2 - 1]
+    suma_total = a.to_cb() + b.to_cb()
+    mitad = a.modulus // 2
     
     return {
-        'resultado': resultado,
-        'llevo': llevo,
-        'valor_decimal': CB_a_decimal(resultado, base)
+        'resultado': str(resultado),
+        'llevo': not -mitad <= suma_total < mitad,
+        'valor_decimal': resultado.to_cb()
     }
 
 
@@ -296,11 +274,8 @@ def resta_CB(palabra_a: str, palabra_b: str, base: int) -> dict:
             'valor_decimal': Valor decimal del resultado
         }
     """
-    # Negar palabra_b
-    palabra_b_negada = opCB_palabra(palabra_b, base)
-    
-    # Sumar A + (-B)
-    return suma_CB(palabra_a, palabra_b_negada, base)
+    # Sumar A + opCB(B)
+    return _suma_CB(Word.parse(palabra_a, base), Word.parse(palabra_b, base).complement())
 
 
 def multiplicacion_CB(palabra_a: str, palabra_b: str, base: int) -> dict:
@@ -325,29 +300,22 @@ def multiplicacion_CB(palabra_a: str, palabra_b: str, base: int) -> dict:
             'valor_exacto': Valor decimal sin truncar
         }
     """
-    longitud = len(palabra_a)
-    
-    # Convertir a decimal
-    val_a = CB_a_decimal(palabra_a, base)
-    val_b = CB_a_decimal(palabra_b, base)
-    
-    # Multiplicar
-    producto = val_a * val_b
+    a = Word.parse(palabra_a, base)
+    b = Word.parse(palabra_b, base)
     
-    # Formato resultado (truncado a l dígitos)
-    resultado = repr_CB(producto, base, longitud)
-    valor_resultado = CB_a_decimal(resultado, base)
+    # Multiplicar los valores y truncar a l dígitos (módulo B^l)
+    producto = a.to_cb() * b.to_cb()
+    resultado = Word.from_cb(producto, base, a.length)
     
     # Detectar overflow
-    max_val = base ** longitud
-    rango_min = -(max_val // 2)
-    rango_max = (max_val // 2) - 1
+    rango_min = -(a.modulus // 2)
+    rango_max = (a.modulus // 2) - 1
     llevo = producto < rango_min or producto > rango_max
     
     return {
-        'resultado': resultado,
+        'resultado': str(resultado),
         'llevo': llevo,
-        'valor_decimal': valor_resultado,
+        'valor_decimal': resultado.to_cb(),
         'valor_exacto': producto
     }
 
@@ -404,40 +372,15 @@ def generar_tabla_CB(base: int, longitud: int) -> str:
     if base == 2 and longitud > 8:
         return f"Tabla muy grande para B={base}, L={longitud}. Use longitud <= 8."
     
-    total_combinaciones = base ** longitud
-    
     lineas = []
     lineas.append(f"Tabla de representacion en CB (base {base}, {longitud} digitos)")
     lineas.append("=" * 80)
     lineas.append(f"{'Decimal':>8} | {'Repr. CB':>15} | Significado")
     lineas.append("-" * 80)
     
-    for i in range(total_combinaciones):
-        # Convertir a representación
-        if base == 10:
-            cb_str = str(i).zfill(longitud)
-        elif base == 2:
-            cb_str = format(i, f'0{longitud}b')
-        else:
-            cb_str = format(i, f'0{longitud}x')
-        
-        # Obtener valor decimal
-        valor = CB_a_decimal(cb_str, base)
-        
-        linea = f"{valor:8d} | {cb_str:>15} | "
-        
-        # Agregar notas especiales
-        max_pos = (base ** (longitud - 1)) - 1
-        min_neg = -(base ** (longitud - 1))
-        
-        if valor == 0:
-            linea += "Cero (unica representacion)"
-        elif valor == max_pos:
-            linea += "Maximo positivo"
-        elif valor == min_neg:
-            linea += "Minimo negativo"
-        
-        lineas.append(linea)
+    # Filas calculadas por código (ver core.tablas_representacion)
+    for fila in tabla_representacion('cb', base, longitud):
+        lineas.append(f"{fila.valor:8d} | {fila.palabra:>15} | {fila.nota}")
     
     lineas.append("=" * 80)
     
@@ -0,0 +1,398 @@
+"""
+Registro de códigos de ancho fijo compilados a tablas de búsqueda.
+
+Cada código (BCD 8421 / 2421 / XS-3, biquinarios de 5, 6 y 7 bits, 2 entre 5,
+Gray y Johnson de cualquier ancho) se describe por la lista valor → código y
+se compila una sola vez en tablas:
+
+    codigos        valor → código entero
+    _valores       código → valor (-1 si el código no es válido)
+    _por_caracter  dígito ('0'-'9', 'A'-'Z') → código
+    _por_palabra   palabra binaria ('0110') → valor
+
+Las operaciones por lotes aceptan cadenas de dígitos, listas de códigos o
+buffers de bytes (un código por byte). Con códigos de hasta 7 bits la
+codificación y la decodificación de cadenas y buffers es un solo
+bytes.translate y el byte 0xFF marca los dígitos / códigos inválidos; con
+NumPy (opcional) la detección de inválidos es una sola indexación.
+
+Gray y Johnson de más de MAX_BITS_TABLA bits no caben en una tabla: se
+resuelven con su fórmula (XOR con desplazamientos / forma 0...01...1).
+
+Ejemplo:
+    xs3 = codigo('xs3')
+    xs3.encode_many('1995')            → [4, 12, 12, 8]
+    xs3.encode_bits('1995')            → '0100 1100 1100 1000'
+    xs3.decode_string(b'\\x04\\x0c')     → '19'
+    xs3.invalid_positions([4, 15, 2])  → [1, 2]
+    codigo('gray12').decode(0b100000000000) → 4095
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Sequence, Union
+import re
+
+from core.conversion_enteros_grandes import ALFABETO_MAYUSCULAS
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+MAX_BITS_TABLA = 16     # Tablas código → valor de hasta 2^16 entradas
+_INVALIDO = 0xFF        # Centinela de bytes.translate (los códigos de <= 7 bits son < 0x80)
+
+Codigos = Union[bytes, bytearray, memoryview, Iterable[int]]
+_BUFFERS = (bytes, bytearray, memoryview)
+
+
+def _secuencia(codigos: Codigos):
+    """Lista / tupla / array tal cual; cualquier otro iterable se materializa."""
+    return codigos if isinstance(codigos, (list, tuple)) or hasattr(codigos, 'dtype') else list(codigos)
+
+
+class CodigoBase:
+    """
+    Interfaz común: encode / decode de un valor y sus versiones por lotes.
+
+    Las subclases definen _codificar(valor) y _decodificar(codigo) (este
+    último devuelve -1 si el código no es válido).
+    """
+
+    def __init__(self, nombre: str, bits: int, capacidad: int, descripcion: str = ''):
+        self.nombre = nombre
+        self.bits = bits
+        self.capacidad = capacidad
+        self.descripcion = descripcion
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self.nombre}', bits={self.bits}, capacidad={self.capacidad})"
+
+    # ------------------------------------------------------------------
+    # Un valor
+    # ------------------------------------------------------------------
+
+    def encode(self, valor: int) -> int:
+        if not 0 <= valor < self.capacidad:
+            raise ValueError(f"Valor {valor} fuera de rango [0, {self.capacidad - 1}] "
+                             f"en código {self.nombre}")
+        return self._codificar(valor)
+
+    def decode(self, codigo: int) -> int:
+        valor = self._decodificar(codigo) if 0 <= codigo < (1 << self.bits) else -1
+        if valor < 0:
+            raise ValueError(f"Código {self.nombre} inválido: {self._texto_codigo(codigo)}")
+        return valor
+
+    def _texto_codigo(self, codigo: int) -> str:
+        return format(codigo, f'0{self.bits}b') if codigo >= 0 else str(codigo)
+
+    def _error_codigo(self, codigo: int, posicion: int) -> ValueError:
+        return ValueError(f"Código {self.nombre} inválido: {self._texto_codigo(codigo)} "
+                          f"(posición {posicion})")
+
+    # ------------------------------------------------------------------
+    # Lotes
+    # ------------------------------------------------------------------
+
+    def _valor_de_caracter(self, caracter: str, posicion: int) -> int:
+        valor = ALFABETO_MAYUSCULAS.find(caracter.upper()) if len(caracter) == 1 else -1
+        if not 0 <= valor < self.capacidad:
+            raise ValueError(f"Dígito '{caracter}' no válido en código {self.nombre} "
+                             f"(posición {posicion})")
+        return valor
+
+    def encode_many(self, valores: Union[str, Iterable[int]]) -> List[int]:
+        """Cadena de dígitos o valores enteros → lista de códigos."""
+        if isinstance(valores, str):
+            return [self._codificar(self._valor_de_caracter(c, i)) for i, c in enumerate(valores)]
+        return [self.encode(v) for v in valores]
+
+    def decode_many(self, codigos: Codigos) -> List[int]:
+        """Códigos (lista o buffer de bytes) → valores; ValueError en el primer inválido."""
+        valores = []
+        for posicion, c in enumerate(codigos):
+            valor = self._decodificar(c) if 0 <= c < (1 << self.bits) else -1
+            if valor < 0:
+                raise self._error_codigo(c, posicion)
+            valores.append(valor)
+        return valores
+
+    def decode_string(self, codigos: Codigos) -> str:
+        """Códigos → cadena de dígitos (códigos de hasta 36 valores)."""
+        self._exigir_digitos()
+        return ''.join(ALFABETO_MAYUSCULAS[v] for v in self.decode_many(codigos))
+
+    def invalid_positions(self, codigos: Codigos) -> List[int]:
+        """Índices de los códigos que no pertenecen al código."""
+        limite = 1 << self.bits
+        return [i for i, c in enumerate(codigos) if not 0 <= c < limite or self._decodificar(c) < 0]
+
+    def encode_bits(self, valores: Union[str, Iterable[int]], separador: str = ' ') -> str:
+        """Cadena de dígitos o valores → palabras binarias separadas."""
+        return separador.join(format(c, f'0{self.bits}b') for c in self.encode_many(valores))
+
+    def decode_bits(self, texto: str) -> List[int]:
+        """Palabras binarias (con o sin separadores) → valores."""
+        bits = re.sub(r'\s+', '', texto)
+        if len(bits) % self.bits or bits.strip('01'):
+            raise ValueError(f"'{texto}' no es una secuencia de palabras de {self.bits} bits")
+        return self.decode_many(int(bits[i:i + self.bits], 2) for i in range(0, len(bits), self.bits))
+
+    def _exigir_digitos(self) -> None:
+        if self.capacidad > len(ALFABETO_MAYUSCULAS):
+            raise ValueError(f"El código {self.nombre} tiene {self.capacidad} valores: "
+                             f"no se puede escribir con un dígito por código")
+
+
+class CodigoTabla(CodigoBase):
+    """Código compilado a tablas valor → código y código → valor."""
+
+    def __init__(self, nombre: str, bits: int, codigos: Sequence[int], descripcion: str = ''):
+        if not 1 <= bits <= MAX_BITS_TABLA:
+            raise ValueError(f"Los códigos con tabla deben tener entre 1 y {MAX_BITS_TABLA} bits. "
+                             f"bits={bits}")
+        codigos = tuple(codigos)
+        limite = 1 << bits
+        if any(not 0 <= c < limite for c in codigos):
+            raise ValueError(f"El código {nombre} tiene palabras de más de {bits} bits")
+        if len(set(codigos)) != len(codigos):
+            raise ValueError(f"El código {nombre} tiene palabras repetidas")
+        super().__init__(nombre, bits, len(codigos), descripcion)
+
+        self.codigos = codigos
+        valores = [-1] * limite
+        for valor, c in enumerate(codigos):
+            valores[c] = valor
+        self._valores = valores
+        self._por_palabra = {format(c, f'0{bits}b'): v for v, c in enumerate(codigos)}
+        self._por_caracter: Dict[str, int] = {}
+        for valor, caracter in enumerate(ALFABETO_MAYUSCULAS[:self.capacidad]):
+            self._por_caracter[caracter] = self._por_caracter[caracter.lower()] = codigos[valor]
+        self._np_valores = None
+
+        # Tablas de bytes.translate: solo si ningún código coincide con el centinela
+        self._tabla_codificar = self._tabla_valores = self._tabla_ascii = None
+        if bits <= 7:
+            self._tabla_codificar = bytes(self._por_caracter.get(chr(b), _INVALIDO) for b in range(256))
+            self._tabla_valores = bytes(valores[b] if b < limite and valores[b] >= 0 else _INVALIDO
+                                        for b in range(256))
+            if self.capacidad <= len(ALFABETO_MAYUSCULAS):
+                self._tabla_ascii = bytes(ord(ALFABETO_MAYUSCULAS[valores[b]])
+                                          if b < limite and valores[b] >= 0 else _INVALIDO
+                                          for b in range(256))
+
+    def _codificar(self, valor: int) -> int:
+        return self.codigos[valor]
+
+    def _decodificar(self, codigo: int) -> int:
+        return self._valores[codigo]
+
+    # ------------------------------------------------------------------
+    # Lotes con tablas
+    # ------------------------------------------------------------------
+
+    def _traducir(self, datos: bytes, tabla: bytes, es_digito: bool) -> bytes:
+        traducido = datos.translate(tabla)
+        posicion = traducido.find(_INVALIDO)
+        if posicion >= 0:
+            if es_digito:
+                self._valor_de_caracter(chr(datos[posicion]), posicion)
+            raise self._error_codigo(datos[posicion], posicion)
+        return traducido
+
+    def encode_bytes(self, digitos: str) -> bytes:
+        """Cadena de dígitos → buffer con un código por byte."""
+        if self._tabla_codificar is not None and digitos.isascii():
+            return self._traducir(digitos.encode('ascii'), self._tabla_codificar, True)
+        if self.bits > 8:
+            raise ValueError(f"El código {self.nombre} tiene {self.bits} bits: no cabe en un byte")
+        return bytes(self.encode_many(digitos))
+
+    def encode_many(self, valores: Union[str, Iterable[int]]) -> List[int]:
+        if isinstance(valores, str):
+            if self._tabla_codificar is not None and valores.isascii():
+                return list(self._traducir(valores.encode('ascii'), self._tabla_codificar, True))
+            por_caracter = self._por_caracter
+            for posicion, caracter in enumerate(valores):
+                if caracter not in por_caracter:
+                    self._valor_de_caracter(caracter, posicion)
+            return [por_caracter[c] for c in valores]
+        codigos, capacidad = self.codigos, self.capacidad
+        return [codigos[v] if 0 <= v < capacidad else self.encode(v) for v in valores]
+
+    def decode_many(self, codigos: Codigos) -> List[int]:
+        if self._tabla_valores is not None and isinstance(codigos, _BUFFERS):
+            return list(self._traducir(bytes(codigos), self._tabla_valores, False))
+        codigos = _secuencia(codigos)
+        valores, limite = self._valores, len(self._valores)
+        resultado = [valores[c] if 0 <= c < limite else -1 for c in codigos]
+        if -1 in resultado:
+            posicion = resultado.index(-1)
+            raise self._error_codigo(codigos[posicion], posicion)
+        return resultado
+
+    def decode_string(self, codigos: Codigos) -> str:
+        if self._tabla_ascii is not None and isinstance(codigos, _BUFFERS):
+            return self._traducir(bytes(codigos), self._tabla_ascii, False).decode('ascii')
+        return super().decode_string(codigos)
+
+    def invalid_positions(self, codigos: Codigos) -> List[int]:
+        if HAS_NUMPY:
+            if isinstance(codigos, _BUFFERS):
+                arr = np.frombuffer(bytes(codigos), dtype=np.uint8).astype(np.int64)
+            else:
+                arr = np.asarray(_secuencia(codigos), dtype=np.int64)
+            if self._np_valores is None:
+                self._np_valores = np.asarray(self._valores, dtype=np.int64)
+            en_rango = (arr >= 0) & (arr < len(self._valores))
+            invalido = np.ones(arr.shape, dtype=bool)
+            invalido[en_rango] = self._np_valores[arr[en_rango]] < 0
+            return np.flatnonzero(invalido).tolist()
+        if self._tabla_valores is not None and isinstance(codigos, _BUFFERS):
+            traducido = bytes(codigos).translate(self._tabla_valores)
+            return [i for i, v in enumerate(traducido) if v == _INVALIDO]
+        return super().invalid_positions(codigos)
+
+    def decode_bits(self, texto: str) -> List[int]:
+        palabras = texto.split()
+        if all(len(p) == self.bits for p in palabras):
+            # Palabras ya separadas: búsqueda directa por palabra
+            try:
+                return [self._por_palabra[p] for p in palabras]
+            except KeyError:
+                pass
+        return super().decode_bits(texto)
+
+
+class CodigoFormula(CodigoBase):
+    """Código sin tabla: codificación y decodificación por fórmula (anchos grandes)."""
+
+    def __init__(self, nombre: str, bits: int, capacidad: int,
+                 codificar: Callable[[int], int], decodificar: Callable[[int], int],
+                 descripcion: str = ''):
+        super().__init__(nombre, bits, capacidad, descripcion)
+        self._codificar = codificar
+        self._decodificar = decodificar
+
+
+# ============================================================================
+# CÓDIGOS PARAMÉTRICOS: GRAY Y JOHNSON
+# ============================================================================
+
+def _gray_decodificar(ancho: int) -> Callable[[int], int]:
+    def decodificar(g: int) -> int:
+        # XOR de todos los desplazamientos (prefijo) en log2(ancho) pasos
+        n, desplazamiento = g, 1
+        while desplazamiento < ancho:
+            n ^= n >> desplazamiento
+            desplazamiento <<= 1
+        return n
+    return decodificar
+
+
+def _johnson_codificar(ancho: int) -> Callable[[int], int]:
+    mascara = (1 << ancho) - 1
+
+    def codificar(valor: int) -> int:
+        # 0..ancho: se llenan unos por la derecha; ancho+1..2·ancho-1: se vacían
+        if valor <= ancho:
+            return (1 << valor) - 1
+        return mascara ^ ((1 << (valor - ancho)) - 1)
+    return codificar
+
+
+def _johnson_decodificar(ancho: int) -> Callable[[int], int]:
+    mascara = (1 << ancho) - 1
+
+    def decodificar(c: int) -> int:
+        if c & (c + 1) == 0:            # 0...01...1
+            return c.bit_length()
+        resto = mascara ^ c             # 1...10...0 → su complemento es 0...01...1
+        if resto & (resto + 1) == 0:
+            return ancho + resto.bit_length()
+        return -1
+    return decodificar
+
+
+@lru_cache(maxsize=64)
+def gray(ancho: int) -> CodigoBase:
+    """Gray reflejado de ancho bits: g = n XOR (n >> 1)."""
+    if ancho < 1:
+        raise ValueError(f"El ancho debe ser positivo. ancho={ancho}")
+    nombre, descripcion = f'gray{ancho}', f'Gray reflejado de {ancho} bits'
+    if ancho <= MAX_BITS_TABLA:
+        return CodigoTabla(nombre, ancho, [n ^ (n >> 1) for n in range(1 << ancho)], descripcion)
+    return CodigoFormula(nombre, ancho, 1 << ancho, lambda n: n ^ (n >> 1),
+                         _gray_decodificar(ancho), descripcion)
+
+
+@lru_cache(maxsize=64)
+def johnson(ancho: int) -> CodigoBase:
+    """Johnson (contador en anillo torcido) de ancho bits: 2·ancho estados."""
+    if ancho < 1:
+        raise ValueError(f"El ancho debe ser positivo. ancho={ancho}")
+    nombre, descripcion = f'johnson{ancho}', f'Johnson de {ancho} bits ({2 * ancho} estados)'
+    codificar = _johnson_codificar(ancho)
+    if ancho <= MAX_BITS_TABLA:
+        return CodigoTabla(nombre, ancho, [codificar(v) for v in range(2 * ancho)], descripcion)
+    return CodigoFormula(nombre, ancho, 2 * ancho, codificar, _johnson_decodificar(ancho), descripcion)
+
+
+# ============================================================================
+# REGISTRO
+# ============================================================================
+
+def _biquinario(clase_nombre: str, nombre: str, descripcion: str) -> Callable[[], CodigoTabla]:
+    def construir() -> CodigoTabla:
+        # Import diferido: core.biquinarios usa este registro en encode_number
+        from core import biquinarios
+        generador = getattr(biquinarios, clase_nombre)()
+        return CodigoTabla(nombre, generador.total_bits,
+                           [generador.encode(d) for d in range(10)], descripcion)
+    return construir
+
+
+def _dos_entre_cinco() -> CodigoTabla:
+    from core.sistemas_numeracion_basicos import CODIGO_BIQUINARIO
+    return CodigoTabla('2entre5', 5, [int(CODIGO_BIQUINARIO[d], 2) for d in range(10)],
+                       '2 entre 5 (exactamente dos unos)')
+
+
+_REGISTRO: Dict[str, Callable[[], CodigoBase]] = {
+    'bcd8421': lambda: CodigoTabla('bcd8421', 4, range(10), 'BCD natural (pesos 8-4-2-1)'),
+    'bcd2421': lambda: CodigoTabla('bcd2421', 4, [0, 1, 2, 3, 4, 11, 12, 13, 14, 15],
+                                   'BCD Aiken (pesos 2-4-2-1)'),
+    'xs3': lambda: CodigoTabla('xs3', 4, [d + 3 for d in range(10)], 'BCD exceso a 3'),
+    'biquinario5': _biquinario('Biquinary5Bit', 'biquinario5', 'Biquinario de 5 bits (Univac 60/120)'),
+    'biquinario6': _biquinario('Biquinary6Bit', 'biquinario6', 'Biquinario de 6 bits (IBM 1401)'),
+    'biquinario7': _biquinario('Biquinary7Bit', 'biquinario7', 'Biquinario de 7 bits (IBM 650)'),
+    '2entre5': _dos_entre_cinco,
+}
+
+_PARAMETRICOS = {'gray': gray, 'johnson': johnson}
+
+
+def registrar_codigo(nombre: str, bits: int, codigos: Sequence[int], descripcion: str = '') -> None:
+    """Añade un código de tabla al registro (valor v → codigos[v])."""
+    if nombre in _REGISTRO:
+        raise ValueError(f"El código {nombre} ya está registrado")
+    codigos = tuple(codigos)
+    _REGISTRO[nombre] = lambda: CodigoTabla(nombre, bits, codigos, descripcion)
+
+
+def codigos_registrados() -> List[str]:
+    """Nombres del registro (Gray y Johnson admiten cualquier ancho: 'gray<n>', 'johnson<n>')."""
+    return list(_REGISTRO) + [f'{familia}<n>' for familia in _PARAMETRICOS]
+
+
+@lru_cache(maxsize=128)
+def codigo(nombre: str) -> CodigoBase:
+    """Código compilado por nombre: 'bcd8421', 'xs3', 'biquinario7', 'gray12', 'johnson5'..."""
+    if nombre in _REGISTRO:
+        return _REGISTRO[nombre]()
+    coincidencia = re.fullmatch(r'([a-z]+)(\d+)', nombre)
+    if coincidencia and coincidencia.group(1) in _PARAMETRICOS:
+        return _PARAMETRICOS[coincidencia.group(1)](int(coincidencia.group(2)))
+    raise ValueError(f"Código desconocido: {nombre}. Códigos: {', '.join(codigos_registrados())}")
@@ -17,9 +17,12 @@ Ambos métodos respetan la regla: B'^F' >= B^F
 """
 
 from decimal import Decimal, getcontext
-from typing import Tuple, List, Dict
+from fractions import Fraction
+from typing import Tuple, List, Dict, Union
 import math
 
+from core.fracciones_periodicas import digitos_fraccion, pasos_fraccion
+
 getcontext().prec = 100
 
 
@@ -78,11 +81,12 @@ def convert_integer_part(
 
 
 def convert_fractional_part(
-    fraction: Decimal,
+    fraction: Union[Decimal, Fraction],
     from_base: int,
     to_base: int,
-    num_digits: int
-) -> Tuple[List[int], List[Decimal], List[Decimal]]:
+    num_digits: int,
+    with_steps: bool = True
+) -> Tuple[List[int], List[Decimal], List[Dict]]:
     """
     Convertir la parte fraccionaria usando multiplicaciones sucesivas.
     
@@ -91,15 +95,22 @@ def convert_fractional_part(
             fracción = fracción × to_base
             dígito = floor(fracción)
             fracción = fracción - floor(fracción)
+    
+    Los dígitos salen de la división larga entera (core.fracciones_periodicas):
+    se calculan a lo sumo num_digits, y si el periodo es más corto se repite
+    sin volver a dividir; un periodo más largo que num_digits no se recorre.
+    Los pasos son multiplicaciones de Fraction exactas, también acotadas por
+    num_digits. Las fracciones se devuelven como Decimal si la entrada es Decimal.
             
     Args:
-        fraction: Parte fraccionaria como Decimal en (0,1)
+        fraction: Parte fraccionaria como Decimal o Fraction en [0,1)
         from_base: Base origen
         to_base: Base destino
         num_digits: Número máximo de dígitos a generar
+        with_steps: Si False no se construyen fracciones ni pasos (listas vacías)
         
     Returns:
-        (dígitos, fracciones_parciales, información_transportada)
+        (dígitos, fracciones_parciales, pasos)
     
     Ejemplo:
         convert_fractional_part(0.625, 10, 2, 8)
@@ -110,39 +121,25 @@ def convert_fractional_part(
         Resultado: [1,0,1] → .101₂ exacto
     """
     if fraction == 0:
-        return [0] * num_digits, [fraction] * num_digits, []
+        return [0] * num_digits, ([fraction] * num_digits if with_steps else []), []
     
-    digits = []
-    fractions = [fraction]
-    steps = []
+    digits = digitos_fraccion(fraction, to_base, num_digits)
+    if not with_steps:
+        return digits, [], []
     
-    current = fraction
-    
-    for i in range(num_digits):
-        if current == 0:
-            # Fracción terminante
-            digits.extend([0] * (num_digits - len(digits)))
-            break
-        
-        # Multiplicar por base destino
-        product = current * Decimal(to_base)
-        digit = int(product)
-        remainder = product - Decimal(digit)
-        
-        digits.append(digit)
-        steps.append({
-            'iteration': i + 1,
-            'fraction': current,
-            'product': product,
-            'digit': digit,
-            'remainder': remainder
-        })
-        fractions.append(remainder)
-        current = remainder
+    steps = list(pasos_fraccion(fraction, to_base, num_digits))
+    if isinstance(fraction, Decimal):
+        steps = [{key: _to_decimal(value) if isinstance(value, Fraction) else value
+                  for key, value in step.items()} for step in steps]
     
+    fractions = [fraction] + [step['remainder'] for step in steps]
     return digits, fractions, steps
 
 
+def _to_decimal(value: Fraction) -> Decimal:
+    return Decimal(value.numerator) / Decimal(value.denominator)
+
+
 def decomposition_conversion(
     E: int,
     F: int,
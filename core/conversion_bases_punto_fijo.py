@@ -24,9 +24,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.punto_fijo import FixedPoint
+from core.fracciones_periodicas import expansion_periodica, longitud_anteperiodo
 
 getcontext().prec = 100
 
+# Cota de anteperiodo + periodo para anotar la expansión exacta en la base
+# destino: el periodo puede tener del orden del denominador en dígitos
+MAX_DIGITOS_EXPANSION = 4096
+
 
 class BaseConversionError(Exception):
     """Error en conversión entre bases."""
@@ -93,7 +98,8 @@ def convert_fixed_point_base(
         F_prime: Bits fraccionarios destino (si None, se calcula automáticamente)
     
     Returns:
-        Tupla (nuevo_FixedPoint, información_conversión)
+        Tupla (nuevo_FixedPoint, información_conversión); 'exact_expansion'
+        es None si B' > 36 o la expansión supera MAX_DIGITOS_EXPANSION
     
     Raises:
         BaseConversionError: Si la conversión no es posible
@@ -113,14 +119,25 @@ def convert_fixed_point_base(
     # Obtener el valor exacto (en decimal de alta precisión)
     value = fp.value
     
-    # Crear nuevo FixedPoint en formato destino
+    # Crear nuevo FixedPoint en formato destino (desde el valor exacto, sin pasar por float)
     try:
-        fp_prime = FixedPoint(E_prime, F_prime, B_prime, value=float(value))
+        fp_prime = FixedPoint(E_prime, F_prime, B_prime, value=value)
     except OverflowError as e:
         raise BaseConversionError(
             f"El valor {value} no cabe en Q({E_prime},{F_prime})_{B_prime}: {e}"
         )
     
+    # Periódica si el denominador tiene primos que no dividen a B' (μ y q2
+    # salen del mcd, sin recorrer el periodo); el texto solo si es corto
+    exact_value = fp.to_fraction()
+    mu, q2 = longitud_anteperiodo(exact_value.denominator, B_prime)
+    expansion = None
+    if B_prime <= 36:
+        try:
+            expansion = str(expansion_periodica(exact_value, B_prime, max_digitos=MAX_DIGITOS_EXPANSION))
+        except ValueError:
+            pass
+    
     # Información de la conversión
     info = {
         'source_format': f"Q({fp.E},{fp.F})_{{{fp.B}}}",
@@ -131,6 +148,9 @@ def convert_fixed_point_base(
         'source_raw': fp.raw_value,
         'dest_raw': fp_prime.raw_value,
         'rule_satisfied': f"{B_prime}^{F_prime} = {Decimal(B_prime)**F_prime} >= {Decimal(fp.B)**fp.F} = {fp.B}^{fp.F}",
+        'exact_expansion': expansion,
+        'periodic': q2 > 1,
+        'exact': q2 == 1 and mu <= F_prime,
     }
     
     return fp_prime, info
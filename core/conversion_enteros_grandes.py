@@ -0,0 +1,210 @@
+"""
+Conversión de enteros grandes entre base 10 y cualquier base B (2-36).
+
+Motor compartido por las funciones de conversión de
+sistemas_numeracion_basicos y numeracion_utils cuando los números tienen
+miles de dígitos (ejercicios de estrés, tablas de capacidad y rango).
+
+ALGORITMO (divide y vencerás):
+
+  Árbol de potencias: P_k = B^(HOJA · 2^k)   (P_{k+1} = P_k², cacheado por base)
+
+  Entero → dígitos:
+      n = alto · P_k + bajo        (divmod por la mayor P_k ≤ n)
+      dígitos(n) = dígitos(alto) + dígitos(bajo) rellenado a HOJA·2^k
+
+  Dígitos → entero:
+      "alto|bajo" con len(bajo) = HOJA·2^k
+      valor = valor(alto) · P_k + valor(bajo)
+
+  Las hojas (≤ HOJA dígitos) se resuelven con una tabla de pares de dígitos
+  (dos dígitos por división) o con int() para la lectura. Las bases potencia
+  de 2 usan directamente la conversión lineal de Python (format / int).
+
+Frente a las divisiones sucesivas (un divmod sobre el número completo por
+cada dígito) y a la suma d_i · B^i (una potencia nueva por dígito), el número
+de operaciones sobre enteros grandes pasa de O(n) a O(log n) niveles, y la
+lectura aprovecha la multiplicación Karatsuba de Python.
+
+Ejemplos:
+    entero_a_digitos(1994, 5)            → "30434"
+    entero_a_digitos(255, 16, True)      → "FF"
+    digitos_a_entero("30434", 5)         → 1994
+    primer_digito_invalido("1G", 16)     → "G"
+"""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple
+
+# Número de dígitos de una hoja del árbol (conversión directa sin recursión)
+HOJA = 128
+
+ALFABETO_MINUSCULAS = "0123456789abcdefghijklmnopqrstuvwxyz"
+ALFABETO_MAYUSCULAS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Tabla de consulta carácter → valor (acepta mayúsculas y minúsculas)
+VALOR_DIGITO: Dict[str, int] = {c: i for i, c in enumerate(ALFABETO_MINUSCULAS)}
+VALOR_DIGITO.update({c: i for i, c in enumerate(ALFABETO_MAYUSCULAS)})
+
+# Bases cuya conversión lineal ya ofrece Python
+_FORMATO_POTENCIA_2 = {2: 'b', 8: 'o', 16: 'x'}
+
+
+def _validar_base(base: int) -> None:
+    if not (isinstance(base, int) and 2 <= base <= 36):
+        raise ValueError(f"Base debe estar entre 2 y 36, recibido: {base}")
+
+
+# ============================================================================
+# TABLAS CACHEADAS
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def digitos_validos(base: int) -> FrozenSet[str]:
+    """Conjunto de caracteres válidos en la base (mayúsculas y minúsculas)."""
+    _validar_base(base)
+    return frozenset(ALFABETO_MINUSCULAS[:base] + ALFABETO_MAYUSCULAS[:base])
+
+
+@lru_cache(maxsize=None)
+def _tabla_pares(base: int, mayusculas: bool) -> Tuple[str, ...]:
+    """Tabla de los base² pares de dígitos: índice v → representación de v con 2 dígitos."""
+    alfabeto = ALFABETO_MAYUSCULAS if mayusculas else ALFABETO_MINUSCULAS
+    return tuple(alfabeto[alto] + alfabeto[bajo] for alto in range(base) for bajo in range(base))
+
+
+@lru_cache(maxsize=512)
+def potencia_arbol(base: int, nivel: int) -> int:
+    """P_nivel = base^(HOJA · 2^nivel), calculada por cuadrados sucesivos y cacheada."""
+    if nivel == 0:
+        return base ** HOJA
+    anterior = potencia_arbol(base, nivel - 1)
+    return anterior * anterior
+
+
+def limpiar_cache() -> None:
+    """Libera el árbol de potencias (puede ocupar varios MB tras números enormes)."""
+    potencia_arbol.cache_clear()
+
+
+# ============================================================================
+# VALIDACIÓN
+# ============================================================================
+
+def primer_digito_invalido(numero_str: str, base: int, desde_derecha: bool = False) -> Optional[str]:
+    """
+    Primer carácter de numero_str que no es un dígito de la base, o None.
+
+    La comprobación rápida (inclusión de conjuntos) solo recorre el texto
+    carácter a carácter cuando hay algún dígito inválido.
+    """
+    validos = digitos_validos(base)
+    if validos.issuperset(numero_str):
+        return None
+    recorrido = reversed(numero_str) if desde_derecha else numero_str
+    for caracter in recorrido:
+        if caracter not in validos:
+            return caracter
+    return None
+
+
+# ============================================================================
+# ENTERO → DÍGITOS
+# ============================================================================
+
+def _hoja_a_digitos(n: int, base: int, mayusculas: bool) -> str:
+    """n < base^HOJA (aprox.) → dígitos sin relleno, dos dígitos por división."""
+    if n < base:
+        return (ALFABETO_MAYUSCULAS if mayusculas else ALFABETO_MINUSCULAS)[n]
+    pares = _tabla_pares(base, mayusculas)
+    cuadrado = base * base
+    trozos = []
+    while n:
+        n, resto = divmod(n, cuadrado)
+        trozos.append(pares[resto])
+    return ''.join(reversed(trozos)).lstrip('0')
+
+
+def _digitos_rellenos(n: int, base: int, nivel: int, mayusculas: bool) -> str:
+    """Exactamente HOJA · 2^nivel dígitos (con ceros a la izquierda)."""
+    ancho = HOJA << nivel
+    if n == 0:
+        return '0' * ancho
+    if nivel == 0:
+        return _hoja_a_digitos(n, base, mayusculas).rjust(ancho, '0')
+    alto, bajo = divmod(n, potencia_arbol(base, nivel - 1))
+    return (_digitos_rellenos(alto, base, nivel - 1, mayusculas)
+            + _digitos_rellenos(bajo, base, nivel - 1, mayusculas))
+
+
+def entero_a_digitos(numero: int, base: int, mayusculas: bool = False) -> str:
+    """
+    Representación de un entero no negativo en base B (2-36), sin prefijos.
+
+    Args:
+        numero: Entero >= 0 (cualquier tamaño)
+        base: Base destino (2-36)
+        mayusculas: Letras A-Z en lugar de a-z para bases > 10
+
+    Raises:
+        ValueError: Si la base está fuera de rango o el número es negativo
+    """
+    _validar_base(base)
+    if numero < 0:
+        raise ValueError(f"El número debe ser no-negativo, recibido: {numero}")
+
+    formato = _FORMATO_POTENCIA_2.get(base)
+    if formato is not None:
+        return format(numero, 'X' if mayusculas and base == 16 else formato)
+
+    if numero < potencia_arbol(base, 0):
+        return _hoja_a_digitos(numero, base, mayusculas)
+
+    # Mayor nivel con P_nivel <= numero: el cociente cabe en HOJA·2^nivel dígitos
+    nivel = 0
+    while potencia_arbol(base, nivel + 1) <= numero:
+        nivel += 1
+    alto, bajo = divmod(numero, potencia_arbol(base, nivel))
+    return (entero_a_digitos(alto, base, mayusculas)
+            + _digitos_rellenos(bajo, base, nivel, mayusculas))
+
+
+# ============================================================================
+# DÍGITOS → ENTERO
+# ============================================================================
+
+def _valor_digitos(numero_str: str, base: int) -> int:
+    longitud = len(numero_str)
+    if longitud <= HOJA:
+        return int(numero_str, base)
+    # Mayor nivel con HOJA·2^nivel < longitud: la parte baja usa una potencia del árbol
+    nivel = 0
+    while (HOJA << (nivel + 1)) < longitud:
+        nivel += 1
+    corte = longitud - (HOJA << nivel)
+    alto = _valor_digitos(numero_str[:corte], base)
+    bajo = _valor_digitos(numero_str[corte:], base)
+    return alto * potencia_arbol(base, nivel) + bajo
+
+
+def digitos_a_entero(numero_str: str, base: int) -> int:
+    """
+    Valor de una cadena de dígitos en base B (2-36). Acepta mayúsculas y minúsculas.
+
+    No admite signo, espacios ni separadores: usar primer_digito_invalido()
+    para obtener el carácter culpable y construir el mensaje de error.
+
+    Raises:
+        ValueError: Si la base está fuera de rango, la cadena está vacía o
+            contiene dígitos inválidos
+    """
+    caracter = primer_digito_invalido(numero_str, base)
+    if caracter is not None:
+        raise ValueError(f"Dígito '{caracter}' inválido para base {base}")
+    if not numero_str:
+        raise ValueError("El número no puede estar vacío")
+
+    # Bases potencia de 2: int() es lineal y no tiene límite de dígitos
+    if base & (base - 1) == 0:
+        return int(numero_str, base)
+    return _valor_digitos(numero_str, base)
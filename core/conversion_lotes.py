@@ -0,0 +1,267 @@
+"""
+Conversión por lotes: muchos enteros → sus representaciones en una llamada.
+
+Formatos (clave → representación):
+    'bin'    Binario natural de n bits         [0, 2^n - 1]
+    'oct'    Octal natural (sin relleno)       [0, ∞)
+    'hex'    Hexadecimal natural (sin relleno) [0, ∞)
+    'bcd'    BCD 8421, n/4 dígitos, "0001 0010" [0, 10^(n/4) - 1]
+    'sm'     Signo-magnitud de n bits          [-(2^(n-1) - 1), 2^(n-1) - 1]
+    'c1'     Complemento a 1 de n bits         [-(2^(n-1) - 1), 2^(n-1) - 1]
+    'c2'     Complemento a 2 de n bits         [-2^(n-1), 2^(n-1) - 1]
+    'exceso' Exceso a K de n bits (K = 2^(n-1) por defecto) [-K, 2^n - 1 - K]
+
+Los valores fuera de rango se representan como "NR" (no representable).
+
+Todas las representaciones se reducen a: código entero sin signo + máscara
+de representabilidad + formateo a ancho fijo en base 2^k. Con NumPy, los
+dígitos de todo el lote se extraen a la vez (desplazamientos y máscaras
+sobre una matriz N × ancho) y se traducen a ASCII con una tabla; sin NumPy
+(o con lotes pequeños) se usa format() valor a valor.
+
+Ejemplo:
+    convertir_lote([5, -3, 200], n_bits=8, formatos=('bin', 'c2', 'bcd'))
+    → {'bin': ['00000101', 'NR', '11001000'],
+       'c2':  ['00000101', '11111101', 'NR'],
+       'bcd': ['0000 0101', 'NR', 'NR']}
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from core.conversion_enteros_grandes import entero_a_digitos
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+NR = "NR"
+
+FORMATOS_LOTE = ('bin', 'oct', 'hex', 'bcd', 'sm', 'c1', 'c2', 'exceso')
+
+# Por debajo de este tamaño, crear arrays cuesta más que formatear valor a valor
+UMBRAL_NUMPY = 256
+
+# Los códigos deben caber en int64 sin desbordar al desplazar/sumar K
+_MAX_BITS_NUMPY = 62
+
+_ASCII_DIGITOS = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+# ============================================================================
+# CONVERSIONES DE UN VALOR (referencia y lotes pequeños)
+# ============================================================================
+
+def entero_a_binario(valor: int, n_bits: int) -> str:
+    """Patrón binario de n bits; los negativos se escriben en complemento a 2 (sin comprobar rango)."""
+    return format(valor if valor >= 0 else (1 << n_bits) + valor, f'0{n_bits}b')
+
+
+def entero_a_bcd(valor: int, n_digitos: int = 2) -> str:
+    """BCD 8421 con nibbles separados por espacios, o "NR" si no cabe en n_digitos."""
+    if n_digitos < 1 or not (0 <= valor < 10 ** n_digitos):
+        return NR
+    texto = f"{valor:0{n_digitos}d}"
+    return " ".join(f"{int(digito):04b}" for digito in texto)
+
+
+def entero_a_sm(valor: int, n_bits: int) -> str:
+    """Signo-magnitud de n bits (sin comprobar rango)."""
+    if valor >= 0:
+        return format(valor, f'0{n_bits}b')
+    return '1' + format(abs(valor), f'0{n_bits - 1}b')
+
+
+# ============================================================================
+# CÓDIGOS SIN SIGNO + RANGO
+# ============================================================================
+
+def _rango(formato: str, n_bits: int, K: int):
+    """(mínimo, máximo) representable; máximo None = sin límite."""
+    media = 1 << (n_bits - 1)
+    if formato == 'bin':
+        return 0, (1 << n_bits) - 1
+    if formato in ('oct', 'hex'):
+        return 0, None
+    if formato == 'bcd':
+        return 0, 10 ** (n_bits // 4) - 1
+    if formato in ('sm', 'c1'):
+        return -(media - 1), media - 1
+    if formato == 'c2':
+        return -media, media - 1
+    if formato == 'exceso':
+        return -K, (1 << n_bits) - 1 - K
+    raise ValueError(f"Formato desconocido: {formato}. Formatos: {', '.join(FORMATOS_LOTE)}")
+
+
+def _codigo(formato: str, valor: int, n_bits: int, K: int) -> int:
+    """Código sin signo de un valor representable."""
+    if formato == 'sm':
+        return valor if valor >= 0 else (1 << (n_bits - 1)) | -valor
+    if formato == 'c1':
+        return valor if valor >= 0 else (1 << n_bits) - 1 + valor
+    if formato == 'c2':
+        return valor & ((1 << n_bits) - 1)
+    if formato == 'exceso':
+        return valor + K
+    if formato == 'bcd':
+        codigo = 0
+        for desplazamiento in range(0, n_bits // 4 * 4, 4):
+            valor, digito = divmod(valor, 10)
+            codigo |= digito << desplazamiento
+        return codigo
+    return valor
+
+
+def _codigos_numpy(formato: str, valores, n_bits: int, K: int):
+    """Versión vectorizada de _codigo (valores: array int64 ya dentro de rango o enmascarados)."""
+    if formato == 'sm':
+        return np.where(valores >= 0, valores, (1 << (n_bits - 1)) | -valores)
+    if formato == 'c1':
+        return np.where(valores >= 0, valores, (1 << n_bits) - 1 + valores)
+    if formato == 'c2':
+        return valores & ((1 << n_bits) - 1)
+    if formato == 'exceso':
+        return valores + K
+    if formato == 'bcd':
+        codigos = np.zeros_like(valores)
+        resto = valores.copy()
+        for desplazamiento in range(0, n_bits // 4 * 4, 4):
+            resto, digito = np.divmod(resto, 10)
+            codigos |= digito << desplazamiento
+        return codigos
+    return valores
+
+
+# ============================================================================
+# FORMATEO DEL LOTE
+# ============================================================================
+
+_BITS_POR_DIGITO = {'bin': 1, 'bcd': 1, 'sm': 1, 'c1': 1, 'c2': 1, 'exceso': 1, 'oct': 3, 'hex': 4}
+
+
+def _formatear_python(formato: str, valores: Sequence[int], n_bits: int, K: int) -> List[str]:
+    minimo, maximo = _rango(formato, n_bits, K)
+    if formato in ('oct', 'hex'):
+        base = 8 if formato == 'oct' else 16
+        return [entero_a_digitos(v, base, mayusculas=True) if v >= minimo else NR for v in valores]
+    if formato == 'bcd':
+        n_digitos = n_bits // 4
+        if n_digitos == 0:
+            return [NR] * len(valores)  # Menos de 4 bits: no cabe ningún dígito
+        return [entero_a_bcd(v, n_digitos) for v in valores]
+    patron = f'0{n_bits}b'
+    return [
+        format(_codigo(formato, v, n_bits, K), patron) if minimo <= v <= maximo else NR
+        for v in valores
+    ]
+
+
+def _formatear_numpy(formato: str, valores, n_bits: int, K: int) -> List[str]:
+    """Extrae los dígitos de todo el lote en una matriz N × ancho y la traduce a ASCII."""
+    if formato == 'bcd' and n_bits < 4:
+        return [NR] * len(valores)  # Ningún dígito BCD cabe (y el ancho sería 0)
+    minimo, maximo = _rango(formato, n_bits, K)
+    representable = valores >= minimo
+    if maximo is not None:
+        representable &= valores <= maximo
+    seguros = np.where(representable, valores, 0)
+    codigos = _codigos_numpy(formato, seguros, n_bits, K)
+
+    bits_digito = _BITS_POR_DIGITO[formato]
+    if formato in ('oct', 'hex'):
+        # Ancho suficiente para el mayor valor; los ceros a la izquierda se quitan después
+        mayor = int(codigos.max()) if codigos.size else 0
+        ancho = max(1, -(-mayor.bit_length() // bits_digito))
+    elif formato == 'bcd':
+        ancho = n_bits // 4 * 4
+    else:
+        ancho = n_bits
+    desplazamientos = np.arange(ancho - 1, -1, -1, dtype=np.int64) * bits_digito
+    digitos = (codigos[:, None] >> desplazamientos) & ((1 << bits_digito) - 1)
+    caracteres = np.frombuffer(_ASCII_DIGITOS, dtype=np.uint8)[digitos]
+
+    if formato == 'bcd':
+        # Separador ' ' entre nibbles: columnas 4, 9, 14... del resultado
+        n_nibbles = ancho // 4
+        separado = np.full((len(codigos), ancho + n_nibbles - 1), ord(' '), dtype=np.uint8)
+        for nibble in range(n_nibbles):
+            separado[:, nibble * 5:nibble * 5 + 4] = caracteres[:, nibble * 4:nibble * 4 + 4]
+        caracteres = separado
+
+    # Cada fila de bytes es una palabra: vista 'S<ancho>' → cadenas sin bucle Python
+    palabras = np.ascontiguousarray(caracteres).view(f'S{caracteres.shape[1]}')[:, 0].astype('U')
+    if formato in ('oct', 'hex'):
+        palabras = np.char.lstrip(palabras, '0')
+        palabras = np.where(palabras == '', '0', palabras)
+    return np.where(representable, palabras, NR).tolist()
+
+
+def _cabe_en_numpy(valores: Sequence[int], n_bits: int, K: int) -> bool:
+    if n_bits > _MAX_BITS_NUMPY or not valores:
+        return False
+    limite = 1 << _MAX_BITS_NUMPY
+    return -limite < min(valores) and max(valores) + abs(K) < limite
+
+
+def convertir_lote(
+    valores: Iterable[int],
+    n_bits: int = 8,
+    formatos: Sequence[str] = FORMATOS_LOTE,
+    K: Optional[int] = None,
+    usar_numpy: Optional[bool] = None,
+) -> Dict[str, List[str]]:
+    """
+    Convierte un lote de enteros a varios formatos en una sola llamada.
+
+    Args:
+        valores: Enteros (lista, tupla, generador o array de NumPy)
+        n_bits: Longitud de palabra para los formatos de ancho fijo
+        formatos: Subconjunto de FORMATOS_LOTE
+        K: Sesgo del exceso (por defecto 2^(n_bits-1))
+        usar_numpy: Forzar (True) o desactivar (False) NumPy; None = automático
+
+    Returns:
+        Dict formato → lista de cadenas (mismo orden que valores; "NR" fuera de rango)
+    """
+    if n_bits < 1:
+        raise ValueError(f"n_bits debe ser positivo, recibido: {n_bits}")
+    valores = [int(v) for v in valores]
+    if K is None:
+        K = 1 << (n_bits - 1)
+    for formato in formatos:
+        _rango(formato, n_bits, K)  # Valida el nombre del formato
+
+    if usar_numpy is None:
+        usar_numpy = HAS_NUMPY and len(valores) >= UMBRAL_NUMPY
+    if usar_numpy and not HAS_NUMPY:
+        raise ImportError("NumPy no está instalado")
+    if usar_numpy and _cabe_en_numpy(valores, n_bits, K):
+        array = np.array(valores, dtype=np.int64)
+        return {formato: _formatear_numpy(formato, array, n_bits, K) for formato in formatos}
+    return {formato: _formatear_python(formato, valores, n_bits, K) for formato in formatos}
+
+
+_FORMATO_BASE = {8: 'oct', 16: 'hex'}
+
+
+def convertir_a_bases(valores: Iterable[int], bases: Sequence[int] = (2, 8, 10, 16)) -> Dict[int, List[str]]:
+    """
+    Representación natural (sin relleno, A-Z en mayúsculas) de enteros en varias bases.
+
+    Los negativos se escriben con signo ('-' + magnitud). Las bases 8 y 16 usan
+    el formateo vectorizado del lote; el resto, core.conversion_enteros_grandes.
+    """
+    valores = [int(v) for v in valores]
+    magnitudes = [abs(v) for v in valores]
+    signos = ['-' if v < 0 else '' for v in valores]
+    resultado: Dict[int, List[str]] = {}
+    for base in bases:
+        formato = _FORMATO_BASE.get(base)
+        if formato is not None:
+            textos = convertir_lote(magnitudes, formatos=(formato,))[formato]
+        else:
+            textos = [entero_a_digitos(m, base, mayusculas=True) for m in magnitudes]
+        resultado[base] = [s + t for s, t in zip(signos, textos)]
+    return resultado
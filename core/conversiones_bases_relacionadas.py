@@ -19,8 +19,10 @@ El algoritmo:
 5. Convertir cada grupo de k' a un dígito de B^k
 """
 
+from functools import lru_cache
 from math import gcd
-from typing import List, Dict, Tuple, Union
+from typing import Iterator, List, Dict, Tuple, Union
+from core.conversion_enteros_grandes import ALFABETO_MAYUSCULAS, primer_digito_invalido
 from core.numeracion_utils import (
     valor_digito_en_base,
     validar_numero_en_base
@@ -35,40 +37,23 @@ def encontrar_base_primitiva(base1: int, base2: int) -> Tuple[int, int, int]:
     
     Retorna: (B, l, k) o None si no son potencias de la misma base
     """
-    # Detectar patrones comunes
-    # Formato: (base1, base2, B_primitiva, l, k)
-    pares_potencias = [
-        (2, 4, 2, 1, 2),    # 2=2^1, 4=2^2
-        (2, 8, 2, 1, 3),    # 2=2^1, 8=2^3
-        (2, 16, 2, 1, 4),   # 2=2^1, 16=2^4
-        (2, 32, 2, 1, 5),   # 2=2^1, 32=2^5
-        (4, 2, 2, 2, 1),    # 4=2^2, 2=2^1
-        (4, 8, 2, 2, 3),    # 4=2^2, 8=2^3
-        (4, 16, 2, 2, 4),   # 4=2^2, 16=2^4
-        (8, 2, 2, 3, 1),    # 8=2^3, 2=2^1
-        (8, 4, 2, 3, 2),    # 8=2^3, 4=2^2
-        (8, 16, 2, 3, 4),   # 8=2^3, 16=2^4
-        (16, 2, 2, 4, 1),   # 16=2^4, 2=2^1
-        (16, 4, 2, 4, 2),   # 16=2^4, 4=2^2
-        (16, 8, 2, 4, 3),   # 16=2^4, 8=2^3
-        (32, 2, 2, 5, 1),   # 32=2^5, 2=2^1
-        (3, 9, 3, 1, 2),    # 3=3^1, 9=3^2
-        (3, 27, 3, 1, 3),   # 3=3^1, 27=3^3
-        (9, 3, 3, 2, 1),    # 9=3^2, 3=3^1
-        (9, 27, 3, 2, 3),   # 9=3^2, 27=3^3
-        (27, 3, 3, 3, 1),   # 27=3^3, 3=3^1
-        (27, 9, 3, 3, 2),   # 27=3^3, 9=3^2
-        (5, 25, 5, 1, 2),   # 5=5^1, 25=5^2
-        (25, 5, 5, 2, 1),   # 25=5^2, 5=5^1
-        (6, 36, 6, 1, 2),   # 6=6^1, 36=6^2
-        (36, 6, 6, 2, 1),   # 36=6^2, 6=6^1
-    ]
-    
-    for b1, b2, B, l, k in pares_potencias:
-        if base1 == b1 and base2 == b2:
-            return B, l, k
-    
-    return None
+    if base1 < 2 or base2 < 2:
+        return None
+    B1, l = _raiz_primitiva(base1)
+    B2, k = _raiz_primitiva(base2)
+    if B1 != B2:
+        return None
+    return B1, l, k
+
+
+def _raiz_primitiva(base: int) -> Tuple[int, int]:
+    """(r, e) con base = r^e y r mínimo (16 → (2, 4), 36 → (6, 2), 10 → (10, 1))."""
+    for e in range(base.bit_length(), 1, -1):
+        r = round(base ** (1 / e))
+        for candidata in (r - 1, r, r + 1):
+            if candidata >= 2 and candidata ** e == base:
+                return candidata, e
+    return base, 1
 
 
 def validar_conversion_bases_relacionadas(base1: int, base2: int) -> Tuple[bool, str]:
@@ -138,6 +123,137 @@ def dígitos_base_b_a_dígito_base_potencia(
         raise ValueError(f"Valor {valor} no cabe en un dígito de base {base_destino}")
 
 
+# ============================================================================
+# TABLAS DE GRUPOS: conversión lineal en una pasada
+# ============================================================================
+
+def _digitos_fijos(valor: int, base: int, longitud: int) -> str:
+    """valor en base (<= 36) con exactamente longitud dígitos."""
+    digitos = []
+    for _ in range(longitud):
+        valor, digito = divmod(valor, base)
+        digitos.append(ALFABETO_MAYUSCULAS[digito])
+    return ''.join(reversed(digitos))
+
+
+class TablaGrupos:
+    """
+    Conversión base_origen = B^l → base_destino = B^k con tablas precalculadas.
+    
+    Con m = gcd(l, k), cada dígito origen son l' = l/m dígitos de la base común
+    B^m y cada dígito destino son k' = k/m. Se precalculan una vez:
+        dígito origen → grupo de l' dígitos en B^m    (tabla de str.translate)
+        grupo de k' dígitos en B^m → dígito destino   (diccionario)
+    La conversión recorre el número una sola vez por bloques alineados a k'
+    (el relleno de ceros a la izquierda se conoce de antemano: la longitud
+    total de la expansión es len(número) · l'), sin listas intermedias.
+    """
+    
+    def __init__(self, base_origen: int, base_destino: int):
+        if not (2 <= base_origen <= 36 and 2 <= base_destino <= 36):
+            raise ValueError(f"Bases deben estar entre 2 y 36. "
+                             f"base_origen={base_origen}, base_destino={base_destino}")
+        resultado = encontrar_base_primitiva(base_origen, base_destino)
+        if resultado is None:
+            raise ValueError(f"Las bases {base_origen} y {base_destino} no son potencias de la misma base")
+        self.base_origen = base_origen
+        self.base_destino = base_destino
+        self.B, self.l, self.k = resultado
+        self.m = gcd(self.l, self.k)
+        self.l_prima = self.l // self.m
+        self.k_prima = self.k // self.m
+        self.base_comun = self.B ** self.m
+        
+        expansion = {}
+        for valor in range(base_origen):
+            grupo = _digitos_fijos(valor, self.base_comun, self.l_prima)
+            caracter = ALFABETO_MAYUSCULAS[valor]
+            expansion[ord(caracter)] = expansion[ord(caracter.lower())] = grupo
+        self._expansion = expansion
+        self._reagrupacion = {_digitos_fijos(valor, self.base_comun, self.k_prima): ALFABETO_MAYUSCULAS[valor]
+                              for valor in range(base_destino)}
+        # k' = 1: el reagrupamiento también es un str.translate carácter a carácter
+        self._reagrupacion_translate = ({ord(grupo): digito for grupo, digito in self._reagrupacion.items()}
+                                        if self.k_prima == 1 else None)
+    
+    def __repr__(self) -> str:
+        return (f"TablaGrupos({self.base_origen} → {self.base_destino}: "
+                f"base común {self.base_comun}, l'={self.l_prima}, k'={self.k_prima})")
+    
+    def _validar(self, numero_str: str) -> None:
+        digito = primer_digito_invalido(numero_str, self.base_origen)
+        if digito is not None:
+            raise ValueError(f"'{digito}' no es un dígito válido en base {self.base_origen}")
+    
+    def _reagrupar(self, expandido: str) -> str:
+        if self._reagrupacion_translate is not None:
+            return expandido.translate(self._reagrupacion_translate)
+        k, tabla = self.k_prima, self._reagrupacion
+        return ''.join([tabla[expandido[i:i + k]] for i in range(0, len(expandido), k)])
+    
+    def iterar(self, numero_str: str, bloque: int = 1 << 16) -> Iterator[str]:
+        """Trozos consecutivos del resultado (dígitos A-Z en mayúsculas)."""
+        self._validar(numero_str)
+        n = len(numero_str)
+        k = self.k_prima
+        # Ceros (en B^m) a la izquierda para que la expansión sea múltiplo de k'
+        relleno = (-n * self.l_prima) % k
+        # Primer bloque: n mod k' dígitos (más el relleno completa un grupo); luego múltiplos de k'
+        inicio = n % k
+        bloque = max(k, bloque - bloque % k)
+        if inicio:
+            yield self._reagrupar('0' * relleno + numero_str[:inicio].translate(self._expansion))
+        for desde in range(inicio, n, bloque):
+            yield self._reagrupar(numero_str[desde:desde + bloque].translate(self._expansion))
+    
+    def convertir(self, numero_str: str) -> str:
+        """Número en base_origen → base_destino, conservando los ceros de la expansión."""
+        return ''.join(self.iterar(numero_str))
+    
+    def pasos(self, numero_str: str) -> Iterator[Dict]:
+        """Pasos de convertir_bases_relacionadas(verbose=True), generados al pedirlos."""
+        self._validar(numero_str)
+        yield {
+            'paso': 'inicializacion',
+            'descripcion': (f'base_origen={self.base_origen}=B^l={self.B}^{self.l}, '
+                            f'base_destino={self.base_destino}=B^k={self.B}^{self.k}'),
+            'gcd': self.m,
+            'l_prima': self.l_prima,
+            'k_prima': self.k_prima
+        }
+        expandido = numero_str.translate(self._expansion)
+        yield {
+            'paso': 1,
+            'descripcion': f'Convertir cada dígito a {self.l_prima} dígitos en base {self.base_comun}',
+            'dígitos_originales': numero_str,
+            'dígitos_en_B': expandido
+        }
+        k = self.k_prima
+        expandido = '0' * ((-len(expandido)) % k) + expandido
+        grupos = [list(expandido[i:i + k]) for i in range(0, len(expandido), k)]
+        yield {
+            'paso': 2,
+            'descripcion': f'Agrupar de {k} en {k} dígitos',
+            'dígitos_en_B': expandido,
+            'grupos': grupos
+        }
+        for grupo in grupos:
+            texto = ''.join(grupo)
+            digito = self._reagrupacion[texto]
+            yield {
+                'paso': 3,
+                'grupo': texto,
+                'valor_en_B': ALFABETO_MAYUSCULAS.index(digito),
+                'dígito_destino': digito
+            }
+
+
+@lru_cache(maxsize=256)
+def tabla_grupos(base_origen: int, base_destino: int) -> TablaGrupos:
+    """TablaGrupos compartida por par de bases (se construye una vez)."""
+    return TablaGrupos(base_origen, base_destino)
+
+
 def convertir_bases_relacionadas(
     numero_str: str,
     base_origen: int,
@@ -173,76 +289,12 @@ def convertir_bases_relacionadas(
     if not valido:
         raise ValueError(msg)
     
-    # Obtener información de bases relacionadas
-    B, l, k = encontrar_base_primitiva(base_origen, base_destino)
-    m = gcd(l, k)
-    l_prima = l // m
-    k_prima = k // m
-    
-    pasos = [] if verbose else None
-    
-    if verbose:
-        pasos.append({
-            'paso': 'inicializacion',
-            'descripcion': f'base_origen={base_origen}=B^l={B}^{l}, base_destino={base_destino}=B^k={B}^{k}',
-            'gcd': m,
-            'l_prima': l_prima,
-            'k_prima': k_prima
-        })
-    
-    # PASO 1: Convertir cada dígito de base_origen a l_prima dígitos de B
-    dígitos_en_B = []
-    for dígito in numero_str:
-        grupo = dígito_base_b_a_dígitos_base_potencia(dígito, base_origen, B)
-        # Rellenar a l_prima dígitos
-        while len(grupo) < l_prima:
-            grupo.insert(0, '0')
-        dígitos_en_B.extend(grupo)
-    
-    if verbose:
-        pasos.append({
-            'paso': 1,
-            'descripcion': f'Convertir cada dígito a {l_prima} dígitos en base {B}',
-            'dígitos_originales': numero_str,
-            'dígitos_en_B': ''.join(dígitos_en_B)
-        })
-    
-    # PASO 2: Agrupar de k_prima en k_prima (empezando por la derecha)
-    # Rellenar con ceros a la izquierda si es necesario
-    while len(dígitos_en_B) % k_prima != 0:
-        dígitos_en_B.insert(0, '0')
-    
-    grupos = []
-    for i in range(0, len(dígitos_en_B), k_prima):
-        grupos.append(dígitos_en_B[i:i+k_prima])
-    
-    if verbose:
-        pasos.append({
-            'paso': 2,
-            'descripcion': f'Agrupar de {k_prima} en {k_prima} dígitos',
-            'dígitos_en_B': ''.join(dígitos_en_B),
-            'grupos': grupos
-        })
-    
-    # PASO 3: Convertir cada grupo a un dígito en base_destino
-    resultado_dígitos = []
-    for grupo in grupos:
-        dígito_destino = dígitos_base_b_a_dígito_base_potencia(grupo, B, base_destino)
-        resultado_dígitos.append(dígito_destino)
-        
-        if verbose:
-            valor_grupo = sum(
-                valor_digito_en_base(d, B) * (B ** (len(grupo) - 1 - i))
-                for i, d in enumerate(grupo)
-            )
-            pasos.append({
-                'paso': 3,
-                'grupo': ''.join(grupo),
-                'valor_en_B': valor_grupo,
-                'dígito_destino': dígito_destino
-            })
-    
-    resultado = ''.join(resultado_dígitos)
+    # Tablas dígito → grupo → dígito del par de bases (precalculadas y cacheadas)
+    tabla = tabla_grupos(base_origen, base_destino)
+    resultado = tabla.convertir(numero_str)
+    B, l, k = tabla.B, tabla.l, tabla.k
+    m, l_prima, k_prima = tabla.m, tabla.l_prima, tabla.k_prima
+    pasos = list(tabla.pasos(numero_str)) if verbose else None
     
     return {
         'numero_original': numero_str,
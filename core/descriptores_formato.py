@@ -0,0 +1,349 @@
+"""
+Descriptores de formato: características derivadas de un formato numérico,
+calculadas una sola vez y compartidas.
+
+Un descriptor identifica un formato por (tipo, E, F, base, representación):
+
+    'fixed'    punto fijo Q(E,F); representación 'unsigned', 'ms' o 'complement'
+    'ieee754'  IEEE 754 genérico con E bits de exponente y F de mantisa
+
+y guarda sus características (escala, épsilon, rangos, recuentos de
+códigos, ...). Cada característica se calcula la primera vez que se pide
+(functools.cached_property) y queda en el descriptor.
+
+format_descriptor internaliza los descriptores en una LRU acotada: el mismo
+formato devuelve el mismo objeto, así que FixedPoint, FixedPointUnified,
+IEEE754Gen, RepresentationValidator y la web comparten los cálculos con
+potencias grandes en lugar de repetirlos en cada llamada.
+
+Ejemplo:
+    d = format_descriptor('ieee754', 8, 23)
+    d.max_positive              → Fraction((2 - 2^-23) · 2^127)
+    d.characteristics()         → dict con E_min, E_max, min_positive, ...
+    format_descriptor('ieee754', 8, 23) is d   → True
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+from functools import cached_property, lru_cache
+from typing import Dict, Optional, Tuple
+import math
+import sys
+
+FORMAT_KINDS = ('fixed', 'ieee754')
+FIXED_REPRESENTATIONS = ('unsigned', 'ms', 'complement')
+
+# Tamaño de la LRU de descriptores internalizados
+MAX_DESCRIPTORS = 256
+
+
+class FormatDescriptor:
+    """
+    Características de un formato, calculadas bajo demanda una sola vez.
+
+    Los atributos exactos son int o Fraction; los *_float y *_decimal
+    reproducen los valores que las clases de formato exponían antes (mismas
+    operaciones en float / Decimal), para no alterar sus salidas.
+    """
+
+    def __init__(self, kind: str, E: int, F: int, base: int = 2, representation: Optional[str] = None):
+        if kind not in FORMAT_KINDS:
+            raise ValueError(f"Tipo de formato desconocido: {kind}. Tipos: {', '.join(FORMAT_KINDS)}")
+        if base < 2:
+            raise ValueError(f"Base debe ser >= 2. base={base}")
+        if kind == 'fixed':
+            if E < 0 or F < 0:
+                raise ValueError(f"E y F deben ser no-negativos. E={E}, F={F}")
+            if representation not in FIXED_REPRESENTATIONS:
+                raise ValueError(f"Representación desconocida: {representation}. "
+                                 f"Representaciones: {', '.join(FIXED_REPRESENTATIONS)}")
+        else:
+            if E < 1 or F < 1:
+                raise ValueError("E_bits y F_bits deben ser >= 1")
+            if representation is not None:
+                raise ValueError(f"IEEE 754 no admite representación: {representation}")
+
+        self.kind = kind
+        self.E = E
+        self.F = F
+        self.base = base
+        self.representation = representation
+
+    @property
+    def key(self) -> Tuple:
+        return (self.kind, self.E, self.F, self.base, self.representation)
+
+    def __repr__(self) -> str:
+        if self.kind == 'fixed':
+            return f"FormatDescriptor(fixed Q({self.E},{self.F}) base {self.base}, {self.representation})"
+        return f"FormatDescriptor(ieee754 E_bits={self.E}, F_bits={self.F}, base={self.base})"
+
+    # ------------------------------------------------------------------
+    # Comunes
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def scale(self) -> int:
+        """B^F: un ulp del valor crudo (punto fijo) o de la mantisa (IEEE 754)."""
+        return self.base ** self.F
+
+    @cached_property
+    def epsilon(self) -> Fraction:
+        """B^(-F) exacto (resolución en punto fijo, épsilon de máquina en IEEE 754)."""
+        return Fraction(1, self.scale)
+
+    @cached_property
+    def epsilon_decimal(self) -> Decimal:
+        return Decimal(self.base) ** (-self.F)
+
+    @cached_property
+    def total_digits(self) -> int:
+        """Dígitos del código completo (bits en base 2), signo incluido."""
+        if self.kind == 'ieee754':
+            return 1 + self.E + self.F
+        return self.E + self.F + (0 if self.representation == 'unsigned' else 1)
+
+    # ------------------------------------------------------------------
+    # Punto fijo
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def base_power_E(self) -> int:
+        return self.base ** self.E
+
+    @cached_property
+    def raw_range(self) -> Tuple[int, int]:
+        """(mínimo, máximo) del valor crudo n = valor · B^F."""
+        digits = self.base ** (self.E + self.F)
+        if self.representation == 'unsigned':
+            return 0, digits - 1
+        if self.representation == 'ms':
+            return -(digits - 1), digits - 1
+        return -digits, digits - 1
+
+    @cached_property
+    def value_range(self) -> Tuple[Fraction, Fraction]:
+        """(mínimo, máximo) representables, exactos."""
+        low, high = self.raw_range
+        return Fraction(low, self.scale), Fraction(high, self.scale)
+
+    @cached_property
+    def epsilon_float(self) -> float:
+        return self.base ** (-self.F)
+
+    @cached_property
+    def float_range(self) -> Tuple[float, float]:
+        """(mínimo, máximo) en float, con las operaciones de FixedPointUnified."""
+        max_value = self.base_power_E - self.epsilon_float
+        if self.representation == 'unsigned':
+            return 0, max_value
+        if self.representation == 'ms':
+            return -max_value, max_value
+        return -self.base_power_E, max_value
+
+    @cached_property
+    def max_value_decimal(self) -> Decimal:
+        """B^E - B^(-F) en Decimal (FixedPoint)."""
+        return Decimal(self.base) ** self.E - self.epsilon_decimal
+
+    @cached_property
+    def value_count(self) -> int:
+        """Valores distintos representables (el cero de M&S cuenta una vez)."""
+        if self.kind == 'ieee754':
+            return 2 * (self.finite_nonnegative_count - 1) + 1
+        low, high = self.raw_range
+        return high - low + 1
+
+    # ------------------------------------------------------------------
+    # IEEE 754
+    # ------------------------------------------------------------------
+
+    @cached_property
+    def bias(self) -> int:
+        return self.base ** (self.E - 1) - 1
+
+    @cached_property
+    def E_max_encoded(self) -> int:
+        """Exponente codificado de infinito y NaN (todos los dígitos al máximo)."""
+        return self.base ** self.E - 1
+
+    @property
+    def E_min(self) -> int:
+        return 1 - self.bias
+
+    @property
+    def E_max(self) -> int:
+        return self.bias - 1
+
+    def magnitude(self, E_encoded: int, M_encoded: int) -> Fraction:
+        """Valor exacto (sin signo) de un código IEEE 754 finito."""
+        if E_encoded == 0:
+            significand, exponent = M_encoded, self.E_min - self.F
+        else:
+            significand, exponent = self.scale + M_encoded, E_encoded - self.bias - self.F
+        if exponent >= 0:
+            return Fraction(significand * self.base ** exponent)
+        return Fraction(significand, self.base ** -exponent)
+
+    @cached_property
+    def min_positive(self) -> Fraction:
+        """Menor subnormal: B^(E_min - F)."""
+        return self.magnitude(0, 1)
+
+    @cached_property
+    def max_subnormal(self) -> Fraction:
+        return self.magnitude(0, self.scale - 1)
+
+    @cached_property
+    def min_normal(self) -> Fraction:
+        """B^E_min."""
+        return self.magnitude(1, 0)
+
+    @cached_property
+    def max_positive(self) -> Fraction:
+        """Mayor finito: mayor exponente no especial y mantisa máxima."""
+        return self.magnitude(self.E_max_encoded - 1, self.scale - 1)
+
+    @cached_property
+    def fits_float(self) -> bool:
+        """
+        ¿B^E_max cabe en float? Se decide sin construir las magnitudes exactas,
+        que con E_bits grandes ocupan megabytes (max_positive ≈ B^(B^(E_bits-1))).
+        """
+        if (self.E - 1) * math.log2(self.base) > 16:  # E_max > 2^16: muy por encima de 2^1024
+            return False
+        return self.E_max * math.log2(self.base) < sys.float_info.max_exp
+
+    @cached_property
+    def normal_count(self) -> int:
+        """Códigos normalizados positivos."""
+        return (self.E_max_encoded - 1) * self.scale
+
+    @cached_property
+    def subnormal_count(self) -> int:
+        """Códigos subnormales positivos (sin el cero)."""
+        return self.scale - 1
+
+    @cached_property
+    def finite_nonnegative_count(self) -> int:
+        """Códigos finitos no negativos (cero incluido)."""
+        return self.normal_count + self.subnormal_count + 1
+
+    @cached_property
+    def nan_count(self) -> int:
+        """Códigos NaN por signo."""
+        return self.scale - 1
+
+    @cached_property
+    def _decimal_powers(self) -> Tuple[Decimal, Decimal]:
+        base = Decimal(self.base)
+        return base ** self.E_min, base ** self.E_max
+
+    @cached_property
+    def range_normalized(self) -> Tuple[float, float]:
+        """(mínimo, máximo) normalizados en float, como IEEE754Gen.get_range_normalized."""
+        low, high = self._decimal_powers
+        return float(Decimal(1) * low), float((Decimal(2) - self.epsilon_decimal) * high)
+
+    @cached_property
+    def range_denormalized(self) -> Tuple[float, float]:
+        """(mínimo, máximo) subnormales en float, como IEEE754Gen.get_range_denormalized."""
+        low, _ = self._decimal_powers
+        return float(self.epsilon_decimal * low), float((1 - self.epsilon_decimal) * low)
+
+    @cached_property
+    def _ieee_info(self) -> Dict:
+        normalized_min, normalized_max = self.range_normalized
+        return {
+            'E_bits': self.E,
+            'F_bits': self.F,
+            'total_bits': self.total_digits,
+            'bias': self.bias,
+            'E_min': self.E_min,
+            'E_max': self.E_max,
+            'epsilon': float(self.epsilon_decimal),
+            'normalized_min': normalized_min,
+            'denormalized_min': self.range_denormalized[0],
+            'max': normalized_max,
+        }
+
+    def ieee_info(self) -> Dict:
+        """Diccionario de IEEE754Gen.info (copia: el llamador puede modificarlo)."""
+        return dict(self._ieee_info)
+
+    @cached_property
+    def _characteristics(self) -> Dict:
+        if self.kind == 'ieee754':
+            if not self.fits_float:
+                raise ValueError(f"max_positive no cabe en float con E_bits={self.E} en base {self.base}")
+            return {
+                'base': self.base,
+                'E_bits': self.E,
+                'F_bits': self.F,
+                'total_bits': self.total_digits,
+                'E_min': self.E_min,
+                'E_max': self.E_max,
+                'min_positive': float(self.min_positive),
+                'max_positive': float(self.max_positive),
+                'epsilon': float(self.epsilon),
+            }
+        low, high = self.value_range
+        return {
+            'base': self.base,
+            'E': self.E,
+            'F': self.F,
+            'representation': self.representation,
+            'total_digits': self.total_digits,
+            'epsilon': float(self.epsilon),
+            'min_value': float(low),
+            'max_value': float(high),
+            'value_count': self.value_count,
+        }
+
+    def characteristics(self) -> Dict:
+        """Características principales en float / int (listas para JSON)."""
+        return dict(self._characteristics)
+
+
+@lru_cache(maxsize=MAX_DESCRIPTORS)
+def _interned(kind: str, E: int, F: int, base: int, representation: Optional[str]) -> FormatDescriptor:
+    return FormatDescriptor(kind, E, F, base, representation)
+
+
+def format_descriptor(kind: str, E: int, F: int, base: int = 2,
+                      representation: Optional[str] = None) -> FormatDescriptor:
+    """
+    Descriptor compartido del formato (mismo objeto para la misma clave).
+
+    En punto fijo la representación por defecto es 'unsigned'.
+    """
+    if kind == 'fixed' and representation is None:
+        representation = 'unsigned'
+    return _interned(kind, int(E), int(F), int(base), representation)
+
+
+def descriptor_of(fmt) -> FormatDescriptor:
+    """Descriptor de una instancia de formato (FixedPoint, FixedPointUnified, IEEE754Gen, ...)."""
+    descriptor = getattr(fmt, 'descriptor', None)
+    if isinstance(descriptor, FormatDescriptor):
+        return descriptor
+    if hasattr(fmt, 'E_bits'):
+        return format_descriptor('ieee754', fmt.E_bits, fmt.F_bits, fmt.base)
+    raw_format = getattr(fmt, 'raw_format', None)
+    if raw_format is not None:
+        # FixedPointSignedMS / FixedPointSignedComplement no tienen 'signed'
+        representation = raw_format.representation
+    elif getattr(fmt, 'signed', False):
+        representation = getattr(fmt, 'representation', 'complement')
+    else:
+        representation = 'unsigned'
+    return format_descriptor('fixed', fmt.E, fmt.F, getattr(fmt, 'base', getattr(fmt, 'B', 2)), representation)
+
+
+def cache_info():
+    """Estadísticas de la LRU de descriptores."""
+    return _interned.cache_info()
+
+
+def clear_cache() -> None:
+    _interned.cache_clear()
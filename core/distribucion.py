@@ -0,0 +1,237 @@
+"""
+Distribución exacta de los valores representables (histogramas analíticos).
+
+Cuenta cuántos valores distintos de un formato caen en cada intervalo sin
+enumerarlos: los valores finitos están ordenados, así que basta con el
+rango (número de valores < x) en cada borde y restar.
+
+  Punto fijo (FixedPointUnified): valores n / B^F con n entero en
+      [n_min, n_max]  →  rango(x) = ceil(x · B^F) - n_min   (acotado)
+
+  Punto flotante (IEEE754Gen): los códigos positivos finitos 1..N están en
+      orden creciente de valor. Para x > 0 se busca la banda de exponente
+      (floor(log_B x), exacto) y dentro de ella la mantisa:
+      rango(x) = E_encoded · B^F - 1 + #{M : (B^F + M) · B^(e-F) < x}
+      Los negativos son simétricos y el cero (±0) cuenta una vez.
+
+Todo es aritmética entera y Fraction: vale para cualquier E/F (incluidos
+formatos de 2^64 códigos o más) y cuesta O(bins). Los resultados se cachean
+por (formato, bins, escala).
+
+Escalas:
+    'lineal'  bins de igual anchura en [mínimo, máximo] (todos los valores)
+    'log'     bins de igual anchura en log_B sobre los valores positivos
+
+Ejemplo:
+    h = histograma_ieee754(IEEE754Gen(4, 3), bins=4, escala='log')
+    h.counts → recuentos por bin; sum(h.counts) == h.total
+"""
+
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+from typing import Tuple
+import math
+
+from core.ieee754 import IEEE754Gen, _floor_log, _floor_scaled, _power
+
+ESCALAS = ('lineal', 'log')
+
+
+@dataclass(frozen=True)
+class Histograma:
+    """Histograma exacto: len(edges) == len(counts) + 1; el último bin es cerrado."""
+    edges: Tuple[Fraction, ...]
+    counts: Tuple[int, ...]
+    escala: str
+    total: int  # Valores distintos en [edges[0], edges[-1]]
+
+    @property
+    def rango(self) -> Tuple[float, float]:
+        """(primer borde, último borde) como float."""
+        return _a_float(self.edges[0]), _a_float(self.edges[-1])
+
+    @property
+    def centers(self) -> Tuple[float, ...]:
+        """Centro de cada bin (geométrico en escala log) como float (±inf si desborda)."""
+        centros = []
+        for inicio, fin in zip(self.edges, self.edges[1:]):
+            if self.escala == 'log':
+                centros.append(_a_float(inicio) * math.sqrt(_a_float(fin / inicio)))
+            else:
+                centros.append(_a_float((inicio + fin) / 2))
+        return tuple(centros)
+
+
+def _a_float(x: Fraction) -> float:
+    try:
+        return x.numerator / x.denominator
+    except OverflowError:
+        return math.inf if x > 0 else -math.inf
+
+
+def _ceil_scaled(x: Fraction, base: int, k: int) -> int:
+    """ceil(x · base^k) con aritmética entera."""
+    q, exacto = _floor_scaled(x, base, k)
+    return q if exacto else q + 1
+
+
+# ============================================================================
+# RANGOS: número de valores < x (o <= x)
+# ============================================================================
+
+def _rango_fijo(x: Fraction, base: int, F: int, n_min: int, n_max: int, inclusivo: bool) -> int:
+    """#{n ∈ [n_min, n_max] : n / B^F < x} (o <= x)."""
+    if inclusivo:
+        limite = _floor_scaled(x, base, F)[0] + 1
+    else:
+        limite = _ceil_scaled(x, base, F)
+    return min(max(limite - n_min, 0), n_max - n_min + 1)
+
+
+def _positivos_flotante(ieee: IEEE754Gen, y: Fraction, inclusivo: bool) -> int:
+    """Número de valores finitos positivos < y (o <= y), y > 0."""
+    base, F, escala_m = ieee.base, ieee.F_bits, ieee._scale
+    total = ieee.E_max_encoded * escala_m - 1
+    e = _floor_log(y, base)
+
+    if e < ieee.E_min:
+        # Subnormales: M · B^(E_min - F), M en [1, B^F - 1]
+        k = ieee.F_bits - ieee.E_min
+        m = _floor_scaled(y, base, k)[0] if inclusivo else _ceil_scaled(y, base, k) - 1
+        return min(m, escala_m - 1)
+
+    E_enc = e + ieee.bias
+    if E_enc >= ieee.E_max_encoded:
+        return total
+    # Banda E_enc: (B^F + M) · B^(e-F); antes están los códigos 1..E_enc·B^F - 1
+    if inclusivo:
+        en_banda = _floor_scaled(y, base, F - e)[0] - escala_m + 1
+    else:
+        en_banda = _ceil_scaled(y, base, F - e) - escala_m
+    return E_enc * escala_m - 1 + min(max(en_banda, 0), escala_m)
+
+
+def _rango_flotante(ieee: IEEE754Gen, x: Fraction, inclusivo: bool) -> int:
+    """Número de valores finitos distintos < x (o <= x); ±0 cuenta una vez."""
+    n_positivos = ieee.E_max_encoded * ieee._scale - 1
+    if x > 0:
+        return n_positivos + 1 + _positivos_flotante(ieee, x, inclusivo)
+    if x == 0:
+        return n_positivos + (1 if inclusivo else 0)
+    # Negativos: v < x  ⇔  -v > -x
+    return n_positivos - _positivos_flotante(ieee, -x, not inclusivo)
+
+
+# ============================================================================
+# BORDES Y RECUENTO
+# ============================================================================
+
+def _bordes(minimo: Fraction, maximo: Fraction, bins: int, escala: str, base: int) -> Tuple[Fraction, ...]:
+    if escala == 'lineal':
+        ancho = (maximo - minimo) / bins
+        return tuple(minimo + ancho * i for i in range(bins)) + (maximo,)
+    # Log: exponente t = k + f (k entero) → B^t = B^f · B^k, sin desbordar floats
+    t_min = _log_base(minimo, base)
+    t_max = _log_base(maximo, base)
+    bordes = [minimo]
+    for i in range(1, bins):
+        t = t_min + (t_max - t_min) * i / bins
+        k = math.floor(t)
+        bordes.append(Fraction(base ** (t - k)) * _potencia(base, k))
+    bordes.append(maximo)
+    return tuple(bordes)
+
+
+def _log_base(x: Fraction, base: int) -> float:
+    """log_B(x) en float para x > 0 arbitrariamente grande o pequeño."""
+    return (math.log(x.numerator) - math.log(x.denominator)) / math.log(base)
+
+
+def _potencia(base: int, k: int) -> Fraction:
+    return Fraction(_power(base, k)) if k >= 0 else Fraction(1, _power(base, -k))
+
+
+def _contar(rango, bordes: Tuple[Fraction, ...]) -> Tuple[int, ...]:
+    """Recuentos [b_i, b_{i+1}) y el último bin cerrado, a partir de la función de rango."""
+    previos = [rango(b, False) for b in bordes[:-1]] + [rango(bordes[-1], True)]
+    return tuple(fin - inicio for inicio, fin in zip(previos, previos[1:]))
+
+
+def _validar(bins: int, escala: str) -> None:
+    if bins < 1:
+        raise ValueError(f"bins debe ser positivo, recibido: {bins}")
+    if escala not in ESCALAS:
+        raise ValueError(f"Escala desconocida: {escala}. Escalas: {', '.join(ESCALAS)}")
+
+
+# ============================================================================
+# API
+# ============================================================================
+
+@lru_cache(maxsize=256)
+def _histograma_fijo(E: int, F: int, base: int, n_min: int, bins: int, escala: str) -> Histograma:
+    n_max = _power(base, E + F) - 1
+    if escala == 'log':
+        n_min = max(n_min, 1)  # Solo positivos
+    minimo, maximo = Fraction(n_min, _power(base, F)), Fraction(n_max, _power(base, F))
+
+    def rango(x, inclusivo):
+        return _rango_fijo(x, base, F, n_min, n_max, inclusivo)
+
+    bordes = _bordes(minimo, maximo, bins, escala, base)
+    return Histograma(bordes, _contar(rango, bordes), escala, n_max - n_min + 1)
+
+
+def histograma_punto_fijo(fp, bins: int = 50, escala: str = 'lineal') -> Histograma:
+    """
+    Histograma exacto de los valores de un FixedPointUnified.
+
+    Cuenta valores distintos (en magnitud y signo, +0 y -0 son un solo valor).
+    En escala log solo se consideran los valores positivos [ε, máximo].
+    """
+    _validar(bins, escala)
+    cifras = _power(fp.base, fp.E + fp.F)
+    if not fp.signed:
+        n_min = 0
+    elif fp.representation == 'ms':
+        n_min = -(cifras - 1)
+    else:
+        n_min = -cifras
+    return _histograma_fijo(fp.E, fp.F, fp.base, n_min, bins, escala)
+
+
+@lru_cache(maxsize=256)
+def _histograma_flotante(E_bits: int, F_bits: int, base: int, bins: int, escala: str) -> Histograma:
+    ieee = IEEE754Gen(E_bits, F_bits, base)
+    n_positivos = ieee.E_max_encoded * ieee._scale - 1
+    if escala == 'log':
+        minimo, maximo = ieee.min_positive, ieee.max_positive
+        total = n_positivos
+    else:
+        maximo = ieee.max_positive
+        minimo = -maximo
+        total = 2 * n_positivos + 1
+
+    def rango(x, inclusivo):
+        return _rango_flotante(ieee, x, inclusivo)
+
+    bordes = _bordes(minimo, maximo, bins, escala, base)
+    return Histograma(bordes, _contar(rango, bordes), escala, total)
+
+
+def histograma_ieee754(ieee: IEEE754Gen, bins: int = 50, escala: str = 'log') -> Histograma:
+    """
+    Histograma exacto de los valores finitos de un IEEE754Gen.
+
+    En escala log cubre los positivos [mínimo subnormal, máximo finito]; en
+    lineal, [-máximo, máximo] con ±0 contado una vez. Infinitos y NaN no cuentan.
+    """
+    _validar(bins, escala)
+    return _histograma_flotante(ieee.E_bits, ieee.F_bits, ieee.base, bins, escala)
+
+
+def limpiar_cache() -> None:
+    """Vacía las cachés de histogramas."""
+    _histograma_fijo.cache_clear()
+    _histograma_flotante.cache_clear()
@@ -70,6 +70,9 @@ CONVENCIÓN MSB/LSB:
 from typing import Dict, Tuple, List, Union
 import math
 
+from core.palabra import Word
+from core.tablas_representacion import tabla_representacion
+
 
 # ============================================================================
 # PARTE 1: ANÁLISIS DE RANGO Y CAPACIDAD
@@ -369,12 +372,8 @@ def negacion_ms(representacion_ms: str) -> str:
         negacion_ms('11010110') → '01010110'  (-86 → +86)
         negacion_ms('00000000') → '10000000'  (+0 → -0)
     """
-    signo_bit = int(representacion_ms[0])
-    magnitud_bits = representacion_ms[1:]
-    
-    nuevo_signo = 1 - signo_bit  # Flip del bit
-    
-    return str(nuevo_signo) + magnitud_bits
+    # Flip del bit de signo: ± 2^(n-1) sobre el entero
+    return str(Word.parse(representacion_ms, 2).negate_ms())
 
 
 def es_positivo_ms(representacion_ms: str) -> bool:
@@ -545,43 +544,23 @@ def generar_tabla_ms(n_bits: int) -> List[Dict]:
     - signo: + o -
     - magnitud: valor absoluto
     """
-    info = rango_ms(n_bits)
-    tabla = []
+    filas = tabla_representacion('ms', 2, n_bits)
+    mitad = len(filas) // 2  # Código de -0 (10...0)
     
-    # Negativos
-    for i in range(info['min_negativo'], 0):
-        tabla.append({
-            'decimal': i,
-            'ms': decimal_a_ms(i, n_bits),
-            'signo': '-',
-            'magnitud': abs(i)
-        })
-    
-    # Ceros
-    tabla.append({
-        'decimal': 0,
-        'ms': crear_cero_positivo_ms(n_bits),
-        'signo': '+',
-        'magnitud': 0,
-        'nota': '+0'
-    })
-    
-    tabla.append({
-        'decimal': 0,
-        'ms': crear_cero_negativo_ms(n_bits),
-        'signo': '-',
-        'magnitud': 0,
-        'nota': '-0 (duplicado)'
-    })
-    
-    # Positivos
-    for i in range(1, info['max_positivo'] + 1):
-        tabla.append({
-            'decimal': i,
-            'ms': decimal_a_ms(i, n_bits),
-            'signo': '+',
-            'magnitud': i
-        })
+    # Negativos (de -max a -1), +0, -0 y positivos
+    codigos = [*range(len(filas) - 1, mitad, -1), 0, mitad, *range(1, mitad)]
+    
+    tabla = []
+    for fila in map(filas.__getitem__, codigos):
+        entrada = {
+            'decimal': fila.valor,
+            'ms': fila.palabra,
+            'signo': '-' if fila.codigo >= mitad else '+',
+            'magnitud': abs(fila.valor)
+        }
+        if fila.valor == 0:
+            entrada['nota'] = fila.nota
+        tabla.append(entrada)
     
     return tabla
 
@@ -684,7 +663,8 @@ def opCBm1_palabra(palabra: str, base: int) -> str:
         - No hay carries ni borrows
         - Cada dígito se procesa independientemente
     """
-    return ''.join(opCBm1_digito(d, base) for d in palabra)
+    # B - 1 - d en cada dígito = (B^l - 1) - n sobre el entero
+    return str(Word.parse(palabra, base).complement_m1())
 
 
 def repr_CBm1(numero: int, base: int, longitud: int) -> str:
@@ -755,9 +735,9 @@ def CBm1_a_decimal(palabra: str, base: int) -> int:
         # Es positivo o cero
         return valor
     else:
-        # Es negativo: aplicar CB-1
+        # Es negativo: -(B^l - 1 - valor)
         max_val = (base ** longitud) - 1
-        return valor - max_val - 1
+        return valor - max_val
 
 
 def ms_a_CBm1(ms_palabra: str, base: int) -> str:
@@ -812,38 +792,14 @@ def suma_CBm1(palabra_a: str, palabra_b: str, base: int) -> dict:
             'valor_decimal': Valor decimal del resultado
         }
     """
-    longitud = len(palabra_a)
-    
-    # Convertir a decimal
-    val_a = int(palabra_a, base)
-    val_b = int(palabra_b, base)
-    
-    # Sumar
-    suma_total = val_a + val_b
-    
-    # Capacidad máxima
-    max_val = base ** longitud
-    
-    # Verificar carry
-    carry = suma_total >= max_val
-    
-    # Aplicar end-around carry si es necesario
-    if carry:
-        suma_total = (suma_total % max_val) + 1
-    
-    # Formatear resultado
-    if base == 10:
-        resultado = str(suma_total).zfill(longitud)
-    elif base == 2:
-        resultado = format(suma_total, f'0{longitud}b')
-    else:
-        resultado = format(suma_total, f'0{longitud}x')
+    # Suma natural módulo B^l con end-around carry
+    resultado, carry = Word.parse(palabra_a, base).add_end_around(Word.parse(palabra_b, base))
     
     return {
-        'resultado': resultado,
+        'resultado': str(resultado),
         'carry': carry,
         'carry_suma_uno': carry,
-        'valor_decimal': CBm1_a_decimal(resultado, base)
+        'valor_decimal': resultado.to_cbm1()
     }
 
 
@@ -901,8 +857,6 @@ def generar_tabla_CBm1(base: int, longitud: int) -> str:
     if base == 2 and longitud > 8:
         return f"Tabla muy grande para B={base}, L={longitud}. Use longitud <= 8."
     
-    total_combinaciones = base ** longitud
-    
     lineas = []
     lineas.append(f"Tabla de representacion en CB-{base-1} (base {base}, {longitud} digitos)")
     lineas.append("=" * 80)
@@ -910,32 +864,9 @@ def generar_tabla_CBm1(base: int, longitud: int) -> str:
     lineas.append(f"{'Decimal':>8} | {'CB-{0}':>15} | Significado".format(base-1, ''))
     lineas.append("-" * 80)
     
-    for i in range(total_combinaciones):
-        # Convertir a representación
-        if base == 10:
-            cb1_str = str(i).zfill(longitud)
-        elif base == 2:
-            cb1_str = format(i, f'0{longitud}b')
-        else:
-            cb1_str = format(i, f'0{longitud}x')
-        
-        # Obtener valor decimal
-        valor = CBm1_a_decimal(cb1_str, base)
-        
-        linea = f"{valor:8d} | {cb1_str:>15} | "
-        
-        # Agregar notas especiales
-        max_pos = (base ** (longitud - 1)) - 1
-        if valor == 0 and cb1_str == '0' * longitud:
-            linea += "Cero positivo (+0)"
-        elif valor == 0 and cb1_str == str(base-1) * longitud:
-            linea += "Cero negativo (-0)"
-        elif valor == max_pos:
-            linea += "Maximo positivo"
-        elif valor == -(max_pos):
-            linea += "Minimo negativo"
-        
-        lineas.append(linea)
+    # Filas calculadas por código (ver core.tablas_representacion)
+    for fila in tabla_representacion('cbm1', base, longitud):
+        lineas.append(f"{fila.valor:8d} | {fila.palabra:>15} | {fila.nota}")
     
     lineas.append("=" * 80)
     
@@ -985,7 +916,12 @@ def explicar_operacion_CBm1(numero_a: int, numero_b: int, operacion: str, base:
         pasos.append(f"Numero A: {numero_a} -> CB-{base-1}: {cb1_a}")
         pasos.append(f"Numero B: {numero_b} -> CB-{base-1}: {cb1_b}")
         
-        resultado_suma = suma_CBm1(cb1_a, cb1_b, base)
+        try:
+            resultado_suma = suma_CBm1(cb1_a, cb1_b, base)
+        except ValueError as e:
+            # Operandos fuera de rango para la longitud elegida
+            pasos.append(f"ERROR: {e}")
+            return "\n".join(pasos)
         pasos.append(f"Suma en CB-{base-1}: {cb1_a} + {cb1_b} = {resultado_suma['resultado']}")
         
         if resultado_suma['carry']:
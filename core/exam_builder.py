@@ -1,6 +1,7 @@
 import json
 import os
 import random
+from dataclasses import asdict as dataclass_asdict, is_dataclass
 from typing import List, Dict, Any, Optional
 from core.generator_base import ExerciseData, ExerciseGenerator, ExerciseRandomizer
 from core.catalog import EXERCISE_CATALOG
@@ -202,6 +203,17 @@ class ExamBuilder:
                 # Serializar a JSON agnóstico
                 if hasattr(data, 'asdict'):
                     self.exercises_json.append(data.asdict())
+                elif is_dataclass(data):
+                    # Dataclasses sin separación problema/solución: campos en 'data'
+                    self.exercises_json.append({
+                        "title": data.title,
+                        "description": data.description,
+                        "data": dataclass_asdict(data),
+                        "metadata": {
+                            "exercise_type": data.__class__.__name__,
+                            "module": data.__class__.__module__,
+                        }
+                    })
                 else:
                     # Fallback para ejercicios sin asdict()
                     self.exercises_json.append({
@@ -13,6 +13,9 @@ Exceso a K permite:
 
 from typing import Dict, Tuple
 
+from core.palabra import Word
+from core.tablas_representacion import tabla_representacion
+
 
 def repr_ExcK(numero: int, base: int, longitud: int, K: int) -> str:
     """
@@ -79,6 +82,19 @@ def ExcK_a_decimal(palabra: str, base: int, K: int) -> int:
     return valor_natural - K
 
 
+def _resultado_ExcK(valor: int, base: int, longitud: int, K: int) -> dict:
+    """Resultado de una operación en ExcK: valor + K, truncado módulo B^l si desborda."""
+    codigo = valor + K
+    resultado = Word.from_cb(codigo, base, longitud)  # codigo mod B^l
+    
+    return {
+        'resultado': str(resultado),
+        'llevo': resultado.code != codigo,
+        'valor_decimal': resultado.to_excess(K),
+        'valor_exacto': valor
+    }
+
+
 def suma_ExcK(palabra_a: str, palabra_b: str, base: int, K: int) -> dict:
     """
     Suma en Exceso a K.
@@ -106,39 +122,19 @@ def suma_ExcK(palabra_a: str, palabra_b: str, base: int, K: int) -> dict:
         suma_ExcK('47', '47', 10, 47) -> resultado='47', valor_decimal=0
         suma_ExcK('48', '49', 10, 47) -> resultado='50', valor_decimal=3 (1+2=3)
     """
-    longitud = len(palabra_a)
+    a = Word.parse(palabra_a, base)
+    b = Word.parse(palabra_b, base)
+    longitud = a.length
     
     # Convertir a decimal
-    val_a = ExcK_a_decimal(palabra_a, base, K)
-    val_b = ExcK_a_decimal(palabra_b, base, K)
+    val_a = a.to_excess(K)
+    val_b = b.to_excess(K)
     
     # Suma decimal
     suma_decimal = val_a + val_b
     
     # Formatear resultado
-    try:
-        resultado = repr_ExcK(suma_decimal, base, longitud, K)
-        llevo = False
-    except ValueError:
-        # Overflow: truncar con modulo
-        max_val = base ** longitud
-        valor_exc = (suma_decimal + K) % max_val
-        if base == 10:
-            resultado = str(valor_exc).zfill(longitud)
-        elif base == 2:
-            resultado = format(valor_exc, f'0{longitud}b')
-        else:
-            resultado = format(valor_exc, f'0{longitud}x')
-        llevo = True
-    
-    valor_resultado = ExcK_a_decimal(resultado, base, K)
-    
-    return {
-        'resultado': resultado,
-        'llevo': llevo,
-        'valor_decimal': valor_resultado,
-        'valor_exacto': suma_decimal
-    }
+    return _resultado_ExcK(suma_decimal, base, longitud, K)
 
 
 def resta_ExcK(palabra_a: str, palabra_b: str, base: int, K: int) -> dict:
@@ -165,39 +161,19 @@ def resta_ExcK(palabra_a: str, palabra_b: str, base: int, K: int) -> dict:
     Returns:
         dict: Resultado de la resta
     """
-    longitud = len(palabra_a)
+    a = Word.parse(palabra_a, base)
+    b = Word.parse(palabra_b, base)
+    longitud = a.length
     
     # Convertir a decimal
-    val_a = ExcK_a_decimal(palabra_a, base, K)
-    val_b = ExcK_a_decimal(palabra_b, base, K)
+    val_a = a.to_excess(K)
+    val_b = b.to_excess(K)
     
     # Resta decimal
     resta_decimal = val_a - val_b
     
     # Formatear resultado
-    try:
-        resultado = repr_ExcK(resta_decimal, base, longitud, K)
-        llevo = False
-    except ValueError:
-        # Overflow: truncar con modulo
-        max_val = base ** longitud
-        valor_exc = (resta_decimal + K) % max_val
-        if base == 10:
-            resultado = str(valor_exc).zfill(longitud)
-        elif base == 2:
-            resultado = format(valor_exc, f'0{longitud}b')
-        else:
-            resultado = format(valor_exc, f'0{longitud}x')
-        llevo = True
-    
-    valor_resultado = ExcK_a_decimal(resultado, base, K)
-    
-    return {
-        'resultado': resultado,
-        'llevo': llevo,
-        'valor_decimal': valor_resultado,
-        'valor_exacto': resta_decimal
-    }
+    return _resultado_ExcK(resta_decimal, base, longitud, K)
 
 
 def multiplicacion_ExcK(palabra_a: str, palabra_b: str, base: int, K: int) -> dict:
@@ -228,39 +204,19 @@ def multiplicacion_ExcK(palabra_a: str, palabra_b: str, base: int, K: int) -> di
             'valor_exacto': Valor decimal sin truncar
         }
     """
-    longitud = len(palabra_a)
+    a = Word.parse(palabra_a, base)
+    b = Word.parse(palabra_b, base)
+    longitud = a.length
     
     # Convertir a decimal
-    val_a = ExcK_a_decimal(palabra_a, base, K)
-    val_b = ExcK_a_decimal(palabra_b, base, K)
+    val_a = a.to_excess(K)
+    val_b = b.to_excess(K)
     
     # Multiplicar
     producto = val_a * val_b
     
     # Formatear resultado (truncado a l dígitos)
-    try:
-        resultado = repr_ExcK(producto, base, longitud, K)
-        llevo = False
-    except ValueError:
-        # Overflow: truncar con modulo
-        max_val = base ** longitud
-        valor_exc = (producto + K) % max_val
-        if base == 10:
-            resultado = str(valor_exc).zfill(longitud)
-        elif base == 2:
-            resultado = format(valor_exc, f'0{longitud}b')
-        else:
-            resultado = format(valor_exc, f'0{longitud}x')
-        llevo = True
-    
-    valor_resultado = ExcK_a_decimal(resultado, base, K)
-    
-    return {
-        'resultado': resultado,
-        'llevo': llevo,
-        'valor_decimal': valor_resultado,
-        'valor_exacto': producto
-    }
+    return _resultado_ExcK(producto, base, longitud, K)
 
 
 def analizar_representacion_ExcK(base: int, longitud: int, K: int) -> dict:
@@ -320,37 +276,15 @@ def generar_tabla_ExcK(base: int, longitud: int, K: int) -> str:
     if base == 2 and longitud > 8:
         return f"Tabla muy grande para B={base}, L={longitud}. Use longitud <= 8."
     
-    total_combinaciones = base ** longitud
-    
     lineas = []
     lineas.append(f"Tabla de representacion en ExcK (base {base}, {longitud} digitos, K={K})")
     lineas.append("=" * 100)
     lineas.append(f"{'Decimal':>8} | {'Repr. ExcK':>15} | {'Valor Natural':>15} | Significado")
     lineas.append("-" * 100)
     
-    for i in range(total_combinaciones):
-        # Convertir a representación
-        if base == 10:
-            exc_str = str(i).zfill(longitud)
-        elif base == 2:
-            exc_str = format(i, f'0{longitud}b')
-        else:
-            exc_str = format(i, f'0{longitud}x')
-        
-        # Obtener valor decimal
-        valor = ExcK_a_decimal(exc_str, base, K)
-        
-        linea = f"{valor:8d} | {exc_str:>15} | {i:>15d} | "
-        
-        # Agregar notas especiales
-        if valor == -K:
-            linea += "Minimo (00...0)"
-        elif valor == 0:
-            linea += "Cero (representa 0)"
-        elif valor == (base ** longitud) - 1 - K:
-            linea += "Maximo"
-        
-        lineas.append(linea)
+    # Filas calculadas por código (ver core.tablas_representacion)
+    for fila in tabla_representacion('exck', base, longitud, K):
+        lineas.append(f"{fila.valor:8d} | {fila.palabra:>15} | {fila.codigo:>15d} | {fila.nota}")
     
     lineas.append("=" * 100)
     
@@ -0,0 +1,509 @@
+"""
+Aritmética de punto flotante exacta con enteros (soft-float).
+
+Un formato de base B con F cifras de fracción y exponentes E_min..E_max
+representa ±m · B^k con m entero de hasta F+1 cifras (m ∈ [B^F, B^(F+1))
+en los normalizados). Cada operación calcula el resultado exacto con enteros
+y redondea una sola vez, como el hardware:
+
+    suma/resta   alinea los significandos al menor exponente y suma enteros
+    producto     m1 · m2 con exponente k1 + k2
+    cociente     m1 / m2 se redondea directamente (round_div), sin truncar
+
+Redondeo con cualquiera de ROUNDING_MODES. La traza de una operación
+(operar_traza) muestra la alineación, el resultado exacto, el significando
+normalizado y las cifras de guarda (G), redondeo (R) y sticky (S) que
+deciden el redondeo.
+
+Formatos:
+    FormatoFlotante.de_ieee754(IEEE754Gen)
+        subnormales, ±infinito y NaN; el desbordamiento da infinito o el
+        máximo finito según el modo de redondeo
+    FormatoFlotante.de_punto_flotante(FixedPointFloating)
+        sin subnormales, como core.barrido_errores: satura en el máximo y
+        anula los resultados menores que B^E_min
+
+Lotes: operar_lote hace con NumPy la operación en float64 y un único
+redondeo vectorizado cuando el formato es binario de hasta 24 bits de
+fracción y el modo es 'nearest_even': con p ≤ 25 bits de precisión,
+53 ≥ 2p + 2 y el doble redondeo es inocuo, así que el resultado coincide con
+el exacto. En otro caso se opera valor a valor con enteros.
+
+verificar_binary32 contrasta las cuatro operaciones de binary32 contra
+struct ('f').
+
+Ejemplo:
+    fmt = FormatoFlotante.de_ieee754(IEEE754Gen(E_bits=8, F_bits=23))
+    fmt.a_float(fmt.sumar(0.1, 0.2))             → 0.30000001192092896
+    fmt.operar_traza('add', 1, 2 ** -24)['sticky'] → False (empate: a par)
+"""
+
+import math
+import random
+import struct
+from fractions import Fraction
+from typing import Dict, List, NamedTuple, Optional
+
+from core.conversion_enteros_grandes import entero_a_digitos
+from core.ieee754 import ROUNDING_MODES, _exact_value, _floor_log, _power
+from core.punto_fijo_raw import round_div
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+OPERACIONES = ('add', 'subtract', 'multiply', 'divide')
+DESBORDAMIENTOS = ('infinito', 'saturar')
+CLASES = ('cero', 'finito', 'infinito', 'nan')
+
+_MODOS_CERCANOS = ('nearest_even', 'nearest_away')
+
+
+class Flotante(NamedTuple):
+    """Valor (-1)^signo · significando · base^exponente del formato (o especial)."""
+    signo: int
+    significando: int
+    exponente: int
+    clase: str = 'finito'
+
+
+def _cero(signo: int) -> Flotante:
+    return Flotante(signo, 0, 0, 'cero')
+
+
+def _infinito(signo: int) -> Flotante:
+    return Flotante(signo, 0, 0, 'infinito')
+
+
+NAN = Flotante(0, 0, 0, 'nan')
+
+
+class FormatoFlotante:
+    """
+    Formato de punto flotante de base B con F cifras de fracción.
+
+    Args:
+        base: base del significando
+        F: cifras después del punto (precisión F+1 cifras)
+        E_min, E_max: exponentes del primer dígito de los normalizados
+        subnormales: si True, por debajo de B^E_min se pierde precisión
+            gradualmente; si no, los resultados se anulan
+        desbordamiento: 'infinito' (IEEE) o 'saturar' (máximo finito)
+        con_signo: si False, los resultados negativos se saturan a 0
+    """
+
+    def __init__(self, base: int, F: int, E_min: int, E_max: int, subnormales: bool = False,
+                 desbordamiento: str = 'saturar', con_signo: bool = True):
+        if base < 2:
+            raise ValueError("base debe ser >= 2")
+        if F < 0:
+            raise ValueError("F debe ser >= 0")
+        if E_min > E_max:
+            raise ValueError(f"E_min ({E_min}) no puede ser mayor que E_max ({E_max})")
+        if desbordamiento not in DESBORDAMIENTOS:
+            raise ValueError(f"Desbordamiento desconocido: {desbordamiento}. Modos: {', '.join(DESBORDAMIENTOS)}")
+        self.base = base
+        self.F = F
+        self.E_min = E_min
+        self.E_max = E_max
+        self.subnormales = subnormales
+        self.desbordamiento = desbordamiento
+        self.con_signo = con_signo
+        self._tope = _power(base, F + 1)  # Los significandos son < B^(F+1)
+
+    @classmethod
+    def de_ieee754(cls, ieee) -> 'FormatoFlotante':
+        """Formato de un IEEE754Gen (exponente máximo: E_max_encoded - 1 - bias)."""
+        return cls(ieee.base, ieee.F_bits, ieee.E_min, ieee.E_max_encoded - 1 - ieee.bias,
+                   subnormales=True, desbordamiento='infinito')
+
+    @classmethod
+    def de_punto_flotante(cls, fp) -> 'FormatoFlotante':
+        """Formato de un FixedPointFloating (sin subnormales, satura y anula)."""
+        return cls(fp.base, fp.F_M, fp.E_min, fp.E_max, subnormales=False,
+                   desbordamiento='saturar', con_signo=fp.signed)
+
+    def __repr__(self) -> str:
+        return (f"FormatoFlotante(base={self.base}, F={self.F}, E_min={self.E_min}, E_max={self.E_max}, "
+                f"subnormales={self.subnormales}, desbordamiento={self.desbordamiento!r})")
+
+    def maximo(self, signo: int = 0) -> Flotante:
+        """Mayor valor finito (B - B^-F) · B^E_max."""
+        return Flotante(signo, self._tope - 1, self.E_max - self.F)
+
+    # ------------------------------------------------------------------
+    # Redondeo
+    # ------------------------------------------------------------------
+
+    def _desborde(self, signo: int, rounding: str) -> Flotante:
+        """Resultado de un desbordamiento: infinito o el máximo según el modo."""
+        if self.desbordamiento == 'saturar' or rounding == 'toward_zero':
+            return self.maximo(signo)
+        if rounding in _MODOS_CERCANOS or (rounding == 'toward_positive') == (signo == 0):
+            return _infinito(signo)
+        return self.maximo(signo)
+
+    def _redondear(self, signo: int, N: int, D: int, k: int, rounding: str,
+                   traza: Optional[Dict] = None) -> Flotante:
+        """Redondea el valor exacto (-1)^signo · N/D · B^k (N, D > 0) al formato."""
+        if not self.con_signo and signo:
+            return _cero(0)  # Sin signo: los negativos se saturan a 0
+        B, F = self.base, self.F
+        e = k + _floor_log(Fraction(N, D), B)  # Exponente del primer dígito
+        t = (max(e, self.E_min) if self.subnormales else e) - F  # Exponente de la última cifra
+        if k >= t:
+            num, den = N * _power(B, k - t), D
+        else:
+            num, den = N, D * _power(B, t - k)
+        m = abs(round_div(-num if signo else num, den, rounding))
+
+        if traza is not None:
+            # Dos cifras más allá de la última: guarda y redondeo; sticky = ¿queda resto?
+            cifras, resto = divmod(num * B * B, den)
+            traza.update({
+                'exponente': e,
+                'truncado': cifras // (B * B),
+                'guarda': cifras // B % B,
+                'redondeo': cifras % B,
+                'sticky': resto != 0,
+                'incremento': m != cifras // (B * B),
+            })
+
+        if m == self._tope:  # El redondeo arrastra una cifra más: B^(F+1) → B^F
+            m //= B
+            t += 1
+        if m == 0:
+            return _cero(signo)
+        if t + F > self.E_max:
+            if traza is not None:
+                traza['desbordamiento'] = True
+            return self._desborde(signo, rounding)
+        if not self.subnormales and t + F < self.E_min:
+            if traza is not None:
+                traza['subdesbordamiento'] = True
+            return _cero(signo)
+        return Flotante(signo, m, t)
+
+    def redondear(self, valor, rounding: str = 'nearest_even') -> Flotante:
+        """Valor (int, float, Fraction, Decimal o str exacto) redondeado al formato."""
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Modo de redondeo desconocido: {rounding}. Modos: {', '.join(ROUNDING_MODES)}")
+        signo, magnitud, especial = _exact_value(valor)
+        if especial == 'nan':
+            if self.desbordamiento == 'saturar':
+                raise ValueError("NaN no es representable en el formato")
+            return NAN
+        if especial == 'inf':
+            if not self.con_signo and signo:
+                return _cero(0)
+            return self.maximo(signo) if self.desbordamiento == 'saturar' else _infinito(signo)
+        if magnitud == 0:
+            return _cero(signo if self.con_signo else 0)
+        return self._redondear(signo, magnitud.numerator, magnitud.denominator, 0, rounding)
+
+    def _operando(self, valor, rounding: str) -> Flotante:
+        return valor if isinstance(valor, Flotante) else self.redondear(valor, rounding)
+
+    # ------------------------------------------------------------------
+    # Valores
+    # ------------------------------------------------------------------
+
+    def a_fraccion(self, f: Flotante) -> Fraction:
+        """Valor exacto de un Flotante finito."""
+        if f.clase == 'cero':
+            return Fraction(0)
+        if f.clase != 'finito':
+            raise ValueError(f"El valor {f.clase} no tiene valor exacto")
+        valor = f.significando * Fraction(self.base) ** f.exponente
+        return -valor if f.signo else valor
+
+    def a_float(self, f: Flotante) -> float:
+        """Float de Python más cercano (±0.0, ±inf y nan incluidos)."""
+        if f.clase == 'nan':
+            return math.nan
+        if f.clase == 'infinito':
+            return -math.inf if f.signo else math.inf
+        if f.clase == 'cero':
+            return -0.0 if f.signo else 0.0
+        try:
+            return float(self.a_fraccion(f))
+        except OverflowError:
+            return -math.inf if f.signo else math.inf
+
+    def texto(self, f: Flotante) -> str:
+        """'+1.0110 × 2^3': significando con F cifras de fracción y exponente del primer dígito."""
+        if f.clase == 'nan':
+            return 'NaN'
+        signo = '-' if f.signo else '+'
+        if f.clase == 'infinito':
+            return f"{signo}∞"
+        cifras = entero_a_digitos(f.significando, self.base, mayusculas=True).rjust(self.F + 1, '0')
+        exponente = f.exponente + self.F if f.clase == 'finito' else 0
+        fraccion = f".{cifras[1:]}" if self.F else ''
+        return f"{signo}{cifras[0]}{fraccion} × {self.base}^{exponente}"
+
+    # ------------------------------------------------------------------
+    # Operaciones
+    # ------------------------------------------------------------------
+
+    def _sumar(self, a: Flotante, b: Flotante, rounding: str, traza: Optional[Dict]) -> Flotante:
+        if a.clase == 'nan' or b.clase == 'nan':
+            return NAN
+        if a.clase == 'infinito' or b.clase == 'infinito':
+            if a.clase == b.clase and a.signo != b.signo:
+                return NAN  # ∞ - ∞
+            return a if a.clase == 'infinito' else b
+
+        # Alinear al menor exponente: los significandos siguen siendo enteros
+        k = min(f.exponente for f in (a, b) if f.clase == 'finito') if 'finito' in (a.clase, b.clase) else 0
+        ma = a.significando * _power(self.base, a.exponente - k) if a.clase == 'finito' else 0
+        mb = b.significando * _power(self.base, b.exponente - k) if b.clase == 'finito' else 0
+        N = (-ma if a.signo else ma) + (-mb if b.signo else mb)
+        if traza is not None:
+            traza['alineacion'] = {'exponente': k, 'a': -ma if a.signo else ma, 'b': -mb if b.signo else mb}
+            traza['exacto'] = N * Fraction(self.base) ** k
+        if N == 0:
+            # Cero exacto: conserva el signo común; si no, +0 (-0 hacia -∞)
+            signo = a.signo if a.signo == b.signo else int(rounding == 'toward_negative')
+            return _cero(signo if self.con_signo else 0)
+        return self._redondear(int(N < 0), abs(N), 1, k, rounding, traza)
+
+    def _multiplicar(self, a: Flotante, b: Flotante, rounding: str, traza: Optional[Dict]) -> Flotante:
+        signo = a.signo ^ b.signo
+        if a.clase == 'nan' or b.clase == 'nan':
+            return NAN
+        if a.clase == 'infinito' or b.clase == 'infinito':
+            return NAN if 'cero' in (a.clase, b.clase) else _infinito(signo)
+        if a.clase == 'cero' or b.clase == 'cero':
+            return _cero(signo if self.con_signo else 0)
+        N, k = a.significando * b.significando, a.exponente + b.exponente
+        if traza is not None:
+            traza['exacto'] = (-N if signo else N) * Fraction(self.base) ** k
+        return self._redondear(signo, N, 1, k, rounding, traza)
+
+    def _dividir(self, a: Flotante, b: Flotante, rounding: str, traza: Optional[Dict]) -> Flotante:
+        signo = a.signo ^ b.signo
+        if b.clase == 'cero' and self.desbordamiento == 'saturar':
+            raise ValueError("División por cero")
+        if a.clase == 'nan' or b.clase == 'nan' or a.clase == b.clase == 'infinito' or a.clase == b.clase == 'cero':
+            return NAN
+        if a.clase == 'infinito' or b.clase == 'cero':
+            return _infinito(signo)
+        if a.clase == 'cero' or b.clase == 'infinito':
+            return _cero(signo if self.con_signo else 0)
+        N, D, k = a.significando, b.significando, a.exponente - b.exponente
+        if traza is not None:
+            traza['exacto'] = Fraction(-N if signo else N, D) * Fraction(self.base) ** k
+        return self._redondear(signo, N, D, k, rounding, traza)
+
+    def _operar(self, operacion: str, a, b, rounding: str, traza: Optional[Dict] = None) -> Flotante:
+        if operacion not in OPERACIONES:
+            raise ValueError(f"Operación desconocida: {operacion}. Operaciones: {', '.join(OPERACIONES)}")
+        a, b = self._operando(a, rounding), self._operando(b, rounding)
+        if operacion == 'subtract':
+            b = b if b.clase == 'nan' else b._replace(signo=1 - b.signo)
+            return self._sumar(a, b, rounding, traza)
+        if operacion == 'add':
+            return self._sumar(a, b, rounding, traza)
+        if operacion == 'multiply':
+            return self._multiplicar(a, b, rounding, traza)
+        return self._dividir(a, b, rounding, traza)
+
+    def operar(self, operacion: str, a, b, rounding: str = 'nearest_even') -> Flotante:
+        """
+        a <operacion> b con un único redondeo. Los operandos que no son
+        Flotante se redondean antes al formato (como al cargarlos en registros).
+        """
+        return self._operar(operacion, a, b, rounding)
+
+    def sumar(self, a, b, rounding: str = 'nearest_even') -> Flotante:
+        return self._operar('add', a, b, rounding)
+
+    def restar(self, a, b, rounding: str = 'nearest_even') -> Flotante:
+        return self._operar('subtract', a, b, rounding)
+
+    def multiplicar(self, a, b, rounding: str = 'nearest_even') -> Flotante:
+        return self._operar('multiply', a, b, rounding)
+
+    def dividir(self, a, b, rounding: str = 'nearest_even') -> Flotante:
+        return self._operar('divide', a, b, rounding)
+
+    def operar_traza(self, operacion: str, a, b, rounding: str = 'nearest_even') -> Dict:
+        """
+        Operación con sus pasos: operandos en el formato, alineación (suma),
+        resultado exacto, cifras G/R/S y resultado redondeado.
+        """
+        fa, fb = self._operando(a, rounding), self._operando(b, rounding)
+        traza: Dict = {}
+        resultado = self._operar(operacion, fa, fb, rounding, traza)
+
+        pasos = [f"a = {self.texto(fa)}", f"b = {self.texto(fb)}"]
+        if 'alineacion' in traza:
+            alineacion = traza['alineacion']
+            pasos.append(f"Alinear a {self.base}^{alineacion['exponente']}: "
+                         f"{alineacion['a']} + {alineacion['b']}")
+        if 'exacto' in traza:
+            pasos.append(f"Resultado exacto: {traza['exacto']}")
+        if 'guarda' in traza:
+            pasos.append(f"Normalizar: exponente {traza['exponente']}, "
+                         f"G={traza['guarda']} R={traza['redondeo']} S={int(traza['sticky'])}")
+            pasos.append(f"Redondeo {rounding}: " + ("se incrementa el significando" if traza['incremento']
+                                                      else "se trunca"))
+        if traza.get('desbordamiento'):
+            pasos.append("Desbordamiento")
+        if traza.get('subdesbordamiento'):
+            pasos.append("Subdesbordamiento: el resultado se anula")
+        pasos.append(f"Resultado: {self.texto(resultado)}")
+
+        exacto = traza.get('exacto')
+        return {
+            'operacion': operacion,
+            'rounding': rounding,
+            'a': self.texto(fa),
+            'b': self.texto(fb),
+            'exacto': None if exacto is None else str(exacto),
+            'guarda': traza.get('guarda'),
+            'redondeo': traza.get('redondeo'),
+            'sticky': traza.get('sticky'),
+            'desbordamiento': traza.get('desbordamiento', False),
+            'subdesbordamiento': traza.get('subdesbordamiento', False),
+            'resultado': self.texto(resultado),
+            'valor': self.a_float(resultado),
+            'pasos': pasos,
+        }
+
+    # ------------------------------------------------------------------
+    # Lotes
+    # ------------------------------------------------------------------
+
+    def vectorizable(self, rounding: str) -> bool:
+        """¿Puede operar_lote usar float64? (binario, p ≤ 25, 'nearest_even' y rango cubierto)."""
+        if not HAS_NUMPY or rounding != 'nearest_even' or self.base != 2 or self.F > 24:
+            return False
+        # Exponentes de la última cifra más pequeña y del máximo: productos y
+        # cocientes de extremos deben quedar en el rango normal de float64
+        bajo, alto = self.E_min - self.F, self.E_max + 1
+        return min(2 * bajo, bajo - alto) >= -1021 and max(2 * alto, alto - bajo) <= 1023
+
+    def _redondear_array(self, y):
+        """Redondeo 'nearest_even' de un array float64 al formato binario."""
+        a = np.abs(y)
+        finito = np.isfinite(y) & (a > 0)
+        _, e = np.frexp(np.where(finito, a, 1.0))
+        e = e - 1  # |y| = 1.xxx · 2^e
+        if self.subnormales:
+            e = np.maximum(e, self.E_min)
+        n = np.rint(np.ldexp(np.where(finito, y, 0.0), self.F - e))
+        q = np.where(finito, np.ldexp(n, e - self.F), y)  # Exacto: n tiene F+1 bits como mucho
+        e = np.where(np.abs(n) >= float(self._tope), e + 1, e)  # Acarreo de B^(F+1)
+
+        desborda = finito & (e > self.E_max)
+        if self.desbordamiento == 'saturar':
+            if np.isnan(y).any():
+                raise ValueError("NaN no es representable en el formato")
+            desborda |= np.isinf(y)
+            q = np.where(desborda, np.copysign(float(self.a_fraccion(self.maximo())), y), q)
+        else:
+            q = np.where(desborda, np.copysign(np.inf, y), q)
+        if not self.subnormales:
+            q = np.where(finito & (e < self.E_min), np.copysign(0.0, y), q)
+        if not self.con_signo:
+            q = np.where(np.signbit(y), 0.0, q)
+        return q
+
+    def operar_lote(self, operacion: str, xs, ys, rounding: str = 'nearest_even'):
+        """
+        operar(operacion, x, y) para cada par; devuelve floats (array con NumPy).
+
+        Si el formato es vectorizable: redondeo de los operandos, operación en
+        float64 y un redondeo del resultado, todo sobre arrays.
+        """
+        if operacion not in OPERACIONES:
+            raise ValueError(f"Operación desconocida: {operacion}. Operaciones: {', '.join(OPERACIONES)}")
+        if not self.vectorizable(rounding):
+            resultado = [self.a_float(self._operar(operacion, x, y, rounding)) for x, y in zip(xs, ys)]
+            return np.asarray(resultado, dtype=np.float64) if HAS_NUMPY else resultado
+
+        x = self._redondear_array(np.asarray(xs, dtype=np.float64))
+        y = self._redondear_array(np.asarray(ys, dtype=np.float64))
+        if x.shape != y.shape:
+            raise ValueError(f"Los lotes deben tener la misma longitud: {x.shape} y {y.shape}")
+        if operacion == 'divide' and self.desbordamiento == 'saturar' and (y == 0).any():
+            raise ValueError("División por cero")
+        with np.errstate(all='ignore'):
+            if operacion == 'add':
+                z = x + y
+            elif operacion == 'subtract':
+                z = x - y
+            elif operacion == 'multiply':
+                z = x * y
+            else:
+                z = x / y
+        return self._redondear_array(z)
+
+
+# ============================================================================
+# CONTRASTE CON struct (binary32)
+# ============================================================================
+
+def _a_binary32(valor: float) -> bytes:
+    """Bytes de float32 de struct; los valores que redondean a infinito dan ±inf."""
+    try:
+        return struct.pack('<f', valor)
+    except OverflowError:
+        return struct.pack('<f', math.copysign(math.inf, valor))
+
+
+def _binary32_aleatorio(generador: random.Random) -> float:
+    while True:
+        valor = struct.unpack('<f', generador.getrandbits(32).to_bytes(4, 'little'))[0]
+        if not math.isnan(valor):
+            return valor
+
+
+def verificar_binary32(n: int = 10000, seed: int = 0, operaciones=OPERACIONES) -> Dict:
+    """
+    Contrasta el motor (camino entero) con struct en n pares de binary32
+    aleatorios por operación ('nearest_even').
+
+    Referencia: la operación en float64 (exacta o con doble redondeo inocuo)
+    empaquetada con struct.pack('f'). La mitad de los pares comparten
+    exponente (cancelaciones y empates en la suma).
+
+    Returns:
+        {'casos': int, 'discrepancias': [{'operacion', 'a', 'b', 'esperado', 'obtenido'}, ...]}
+    """
+    from core.ieee754 import IEEE754Gen
+
+    formato = FormatoFlotante.de_ieee754(IEEE754Gen(E_bits=8, F_bits=23))
+    generador = random.Random(seed)
+    operadores = {'add': lambda a, b: a + b, 'subtract': lambda a, b: a - b,
+                  'multiply': lambda a, b: a * b, 'divide': lambda a, b: a / b if b else None}
+    discrepancias: List[Dict] = []
+    casos = 0
+    for _ in range(n):
+        a = _binary32_aleatorio(generador)
+        if generador.random() < 0.5:
+            bits = struct.unpack('<I', struct.pack('<f', a))[0] ^ generador.getrandbits(23)
+            b = struct.unpack('<f', struct.pack('<I', bits ^ (generador.getrandbits(1) << 31)))[0]
+        else:
+            b = _binary32_aleatorio(generador)
+        for operacion in operaciones:
+            casos += 1
+            try:
+                exacto = operadores[operacion](a, b)
+            except (OverflowError, ValueError):
+                exacto = math.nan  # inf - inf, etc. en Python
+            if exacto is None:  # x / 0 en IEEE
+                exacto = math.nan if a == 0 or math.isnan(a) else math.copysign(math.inf, a) * math.copysign(1.0, b)
+            obtenido = formato.a_float(formato.operar(operacion, a, b))
+            if math.isnan(exacto) and math.isnan(obtenido):
+                continue
+            if math.isnan(exacto) or math.isnan(obtenido) or _a_binary32(exacto) != _a_binary32(obtenido):
+                discrepancias.append({'operacion': operacion, 'a': a, 'b': b,
+                                      'esperado': struct.unpack('<f', _a_binary32(exacto))[0],
+                                      'obtenido': obtenido})
+    return {'casos': casos, 'discrepancias': discrepancias}
@@ -0,0 +1,263 @@
+"""
+Expansiones periódicas exactas de números racionales en base B.
+
+Un racional x = p/q (irreducible) tiene en base B una expansión
+
+    x = entera . anteperiodo (periodo)
+
+que siempre es finita o periódica. Las longitudes salen del denominador:
+
+    q = q1 · q2   con q1 formado solo por primos de B y mcd(q2, B) = 1
+    anteperiodo μ = menor k tal que q1 | B^k   (se obtiene quitando mcd(q, B))
+    periodo     λ = orden de B módulo q2       (0 si q2 = 1: expansión finita)
+
+Los dígitos se calculan con la división larga entera (resto r → dígito
+r·B // q, resto r·B mod q). El resto tras μ dígitos, r_μ, es el primero del
+ciclo: el periodo termina cuando vuelve a aparecer. Basta con guardar r_μ,
+así que cuesta O(μ + λ) operaciones y O(1) memoria extra; el dígito n-ésimo
+de cualquier n se lee de la expansión sin volver a multiplicar.
+
+Ejemplo:
+    e = expansion_periodica(Fraction(1, 10), 2)
+    str(e)          → '0.0(0011)'
+    e.digitos(10)   → [0, 0, 0, 1, 1, 0, 0, 1, 1, 0]
+    fraccion_desde_cadena('0.0(0011)', 2) → Fraction(1, 10)
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from fractions import Fraction
+from typing import Dict, Iterator, List, Optional, Tuple
+import math
+
+from core.conversion_enteros_grandes import digitos_a_entero, entero_a_digitos
+
+_DIGITOS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+def _validar_base(base: int, texto: bool = True) -> None:
+    """Con dígitos como caracteres la base llega a 36; como enteros, a cualquiera ≥ 2."""
+    if base < 2 or (texto and base > 36):
+        raise ValueError(f"Base debe estar entre 2 y 36. base={base}")
+
+
+def _a_fraccion(x) -> Fraction:
+    """int, Fraction, Decimal o str → Fraction exacta (los float por su repr más corta)."""
+    if isinstance(x, float):
+        if not math.isfinite(x):
+            raise ValueError(f"Valor no finito: {x}")
+        x = repr(x)
+    if isinstance(x, Decimal) and not x.is_finite():
+        raise ValueError(f"Valor no finito: {x}")
+    return Fraction(x)
+
+
+def longitud_anteperiodo(denominador: int, base: int) -> Tuple[int, int]:
+    """
+    (μ, q2): dígitos del anteperiodo de 1/denominador en base B y la parte
+    del denominador coprima con B (q2 = 1 ⇔ la expansión es finita).
+    """
+    mu = 0
+    g = math.gcd(denominador, base)
+    while g > 1:
+        denominador //= g
+        mu += 1
+        g = math.gcd(denominador, base)
+    return mu, denominador
+
+
+@dataclass(frozen=True)
+class ExpansionPeriodica:
+    """Expansión exacta de un racional: signo, parte entera, anteperiodo y periodo."""
+    valor: Fraction
+    base: int
+    negativo: bool
+    entera: str                     # Dígitos de la parte entera
+    anteperiodo: Tuple[int, ...]
+    periodo: Tuple[int, ...]        # Vacío si la expansión es finita
+
+    @property
+    def es_finita(self) -> bool:
+        return not self.periodo
+
+    def digito(self, n: int) -> int:
+        """Dígito fraccionario n-ésimo (n = 0 es el primero tras el punto)."""
+        if n < 0:
+            raise ValueError(f"El índice de dígito debe ser no negativo. n={n}")
+        mu = len(self.anteperiodo)
+        if n < mu:
+            return self.anteperiodo[n]
+        if not self.periodo:
+            return 0
+        return self.periodo[(n - mu) % len(self.periodo)]
+
+    def digitos(self, n: int) -> List[int]:
+        """Primeros n dígitos fraccionarios (rellenando con ceros si es finita)."""
+        if n < 0:
+            raise ValueError(f"El número de dígitos debe ser no negativo. n={n}")
+        cabeza = list(self.anteperiodo[:n])
+        resto = n - len(cabeza)
+        if resto == 0:
+            return cabeza
+        if not self.periodo:
+            return cabeza + [0] * resto
+        vueltas, parcial = divmod(resto, len(self.periodo))
+        return cabeza + list(self.periodo) * vueltas + list(self.periodo[:parcial])
+
+    def truncar(self, n: int) -> Fraction:
+        """Valor con solo n dígitos fraccionarios (truncado hacia cero)."""
+        magnitud = abs(self.valor)
+        escala = self.base ** n
+        truncado = Fraction(magnitud.numerator * escala // magnitud.denominator, escala)
+        return -truncado if self.negativo else truncado
+
+    def pasos(self, n: Optional[int] = None) -> Iterator[Dict]:
+        """
+        Traza de las multiplicaciones sucesivas, generada al pedirla.
+
+        Cada paso es {'iteration', 'fraction', 'product', 'digit', 'remainder'}
+        con Fraction exactas. Sin n se recorre anteperiodo + un periodo.
+        """
+        if n is None:
+            n = len(self.anteperiodo) + len(self.periodo)
+        return pasos_fraccion(self.valor, self.base, n)
+
+    def __str__(self) -> str:
+        texto = ('-' if self.negativo else '') + self.entera
+        if not self.anteperiodo and not self.periodo:
+            return texto
+        texto += '.' + ''.join(_DIGITOS[d] for d in self.anteperiodo)
+        if self.periodo:
+            texto += '(' + ''.join(_DIGITOS[d] for d in self.periodo) + ')'
+        return texto
+
+
+def _division_larga(resto: int, denominador: int, base: int, n: int) -> Tuple[List[int], int]:
+    """n dígitos de resto/denominador en base B y el resto final."""
+    digitos = []
+    for _ in range(n):
+        digito, resto = divmod(resto * base, denominador)
+        digitos.append(digito)
+    return digitos, resto
+
+
+def expansion_periodica(x, base: int, max_digitos: Optional[int] = None) -> ExpansionPeriodica:
+    """
+    Expansión exacta de x (int, Fraction, Decimal, float o str) en base B.
+
+    Args:
+        max_digitos: cota de μ + λ; si la expansión es más larga se lanza
+            ValueError en lugar de calcularla (para entradas no confiables)
+    """
+    _validar_base(base)
+    valor = _a_fraccion(x)
+    magnitud = abs(valor)
+    p, q = magnitud.numerator, magnitud.denominator
+    entera, resto = divmod(p, q)
+
+    mu, q2 = longitud_anteperiodo(q, base)
+    if max_digitos is not None and mu > max_digitos:
+        raise ValueError(f"El anteperiodo ({mu} dígitos) supera max_digitos={max_digitos}")
+    anteperiodo, inicio = _division_larga(resto, q, base, mu)
+
+    periodo = []
+    if q2 > 1:
+        # El ciclo empieza en el resto r_μ y termina cuando vuelve a aparecer
+        limite = None if max_digitos is None else max_digitos - mu
+        resto = inicio
+        while True:
+            if limite is not None and len(periodo) >= limite:
+                raise ValueError(f"La expansión de {valor} en base {base} supera "
+                                 f"max_digitos={max_digitos}")
+            digito, resto = divmod(resto * base, q)
+            periodo.append(digito)
+            if resto == inicio:
+                break
+
+    return ExpansionPeriodica(valor, base, valor < 0, entero_a_digitos(entera, base, mayusculas=True),
+                              tuple(anteperiodo), tuple(periodo))
+
+
+def digitos_fraccion(x, base: int, n: int) -> List[int]:
+    """
+    Primeros n dígitos fraccionarios de x en base B (cualquier B ≥ 2).
+
+    Solo calcula min(n, μ + λ) dígitos: al detectar el periodo el resto se
+    copia, así que n puede ser mucho mayor que el periodo, y un periodo más
+    largo que n no se llega a recorrer.
+    """
+    _validar_base(base, texto=False)
+    magnitud = abs(_a_fraccion(x))
+    q = magnitud.denominator
+    resto = magnitud.numerator % q
+    mu, q2 = longitud_anteperiodo(q, base)
+    cabeza, inicio = _division_larga(resto, q, base, min(n, mu))
+    if n <= mu or q2 == 1:
+        return cabeza + [0] * (n - len(cabeza))
+
+    periodo = []
+    resto = inicio
+    while len(periodo) < n - mu:
+        digito, resto = divmod(resto * base, q)
+        periodo.append(digito)
+        if resto == inicio:
+            break
+    vueltas, parcial = divmod(n - mu, len(periodo))
+    return cabeza + periodo * vueltas + periodo[:parcial]
+
+
+def pasos_fraccion(x, base: int, n: int) -> Iterator[Dict]:
+    """
+    Traza de las multiplicaciones sucesivas de la parte fraccionaria de x en
+    base B (cualquier B ≥ 2): hasta n pasos, menos si la expansión termina.
+    """
+    _validar_base(base, texto=False)
+    magnitud = abs(_a_fraccion(x))
+    actual = magnitud - magnitud.numerator // magnitud.denominator
+    for i in range(n):
+        if actual == 0:
+            return
+        producto = actual * base
+        digito = producto.numerator // producto.denominator
+        resto = producto - digito
+        yield {
+            'iteration': i + 1,
+            'fraction': actual,
+            'product': producto,
+            'digit': digito,
+            'remainder': resto,
+        }
+        actual = resto
+
+
+def fraccion_desde_cadena(texto: str, base: int) -> Fraction:
+    """
+    Cadena '[-]entera[.anteperiodo[(periodo)]]' en base B → Fraction exacta.
+
+    Ejemplo: fraccion_desde_cadena('0.0(0011)', 2) → Fraction(1, 10)
+    """
+    _validar_base(base)
+    texto = texto.strip()
+    negativo = texto.startswith('-')
+    if negativo or texto.startswith('+'):
+        texto = texto[1:]
+    entera, _, fraccionaria = texto.partition('.')
+    periodo = ''
+    if fraccionaria.endswith(')') and '(' in fraccionaria:
+        fraccionaria, _, periodo = fraccionaria[:-1].partition('(')
+        if not periodo:
+            raise ValueError(f"Periodo vacío en '{texto}'")
+    if not entera and not fraccionaria and not periodo:
+        raise ValueError(f"'{texto}' no es un número válido en base {base}")
+
+    try:
+        valor = Fraction(digitos_a_entero(entera, base) if entera else 0)
+        if fraccionaria:
+            valor += Fraction(digitos_a_entero(fraccionaria, base), base ** len(fraccionaria))
+        if periodo:
+            # 0.(p) = p / (B^λ - 1), desplazado μ posiciones
+            valor += Fraction(digitos_a_entero(periodo, base),
+                              (base ** len(periodo) - 1) * base ** len(fraccionaria))
+    except ValueError:
+        raise ValueError(f"'{texto}' no es un número válido en base {base}") from None
+    return -valor if negativo else valor
@@ -10,11 +10,111 @@ Incluye:
 Bit de signo: 0 = positivo, 1 = negativo
 Exponente: formato exceso K (bias)
 Mantisa: implícito "1." para normalizados, "0." para denormalizados
+
+Codificación exacta:
+    encode/decode trabajan con enteros y fractions.Fraction (sin logaritmos
+    ni Decimal): el exponente se obtiene comparando con potencias enteras de
+    la base y la mantisa se redondea según ROUNDING_MODES. Para lotes,
+    encode_many/decode_many usan NumPy (base 2, hasta 64 bits) o array('Q').
+
+Enumeración exhaustiva:
+    enumerate_codes devuelve, para formatos de hasta 2^24 códigos, columnas
+    (código, valor, ulp, clase) de todos los patrones, calculadas por bandas
+    de exponente y memoizadas por formato; export_codes las vuelca en CSV o
+    JSON Lines por trozos.
 """
 
+from array import array
 from decimal import Decimal
-from typing import Tuple, Union
+from fractions import Fraction
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import json
 import math
+import struct
+
+from core.descriptores_formato import format_descriptor
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Modos de redondeo IEEE 754 (roundTiesToEven es el modo por defecto del estándar)
+ROUNDING_MODES = ('nearest_even', 'nearest_away', 'toward_zero', 'toward_positive', 'toward_negative')
+
+# Formatos binarios estándar con equivalente en struct: (E_bits, F_bits) → código
+STRUCT_FORMATS = {(5, 10): 'e', (8, 23): 'f', (11, 52): 'd'}
+
+# Clases de patrón de enumerate_codes (la columna 'class' guarda el índice)
+CODE_CLASSES = ('zero', 'subnormal', 'normal', 'infinity', 'qNaN', 'sNaN')
+CODE_ZERO, CODE_SUBNORMAL, CODE_NORMAL, CODE_INFINITY, CODE_QNAN, CODE_SNAN = range(6)
+
+# Límite de enumerate_codes (~21 bytes por código con NumPy: 2^24 códigos ≈ 336 MB)
+MAX_ENUMERATED_CODES = 1 << 24
+
+# Solo se memorizan los formatos de hasta este número de códigos (≈ 1.4 MB cada uno)
+MAX_CACHED_CODES = 1 << 16
+
+
+@lru_cache(maxsize=1024)
+def _power(base: int, exponent: int) -> int:
+    """base^exponent (exponent >= 0), cacheado: los mismos exponentes se repiten en cada valor."""
+    return base ** exponent
+
+
+def _exact_value(value) -> Tuple[int, Optional[Fraction], Optional[str]]:
+    """
+    Valor de entrada → (signo, |valor| exacto, especial).
+
+    Acepta int, float, Fraction, Decimal o str ("0.1" se interpreta como el
+    decimal exacto 1/10, no como el float más cercano). especial es None,
+    'inf' o 'nan'.
+    """
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            value = Fraction(text)
+        except ValueError:
+            value = float(text)  # 'inf', '-inf', 'nan'
+    elif isinstance(value, Decimal) and not value.is_finite():
+        value = float(value)
+    elif not isinstance(value, (int, float, Fraction, Decimal)):
+        value = float(value)  # Escalares de NumPy, etc.
+
+    if isinstance(value, float):
+        if math.isnan(value):
+            return 0, None, 'nan'
+        sign = 1 if math.copysign(1.0, value) < 0 else 0
+        if math.isinf(value):
+            return sign, None, 'inf'
+        return sign, Fraction(abs(value)), None  # Fraction(float) es exacto
+
+    exact = Fraction(value)
+    return (1 if exact < 0 else 0), abs(exact), None
+
+
+def _floor_scaled(x: Fraction, base: int, k: int) -> Tuple[int, bool]:
+    """(floor(x · base^k), ¿exacto?) solo con aritmética entera."""
+    if k >= 0:
+        q, r = divmod(x.numerator * _power(base, k), x.denominator)
+    else:
+        q, r = divmod(x.numerator, x.denominator * _power(base, -k))
+    return q, r == 0
+
+
+def _floor_log(x: Fraction, base: int) -> int:
+    """floor(log_base(x)) exacto para x > 0 (estimación por bit_length + ajuste entero)."""
+    n, d = x.numerator, x.denominator
+    e = math.floor((n.bit_length() - d.bit_length()) / math.log2(base))
+    # Invariante buscado: base^e <= x < base^(e+1)
+    while _floor_scaled(x, base, -e)[0] < 1:
+        e -= 1
+    while _floor_scaled(x, base, -(e + 1))[0] >= 1:
+        e += 1
+    return e
 
 
 class IEEE754Gen:
@@ -57,12 +157,15 @@ class IEEE754Gen:
         if base < 2:
             raise ValueError("base debe ser >= 2")
         
+        # Características del formato (compartidas entre instancias)
+        self.descriptor = format_descriptor('ieee754', E_bits, F_bits, base)
+        
         # Bias para exponente (formato exceso K)
         # Bias = B^(E_bits-1) - 1
-        self.bias = (base ** (E_bits - 1)) - 1
+        self.bias = self.descriptor.bias
         
         # Valores extremos de exponente
-        self.E_max_encoded = base ** E_bits - 1  # Todos 1s: para NaN e infinito
+        self.E_max_encoded = self.descriptor.E_max_encoded  # Todos 1s: para NaN e infinito
         self.E_min_encoded = 1  # Para denormalizados
         self.E_zero_encoded = 0  # Para denormalizados
         
@@ -71,7 +174,11 @@ class IEEE754Gen:
         self.E_max = self.bias - 1  # Exponente máximo para normalizados
         
         # Precisión (máxima mantisa fraccionaria)
-        self.epsilon = Decimal(base) ** (-F_bits)
+        self.epsilon = self.descriptor.epsilon_decimal
+        
+        # Enteros de la codificación exacta
+        self.total_bits = 1 + E_bits + F_bits
+        self._scale = self.descriptor.scale  # Mantisa entera: M / B^F
         
     def __repr__(self) -> str:
         return f"IEEE754Gen(E_bits={self.E_bits}, F_bits={self.F_bits}, base={self.base})"
@@ -79,43 +186,22 @@ class IEEE754Gen:
     @property
     def info(self) -> dict:
         """Información de la representación."""
-        return {
-            'E_bits': self.E_bits,
-            'F_bits': self.F_bits,
-            'total_bits': 1 + self.E_bits + self.F_bits,
-            'bias': self.bias,
-            'E_min': self.E_min,
-            'E_max': self.E_max,
-            'epsilon': float(self.epsilon),
-            'normalized_min': float(Decimal(1) * Decimal(self.base) ** self.E_min),
-            'denormalized_min': float(self.epsilon * Decimal(self.base) ** self.E_min),
-            'max': float((Decimal(2) - self.epsilon) * Decimal(self.base) ** self.E_max),
-        }
-    
-    def encode_normalized(self, value: float) -> Tuple[int, int, int]:
+        return self.descriptor.ieee_info()
+    
+    def encode_normalized(self, value, rounding: str = 'nearest_even') -> Tuple[int, int, int]:
         """
         Codificar número normalizado.
         
         Returns:
             (sign, E_encoded, M_encoded)
         """
-        if value == 0:
+        sign, magnitude, special = _exact_value(value)
+        if special is not None:
+            raise ValueError(f"Valor {value} es infinito o NaN")
+        if magnitude == 0:
             return (0, 0, 0)
         
-        # Signo
-        sign = 0 if value >= 0 else 1
-        value = abs(value)
-        
-        # Normalizar: encontrar E tal que 1 ≤ M < 2
-        E = math.floor(math.log(value, self.base))
-        M = value / (self.base ** E)
-        
-        # Codificar mantisa (solo fraccionaria, el 1 es implícito)
-        M_frac = M - 1  # Parte fraccionaria
-        M_encoded = int(M_frac * (self.base ** self.F_bits))
-        
-        # Codificar exponente (exceso K)
-        E_encoded = E + self.bias
+        E_encoded, M_encoded = self._round_magnitude(sign, magnitude, rounding)
         
         # Validar rango
         if E_encoded < self.E_min_encoded:
@@ -125,36 +211,25 @@ class IEEE754Gen:
         
         return (sign, E_encoded, M_encoded)
     
-    def encode_denormalized(self, value: float) -> Tuple[int, int, int]:
+    def encode_denormalized(self, value, rounding: str = 'nearest_even') -> Tuple[int, int, int]:
         """
         Codificar número denormalizado (subnormal).
         
         Formato: ±0.M × B^E_min
-        Usado para valores muy pequeños cerca de 0.
+        Usado para valores muy pequeños cerca de 0. Si el redondeo alcanza
+        B^E_min, devuelve el menor normalizado (E_encoded = 1, M = 0).
         """
-        if value == 0:
+        sign, magnitude, special = _exact_value(value)
+        if special is not None:
+            raise ValueError(f"Valor {value} es infinito o NaN")
+        if magnitude == 0:
             return (0, 0, 0)
         
-        # Signo
-        sign = 0 if value >= 0 else 1
-        value = abs(value)
-        
-        # Para denormalizados: valor = 0.M × B^E_min
-        # E_min = 1 - bias
-        # M = valor / (B^E_min)
-        E_min_real = self.E_min
-        M = value / (self.base ** E_min_real)
-        
-        # Validar que M < 1
-        if M >= 1:
+        # Validar que |valor| < B^E_min (mantisa 0.M < 1)
+        if _floor_scaled(magnitude, self.base, -self.E_min)[0] >= 1:
             raise ValueError(f"Valor {value} no es denormalizado, es normalizado")
         
-        # Codificar mantisa (0.M)
-        M_encoded = int(M * (self.base ** self.F_bits))
-        
-        # Exponente encoded es 0 para denormalizados
-        E_encoded = 0
-        
+        E_encoded, M_encoded = self._round_magnitude(sign, magnitude, rounding)
         return (sign, E_encoded, M_encoded)
     
     def encode_infinity(self, positive: bool = True) -> Tuple[int, int, int]:
@@ -189,9 +264,9 @@ class IEEE754Gen:
         
         return (sign, E_encoded, M_encoded)
     
-    def encode(self, value: float) -> int:
+    def encode(self, value, rounding: str = 'nearest_even') -> int:
         """
-        Codificar un número flotante a su representación IEEE 754 de 32 bits.
+        Codificar un número a su representación IEEE 754 completa.
         
         Este método determina automáticamente si el número es:
         - Normalizado
@@ -199,41 +274,121 @@ class IEEE754Gen:
         - Especial (infinito, NaN)
         
         Args:
-            value: número flotante a codificar
+            value: número a codificar (float, int, Fraction, Decimal o str exacto)
+            rounding: modo de redondeo (ROUNDING_MODES)
             
         Returns:
-            int: representación IEEE 754 completa como entero
+            int: representación IEEE 754 completa como entero [signo|exponente|mantisa]
         """
-        # Casos especiales
-        if math.isnan(value):
-            sign, E_enc, M_enc = self.encode_nan(quiet=True)
-        elif math.isinf(value):
-            sign, E_enc, M_enc = self.encode_infinity(positive=(value > 0))
+        sign, E_enc, M_enc = self.encode_exact(value, rounding)
+        return self.pack(sign, E_enc, M_enc)
+    
+    def encode_exact(self, value, rounding: str = 'nearest_even') -> Tuple[int, int, int]:
+        """
+        Codificación exacta: (sign, E_encoded, M_encoded) del valor redondeado.
+        
+        Solo usa enteros: el exponente se obtiene comparando con potencias de
+        la base y la mantisa se redondea entre los dos códigos vecinos del valor.
+        Los valores que desbordan dan ±∞ o el máximo finito según el modo.
+        """
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Modo de redondeo desconocido: {rounding}. Modos: {', '.join(ROUNDING_MODES)}")
+        
+        sign, magnitude, special = _exact_value(value)
+        if special == 'nan':
+            return self.encode_nan(quiet=True)
+        if special == 'inf':
+            return self.encode_infinity(positive=(sign == 0))
+        if magnitude == 0:
+            return (sign, 0, 0)
+        
+        E_enc, M_enc = self._round_magnitude(sign, magnitude, rounding)
+        return (sign, E_enc, M_enc)
+    
+    def _magnitude(self, E_encoded: int, M_encoded: int) -> Fraction:
+        """Valor exacto (sin signo) de un código finito; (E_max_encoded, 0) = B^(E_max+1) virtual."""
+        if E_encoded == 0:
+            significand, exponent = M_encoded, self.E_min - self.F_bits
         else:
-            # Intentar normalizado primero
-            try:
-                sign, E_enc, M_enc = self.encode_normalized(value)
-            except ValueError:
-                # Si no es normalizado, intenta denormalizado
-                try:
-                    sign, E_enc, M_enc = self.encode_denormalized(value)
-                except ValueError:
-                    # Si aún no cabe, es infinito
-                    positive = value > 0
-                    sign, E_enc, M_enc = self.encode_infinity(positive=positive)
-        
-        # Combinar en un entero: [signo|exponente|mantisa]
-        total_bits = 1 + self.E_bits + self.F_bits
-        result = (sign << (self.E_bits + self.F_bits)) | (E_enc << self.F_bits) | M_enc
-        return result
+            significand, exponent = self._scale + M_encoded, E_encoded - self.bias - self.F_bits
+        if exponent >= 0:
+            return Fraction(significand * _power(self.base, exponent))
+        return Fraction(significand, _power(self.base, -exponent))
+    
+    def _round_magnitude(self, sign: int, x: Fraction, rounding: str) -> Tuple[int, int]:
+        """(E_encoded, M_encoded) de x > 0: elige entre el código inferior y el superior."""
+        base, scale = self.base, self._scale
+        e = _floor_log(x, base)
+        
+        if e + self.bias >= self.E_max_encoded:
+            # Más allá del último exponente: entre el máximo finito y ∞
+            lower, upper = (self.E_max_encoded - 1, scale - 1), (self.E_max_encoded, 0)
+        elif e < self.E_min:
+            # Subnormal: x = (m / B^F) · B^E_min
+            m, exact = _floor_scaled(x, base, self.F_bits - self.E_min)
+            if exact:
+                return (0, m) if m < scale else (1, 0)
+            lower = (0, m)
+            upper = (0, m + 1) if m + 1 < scale else (1, 0)
+        else:
+            # Normalizado: x = (1 + m / B^F) · B^e
+            m, exact = _floor_scaled(x, base, self.F_bits - e)
+            m -= scale
+            E_enc = e + self.bias
+            if exact and m < scale:
+                return (E_enc, m)
+            if m >= scale:
+                # Bases > 2: mantisa >= 2 queda entre (2 - B^-F)·B^e y B^(e+1)
+                lower, upper = (E_enc, scale - 1), (E_enc + 1, 0)
+            else:
+                lower = (E_enc, m)
+                upper = (E_enc, m + 1) if m + 1 < scale else (E_enc + 1, 0)
+        
+        if rounding == 'toward_zero':
+            return lower
+        if rounding == 'toward_positive':
+            return upper if sign == 0 else lower
+        if rounding == 'toward_negative':
+            return upper if sign == 1 else lower
+        
+        # Al más cercano: comparar distancias exactas
+        below = x - self._magnitude(*lower)
+        above = self._magnitude(*upper) - x
+        if below < above:
+            return lower
+        if above < below:
+            return upper
+        if rounding == 'nearest_away':
+            return upper
+        return lower if lower[1] % 2 == 0 else upper
     
     def decode(self, sign: int, E_encoded: int, M_encoded: int) -> Union[float, str]:
         """
         Decodificar IEEE 754.
         
         Returns:
-            float: valor normal/denormalizado
-            str: "inf", "-inf", "qNaN", "sNaN"
+            float: valor normal/denormalizado (redondeado una sola vez a float)
+            str: "qNaN", "sNaN"
+        """
+        value = self.decode_exact(sign, E_encoded, M_encoded)
+        if isinstance(value, (str, float)):
+            return value
+        
+        # Cociente de enteros: Python lo redondea correctamente a float
+        try:
+            result = value.numerator / value.denominator
+        except OverflowError:
+            result = math.inf if value > 0 else -math.inf
+        return math.copysign(result, -1.0 if sign == 1 else 1.0)
+    
+    def decode_exact(self, sign: int, E_encoded: int, M_encoded: int) -> Union[Fraction, float, str]:
+        """
+        Decodificar sin redondeo.
+        
+        Returns:
+            Fraction: valor exacto de un código finito (±0 → Fraction(0))
+            float: ±inf
+            str: "qNaN", "sNaN"
         """
         # Casos especiales
         if E_encoded == self.E_max_encoded:
@@ -241,28 +396,11 @@ class IEEE754Gen:
             if M_encoded == 0:
                 # Infinito
                 return float('inf') if sign == 0 else float('-inf')
-            else:
-                # NaN
-                MSB = M_encoded >= (self.base ** (self.F_bits - 1))
-                return "qNaN" if MSB else "sNaN"
-        
-        if E_encoded == 0:
-            # Denormalizado o cero
-            if M_encoded == 0:
-                return 0.0
-            else:
-                # Denormalizado: ±0.M × B^E_min
-                E_real = self.E_min
-                M_frac = Decimal(M_encoded) / Decimal(self.base) ** self.F_bits
-                value = float(M_frac * Decimal(self.base) ** E_real)
-                return -value if sign == 1 else value
-        
-        # Normalizado: ±1.M × B^E
-        E_real = E_encoded - self.bias
-        M_frac = Decimal(M_encoded) / Decimal(self.base) ** self.F_bits
-        M = 1 + M_frac  # Mantisa implícita
-        value = float(M * Decimal(self.base) ** E_real)
+            # NaN
+            MSB = M_encoded >= (self.base ** (self.F_bits - 1))
+            return "qNaN" if MSB else "sNaN"
         
+        value = self._magnitude(E_encoded, M_encoded)
         return -value if sign == 1 else value
     
     def is_special(self, E_encoded: int, M_encoded: int) -> bool:
@@ -275,15 +413,431 @@ class IEEE754Gen:
     
     def get_range_normalized(self) -> Tuple[float, float]:
         """Obtener rango de números normalizados."""
-        min_norm = float(Decimal(1) * Decimal(self.base) ** self.E_min)
-        max_norm = float((Decimal(2) - self.epsilon) * Decimal(self.base) ** self.E_max)
-        return (min_norm, max_norm)
+        return self.descriptor.range_normalized
     
     def get_range_denormalized(self) -> Tuple[float, float]:
         """Obtener rango de números denormalizados."""
-        min_denorm = float(self.epsilon * Decimal(self.base) ** self.E_min)
-        max_denorm = float((1 - self.epsilon) * Decimal(self.base) ** self.E_min)
-        return (min_denorm, max_denorm)
+        return self.descriptor.range_denormalized
+    
+    # ------------------------------------------------------------------
+    # Valores característicos exactos
+    # ------------------------------------------------------------------
+    
+    @property
+    def min_positive(self) -> Fraction:
+        """Menor positivo (subnormal mínimo): B^(E_min - F)."""
+        return self.descriptor.min_positive
+    
+    @property
+    def min_normal(self) -> Fraction:
+        """Menor normalizado: B^E_min."""
+        return self.descriptor.min_normal
+    
+    @property
+    def max_positive(self) -> Fraction:
+        """Mayor finito: mayor exponente no especial y mantisa máxima."""
+        return self.descriptor.max_positive
+    
+    @property
+    def epsilon_machine(self) -> Fraction:
+        """Distancia entre 1 y el siguiente representable: B^(-F)."""
+        return self.descriptor.epsilon
+    
+    # ------------------------------------------------------------------
+    # Empaquetado [signo|exponente|mantisa]
+    # ------------------------------------------------------------------
+    
+    def pack(self, sign: int, E_encoded: int, M_encoded: int) -> int:
+        """Campos → entero completo (mismo orden de bits que encode)."""
+        return (sign << (self.E_bits + self.F_bits)) | (E_encoded << self.F_bits) | M_encoded
+    
+    def unpack(self, code: int) -> Tuple[int, int, int]:
+        """Entero completo → (sign, E_encoded, M_encoded)."""
+        code = int(code)
+        return (
+            (code >> (self.E_bits + self.F_bits)) & 1,
+            (code >> self.F_bits) & ((1 << self.E_bits) - 1),
+            code & ((1 << self.F_bits) - 1),
+        )
+    
+    # ------------------------------------------------------------------
+    # Lotes
+    # ------------------------------------------------------------------
+    
+    def _vectorizable(self) -> bool:
+        """Ruta NumPy: base 2 y códigos de hasta 64 bits (uint64)."""
+        return HAS_NUMPY and self.base == 2 and self.total_bits <= 64
+    
+    def encode_many(self, values: Iterable, rounding: str = 'nearest_even'):
+        """
+        Codificar un lote de valores.
+        
+        Con NumPy, base 2 y floats (lista de float o array de coma flotante),
+        el redondeo se hace vectorizado sobre las mantisas enteras de frexp.
+        En otro caso se codifica valor a valor con encode (exacto).
+        
+        Returns:
+            numpy.ndarray uint64 (con NumPy), array('Q') (sin NumPy) o lista
+            de int si el formato supera los 64 bits.
+        """
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Modo de redondeo desconocido: {rounding}. Modos: {', '.join(ROUNDING_MODES)}")
+        
+        if self._vectorizable():
+            if isinstance(values, np.ndarray) and values.dtype.kind == 'f':
+                return self._encode_many_numpy(values.astype(np.float64), rounding)
+            values = list(values)
+            if all(type(v) is float for v in values):
+                return self._encode_many_numpy(np.array(values, dtype=np.float64), rounding)
+        
+        codes = [self.encode(v, rounding) for v in values]
+        if self.total_bits > 64:
+            return codes
+        if HAS_NUMPY:
+            return np.array(codes, dtype=np.uint64)
+        return array('Q', codes)
+    
+    def _encode_many_numpy(self, x, rounding: str):
+        F, E_all_ones = self.F_bits, self.E_max_encoded
+        sign = np.signbit(x).astype(np.uint64)
+        a = np.abs(x)
+        nan, inf, zero = np.isnan(a), np.isinf(a), a == 0
+        finite = ~(nan | inf | zero)
+        
+        # a = sig · 2^(e - 53), sig entero de 53 bits (exacto para float64)
+        m, e = np.frexp(np.where(finite, a, 1.0))
+        sig = (m * 2.0 ** 53).astype(np.uint64)
+        e = e.astype(np.int64)
+        
+        # Exponente destino (el del número, o E_min para subnormales) y
+        # mantisa completa M = sig · 2^k redondeada a entero
+        target = np.maximum(e - 1, self.E_min)
+        k = e - 53 - target + F
+        shifted = sig << np.maximum(k, 0).astype(np.uint64)
+        drop = np.minimum(np.maximum(-k, 0), 54).astype(np.uint64)
+        q = shifted >> drop
+        r = shifted - (q << drop)
+        half = (np.uint64(1) << drop) >> np.uint64(1)
+        inexact = r > 0
+        if rounding == 'nearest_even':
+            up = (r > half) | ((r == half) & inexact & ((q & np.uint64(1)) == 1))
+        elif rounding == 'nearest_away':
+            up = (r >= half) & inexact
+        elif rounding == 'toward_positive':
+            up = inexact & (sign == 0)
+        elif rounding == 'toward_negative':
+            up = inexact & (sign == 1)
+        else:
+            up = np.zeros_like(inexact)
+        M = q + up.astype(np.uint64)
+        
+        # Acarreo del redondeo: 1.111.. → 10.000..
+        carry = M >= (1 << (F + 1))
+        target = target + carry
+        M = np.where(carry, M >> np.uint64(1), M)
+        normal = M >= (1 << F)
+        E_enc = np.where(normal, target + self.bias, 0)
+        M_field = M & np.uint64((1 << F) - 1)
+        
+        # Desbordamiento: ∞ (al más cercano / hacia el signo) o máximo finito
+        overflow = E_enc >= E_all_ones
+        if rounding in ('nearest_even', 'nearest_away'):
+            to_inf = np.ones_like(overflow)
+        elif rounding == 'toward_positive':
+            to_inf = sign == 0
+        elif rounding == 'toward_negative':
+            to_inf = sign == 1
+        else:
+            to_inf = np.zeros_like(overflow)
+        E_enc = np.where(overflow, np.where(to_inf, E_all_ones, E_all_ones - 1), E_enc)
+        M_field = np.where(overflow, np.where(to_inf, np.uint64(0), np.uint64((1 << F) - 1)), M_field)
+        
+        # Especiales
+        E_enc = np.where(zero, 0, np.where(inf | nan, E_all_ones, E_enc)).astype(np.uint64)
+        M_field = np.where(zero | inf, np.uint64(0), M_field)
+        M_field = np.where(nan, np.uint64(1 << (F - 1)), M_field)
+        sign = np.where(nan, np.uint64(0), sign)
+        
+        return (sign << np.uint64(self.E_bits + F)) | (E_enc << np.uint64(F)) | M_field
+    
+    def decode_many(self, codes: Iterable[int]):
+        """
+        Decodificar un lote de códigos completos a float (NaN → nan).
+        
+        Returns:
+            numpy.ndarray float64 (con NumPy) o array('d')
+        """
+        if self._vectorizable() and self.F_bits <= 52:
+            return self._decode_many_numpy(np.asarray(codes, dtype=np.uint64))
+        
+        values = []
+        for code in codes:
+            value = self.decode(*self.unpack(code))
+            values.append(math.nan if isinstance(value, str) else value)
+        if HAS_NUMPY:
+            return np.array(values, dtype=np.float64)
+        return array('d', values)
+    
+    def _decode_many_numpy(self, codes):
+        F = self.F_bits
+        sign = (codes >> np.uint64(self.E_bits + F)) & np.uint64(1)
+        E_enc = ((codes >> np.uint64(F)) & np.uint64((1 << self.E_bits) - 1)).astype(np.int64)
+        M = (codes & np.uint64((1 << F) - 1)).astype(np.int64)
+        
+        normal = E_enc != 0
+        significand = np.where(normal, M + (1 << F), M).astype(np.float64)  # Exacto: F <= 52
+        exponent = np.where(normal, E_enc - self.bias, self.E_min) - F
+        # ldexp redondea una sola vez; exponentes fuera de rango saturan a 0 / ∞
+        with np.errstate(over='ignore'):
+            values = np.ldexp(significand, np.clip(exponent, -2200, 2200).astype(np.int32))
+        
+        special = E_enc == self.E_max_encoded
+        values = np.where(special, np.where(M == 0, np.inf, np.nan), values)
+        return np.where(sign == 1, -values, values)
+    
+    # ------------------------------------------------------------------
+    # Verificación contra struct (binary16/32/64)
+    # ------------------------------------------------------------------
+    
+    @property
+    def struct_format(self) -> Optional[str]:
+        """Código de struct equivalente ('e', 'f', 'd') o None si no es un formato estándar."""
+        if self.base != 2:
+            return None
+        return STRUCT_FORMATS.get((self.E_bits, self.F_bits))
+    
+    def struct_check(self, values: Iterable[float]) -> List[Tuple[float, int, int]]:
+        """
+        Compara encode_many (al más cercano, empates a par) con struct.pack.
+        
+        Los NaN se comparan por clase: basta con que ambos códigos sean NaN,
+        porque el signo y la carga útil que conserva struct dependen de la
+        plataforma y encode_many siempre produce el qNaN canónico.
+        
+        Returns:
+            Lista de discrepancias (valor, código propio, código de struct); vacía si
+            todo es bit a bit idéntico.
+        """
+        fmt = self.struct_format
+        if fmt is None:
+            raise ValueError(f"{self} no tiene equivalente en struct")
+        int_fmt = {'e': '>H', 'f': '>I', 'd': '>Q'}[fmt]
+        inf_code = self.pack(0, self.E_max_encoded, 0)
+        
+        values = [float(v) for v in values]
+        mismatches = []
+        for value, code in zip(values, self.encode_many(values)):
+            try:
+                expected = struct.unpack(int_fmt, struct.pack('>' + fmt, value))[0]
+            except OverflowError:
+                # struct rechaza lo que redondea a ∞; IEEE lo codifica como ±∞
+                expected = inf_code | (self.pack(1, 0, 0) if value < 0 else 0)
+            if math.isnan(value):
+                if not (self._is_nan_code(int(code)) and self._is_nan_code(expected)):
+                    mismatches.append((value, int(code), expected))
+            elif int(code) != expected:
+                mismatches.append((value, int(code), expected))
+        return mismatches
+    
+    def _is_nan_code(self, code: int) -> bool:
+        _, E_encoded, M_encoded = self.unpack(code)
+        return E_encoded == self.E_max_encoded and M_encoded != 0
+    
+    # ------------------------------------------------------------------
+    # Enumeración exhaustiva del espacio de códigos
+    # ------------------------------------------------------------------
+    
+    @property
+    def code_count(self) -> int:
+        """Número de patrones distintos: 2 · B^E_bits · B^F_bits."""
+        return 2 * (self.E_max_encoded + 1) * self._scale
+    
+    def enumerate_codes(self) -> Dict[str, object]:
+        """
+        Todos los patrones del formato en columnas (memoizado en los formatos de
+        hasta MAX_CACHED_CODES códigos; los mayores se recalculan en cada llamada
+        para no retener cientos de MB en la caché).
+        
+        El código es el índice del patrón: signo · B^(E+F) + E_encoded · B^F
+        + M_encoded (en base 2 coincide con pack). Los positivos ocupan la
+        primera mitad en orden creciente de magnitud; los negativos, la segunda.
+        
+        Returns:
+            Dict de columnas de igual longitud:
+                'code':  índice del patrón (uint32)
+                'value': valor como float (redondeado una sola vez; NaN → nan)
+                'ulp':   distancia al siguiente valor de mayor magnitud (nan en especiales)
+                'class': índice en CODE_CLASSES (uint8)
+            Con NumPy son ndarrays de solo lectura; sin NumPy, arrays del
+            módulo array (pueden estar compartidos con la caché: no modificarlos).
+        
+        Raises:
+            ValueError: Si el formato tiene más de MAX_ENUMERATED_CODES códigos
+        """
+        if self.code_count > MAX_ENUMERATED_CODES:
+            raise ValueError(
+                f"{self} tiene {self.code_count} códigos; "
+                f"enumerate_codes admite hasta {MAX_ENUMERATED_CODES}"
+            )
+        build = _cached_code_space if self.code_count <= MAX_CACHED_CODES else _code_space
+        return dict(build(self.E_bits, self.F_bits, self.base, HAS_NUMPY))
+    
+    def export_codes(self, fmt: str = 'csv', chunk_size: int = 4096) -> Iterator[str]:
+        """
+        Exportación en streaming de enumerate_codes: trozos de texto de
+        chunk_size filas, sin construir el documento completo.
+        
+        El formato y el tamaño se validan al llamar (no al consumir el primer
+        trozo), así /api/ieee754/codes puede responder 400 antes de empezar.
+        
+        Args:
+            fmt: 'csv' (cabecera code,value,ulp,class) o 'jsonl' (un objeto
+                por línea; valores no finitos como null)
+            chunk_size: filas por trozo
+        """
+        if fmt not in ('csv', 'jsonl'):
+            raise ValueError(f"Formato de exportación desconocido: {fmt}. Formatos: csv, jsonl")
+        return _export_chunks(self.enumerate_codes(), fmt, chunk_size)
+
+
+def _export_chunks(columns: Dict[str, object], fmt: str, chunk_size: int) -> Iterator[str]:
+    """Trozos de texto de export_codes (chunk_size filas por trozo)."""
+    if fmt == 'csv':
+        yield "code,value,ulp,class\n"
+    for start in range(0, len(columns['code']), chunk_size):
+        stop = start + chunk_size
+        rows = zip(
+            columns['code'][start:stop].tolist(),
+            columns['value'][start:stop].tolist(),
+            columns['ulp'][start:stop].tolist(),
+            columns['class'][start:stop].tolist(),
+        )
+        if fmt == 'csv':
+            yield ''.join(
+                f"{code},{value!r},{ulp!r},{CODE_CLASSES[cls]}\n" for code, value, ulp, cls in rows
+            )
+        else:
+            yield ''.join(
+                json.dumps({
+                    'code': code,
+                    'value': value if math.isfinite(value) else None,
+                    'ulp': ulp if math.isfinite(ulp) else None,
+                    'class': CODE_CLASSES[cls],
+                }) + "\n"
+                for code, value, ulp, cls in rows
+            )
+
+
+def _scaled_float(n: int, base: int, exponent: int) -> float:
+    """n · base^exponent como float correctamente redondeado (inf si desborda)."""
+    if exponent >= 0:
+        try:
+            return float(n * _power(base, exponent))
+        except OverflowError:
+            return math.inf
+    return n / _power(base, -exponent)  # División entera exacta: un solo redondeo
+
+
+def _exact_float(n: int) -> Optional[float]:
+    """float(n) si es exacto, o None."""
+    try:
+        f = float(n)
+    except OverflowError:
+        return None
+    return f if f == n else None
+
+
+def _code_space(E_bits: int, F_bits: int, base: int, vectorized: bool) -> Dict[str, object]:
+    """
+    Columnas de enumerate_codes, construidas por bandas de exponente.
+    
+    La mitad positiva es una matriz (B^E_bits filas × B^F columnas): la fila
+    es E_encoded y la columna M_encoded. Cada fila finita es sig · B^exp con
+    sig entero; si B^|exp| es exacto en float basta una multiplicación o
+    división por fila (un solo redondeo), y si no se usa aritmética entera.
+    La mitad negativa es la positiva cambiada de signo.
+    """
+    fmt = IEEE754Gen(E_bits, F_bits, base)
+    scale, rows = fmt._scale, fmt.E_max_encoded + 1
+    qnan_min = base ** (F_bits - 1)
+    # Hueco entre (2 - B^-F)·B^e y B^(e+1), en unidades de B^(e-F) (1 en base 2)
+    band_end_gap = base * scale - 2 * scale + 1
+    exponents = [fmt.E_min - F_bits] + [E - fmt.bias - F_bits for E in range(1, rows)]
+    
+    def row_floats(row):
+        first = scale if row else 0
+        return [_scaled_float(s, base, exponents[row]) for s in range(first, first + scale)]
+    
+    def row_ulps(row):
+        ulp = _scaled_float(1, base, exponents[row])
+        return ulp, (_scaled_float(band_end_gap, base, exponents[row]) if row else ulp)
+    
+    if not vectorized:
+        values, ulps, classes = array('d'), array('d'), array('B')
+        for row in range(rows - 1):
+            values.extend(row_floats(row))
+            ulp, last_ulp = row_ulps(row)
+            ulps.extend([ulp] * (scale - 1) + [last_ulp])
+            classes.extend([CODE_NORMAL if row else CODE_SUBNORMAL] * scale)
+        classes[0] = CODE_ZERO
+        values.extend([math.inf] + [math.nan] * (scale - 1))
+        ulps.extend([math.nan] * scale)
+        classes.extend([CODE_INFINITY] + [CODE_SNAN] * (qnan_min - 1) + [CODE_QNAN] * (scale - qnan_min))
+        
+        half = len(values)
+        values.extend(-v for v in values[:half])
+        ulps.extend(ulps[:half])
+        classes.extend(classes[:half])
+        code_type = 'L' if array('L').itemsize >= 4 else 'Q'
+        return {'code': array(code_type, range(2 * half)), 'value': values, 'ulp': ulps, 'class': classes}
+    
+    mantissas = np.arange(scale, dtype=np.float64)
+    values = np.empty((rows, scale), dtype=np.float64)
+    ulps = np.empty((rows, scale), dtype=np.float64)
+    finite_exponents = np.array(exponents[:rows - 1], dtype=np.int64)
+    
+    with np.errstate(over='ignore'):
+        if base == 2:
+            # ldexp: sig exacto (F <= 24) y un solo redondeo; saturación a 0 / ∞
+            clipped = np.clip(finite_exponents, -2200, 2200).astype(np.int32)
+            implicit = np.where(np.arange(rows - 1) > 0, float(scale), 0.0)
+            values[:-1] = np.ldexp(mantissas[None, :] + implicit[:, None], clipped[:, None])
+            ulps[:-1] = np.ldexp(1.0, clipped)[:, None]
+        else:
+            for row in range(rows - 1):
+                exponent = exponents[row]
+                power = _exact_float(_power(base, abs(exponent)))
+                if power is None:
+                    values[row] = row_floats(row)
+                else:
+                    sig = mantissas + (scale if row else 0)
+                    values[row] = sig * power if exponent >= 0 else sig / power
+                ulps[row], ulps[row, -1] = row_ulps(row)
+    values[-1] = np.nan
+    values[-1, 0] = np.inf
+    ulps[-1] = np.nan
+    
+    classes = np.full((rows, scale), CODE_NORMAL, dtype=np.uint8)
+    classes[0] = CODE_SUBNORMAL
+    classes[0, 0] = CODE_ZERO
+    classes[-1, 0] = CODE_INFINITY
+    classes[-1, 1:qnan_min] = CODE_SNAN
+    classes[-1, qnan_min:] = CODE_QNAN
+    
+    values = values.ravel()
+    columns = {
+        'code': np.arange(2 * values.size, dtype=np.uint32),
+        'value': np.concatenate([values, -values]),
+        'ulp': np.tile(ulps.ravel(), 2),
+        'class': np.tile(classes.ravel(), 2),
+    }
+    for column in columns.values():
+        column.flags.writeable = False
+    return columns
+
+
+# Solo para formatos de hasta MAX_CACHED_CODES códigos (ver enumerate_codes)
+_cached_code_space = lru_cache(maxsize=8)(_code_space)
 
 
 def demonstrate_ieee754():
@@ -5,6 +5,17 @@ Funciones para convertir entre sistemas de numeración usando métodos explícit
 
 from typing import Union, Tuple, List
 
+from core.conversion_enteros_grandes import (
+    VALOR_DIGITO,
+    digitos_a_entero,
+    entero_a_digitos,
+    primer_digito_invalido,
+)
+
+# Por encima de esta longitud, base_b_a_decimal_con_horner no detalla los pasos
+# (cada paso guarda un entero cada vez mayor: memoria cuadrática)
+MAX_DIGITOS_PASOS_HORNER = 256
+
 
 def decimal_a_binario_divisiones(numero: Union[int, str], bits: int = None) -> str:
     """
@@ -380,7 +391,12 @@ def decimal_a_base_b_divisiones(numero: Union[int, str], base: int, bits: int =
     # Validar y convertir número
     try:
         if isinstance(numero, str):
-            num = int(numero.strip())
+            texto = numero.strip()
+            # Cadenas de dígitos: sin el límite de longitud de int() en base 10
+            if texto.isascii() and texto.isdigit():
+                num = digitos_a_entero(texto, 10)
+            else:
+                num = int(texto)
         else:
             num = int(numero)
     except (ValueError, TypeError):
@@ -389,22 +405,8 @@ def decimal_a_base_b_divisiones(numero: Union[int, str], base: int, bits: int =
     if num < 0:
         raise ValueError(f"El número debe ser no-negativo, recibido: {num}")
     
-    # Obtener dígitos permitidos para esta base
-    digitos = obtener_digitos_para_base(base)
-    
-    # Caso especial: cero
-    if num == 0:
-        resultado = "0"
-    else:
-        # Algoritmo de divisiones sucesivas
-        digitos_resultado = []
-        while num > 0:
-            resto = num % base  # Dígito en la nueva base
-            digitos_resultado.append(digitos[resto])  # Convertir a carácter
-            num //= base  # Dividir entre la base
-        
-        # Los dígitos están en orden inverso
-        resultado = "".join(reversed(digitos_resultado))
+    # Divisiones sucesivas agrupadas por potencias de la base (divide y vencerás)
+    resultado = entero_a_digitos(num, base, mayusculas=True)
     
     # Padding si se especifica
     if bits is not None:
@@ -585,15 +587,14 @@ def validar_numero_en_base(numero_str: str, base: int) -> Tuple[bool, str]:
     if not validar_base(base):
         return False, f"Base inválida: {base}"
     
-    digitos_validos = obtener_digitos_para_base(base)
     numero_upper = numero_str.strip().upper()
     
     if not numero_upper:
         return False, "El número no puede estar vacío"
     
-    for digito in numero_upper:
-        if digito not in digitos_validos:
-            return False, f"'{digito}' no es un dígito válido en base {base}"
+    digito = primer_digito_invalido(numero_upper, base)
+    if digito is not None:
+        return False, f"'{digito}' no es un dígito válido en base {base}"
     
     return True, f"{numero_upper} es un número en base {base} válido"
 
@@ -612,13 +613,14 @@ def valor_digito_en_base(digito_char: str, base: int) -> int:
         >>> valor_digito_en_base('Z', 36)
         35
     """
-    digitos_tabla = obtener_digitos_para_base(base)
-    digito_upper = digito_char.upper()
+    if not validar_base(base):
+        raise ValueError(f"Base debe estar entre 2 y 36, recibido: {base}")
     
-    if digito_upper not in digitos_tabla:
+    valor = VALOR_DIGITO.get(digito_char)
+    if valor is None or valor >= base:
         raise ValueError(f"'{digito_char}' no es un dígito válido en base {base}")
     
-    return digitos_tabla.index(digito_upper)
+    return valor
 
 
 def base_b_a_decimal_simple(numero_str: str, base: int) -> int:
@@ -653,15 +655,9 @@ def base_b_a_decimal_simple(numero_str: str, base: int) -> int:
         raise ValueError(msg)
     
     numero_upper = numero_str.strip().upper()
-    resultado = 0
-    
-    # Calcular: suma de (dígito × base^posición)
-    for posicion, digito_char in enumerate(reversed(numero_upper)):
-        valor_digito = valor_digito_en_base(digito_char, base)
-        potencia = base ** posicion
-        resultado += valor_digito * potencia
     
-    return resultado
+    # Suma de (dígito × base^posición), evaluada por mitades con potencias cacheadas
+    return digitos_a_entero(numero_upper, base)
 
 
 def base_b_a_decimal_con_polinomio(numero_str: str, base: int) -> dict:
@@ -703,7 +699,7 @@ def base_b_a_decimal_con_polinomio(numero_str: str, base: int) -> dict:
     calculos = []
     total = 0
     
-    for posicion, digito_char in enumerate(reversed(numero_upper)):
+    for posicion, digito_char in enumerate(numero_upper):
         valor_digito = valor_digito_en_base(digito_char, base)
         exponente = n_digitos - 1 - posicion
         potencia = base ** exponente
@@ -768,6 +764,10 @@ def base_b_a_decimal_con_horner(numero_str: str, base: int) -> dict:
     
     Esto reduce operaciones de potencias a simples multiplicaciones.
     
+    El valor se obtiene con el motor divide y vencerás; los pasos solo se
+    detallan hasta MAX_DIGITOS_PASOS_HORNER dígitos (en números mayores
+    'pasos_horner' queda vacío y la explicación lo indica).
+    
     Args:
         numero_str: String con el número en la base especificada
         base: Base numérica (2-36)
@@ -792,12 +792,14 @@ def base_b_a_decimal_con_horner(numero_str: str, base: int) -> dict:
         raise ValueError(msg)
     
     numero_upper = numero_str.strip().upper()
+    decimal = digitos_a_entero(numero_upper, base)
+    detallar_pasos = len(numero_upper) <= MAX_DIGITOS_PASOS_HORNER
     
     # Algoritmo de Horner
     pasos = []
     resultado = 0
     
-    for i, digito_char in enumerate(numero_upper):
+    for i, digito_char in enumerate(numero_upper if detallar_pasos else ""):
         valor_digito = valor_digito_en_base(digito_char, base)
         
         # Paso: resultado = resultado × base + digito
@@ -825,10 +827,9 @@ def base_b_a_decimal_con_horner(numero_str: str, base: int) -> dict:
     if len(numero_upper) == 1:
         forma_horner = numero_upper[0]
     else:
-        forma_horner = f"(({numero_upper[0]}"
-        for digito in numero_upper[1:]:
-            forma_horner += f")×{base} + {digito}"
-        forma_horner += ")"
+        forma_horner = f"(({numero_upper[0]}" + "".join(
+            f")×{base} + {digito}" for digito in numero_upper[1:]
+        ) + ")"
     
     # Explicación
     explicacion_lineas = [
@@ -848,15 +849,20 @@ def base_b_a_decimal_con_horner(numero_str: str, base: int) -> dict:
             f"        {paso['resultado_anterior']} × {base} + {paso['valor_digito']} = {paso['resultado_actual']}"
         )
     
+    if not detallar_pasos:
+        explicacion_lineas.append(
+            f"({len(numero_upper)} dígitos: pasos omitidos, más de {MAX_DIGITOS_PASOS_HORNER})"
+        )
+    
     explicacion_lineas.extend([
         "",
-        f"Resultado: {resultado}"
+        f"Resultado: {entero_a_digitos(decimal, 10)}"
     ])
     
     return {
         'numero_original': numero_upper,
         'base': base,
-        'decimal': resultado,
+        'decimal': decimal,
         'pasos_horner': pasos,
         'forma_horner': forma_horner,
         'explicacion': '\n'.join(explicacion_lineas)
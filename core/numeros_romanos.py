@@ -0,0 +1,177 @@
+"""
+Números romanos: tablas precalculadas y autómata de validación.
+
+Forma canónica (moderna), 1..ROMANO_MAX:
+
+    M{0,3} (CM|CD|D?C{0,3}) (XC|XL|L?X{0,3}) (IX|IV|V?I{0,3})
+
+Cada orden de magnitud usa el mismo patrón de 10 cifras con sus tres
+símbolos (uno, cinco, diez): '', I, II, III, IV, V, VI, VII, VIII, IX.
+
+    tabla_romanos()      número → cadena, las 4000 entradas construidas
+                         una vez juntando las cifras (a_romano es O(1))
+    indice_romanos()     cadena → número (lectura O(1) de las canónicas)
+    automata_romano()    autómata finito determinista compilado una vez
+
+Todo prefijo de un patrón de cifra es a su vez una cifra (I, II, III; IV → I;
+VI..VIII → V), así que el trie de cada orden tiene un estado por cifra y la
+transición suma (cifra_nueva - cifra_anterior) · 10^orden. El autómata
+encadena los cuatro tries de mayor a menor orden: lee cada cadena una sola
+vez, acumula el valor y rechaza en el primer carácter no canónico
+(IIII, VX, IM, MMMM, ...) indicando la posición.
+
+Ejemplo:
+    a_romano(1994)                       → 'MCMXCIV'
+    romano_a_entero('mcmxciv')           → 1994
+    romano_a_entero('IIII')              → ValueError (posición 3)
+    list(iterar_romanos(['X', 'IC'], estricto=False))  → [10, None]
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+ROMANO_MAX = 3999
+
+# Símbolos (uno, cinco, diez) de cada orden, de menor a mayor
+SIMBOLOS_ORDEN = (('I', 'V', 'X'), ('X', 'L', 'C'), ('C', 'D', 'M'), ('M', '', ''))
+
+# Patrón de cada cifra 0-9 con los símbolos uno (u), cinco (c) y diez (d)
+_PATRONES = ('', 'u', 'uu', 'uuu', 'uc', 'c', 'cu', 'cuu', 'cuuu', 'ud')
+
+
+def _cifras_orden(orden: int) -> Tuple[str, ...]:
+    """Las cifras romanas de un orden de magnitud (las de millares solo hasta 3)."""
+    uno, cinco, diez = SIMBOLOS_ORDEN[orden]
+    cifras = tuple(p.replace('u', uno).replace('c', cinco).replace('d', diez) for p in _PATRONES)
+    return cifras[:4] if orden == 3 else cifras
+
+
+@lru_cache(maxsize=None)
+def tabla_romanos() -> Tuple[str, ...]:
+    """Tabla índice n → número romano de n (la entrada 0 es '')."""
+    miles, centenas, decenas, unidades = (_cifras_orden(o) for o in (3, 2, 1, 0))
+    return tuple(m + c + d + u for m in miles for c in centenas for d in decenas for u in unidades)
+
+
+@lru_cache(maxsize=None)
+def indice_romanos() -> Dict[str, int]:
+    """Índice cadena canónica → valor (sin la cadena vacía)."""
+    return {romano: n for n, romano in enumerate(tabla_romanos()) if n}
+
+
+def a_romano(numero: int) -> str:
+    """Número romano canónico de 1..ROMANO_MAX (búsqueda en la tabla)."""
+    if not 1 <= numero <= ROMANO_MAX:
+        raise ValueError(f"Los números romanos van de 1 a {ROMANO_MAX}, recibido: {numero}")
+    return tabla_romanos()[numero]
+
+
+def a_romanos(numeros: Iterable[int]) -> List[str]:
+    """Conversión por lotes (una indexación por número)."""
+    tabla = tabla_romanos()
+    resultado = []
+    for numero in numeros:
+        if not 1 <= numero <= ROMANO_MAX:
+            raise ValueError(f"Los números romanos van de 1 a {ROMANO_MAX}, recibido: {numero}")
+        resultado.append(tabla[numero])
+    return resultado
+
+
+# ============================================================================
+# AUTÓMATA
+# ============================================================================
+
+class AutomataRomano(NamedTuple):
+    """
+    Autómata determinista de la forma canónica.
+
+    transiciones[estado] = {carácter: (estado_siguiente, valor_sumado)};
+    el estado 0 es el inicial y todos los demás son de aceptación.
+    """
+    transiciones: Tuple[Dict[str, Tuple[int, int]], ...]
+
+    @property
+    def estados(self) -> int:
+        return len(self.transiciones)
+
+
+@lru_cache(maxsize=None)
+def automata_romano() -> AutomataRomano:
+    """Compila el autómata: un trie de cifras por orden, encadenados de mayor a menor."""
+    # Estados: 0 inicial; después (orden, cifra) para cada cifra no vacía
+    estados = [(None, 0)]
+    numero_estado = {}
+    for orden in (3, 2, 1, 0):
+        for cifra in range(1, len(_cifras_orden(orden))):
+            numero_estado[(orden, cifra)] = len(estados)
+            estados.append((orden, cifra))
+
+    def entradas(desde_orden: int) -> Dict[str, Tuple[int, int]]:
+        """Primer símbolo de cada orden menor que desde_orden: empieza su trie."""
+        salida = {}
+        for orden in range(desde_orden - 1, -1, -1):
+            cifras = _cifras_orden(orden)
+            for cifra in range(1, len(cifras)):
+                if len(cifras[cifra]) == 1:
+                    salida.setdefault(cifras[cifra], (numero_estado[(orden, cifra)], cifra * 10 ** orden))
+        return salida
+
+    transiciones = []
+    for orden, cifra in estados:
+        if orden is None:
+            transiciones.append(entradas(4))
+            continue
+        cifras = _cifras_orden(orden)
+        salida = dict(entradas(orden))
+        # Continuar dentro del trie del orden: cifras cuyo patrón extiende el actual en un símbolo
+        for siguiente in range(1, len(cifras)):
+            patron = cifras[siguiente]
+            if len(patron) == len(cifras[cifra]) + 1 and patron.startswith(cifras[cifra]):
+                salida[patron[-1]] = (numero_estado[(orden, siguiente)], (siguiente - cifra) * 10 ** orden)
+        transiciones.append(salida)
+    return AutomataRomano(tuple(transiciones))
+
+
+def romano_a_entero(texto: str) -> int:
+    """
+    Valor de un número romano canónico (mayúsculas o minúsculas).
+
+    Raises:
+        ValueError: cadena vacía o primer carácter que rompe la forma canónica
+    """
+    romano = texto.strip().upper()
+    if not romano:
+        raise ValueError("El número romano no puede estar vacío")
+    transiciones = automata_romano().transiciones
+    estado = valor = 0
+    for posicion, caracter in enumerate(romano):
+        siguiente = transiciones[estado].get(caracter)
+        if siguiente is None:
+            raise ValueError(f"Número romano no canónico: '{texto}' (carácter '{caracter}' en la posición {posicion})")
+        estado, sumado = siguiente
+        valor += sumado
+    return valor
+
+
+def iterar_romanos(textos: Iterable[str], estricto: bool = True) -> Iterator[Optional[int]]:
+    """
+    Lee un flujo de números romanos (p. ej. las líneas de un fichero).
+
+    Las cadenas canónicas se resuelven con el índice; el resto pasa por el
+    autómata, que da el error. Con estricto=False los inválidos dan None.
+    """
+    indice = indice_romanos()
+    for texto in textos:
+        valor = indice.get(texto)
+        if valor is None:
+            try:
+                valor = romano_a_entero(texto)
+            except ValueError:
+                if estricto:
+                    raise
+        yield valor
+
+
+def romanos_a_enteros(textos: Iterable[str], estricto: bool = True) -> List[Optional[int]]:
+    """Lectura por lotes de números romanos (ver iterar_romanos)."""
+    return list(iterar_romanos(textos, estricto))
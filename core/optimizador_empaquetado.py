@@ -0,0 +1,147 @@
+"""
+Búsqueda de empaquetados eficientes: k dígitos de base B en b dígitos nativos.
+
+Un grupo de k dígitos en base B tiene B^k valores; guardado en b dígitos de
+la base nativa A (bits si A = 2) su eficacia es
+
+    eficacia(B, k, b) = B^k / A^b      con A^b >= B^k
+
+Para (B, k) fijos la eficacia decrece con b, así que el único b que interesa
+es el mínimo: b = ceil(k · log_A B) (se calcula con log y se corrige con
+enteros exactos). Esa cota cerrada poda el espacio (B, k, b) de golpe:
+en lugar de probar todos los b para cada (B, k), se evalúa un solo candidato,
+y con max_bits el k máximo de cada base es floor(max_bits / log_A B).
+
+Con los candidatos de cada base se construye su frontera de Pareto
+eficacia / tamaño de palabra: las agrupaciones que ninguna otra mejora en
+las dos cosas a la vez (menos bits y más eficacia). Candidatos y fronteras
+se cachean por base.
+
+Ejemplo:
+    mejor_agrupacion(10, max_digitos=20)
+        → OpcionEmpaquetado(base_destino=10, n_digitos=3, bits=10, valores=1000, eficacia=0.9765625)
+    frontera_pareto(10, max_digitos=20)
+        → (1 dígito en 4 bits, 2 en 7, 3 en 10) con eficacia creciente
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import math
+
+
+class OpcionEmpaquetado(NamedTuple):
+    """k dígitos de base_destino en bits dígitos nativos (bits si la base nativa es 2)."""
+    base_destino: int
+    n_digitos: int
+    bits: int
+    valores: int
+    eficacia: float
+
+    def como_opcion(self) -> Dict:
+        """Opción en el formato de comparar_eficacias_empaquetado ('bcd': valores en bits)."""
+        return {'tipo': 'bcd', 'valores': self.valores, 'bits': self.bits}
+
+
+def _validar(base_nativa: int, max_digitos: int) -> None:
+    if base_nativa < 2:
+        raise ValueError(f"La base nativa debe ser >= 2. base_nativa={base_nativa}")
+    if max_digitos < 1:
+        raise ValueError(f"max_digitos debe ser positivo. max_digitos={max_digitos}")
+
+
+def digitos_nativos_minimos(valores: int, base_nativa: int = 2) -> int:
+    """Menor b con base_nativa^b >= valores (exacto, sin depender del redondeo de log)."""
+    if valores <= 1:
+        return 0
+    if base_nativa == 2:
+        return (valores - 1).bit_length()
+    b = max(1, math.ceil(math.log(valores) / math.log(base_nativa)))
+    while base_nativa ** b < valores:
+        b += 1
+    while b > 1 and base_nativa ** (b - 1) >= valores:
+        b -= 1
+    return b
+
+
+@lru_cache(maxsize=512)
+def _candidatos_base(base_nativa: int, base_destino: int, max_digitos: int) -> Tuple[OpcionEmpaquetado, ...]:
+    """Mejor empaquetado de cada k = 1..max_digitos para una base destino."""
+    candidatos = []
+    valores = 1
+    for k in range(1, max_digitos + 1):
+        valores *= base_destino
+        b = digitos_nativos_minimos(valores, base_nativa)
+        candidatos.append(OpcionEmpaquetado(base_destino, k, b, valores, valores / base_nativa ** b))
+    return tuple(candidatos)
+
+
+def candidatos(base_nativa: int = 2, bases_destino: Iterable[int] = range(2, 37),
+               max_digitos: int = 20, max_bits: Optional[int] = None,
+               min_eficacia: float = 0.0) -> List[OpcionEmpaquetado]:
+    """
+    Candidatos (B, k, b mínimo) del espacio de diseño, tras la poda.
+
+    Args:
+        max_bits: tamaño máximo de palabra en dígitos nativos
+        min_eficacia: descarta las opciones por debajo de esta eficacia
+    """
+    _validar(base_nativa, max_digitos)
+    resultado = []
+    for base_destino in bases_destino:
+        if base_destino < 2:
+            raise ValueError(f"Las bases destino deben ser >= 2. base_destino={base_destino}")
+        k_max = max_digitos
+        if max_bits is not None:
+            # Cota cerrada: k · log_A B <= b <= max_bits
+            k_max = min(k_max, int(max_bits * math.log(base_nativa) / math.log(base_destino)) + 1)
+        for opcion in _candidatos_base(base_nativa, base_destino, max_digitos)[:k_max]:
+            if max_bits is not None and opcion.bits > max_bits:
+                break
+            if opcion.eficacia >= min_eficacia:
+                resultado.append(opcion)
+    return resultado
+
+
+@lru_cache(maxsize=512)
+def frontera_pareto(base_destino: int, max_digitos: int = 20, base_nativa: int = 2,
+                    max_bits: Optional[int] = None) -> Tuple[OpcionEmpaquetado, ...]:
+    """
+    Agrupaciones no dominadas de una base en (bits ↓, eficacia ↑), ordenadas por bits.
+
+    Cada opción de la frontera es más eficiente que todas las de palabra más
+    corta; las demás agrupaciones gastan más bits sin ganar eficacia. Con
+    toda la frontera, la última opción es la agrupación óptima.
+    """
+    frontera = []
+    mejor = -1.0
+    for opcion in candidatos(base_nativa, [base_destino], max_digitos, max_bits):
+        # Con B fijo los bits no decrecen con k: basta un barrido de récords,
+        # y un récord con los mismos bits que el anterior lo domina
+        if opcion.eficacia > mejor:
+            if frontera and frontera[-1].bits == opcion.bits:
+                frontera[-1] = opcion
+            else:
+                frontera.append(opcion)
+            mejor = opcion.eficacia
+    return tuple(frontera)
+
+
+def fronteras_pareto(bases_destino: Iterable[int] = range(2, 37), max_digitos: int = 20,
+                     base_nativa: int = 2, max_bits: Optional[int] = None) -> Dict[int, Tuple[OpcionEmpaquetado, ...]]:
+    """Frontera de Pareto de cada base destino."""
+    return {base: frontera_pareto(base, max_digitos, base_nativa, max_bits) for base in bases_destino}
+
+
+def mejor_agrupacion(base_destino: int, max_digitos: int = 20, base_nativa: int = 2,
+                     max_bits: Optional[int] = None) -> OpcionEmpaquetado:
+    """Agrupación de k <= max_digitos dígitos más eficiente (la de menor k si empatan)."""
+    frontera = frontera_pareto(base_destino, max_digitos, base_nativa, max_bits)
+    if not frontera:
+        raise ValueError(f"Ninguna agrupación de base {base_destino} cabe en {max_bits} dígitos nativos")
+    return frontera[-1]
+
+
+def limpiar_cache() -> None:
+    """Vacía las cachés de candidatos y fronteras."""
+    _candidatos_base.cache_clear()
+    frontera_pareto.cache_clear()
@@ -0,0 +1,202 @@
+"""
+Word: palabra de longitud fija en base B guardada como un entero.
+
+Una palabra de l dígitos en base B es su código natural n ∈ [0, B^l). Todas
+las representaciones con signo y sus operaciones se reducen a aritmética
+entera módulo B^l, sin recorrer cadenas dígito a dígito:
+
+    CB      valor(n) = n si n < B^(l-1), si no n - B^l;   opCB(n) = (B^l - n) mod B^l
+    CB-1    valor(n) = n si n < B^(l-1), si no n - (B^l - 1); opCBm1(n) = (B^l - 1) - n
+    M&S     n = s · B^(l-1) + m (s ∈ {0, 1}): valor = (-1)^s · m; negación: s ↔ 1 - s
+    ExcK    valor(n) = n - K
+
+La cadena de dígitos solo se construye al pedirla (str(word)). Las
+explicaciones paso a paso (explicar_operacion_*) se generan aparte, a partir
+de los resultados, solo cuando se piden.
+
+Ejemplo:
+    a = Word.parse('0101', 2)
+    str(a.complement())              → '1011'
+    suma, carry = a.add(Word.from_cb(-3, 2, 4))
+    suma.to_cb()                     → 2
+    Word.from_excess(-5, 2, 8, 127)  → Word('01111010', base=2)
+"""
+
+from functools import lru_cache
+from typing import Tuple
+
+from core.tablas_representacion import palabra_de_codigo
+
+
+@lru_cache(maxsize=1024)
+def _modulo(base: int, length: int) -> int:
+    return base ** length
+
+
+@lru_cache(maxsize=1024)
+def _especificacion(base: int, length: int):
+    """Especificación de format() para las bases con formato nativo (o None)."""
+    tipo = {2: 'b', 8: 'o', 10: 'd', 16: 'x'}.get(base)
+    return f'0{length}{tipo}' if tipo else None
+
+
+class Word:
+    """
+    Palabra de longitud fija: código natural, base y longitud.
+
+    Inmutable en la práctica; las operaciones devuelven palabras nuevas.
+    """
+
+    __slots__ = ('code', 'base', 'length', 'modulus')
+
+    def __init__(self, code: int, base: int, length: int):
+        if not 2 <= base <= 36:
+            raise ValueError(f"Base debe estar entre 2 y 36. base={base}")
+        if length < 1:
+            raise ValueError(f"La longitud debe ser positiva. longitud={length}")
+        modulus = _modulo(base, length)
+        if not 0 <= code < modulus:
+            raise ValueError(f"Código {code} fuera de rango [0, {modulus - 1}]")
+        self.code = code
+        self.base = base
+        self.length = length
+        self.modulus = modulus  # B^l: número de palabras distintas
+
+    def _new(self, code: int) -> 'Word':
+        """Palabra del mismo formato, sin validar (código ya reducido módulo B^l)."""
+        word = object.__new__(Word)
+        word.code = code
+        word.base = self.base
+        word.length = self.length
+        word.modulus = self.modulus
+        return word
+
+    @classmethod
+    def parse(cls, text: str, base: int) -> 'Word':
+        """Cadena de dígitos → palabra de longitud len(text)."""
+        # isalnum descarta signos, espacios y '_' que int() aceptaría
+        if base < 2 or not text.isalnum():
+            raise ValueError(f"'{text}' no es una palabra válida en base {base}")
+        try:
+            code = int(text, base)
+        except ValueError:
+            raise ValueError(f"'{text}' no es una palabra válida en base {base}") from None
+        # 0 <= code < B^len(text) por construcción: sin más validación
+        word = object.__new__(cls)
+        word.code = code
+        word.base = base
+        word.length = length = len(text)
+        word.modulus = _modulo(base, length)
+        return word
+
+    @classmethod
+    def from_cb(cls, value: int, base: int, length: int) -> 'Word':
+        """ReprCB(valor) = valor mod B^l (sin comprobar rango, como repr_CB)."""
+        return cls(value % _modulo(base, length), base, length)
+
+    @classmethod
+    def from_cbm1(cls, value: int, base: int, length: int) -> 'Word':
+        """ReprCB-1(valor) = valor si valor >= 0, si no B^l - 1 + valor."""
+        code = value if value >= 0 else _modulo(base, length) - 1 + value
+        return cls(code, base, length)
+
+    @classmethod
+    def from_ms(cls, value: int, base: int, length: int) -> 'Word':
+        """M&S: dígito de signo 0 (positivo) ó 1 (negativo) y l-1 dígitos de magnitud."""
+        half = _modulo(base, length - 1)
+        if abs(value) >= half:
+            raise ValueError(f"Número {value} fuera de rango [{-(half - 1)}, {half - 1}] "
+                             f"para M&S con {length} dígitos en base {base}")
+        return cls(value if value >= 0 else half - value, base, length)
+
+    @classmethod
+    def from_excess(cls, value: int, base: int, length: int, K: int) -> 'Word':
+        """ReprExcK(valor) = valor + K."""
+        code = value + K
+        modulus = _modulo(base, length)
+        if not 0 <= code < modulus:
+            raise ValueError(f"Número {value} no representable en ExcK({base}, {K}, {length}): "
+                             f"valor {code} fuera de rango [0, {modulus - 1}]")
+        return cls(code, base, length)
+
+    # ------------------------------------------------------------------
+    # Propiedades
+    # ------------------------------------------------------------------
+
+    @property
+    def half(self) -> int:
+        """B^(l-1): primer código negativo en CB / CB-1 y peso del dígito de signo en M&S."""
+        return self.modulus // self.base
+
+    def __str__(self) -> str:
+        spec = _especificacion(self.base, self.length)
+        if spec is None:
+            return palabra_de_codigo(self.code, self.base, self.length)
+        return format(self.code, spec)
+
+    def __repr__(self) -> str:
+        return f"Word('{self}', base={self.base})"
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Word):
+            return NotImplemented
+        return (self.code, self.base, self.length) == (other.code, other.base, other.length)
+
+    def __hash__(self) -> int:
+        return hash((self.code, self.base, self.length))
+
+    # ------------------------------------------------------------------
+    # Interpretaciones
+    # ------------------------------------------------------------------
+
+    def to_cb(self) -> int:
+        code = self.code
+        return code if code * self.base < self.modulus else code - self.modulus
+
+    def to_cbm1(self) -> int:
+        code = self.code
+        return code if code * self.base < self.modulus else code - (self.modulus - 1)
+
+    def to_ms(self) -> int:
+        """Valor en M&S (el dígito de signo debe ser 0 ó 1)."""
+        sign, magnitude = divmod(self.code, self.half)
+        if sign > 1:
+            raise ValueError(f"'{self}' no es M&S: el dígito de signo debe ser 0 ó 1")
+        return -magnitude if sign else magnitude
+
+    def to_excess(self, K: int) -> int:
+        return self.code - K
+
+    # ------------------------------------------------------------------
+    # Operaciones
+    # ------------------------------------------------------------------
+
+    def complement(self) -> 'Word':
+        """opCB: B^l - n (módulo B^l)."""
+        return self._new(-self.code % self.modulus)
+
+    def complement_m1(self) -> 'Word':
+        """opCB-1: (B^l - 1) - n, cada dígito d → B - 1 - d."""
+        return self._new(self.modulus - 1 - self.code)
+
+    def negate_ms(self) -> 'Word':
+        """Negación en M&S: el dígito de signo pasa de 0 a 1 y viceversa."""
+        half = self.half
+        if self.code >= 2 * half:
+            raise ValueError(f"'{self}' no es M&S: el dígito de signo debe ser 0 ó 1")
+        return self._new(self.code - half if self.code >= half else self.code + half)
+
+    def add(self, other: 'Word') -> Tuple['Word', bool]:
+        """Suma natural módulo B^l: (resultado, carry final)."""
+        if self.base != other.base or self.length != other.length:
+            raise ValueError(f"Palabras de formatos distintos: {self!r} y {other!r}")
+        total = self.code + other.code
+        carry = total >= self.modulus
+        return self._new(total - self.modulus if carry else total), carry
+
+    def add_end_around(self, other: 'Word') -> Tuple['Word', bool]:
+        """Suma en CB-1: si hay carry final se suma 1 al resultado (end-around carry)."""
+        result, carry = self.add(other)
+        if carry:
+            result.code += 1
+        return result, carry
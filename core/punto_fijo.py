@@ -13,8 +13,12 @@ Ejemplos:
 
 from typing import Tuple, Union, Optional
 from decimal import Decimal, getcontext
+from fractions import Fraction
 import math
 
+from core.descriptores_formato import FormatDescriptor, format_descriptor
+from core.punto_fijo_raw import FixedPointOverflowError, fixed_format
+
 
 # Configurar precisión decimal para cálculos exactos
 getcontext().prec = 50
@@ -28,16 +32,25 @@ class FixedPoint:
         E (int): Número de dígitos/bits para la parte entera
         F (int): Número de dígitos/bits para la parte fraccionaria
         B (int): Base numérica (por defecto 2 para binario)
-        value (Decimal): Valor representado como número decimal
+        value (Decimal): Valor representado como número decimal (calculado desde raw_value)
         raw_value (int): Valor interno (sin escalar) M
     
     Formato: Q(E, F)
     - Rango (positivos): [B^(-F), B^E - B^(-F)] ∪ {0}
     - Épsilon (mínimo representable): ε = B^(-F)
     - Máximo representable: M_max = B^E - B^(-F)
+    
+    El número solo guarda M y el formato (__slots__); la aritmética es entera
+    (core.punto_fijo_raw) y Decimal solo se usa al leer value.
     """
     
-    def __init__(self, E: int, F: int, B: int = 2, value: Union[float, int, Decimal, str] = 0):
+    __slots__ = ('_fmt', 'raw_value')
+    
+    # Redondeo de * y / (truncamiento, como el hardware)
+    ARITHMETIC_ROUNDING = 'toward_zero'
+    
+    def __init__(self, E: int, F: int, B: int = 2, value: Union[float, int, Decimal, str] = 0,
+                 rounding: str = 'nearest_even'):
         """
         Inicializar un número en formato punto fijo Q(E,F).
         
@@ -46,37 +59,53 @@ class FixedPoint:
             F: Número de posiciones para parte fraccionaria
             B: Base numérica (default 2 para binario)
             value: Valor a representar
+            rounding: Redondeo al múltiplo de ε más cercano (ver ROUNDING_MODES)
         
         Raises:
-            ValueError: Si E < 0, F < 0, B < 2, o si el valor no cabe en Q(E,F)
+            ValueError: Si E < 0, F < 0, B < 2, o si el valor es negativo
+            OverflowError: Si el valor no cabe en Q(E,F)
         """
         if E < 0 or F < 0:
             raise ValueError(f"E y F deben ser no-negativos. E={E}, F={F}")
         if B < 2:
             raise ValueError(f"Base B debe ser >= 2. B={B}")
         
-        self.E = E
-        self.F = F
-        self.B = B
-        self._quantization_step = Decimal(B) ** (-F)  # ε = B^(-F)
-        self._max_representable = Decimal(B) ** E - self._quantization_step
-        self._L = E + F  # Longitud total
-        
-        # Convertir y cuantizar el valor
-        self.value = self._quantize(Decimal(str(value)))
-        self.raw_value = self._get_raw_value()
+        self._fmt = fixed_format(E, F, B)
+        self.raw_value = self._quantize(value, rounding)
     
     # ========== PROPIEDADES DE Q(E,F) ==========
     
+    @property
+    def E(self) -> int:
+        return self._fmt.E
+    
+    @property
+    def F(self) -> int:
+        return self._fmt.F
+    
+    @property
+    def B(self) -> int:
+        return self._fmt.base
+    
+    @property
+    def value(self) -> Decimal:
+        """Valor representado: M · B^(-F)."""
+        return self._fmt.to_decimal(self.raw_value)
+    
+    @property
+    def descriptor(self) -> FormatDescriptor:
+        """Características del formato Q(E,F) (compartidas, ver core.descriptores_formato)."""
+        return format_descriptor('fixed', self.E, self.F, self.B)
+    
     @property
     def epsilon(self) -> Decimal:
         """Épsilon: valor mínimo (no cero) representable en Q(E,F)."""
-        return self._quantization_step
+        return self.descriptor.epsilon_decimal
     
     @property
     def max_value(self) -> Decimal:
         """Valor máximo representable en Q(E,F)."""
-        return self._max_representable
+        return self.descriptor.max_value_decimal
     
     @property
     def min_value(self) -> Decimal:
@@ -91,110 +120,86 @@ class FixedPoint:
     @property
     def length(self) -> int:
         """Longitud total del registro: L = E + F."""
-        return self._L
+        return self.E + self.F
     
     @property
     def max_raw_value(self) -> int:
         """Valor máximo del registro sin escalar (M_max = B^L - 1)."""
-        return self.B ** self._L - 1
+        return self._fmt.raw_max
     
     # ========== MÉTODOS INTERNOS ==========
     
-    def _quantize(self, value: Decimal) -> Decimal:
+    def _quantize(self, value, rounding: str = 'nearest_even') -> int:
         """
-        Cuantizar un valor a la precisión Q(E,F).
+        Cuantizar un valor a la precisión Q(E,F): M = redondeo(value / ε).
         
         Redondea hacia el múltiplo más cercano de epsilon = B^(-F).
         """
-        if value < 0:
+        raw = self._fmt.quantize(value, rounding)
+        # Un negativo pequeño que redondea a 0 también se rechaza
+        if raw < 0 or (raw == 0 and self._fmt.quantize(value, 'toward_negative') < 0):
             raise ValueError(f"Solo se aceptan valores no-negativos. Recibido: {value}")
         
-        # Redondear al múltiplo más cercano de epsilon
-        quantized = (value / self.epsilon).quantize(Decimal(1)) * self.epsilon
-        
         # Verificar que cabe en el rango
-        if quantized > self.max_value:
-            raise OverflowError(
+        if raw > self._fmt.raw_max:
+            raise FixedPointOverflowError(
                 f"Valor {value} no cabe en Q({self.E},{self.F}) base {self.B}. "
                 f"Máximo: {self.max_value}"
             )
         
-        return quantized
-    
-    def _get_raw_value(self) -> int:
-        """Obtener el valor interno M = value * B^F."""
-        raw = (self.value * (Decimal(self.B) ** self.F)).to_integral_value()
-        return int(raw)
+        return raw
     
     @staticmethod
     def _from_raw(E: int, F: int, B: int, raw_value: int) -> 'FixedPoint':
         """Crear FixedPoint directamente desde valor crudo M."""
         fp = FixedPoint.__new__(FixedPoint)
-        fp.E = E
-        fp.F = F
-        fp.B = B
-        fp._L = E + F
-        fp._quantization_step = Decimal(B) ** (-F)
-        fp._max_representable = Decimal(B) ** E - fp._quantization_step
+        fp._fmt = fixed_format(E, F, B)
         fp.raw_value = raw_value
-        fp.value = Decimal(raw_value) * (Decimal(B) ** (-F))
         return fp
     
+    def _with_raw(self, raw_value: int) -> 'FixedPoint':
+        fp = FixedPoint.__new__(FixedPoint)
+        fp._fmt = self._fmt
+        fp.raw_value = raw_value
+        return fp
+    
+    def _operand(self, other: Union['FixedPoint', int, float], symbol: str) -> 'FixedPoint':
+        """Convierte int/float al mismo formato y comprueba que los formatos coinciden."""
+        if type(other) is FixedPoint and other._fmt is self._fmt:
+            return other
+        if isinstance(other, (int, float)):
+            return FixedPoint(self.E, self.F, self.B, other)
+        if other._fmt is not self._fmt and (self.E, self.F, self.B) != (other.E, other.F, other.B):
+            raise ValueError(
+                f"Formatos incompatibles: Q({self.E},{self.F}){self.B} "
+                f"{symbol} Q({other.E},{other.F}){other.B}"
+            )
+        return other
+    
     # ========== OPERACIONES ARITMÉTICAS ==========
     
-    def __add__(self, other: Union['FixedPoint', int, float]) -> 'FixedPoint':
+    def add(self, other: Union['FixedPoint', int, float], overflow: str = 'raise') -> 'FixedPoint':
         """
         Suma: (M1 + M2) * B^(-F)
         
         Ambos deben tener el mismo formato Q(E,F) y base B.
+        overflow: 'raise' (OverflowError), 'saturate' o 'wrap' (módulo B^L)
         """
-        if isinstance(other, (int, float)):
-            other = FixedPoint(self.E, self.F, self.B, other)
-        
-        if self.E != other.E or self.F != other.F or self.B != other.B:
-            raise ValueError(
-                f"Formatos incompatibles: Q({self.E},{self.F}){self.B} "
-                f"+ Q({other.E},{other.F}){other.B}"
-            )
-        
-        # Suma de valores crudos
-        result_raw = self.raw_value + other.raw_value
-        
-        # Verificar overflow
-        if result_raw > self.max_raw_value:
-            raise OverflowError(
-                f"Suma provoca overflow: {self.value} + {other.value} = "
-                f"{Decimal(result_raw) * self._quantization_step} > {self.max_value}"
-            )
-        
-        return FixedPoint._from_raw(self.E, self.F, self.B, result_raw)
+        other = self._operand(other, '+')
+        return self._with_raw(self._fmt.add(self.raw_value, other.raw_value, overflow))
     
-    def __sub__(self, other: Union['FixedPoint', int, float]) -> 'FixedPoint':
+    def sub(self, other: Union['FixedPoint', int, float], overflow: str = 'raise') -> 'FixedPoint':
         """
         Resta: (M1 - M2) * B^(-F)
         
-        Nota: Si el resultado es negativo, se lanza excepción (solo positivos).
+        Nota: Si el resultado es negativo, se lanza excepción (solo positivos)
+        salvo con overflow='saturate' (→ 0) o 'wrap' (módulo B^L).
         """
-        if isinstance(other, (int, float)):
-            other = FixedPoint(self.E, self.F, self.B, other)
-        
-        if self.E != other.E or self.F != other.F or self.B != other.B:
-            raise ValueError(
-                f"Formatos incompatibles: Q({self.E},{self.F}){self.B} "
-                f"- Q({other.E},{other.F}){other.B}"
-            )
-        
-        result_raw = self.raw_value - other.raw_value
-        
-        if result_raw < 0:
-            raise ValueError(
-                f"Resta daría resultado negativo: {self.value} - {other.value} = "
-                f"{Decimal(result_raw) * self._quantization_step}"
-            )
-        
-        return FixedPoint._from_raw(self.E, self.F, self.B, result_raw)
+        other = self._operand(other, '-')
+        return self._with_raw(self._fmt.sub(self.raw_value, other.raw_value, overflow))
     
-    def __mul__(self, other: Union['FixedPoint', int, float]) -> 'FixedPoint':
+    def mul(self, other: Union['FixedPoint', int, float], rounding: str = ARITHMETIC_ROUNDING,
+            overflow: str = 'raise') -> 'FixedPoint':
         """
         Multiplicación con reescalado: (M1 * M2) / B^F
         
@@ -204,31 +209,11 @@ class FixedPoint:
             (M1 * B^(-F)) * (M2 * B^(-F)) = (M1 * M2) * B^(-2F)
             Reescalado: (M1 * M2) * B^(-F) / B^F = (M1 * M2) / B^F
         """
-        if isinstance(other, (int, float)):
-            other = FixedPoint(self.E, self.F, self.B, other)
-        
-        if self.E != other.E or self.F != other.F or self.B != other.B:
-            raise ValueError(
-                f"Formatos incompatibles: Q({self.E},{self.F}){self.B} "
-                f"* Q({other.E},{other.F}){other.B}"
-            )
-        
-        # Multiplicación de valores crudos
-        product_raw = self.raw_value * other.raw_value
-        
-        # Reescalado: dividir por B^F
-        result_raw = product_raw // (self.B ** self.F)
-        
-        # Verificar overflow
-        if result_raw > self.max_raw_value:
-            raise OverflowError(
-                f"Multiplicación provoca overflow: {self.value} * {other.value} = "
-                f"{Decimal(result_raw) * self._quantization_step} > {self.max_value}"
-            )
-        
-        return FixedPoint._from_raw(self.E, self.F, self.B, result_raw)
+        other = self._operand(other, '*')
+        return self._with_raw(self._fmt.mul(self.raw_value, other.raw_value, rounding, overflow))
     
-    def __truediv__(self, other: Union['FixedPoint', int, float]) -> 'FixedPoint':
+    def div(self, other: Union['FixedPoint', int, float], rounding: str = ARITHMETIC_ROUNDING,
+            overflow: str = 'raise') -> 'FixedPoint':
         """
         División con reescalado: (M1 / M2) * B^F
         
@@ -238,63 +223,44 @@ class FixedPoint:
             (M1 * B^(-F)) / (M2 * B^(-F)) = M1 / M2
             Reescalado para mantener precisión: (M1 * B^F) / M2
         """
-        if isinstance(other, (int, float)):
-            other = FixedPoint(self.E, self.F, self.B, other)
-        
-        if self.E != other.E or self.F != other.F or self.B != other.B:
-            raise ValueError(
-                f"Formatos incompatibles: Q({self.E},{self.F}){self.B} "
-                f"/ Q({other.E},{other.F}){other.B}"
-            )
-        
-        if other.raw_value == 0:
-            raise ZeroDivisionError("División por cero en punto fijo")
-        
-        # Reescalado: multiplicar por B^F antes de dividir
-        numerator = self.raw_value * (self.B ** self.F)
-        result_raw = numerator // other.raw_value
-        
-        # Verificar overflow
-        if result_raw > self.max_raw_value:
-            raise OverflowError(
-                f"División provoca overflow: {self.value} / {other.value}"
-            )
-        
-        return FixedPoint._from_raw(self.E, self.F, self.B, result_raw)
+        other = self._operand(other, '/')
+        return self._with_raw(self._fmt.div(self.raw_value, other.raw_value, rounding, overflow))
+    
+    __add__ = add
+    __sub__ = sub
+    __mul__ = mul
+    __truediv__ = div
     
     # ========== COMPARACIÓN ==========
     
     def __eq__(self, other: Union['FixedPoint', int, float]) -> bool:
         """Igualdad exacta: comparar valores crudos."""
-        if isinstance(other, (int, float)):
-            other = FixedPoint(self.E, self.F, self.B, other)
-        return self.raw_value == other.raw_value
+        return self.raw_value == self._operand(other, '==').raw_value
     
     def __lt__(self, other: Union['FixedPoint', int, float]) -> bool:
         """Menor que: comparar valores crudos."""
-        if isinstance(other, (int, float)):
-            other = FixedPoint(self.E, self.F, self.B, other)
-        return self.raw_value < other.raw_value
+        return self.raw_value < self._operand(other, '<').raw_value
     
     def __le__(self, other: Union['FixedPoint', int, float]) -> bool:
         """Menor o igual que."""
-        if isinstance(other, (int, float)):
-            other = FixedPoint(self.E, self.F, self.B, other)
-        return self.raw_value <= other.raw_value
+        return self.raw_value <= self._operand(other, '<=').raw_value
     
     def __gt__(self, other: Union['FixedPoint', int, float]) -> bool:
         """Mayor que."""
-        if isinstance(other, (int, float)):
-            other = FixedPoint(self.E, self.F, self.B, other)
-        return self.raw_value > other.raw_value
+        return self.raw_value > self._operand(other, '>').raw_value
     
     def __ge__(self, other: Union['FixedPoint', int, float]) -> bool:
         """Mayor o igual que."""
-        if isinstance(other, (int, float)):
-            other = FixedPoint(self.E, self.F, self.B, other)
-        return self.raw_value >= other.raw_value
+        return self.raw_value >= self._operand(other, '>=').raw_value
+    
+    # ========== CONVERSIÓN ==========
+    
+    def __float__(self) -> float:
+        return self._fmt.to_float(self.raw_value)
     
-    # ========== CONVERSIÓN A STRING ==========
+    def to_fraction(self) -> Fraction:
+        """Valor exacto M / B^F."""
+        return self._fmt.to_fraction(self.raw_value)
     
     def __str__(self) -> str:
         """Representación en decimal."""
@@ -322,7 +288,7 @@ class FixedPoint:
         """Información detallada del número Q(E,F)."""
         lines = [
             f"Formato: Q({self.E},{self.F}) base {self.B}",
-            f"Longitud total: L = E + F = {self._L} dígitos",
+            f"Longitud total: L = E + F = {self.length} dígitos",
             f"Valor: {self.value}",
             f"Valor crudo: M = {self.raw_value}",
             f"Épsilon (mínimo no-cero): ε = {self.epsilon}",
@@ -342,8 +308,9 @@ class FixedPoint:
         
         Useful para ver propiedades del formato sin un valor específico.
         """
-        epsilon = Decimal(B) ** (-F)
-        max_val = Decimal(B) ** E - epsilon
+        descriptor = format_descriptor('fixed', E, F, B)
+        epsilon = descriptor.epsilon_decimal
+        max_val = descriptor.max_value_decimal
         L = E + F
         
         lines = [
@@ -354,7 +321,7 @@ class FixedPoint:
             f"Rango de valores: [0, {max_val}]",
             f"Épsilon (precisión): ε = {B}^(-{F}) = {epsilon}",
             f"Número máximo: {max_val}",
-            f"Máximo valor crudo: M_max = {B}^{L} - 1 = {B**L - 1}",
+            f"Máximo valor crudo: M_max = {B}^{L} - 1 = {descriptor.raw_range[1]}",
             f"Eficacia: 100%",
             f"═══════════════════════════════════════",
         ]
@@ -369,8 +336,9 @@ def create_fixed_point(E: int, F: int, B: int = 2) -> dict:
     
     Útil para comparar diferentes formatos sin crear instancias.
     """
-    epsilon = Decimal(B) ** (-F)
-    max_val = Decimal(B) ** E - epsilon
+    descriptor = format_descriptor('fixed', E, F, B)
+    epsilon = descriptor.epsilon_decimal
+    max_val = descriptor.max_value_decimal
     
     return {
         'format': f"Q({E},{F})",
@@ -381,7 +349,7 @@ def create_fixed_point(E: int, F: int, B: int = 2) -> dict:
         'epsilon': float(epsilon),
         'max_value': float(max_val),
         'min_value': 0.0,
-        'max_raw_value': B ** (E + F) - 1,
+        'max_raw_value': descriptor.raw_range[1],
     }
 
 
@@ -25,6 +25,7 @@ Ejemplo:
 import json
 from typing import List, Dict, Tuple
 from dataclasses import asdict
+from core.barrido_errores import compare_formats
 from core.punto_fijo_unified import FixedPointUnified
 
 
@@ -264,6 +265,20 @@ class FixedPointComparator:
         
         return json.dumps(data, indent=2, ensure_ascii=False)
     
+    def compare_errors(self, fps: List, values, rounding: str = 'nearest_even',
+                       overflow: str = 'saturate') -> Dict[str, Dict]:
+        """
+        Estadísticas de error de varios formatos sobre la misma muestra.
+        
+        Args:
+            fps: lista de formatos (FixedPointUnified, FixedPointFloating, IEEE754Gen)
+            values: muestra (lista o array de NumPy)
+            
+        Returns:
+            dict str(formato) → error_summary (ver core.barrido_errores)
+        """
+        return compare_formats(fps, values, rounding, overflow)
+    
     def export_json_file(self, fps: List[FixedPointUnified], filename: str) -> None:
         """
         Exporta comparativa a archivo JSON.
@@ -20,6 +20,8 @@ from decimal import Decimal
 from typing import Tuple
 import math
 
+from core.punto_fijo_raw import fixed_format
+
 
 class FixedPointSignedMS:
     """Punto fijo con signo usando Magnitud y Signo (M&S)."""
@@ -42,6 +44,7 @@ class FixedPointSignedMS:
         self.epsilon = Decimal(base) ** (-F)  # Precisión
         self.max_value = Decimal(base) ** E - self.epsilon  # Máximo positivo
         self.min_value = -(Decimal(base) ** E - self.epsilon)  # Mínimo (más negativo)
+        self.raw_format = fixed_format(E, F, base, 'ms')  # Aritmética entera
         
     def __repr__(self) -> str:
         return f"Q({self.E},{self.F})_signed_MS base {self.base}"
@@ -121,25 +124,30 @@ class FixedPointSignedMS:
         
         return float(sign * value)
     
-    def add(self, v1: float, v2: float) -> float:
-        """Suma con punto fijo con signo."""
-        return v1 + v2
+    def add(self, v1: float, v2: float, overflow: str = 'raise') -> float:
+        """Suma con punto fijo con signo (entera sobre los valores crudos)."""
+        fmt = self.raw_format
+        return fmt.to_float(fmt.add(fmt.from_value(v1), fmt.from_value(v2), overflow))
     
-    def subtract(self, v1: float, v2: float) -> float:
+    def subtract(self, v1: float, v2: float, overflow: str = 'raise') -> float:
         """Resta con punto fijo con signo."""
-        return v1 - v2
-    
-    def multiply(self, v1: float, v2: float) -> float:
-        """Multiplicación con punto fijo con signo."""
-        result = v1 * v2
-        # Reescalar si es necesario
-        return result
-    
-    def divide(self, v1: float, v2: float) -> float:
-        """División con punto fijo con signo."""
-        if v2 == 0:
+        fmt = self.raw_format
+        return fmt.to_float(fmt.sub(fmt.from_value(v1), fmt.from_value(v2), overflow))
+    
+    def multiply(self, v1: float, v2: float, rounding: str = 'nearest_even',
+                 overflow: str = 'raise') -> float:
+        """Multiplicación con punto fijo con signo (reescalado: n1·n2 / B^F redondeado)."""
+        fmt = self.raw_format
+        return fmt.to_float(fmt.mul(fmt.from_value(v1), fmt.from_value(v2), rounding, overflow))
+    
+    def divide(self, v1: float, v2: float, rounding: str = 'nearest_even',
+               overflow: str = 'raise') -> float:
+        """División con punto fijo con signo (n1·B^F / n2 redondeado)."""
+        fmt = self.raw_format
+        divisor = fmt.from_value(v2)
+        if divisor == 0:
             raise ValueError("División por cero")
-        return v1 / v2
+        return fmt.to_float(fmt.div(fmt.from_value(v1), divisor, rounding, overflow))
 
 
 class FixedPointSignedComplement:
@@ -164,6 +172,7 @@ class FixedPointSignedComplement:
         self.max_value = Decimal(base) ** E - self.epsilon  # Máximo positivo
         self.min_value = -Decimal(base) ** E  # Mínimo (más negativo)
         self.modulo = Decimal(base) ** (E + F + 1)  # Para complemento
+        self.raw_format = fixed_format(E, F, base, 'complement')  # Aritmética entera
         
     def __repr__(self) -> str:
         return f"Q({self.E},{self.F})_signed_complement base {self.base}"
@@ -237,27 +246,30 @@ class FixedPointSignedComplement:
         value = Decimal(m_int) * Decimal(self.base) ** (-self.F)
         return float(value)
     
-    def add(self, v1: float, v2: float) -> float:
-        """Suma con complemento a base."""
-        # En complemento a base, suma es suma directa (módulo automático)
-        result = v1 + v2
-        
-        # Si excede rango, wrapping ocurre automáticamente en la aritmética modular
-        return result
+    def add(self, v1: float, v2: float, overflow: str = 'raise') -> float:
+        """Suma con complemento a base (overflow='wrap' da la aritmética modular del hardware)."""
+        fmt = self.raw_format
+        return fmt.to_float(fmt.add(fmt.from_value(v1), fmt.from_value(v2), overflow))
     
-    def subtract(self, v1: float, v2: float) -> float:
+    def subtract(self, v1: float, v2: float, overflow: str = 'raise') -> float:
         """Resta con complemento a base."""
-        return v1 - v2
+        fmt = self.raw_format
+        return fmt.to_float(fmt.sub(fmt.from_value(v1), fmt.from_value(v2), overflow))
     
-    def multiply(self, v1: float, v2: float) -> float:
+    def multiply(self, v1: float, v2: float, rounding: str = 'nearest_even',
+                 overflow: str = 'raise') -> float:
         """Multiplicación con complemento a base."""
-        return v1 * v2
+        fmt = self.raw_format
+        return fmt.to_float(fmt.mul(fmt.from_value(v1), fmt.from_value(v2), rounding, overflow))
     
-    def divide(self, v1: float, v2: float) -> float:
+    def divide(self, v1: float, v2: float, rounding: str = 'nearest_even',
+               overflow: str = 'raise') -> float:
         """División con complemento a base."""
-        if v2 == 0:
+        fmt = self.raw_format
+        divisor = fmt.from_value(v2)
+        if divisor == 0:
             raise ValueError("División por cero")
-        return v1 / v2
+        return fmt.to_float(fmt.div(fmt.from_value(v1), divisor, rounding, overflow))
     
     def complement(self, M: int) -> int:
         """
@@ -0,0 +1,235 @@
+"""
+Aritmética de punto fijo sobre el valor crudo entero.
+
+Un número Q(E,F) en base B es n · B^(-F) con n entero (el valor crudo). Todas
+las operaciones se hacen sobre n con enteros de Python:
+
+    suma/resta:        n1 ± n2
+    multiplicación:    redondeo(n1 · n2 / B^F)
+    división:          redondeo(n1 · B^F / n2)
+
+y el resultado se ajusta al rango del formato según el modo de desbordamiento.
+Decimal / float solo aparecen en los extremos (entrada y salida).
+
+Representaciones (rango del valor crudo, L = E + F):
+    'unsigned'    [0, B^L - 1]
+    'ms'          [-(B^L - 1), B^L - 1]      (magnitud y signo)
+    'complement'  [-B^L, B^L - 1]            (complemento a la base)
+
+Modos de redondeo: los de IEEE 754 (core.ieee754.ROUNDING_MODES).
+Modos de desbordamiento:
+    'wrap'      aritmética modular sobre el rango (en M&S, sobre la magnitud)
+    'saturate'  se satura al mínimo / máximo representable
+    'raise'     FixedPointOverflowError
+
+Ejemplo:
+    fmt = fixed_format(4, 4, 2, 'complement')
+    a = fmt.from_value(5.25)            → 84
+    fmt.mul(a, fmt.from_value(-1.5))    → -126  (-7.875)
+    fmt.to_decimal(-126)                → Decimal('-7.8750')
+"""
+
+from decimal import Decimal
+from fractions import Fraction
+from functools import lru_cache
+from typing import Optional, Tuple
+import math
+
+from core.ieee754 import ROUNDING_MODES, _exact_value
+
+REPRESENTATIONS = ('unsigned', 'ms', 'complement')
+OVERFLOW_MODES = ('wrap', 'saturate', 'raise')
+
+
+class FixedPointOverflowError(OverflowError, ValueError):
+    """
+    Resultado fuera del rango del formato (modo 'raise').
+
+    Hereda de OverflowError (contrato de FixedPoint) y de ValueError (contrato
+    de FixedPointUnified y las clases con signo).
+    """
+
+
+def round_div(numerator: int, denominator: int, rounding: str = 'nearest_even') -> int:
+    """
+    numerator / denominator redondeado a entero según el modo, sin floats.
+
+    Raises:
+        ZeroDivisionError: si denominator == 0
+    """
+    if rounding not in ROUNDING_MODES:
+        raise ValueError(f"Modo de redondeo desconocido: {rounding}. Modos: {', '.join(ROUNDING_MODES)}")
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    q, r = divmod(numerator, denominator)  # q = floor
+    if r == 0 or rounding == 'toward_negative':
+        return q
+    if rounding == 'toward_positive':
+        return q + 1
+    if rounding == 'toward_zero':
+        return q if numerator >= 0 else q + 1
+    doble = 2 * r
+    if doble < denominator:
+        return q
+    if doble > denominator:
+        return q + 1
+    if rounding == 'nearest_away':
+        return q + 1 if numerator >= 0 else q
+    return q if q % 2 == 0 else q + 1
+
+
+class FixedFormat:
+    """
+    Formato Q(E,F) en base B: rango del valor crudo y operaciones enteras.
+
+    Los modos rounding / overflow del formato son los valores por defecto de
+    cada operación; cualquiera de ellas acepta otro modo puntual.
+    """
+
+    __slots__ = ('E', 'F', 'base', 'representation', 'rounding', 'overflow',
+                 'scale', 'raw_min', 'raw_max')
+
+    def __init__(self, E: int, F: int, base: int = 2, representation: str = 'unsigned',
+                 rounding: str = 'nearest_even', overflow: str = 'raise'):
+        if E < 0 or F < 0:
+            raise ValueError(f"E y F deben ser no-negativos. E={E}, F={F}")
+        if base < 2:
+            raise ValueError(f"Base debe ser >= 2. base={base}")
+        if representation not in REPRESENTATIONS:
+            raise ValueError(f"Representación desconocida: {representation}. "
+                             f"Representaciones: {', '.join(REPRESENTATIONS)}")
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Modo de redondeo desconocido: {rounding}. Modos: {', '.join(ROUNDING_MODES)}")
+        if overflow not in OVERFLOW_MODES:
+            raise ValueError(f"Modo de desbordamiento desconocido: {overflow}. "
+                             f"Modos: {', '.join(OVERFLOW_MODES)}")
+
+        self.E = E
+        self.F = F
+        self.base = base
+        self.representation = representation
+        self.rounding = rounding
+        self.overflow = overflow
+        self.scale = base ** F
+        digits = base ** (E + F)
+        self.raw_max = digits - 1
+        if representation == 'unsigned':
+            self.raw_min = 0
+        elif representation == 'ms':
+            self.raw_min = -(digits - 1)
+        else:
+            self.raw_min = -digits
+
+    def __repr__(self) -> str:
+        return (f"FixedFormat(E={self.E}, F={self.F}, base={self.base}, "
+                f"representation='{self.representation}')")
+
+    # ------------------------------------------------------------------
+    # Extremos: valor ↔ crudo
+    # ------------------------------------------------------------------
+
+    def quantize(self, value, rounding: Optional[str] = None) -> int:
+        """
+        Valor (int, float, Fraction, Decimal o str) → crudo redondeado, sin comprobar rango.
+
+        Los float se toman por su representación decimal más corta, como
+        Decimal(str(x)): 0.15 es 15/100 y no el binario más cercano.
+        """
+        if isinstance(value, float) and math.isfinite(value):
+            value = repr(value)
+        sign, magnitude, special = _exact_value(value)
+        if special is not None:
+            raise ValueError(f"Valor no finito: {value}")
+        exact = -magnitude if sign else magnitude
+        return round_div(exact.numerator * self.scale, exact.denominator, rounding or self.rounding)
+
+    def from_value(self, value, rounding: Optional[str] = None) -> int:
+        """
+        Valor → crudo dentro del rango.
+
+        Raises:
+            FixedPointOverflowError: si el valor cuantizado no cabe en el formato
+        """
+        raw = self.quantize(value, rounding)
+        if not self.raw_min <= raw <= self.raw_max:
+            low, high = self.range
+            raise FixedPointOverflowError(f"Valor {value} fuera de rango [{low}, {high}]")
+        return raw
+
+    def to_fraction(self, raw: int) -> Fraction:
+        return Fraction(raw, self.scale)
+
+    def to_decimal(self, raw: int) -> Decimal:
+        return Decimal(raw) * Decimal(self.base) ** (-self.F)
+
+    def to_float(self, raw: int) -> float:
+        """Cociente de enteros: un solo redondeo a float."""
+        return raw / self.scale
+
+    @property
+    def range(self) -> Tuple[Decimal, Decimal]:
+        """(mínimo, máximo) representables como Decimal."""
+        return self.to_decimal(self.raw_min), self.to_decimal(self.raw_max)
+
+    # ------------------------------------------------------------------
+    # Desbordamiento
+    # ------------------------------------------------------------------
+
+    def fit(self, raw: int, overflow: Optional[str] = None, operation: str = "Operación") -> int:
+        """Ajusta un crudo al rango según el modo de desbordamiento."""
+        if self.raw_min <= raw <= self.raw_max:
+            return raw
+        overflow = overflow or self.overflow
+        if overflow == 'saturate':
+            return self.raw_max if raw > self.raw_max else self.raw_min
+        if overflow == 'wrap':
+            if self.representation == 'ms':
+                magnitude = abs(raw) % (self.raw_max + 1)
+                return -magnitude if raw < 0 else magnitude
+            return (raw - self.raw_min) % (self.raw_max - self.raw_min + 1) + self.raw_min
+        if overflow != 'raise':
+            raise ValueError(f"Modo de desbordamiento desconocido: {overflow}. "
+                             f"Modos: {', '.join(OVERFLOW_MODES)}")
+        low, high = self.range
+        raise FixedPointOverflowError(
+            f"{operation} provoca overflow: resultado {self.to_decimal(raw)} fuera de rango [{low}, {high}]"
+        )
+
+    # ------------------------------------------------------------------
+    # Operaciones sobre crudos
+    # ------------------------------------------------------------------
+
+    def add(self, a: int, b: int, overflow: Optional[str] = None) -> int:
+        raw = a + b
+        if self.raw_min <= raw <= self.raw_max:
+            return raw
+        return self.fit(raw, overflow, "Suma")
+
+    def sub(self, a: int, b: int, overflow: Optional[str] = None) -> int:
+        raw = a - b
+        if self.raw_min <= raw <= self.raw_max:
+            return raw
+        return self.fit(raw, overflow, "Resta")
+
+    def neg(self, a: int, overflow: Optional[str] = None) -> int:
+        return self.fit(-a, overflow, "Negación")
+
+    def mul(self, a: int, b: int, rounding: Optional[str] = None, overflow: Optional[str] = None) -> int:
+        """(a · B^-F) · (b · B^-F) = a·b · B^-2F → reescalado a B^-F con redondeo."""
+        raw = round_div(a * b, self.scale, rounding or self.rounding)
+        if self.raw_min <= raw <= self.raw_max:
+            return raw
+        return self.fit(raw, overflow, "Multiplicación")
+
+    def div(self, a: int, b: int, rounding: Optional[str] = None, overflow: Optional[str] = None) -> int:
+        """(a · B^-F) / (b · B^-F) = a / b → a · B^F / b con redondeo."""
+        if b == 0:
+            raise ZeroDivisionError("División por cero en punto fijo")
+        return self.fit(round_div(a * self.scale, b, rounding or self.rounding), overflow, "División")
+
+
+@lru_cache(maxsize=256)
+def fixed_format(E: int, F: int, base: int = 2, representation: str = 'unsigned',
+                 rounding: str = 'nearest_even', overflow: str = 'raise') -> FixedFormat:
+    """FixedFormat compartido (los formatos son inmutables en la práctica)."""
+    return FixedFormat(E, F, base, representation, rounding, overflow)
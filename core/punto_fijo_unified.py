@@ -33,6 +33,10 @@ from dataclasses import dataclass
 from typing import Union, Tuple
 import math
 
+from core import barrido_errores
+from core.descriptores_formato import format_descriptor
+from core.punto_fijo_raw import fixed_format
+
 
 @dataclass
 class FixedPointConfig:
@@ -81,22 +85,18 @@ class FixedPointUnified:
         self.signed = signed
         self.representation = representation
         
-        # Precalcular valores importantes
-        self.epsilon = self.base ** (-F)  # Resolución mínima
-        self.base_power_E = self.base ** E
-        self.base_power_F = self.base ** F
-        self.total_bits = E + F + (1 if signed else 0)
+        # Valores importantes, compartidos por todas las instancias del formato:
+        # sin signo [0, B^E - ε], M&S ±(B^E - ε), complemento [-B^E, B^E - ε]
+        raw_representation = representation if signed else 'unsigned'
+        self.descriptor = format_descriptor('fixed', E, F, base, raw_representation)
+        self.epsilon = self.descriptor.epsilon_float  # Resolución mínima
+        self.base_power_E = self.descriptor.base_power_E
+        self.base_power_F = self.descriptor.scale
+        self.total_bits = self.descriptor.total_digits
+        self.min_value, self.max_value = self.descriptor.float_range
         
-        # Calcular rango
-        if not signed:
-            self.min_value = 0
-            self.max_value = self.base_power_E - self.epsilon
-        elif representation == 'ms':
-            self.min_value = -(self.base_power_E - self.epsilon)
-            self.max_value = self.base_power_E - self.epsilon
-        else:  # complemento
-            self.min_value = -self.base_power_E
-            self.max_value = self.base_power_E - self.epsilon
+        # Aritmética entera sobre el valor crudo n = valor · B^F
+        self.raw_format = fixed_format(E, F, base, raw_representation)
     
     def encode(self, value: float) -> int:
         """
@@ -185,40 +185,24 @@ class FixedPointUnified:
                 magnitude = (self.base ** (self.E + self.F)) - raw_value
                 return -magnitude / self.base_power_F
     
-    def add(self, a: float, b: float) -> float:
+    def add(self, a: float, b: float, overflow: str = 'raise') -> float:
         """
         Suma dos números en punto fijo.
         
         Args:
             a, b: operandos
+            overflow: 'raise', 'saturate' o 'wrap' (ver core.punto_fijo_raw)
             
         Returns:
             a + b
             
         Raises:
-            ValueError: si el resultado desborda
+            ValueError: si un operando o el resultado desborda (overflow='raise')
         """
-        result = a + b
-        
-        # Validar rango
-        if result < self.min_value or result > self.max_value:
-            raise ValueError(
-                f"Resultado {result} fuera de rango [{self.min_value}, {self.max_value}]"
-            )
-        
-        # Codificar → decodificar para simular hardware
-        M_a = self.encode(a)
-        M_b = self.encode(b)
-        M_result = M_a + M_b
-        
-        # Manejar overflow (complemento a base)
-        max_raw = (1 << (self.E + self.F + (1 if self.signed else 0))) - 1
-        if M_result > max_raw:
-            M_result = M_result & ((1 << (self.E + self.F + (1 if self.signed else 0))) - 1)
-        
-        return self.decode(M_result)
+        fmt = self.raw_format
+        return fmt.to_float(fmt.add(fmt.from_value(a), fmt.from_value(b), overflow))
     
-    def subtract(self, a: float, b: float) -> float:
+    def subtract(self, a: float, b: float, overflow: str = 'raise') -> float:
         """
         Resta dos números en punto fijo.
         
@@ -228,32 +212,29 @@ class FixedPointUnified:
         Returns:
             a - b
         """
-        return self.add(a, -b)
+        fmt = self.raw_format
+        return fmt.to_float(fmt.sub(fmt.from_value(a), fmt.from_value(b), overflow))
     
-    def multiply(self, a: float, b: float) -> float:
+    def multiply(self, a: float, b: float, rounding: str = 'nearest_even',
+                 overflow: str = 'raise') -> float:
         """
         Multiplica dos números en punto fijo.
         
         Args:
             a, b: operandos
+            rounding: redondeo del producto a múltiplo de ε (ver ROUNDING_MODES)
             
         Returns:
-            a * b
+            a * b cuantizado al formato
             
         Raises:
             ValueError: si el resultado desborda
         """
-        result = a * b
-        
-        # Validar rango
-        if result < self.min_value or result > self.max_value:
-            raise ValueError(
-                f"Resultado {result} fuera de rango [{self.min_value}, {self.max_value}]"
-            )
-        
-        return result
+        fmt = self.raw_format
+        return fmt.to_float(fmt.mul(fmt.from_value(a), fmt.from_value(b), rounding, overflow))
     
-    def divide(self, a: float, b: float) -> float:
+    def divide(self, a: float, b: float, rounding: str = 'nearest_even',
+               overflow: str = 'raise') -> float:
         """
         Divide dos números en punto fijo.
         
@@ -261,23 +242,16 @@ class FixedPointUnified:
             a, b: operandos (b != 0)
             
         Returns:
-            a / b
+            a / b cuantizado al formato
             
         Raises:
             ValueError: si b == 0 o resultado desborda
         """
-        if b == 0:
+        fmt = self.raw_format
+        divisor = fmt.from_value(b)
+        if divisor == 0:
             raise ValueError("División por cero")
-        
-        result = a / b
-        
-        # Validar rango
-        if result < self.min_value or result > self.max_value:
-            raise ValueError(
-                f"Resultado {result} fuera de rango [{self.min_value}, {self.max_value}]"
-            )
-        
-        return result
+        return fmt.to_float(fmt.div(fmt.from_value(a), divisor, rounding, overflow))
     
     def error_absolute(self, true_value: float) -> float:
         """Error absoluto de representación."""
@@ -291,6 +265,18 @@ class FixedPointUnified:
             return 0.0
         return self.error_absolute(true_value) / abs(true_value)
     
+    def quantize_many(self, values, rounding: str = 'nearest_even', overflow: str = 'saturate'):
+        """Cuantiza muchos valores a la vez (ver core.barrido_errores)."""
+        return barrido_errores.quantize_many(self, values, rounding, overflow)
+    
+    def error_many(self, values, rounding: str = 'nearest_even', overflow: str = 'saturate') -> dict:
+        """Errores absoluto/relativo y máscara de overflow por muestra."""
+        return barrido_errores.error_many(self, values, rounding, overflow)
+    
+    def error_summary(self, values, rounding: str = 'nearest_even', overflow: str = 'saturate') -> dict:
+        """Error máximo/medio/RMS y recuento de overflows de una muestra."""
+        return barrido_errores.error_summary(self, values, rounding, overflow)
+    
     def __repr__(self) -> str:
         signed_str = f"signed={self.representation}" if self.signed else "unsigned"
         return (
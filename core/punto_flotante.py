@@ -13,12 +13,19 @@ Ventaja sobre punto fijo:
 
 Al mantener M ∈ [1,2), el error relativo se mantiene constante independientemente
 de la escala del número representado.
+
+Las operaciones (add, subtract, multiply, divide) calculan el resultado exacto
+con enteros y lo redondean una vez a F_M cifras (core.flotante_exacto), con
+cualquiera de los modos de redondeo de IEEE 754.
 """
 
 from decimal import Decimal
+from functools import cached_property
 from typing import Tuple
 import math
 
+from core.flotante_exacto import FormatoFlotante
+
 
 class FixedPointFloating:
     """Punto flotante básico con mantisa normalizada en [1,2)."""
@@ -160,53 +167,38 @@ class FixedPointFloating:
         value = sign_mult * float(mantisa) * (self.base ** exponent)
         return value
     
-    def add(self, v1: float, v2: float) -> float:
+    @cached_property
+    def formato(self) -> FormatoFlotante:
+        """Formato del motor exacto (core.flotante_exacto) equivalente."""
+        return FormatoFlotante.de_punto_flotante(self)
+    
+    def operate(self, operation: str, v1: float, v2: float, rounding: str = 'nearest_even') -> float:
+        """
+        v1 <operation> v2 ('add', 'subtract', 'multiply', 'divide') en el formato.
+        
+        Los operandos se redondean a F_M cifras y el resultado exacto se
+        redondea una sola vez (aritmética entera, ver core.flotante_exacto):
+        satura en max_value y se anula por debajo de B^E_min.
+        """
+        return self.formato.a_float(self.formato.operar(operation, v1, v2, rounding))
+    
+    def add(self, v1: float, v2: float, rounding: str = 'nearest_even') -> float:
         """
         Suma en punto flotante.
         
         Procedimiento:
         1. Normalizar ambos números
-        2. Igualar exponentes (usando el mayor)
+        2. Igualar exponentes (usando el menor, sin perder cifras)
         3. Sumar mantisas
-        4. Renormalizar si es necesario
+        4. Renormalizar y redondear a F_M cifras
         """
-        if v1 == 0:
-            return v2
-        if v2 == 0:
-            return v1
-        
-        # Normalizar
-        m1, e1 = self.normalize(v1)
-        m2, e2 = self.normalize(v2)
-        
-        # Igualar exponentes (usar el mayor)
-        if e1 > e2:
-            # Reducir mantisa 2
-            m2 = m2 / (self.base ** (e1 - e2))
-            e = e1
-        else:
-            # Reducir mantisa 1
-            m1 = m1 / (self.base ** (e2 - e1))
-            e = e2
-        
-        # Sumar mantisas
-        m_sum = m1 + m2
-        
-        # Renormalizar si es necesario
-        if m_sum != 0:
-            m_result, e_correction = self.normalize(m_sum)
-            e = e + e_correction
-        else:
-            m_result = 0
-        
-        # Reconstruir
-        return self.denormalize(m_result, e)
+        return self.operate('add', v1, v2, rounding)
     
-    def subtract(self, v1: float, v2: float) -> float:
+    def subtract(self, v1: float, v2: float, rounding: str = 'nearest_even') -> float:
         """Resta en punto flotante."""
-        return self.add(v1, -v2)
+        return self.operate('subtract', v1, v2, rounding)
     
-    def multiply(self, v1: float, v2: float) -> float:
+    def multiply(self, v1: float, v2: float, rounding: str = 'nearest_even') -> float:
         """
         Multiplicación en punto flotante.
         
@@ -214,51 +206,23 @@ class FixedPointFloating:
         1. Normalizar ambos números
         2. Multiplicar mantisas
         3. Sumar exponentes
-        4. Renormalizar si es necesario
+        4. Renormalizar y redondear a F_M cifras
         """
-        if v1 == 0 or v2 == 0:
-            return 0.0
-        
-        # Normalizar
-        m1, e1 = self.normalize(v1)
-        m2, e2 = self.normalize(v2)
-        
-        # Multiplicar
-        m_product = m1 * m2
-        e_product = e1 + e2
-        
-        # Renormalizar (puede que |m_product| esté fuera de [1, base))
-        if m_product != 0:
-            m_result, e_correction = self.normalize(m_product)
-            e_result = e_product + e_correction
-        else:
-            m_result = 0
-            e_result = 0
-        
-        return self.denormalize(m_result, e_result)
+        return self.operate('multiply', v1, v2, rounding)
     
-    def divide(self, v1: float, v2: float) -> float:
-        """División en punto flotante."""
+    def divide(self, v1: float, v2: float, rounding: str = 'nearest_even') -> float:
+        """División en punto flotante (el cociente exacto se redondea una vez)."""
         if v2 == 0:
             raise ValueError("División por cero")
-        
-        # Normalizar
-        m1, e1 = self.normalize(v1)
-        m2, e2 = self.normalize(v2)
-        
-        # Dividir
-        m_quotient = m1 / m2
-        e_quotient = e1 - e2
-        
-        # Renormalizar
-        if m_quotient != 0:
-            m_result, e_correction = self.normalize(m_quotient)
-            e_result = e_quotient + e_correction
-        else:
-            m_result = 0
-            e_result = 0
-        
-        return self.denormalize(m_result, e_result)
+        return self.operate('divide', v1, v2, rounding)
+    
+    def operate_traced(self, operation: str, v1: float, v2: float, rounding: str = 'nearest_even') -> dict:
+        """Operación con sus pasos y las cifras de guarda, redondeo y sticky."""
+        return self.formato.operar_traza(operation, v1, v2, rounding)
+    
+    def operate_many(self, operation: str, values1, values2, rounding: str = 'nearest_even'):
+        """operate sobre dos lotes (vectorizado con NumPy cuando el formato lo permite)."""
+        return self.formato.operar_lote(operation, values1, values2, rounding)
     
     def relative_error(self, true_value: float) -> float:
         """
@@ -285,6 +249,26 @@ class FixedPointFloating:
                        ≈ ε_mantisa × |valor|
         """
         return self.relative_error(true_value) * abs(true_value)
+    
+    def quantize_many(self, values, rounding: str = 'nearest_even'):
+        """
+        Cuantiza muchos valores a la vez (ver core.barrido_errores).
+        
+        A diferencia de relative_error (cota ε_mantisa), aquí se redondea la
+        mantisa de cada valor y se obtiene el error real.
+        """
+        from core.barrido_errores import quantize_many
+        return quantize_many(self, values, rounding)
+    
+    def error_many(self, values, rounding: str = 'nearest_even') -> dict:
+        """Errores absoluto/relativo y máscaras de overflow/underflow por muestra."""
+        from core.barrido_errores import error_many
+        return error_many(self, values, rounding)
+    
+    def error_summary(self, values, rounding: str = 'nearest_even') -> dict:
+        """Error máximo/medio/RMS y recuentos de overflow/underflow de una muestra."""
+        from core.barrido_errores import error_summary
+        return error_summary(self, values, rounding)
 
 
 def demonstrate_normalization():
@@ -360,6 +344,18 @@ def demonstrate_error_stability():
     
     print(f"\nObservacion: El error relativo es CONSTANTE en punto flotante")
     print(f"             El error absoluto cambia proporcionalmente al valor")
+    
+    # Barrido con operaciones reales: x · 3 redondeado, 1000 valores por escala
+    print(f"\n--- ERROR RELATIVO REAL DE x × 3 (operate_many) ---")
+    print(f"Cota con redondeo al más cercano: epsilon / 2 = {epsilon_float / 2:.6f}")
+    print(f"{'Escala':<15} {'Error Relativo Maximo':<25}")
+    print("-" * 40)
+    for scale in [2.0 ** -10, 1, 2.0 ** 10]:
+        xs = [scale * (1 + i / 1000) for i in range(1000)]
+        exact = [3 * fp.formato.a_float(fp.formato.redondear(x)) for x in xs]
+        products = fp.operate_many('multiply', xs, [3] * len(xs))
+        worst = max(abs(p - e) / e for p, e in zip(products, exact))
+        print(f"{scale:<15.2e} {worst:<25.6f}")
 
 
 def demonstrate_operations():
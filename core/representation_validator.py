@@ -10,6 +10,14 @@ Proporciona:
 - Reporte de validez
 - Recomendaciones de uso
 - Análisis de errores
+- Ida y vuelta sobre muestras (encode_many / decode_many / quantize_many)
+
+Validación por lotes (validate_many):
+    Las representaciones se agrupan por clave de formato (la del descriptor
+    de core.descriptores_formato, o bits + tabla en los biquinarios): cada
+    formato se valida una sola vez, en un pool de procesos si hay bastantes.
+    El resultado es un ValidationResult compacto (serializable a JSON) que
+    ValidationCache guarda entre ejecuciones.
 
 Ejemplo:
     >>> from core.punto_fijo_unified import FixedPointUnified
@@ -21,9 +29,35 @@ Ejemplo:
     >>> print(report.summary())
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from fractions import Fraction
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Tuple, Union
 from enum import Enum
+import json
+import math
+import os
+import random
+import sys
+
+from core.barrido_errores import HAS_NUMPY, error_summary, quantize_many
+from core.descriptores_formato import descriptor_of
+from core.ieee754 import IEEE754Gen
+from core.punto_fijo_unified import FixedPointUnified
+
+# Versión de los chequeos: forma parte de la clave de caché
+VALIDATION_VERSION = 1
+
+# Muestras de ida y vuelta por validación (ruta exacta sin vectorizar: MAX_EXACT_SAMPLES)
+DEFAULT_SAMPLES = 256
+MAX_EXACT_SAMPLES = 64
+
+# Por debajo de este número de formatos pendientes no compensa arrancar el pool
+MIN_PARALLEL = 8
+
+# Mayor valor crudo / significando exacto en float64
+MAX_EXACT_FLOAT = 2 ** 53
 
 
 class ValidationLevel(Enum):
@@ -44,10 +78,12 @@ class ValidationReport:
     issues: List[str] = field(default_factory=list)
     recommendations: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    levels: List[str] = field(default_factory=list)  # Nivel de cada issue
     
     def add_issue(self, level: ValidationLevel, message: str) -> None:
         """Agrega un problema al reporte."""
         self.issues.append(f"{level.value}: {message}")
+        self.levels.append(level.name)
         if level == ValidationLevel.ERROR:
             self.checks_failed += 1
             self.is_valid = False
@@ -85,8 +121,86 @@ class ValidationReport:
         return "\n".join(lines)
 
 
+def _as_tuple(value):
+    """Listas anidadas (de JSON) → tuplas, para usar claves como índice."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_as_tuple(v) for v in value)
+    return value
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """
+    Resultado compacto de validar un formato: solo datos (JSON) y cacheable.
+    
+    issues guarda pares (nivel, mensaje) con el nombre de ValidationLevel;
+    to_report reconstruye el ValidationReport de texto.
+    """
+    key: Tuple
+    representation_type: str
+    is_valid: bool
+    checks_passed: int
+    checks_failed: int
+    checks_total: int
+    issues: Tuple[Tuple[str, str], ...] = ()
+    recommendations: Tuple[str, ...] = ()
+    metadata: Dict[str, Any] = field(default_factory=dict, hash=False, compare=False)
+    
+    @property
+    def errors(self) -> List[str]:
+        return [message for level, message in self.issues if level == 'ERROR']
+    
+    @classmethod
+    def from_report(cls, key: Tuple, report: ValidationReport) -> 'ValidationResult':
+        prefijos = {level.name: f"{level.value}: " for level in ValidationLevel}
+        issues = tuple(
+            (level, issue[len(prefijos[level]):] if issue.startswith(prefijos[level]) else issue)
+            for level, issue in zip(report.levels, report.issues)
+        )
+        return cls(key, report.representation_type, report.is_valid, report.checks_passed,
+                   report.checks_failed, report.checks_total, issues,
+                   tuple(r[2:] if r.startswith("💡 ") else r for r in report.recommendations),
+                   report.metadata)
+    
+    def to_report(self) -> ValidationReport:
+        report = ValidationReport(self.representation_type, self.is_valid, self.checks_passed,
+                                  self.checks_failed, self.checks_total, metadata=dict(self.metadata))
+        for level, message in self.issues:
+            report.issues.append(f"{ValidationLevel[level].value}: {message}")
+            report.levels.append(level)
+        report.recommendations = [f"💡 {r}" for r in self.recommendations]
+        return report
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'key': list(self.key),
+            'representation_type': self.representation_type,
+            'is_valid': self.is_valid,
+            'checks_passed': self.checks_passed,
+            'checks_failed': self.checks_failed,
+            'checks_total': self.checks_total,
+            'issues': [list(i) for i in self.issues],
+            'recommendations': list(self.recommendations),
+            'metadata': self.metadata,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ValidationResult':
+        return cls(_as_tuple(data['key']), data['representation_type'], data['is_valid'],
+                   data['checks_passed'], data['checks_failed'], data['checks_total'],
+                   _as_tuple(data['issues']), tuple(data['recommendations']), data['metadata'])
+
+
 class RepresentationValidator:
-    """Validador universal de representaciones numéricas."""
+    """
+    Validador universal de representaciones numéricas.
+    
+    samples / seed fijan las muestras de ida y vuelta (deterministas).
+    """
+    
+    def __init__(self, samples: int = DEFAULT_SAMPLES, seed: int = 0):
+        self.samples = samples
+        self.seed = seed
     
     def validate_fixed_point(self, fp) -> ValidationReport:
         """
@@ -124,6 +238,13 @@ class RepresentationValidator:
         except Exception as e:
             report.add_issue(ValidationLevel.ERROR, f"Error en parámetros: {e}")
         
+        # Valores esperados: los del descriptor compartido del formato
+        try:
+            descriptor = descriptor_of(fp)
+        except ValueError as e:
+            report.add_issue(ValidationLevel.ERROR, f"Formato inválido: {e}")
+            return report
+        
         # Chequeo 2: Consistencia de rango
         if fp.signed:
             if fp.representation == 'ms':
@@ -139,7 +260,7 @@ class RepresentationValidator:
                     report.checks_passed += 1
             else:  # complemento
                 # Complemento: rango debe ser [-B^E, B^E - ε]
-                expected_min = -fp.base_power_E
+                expected_min = -descriptor.base_power_E
                 if abs(fp.min_value - expected_min) < fp.epsilon:
                     report.checks_passed += 1
                 else:
@@ -150,7 +271,7 @@ class RepresentationValidator:
             report.checks_total += 1
         
         # Chequeo 3: Epsilon válido
-        expected_epsilon = fp.base ** (-fp.F)
+        expected_epsilon = descriptor.epsilon_float
         if abs(fp.epsilon - expected_epsilon) < 1e-10:
             report.checks_passed += 1
         else:
@@ -161,11 +282,7 @@ class RepresentationValidator:
         report.checks_total += 1
         
         # Chequeo 4: Total bits consistente
-        if fp.signed:
-            expected_bits = fp.E + fp.F + 1
-        else:
-            expected_bits = fp.E + fp.F
-        
+        expected_bits = descriptor.total_digits
         if fp.total_bits == expected_bits:
             report.checks_passed += 1
         else:
@@ -175,6 +292,9 @@ class RepresentationValidator:
             )
         report.checks_total += 1
         
+        # Chequeos 5 y 6: ida y vuelta de valores representables y cota de error
+        round_trip = self._round_trip_fixed(fp, descriptor, report)
+        
         # Recomendaciones
         if fp.signed and fp.representation == 'ms':
             report.add_recommendation(
@@ -200,6 +320,7 @@ class RepresentationValidator:
             'max_value': fp.max_value,
             'epsilon': fp.epsilon,
             'range_span': fp.max_value - fp.min_value,
+            'round_trip': round_trip,
         }
         
         return report
@@ -245,6 +366,9 @@ class RepresentationValidator:
             report.add_issue(ValidationLevel.ERROR, f"Error en casos especiales: {e}")
             report.checks_total += 3
         
+        # Chequeo 3: ida y vuelta de códigos finitos
+        round_trip = self._round_trip_ieee754(ieee754, report)
+        
         # Recomendaciones
         if ieee754.base != 2:
             report.add_recommendation(
@@ -253,10 +377,12 @@ class RepresentationValidator:
             )
         
         # Metadata
+        descriptor = descriptor_of(ieee754)
         report.metadata = {
-            'total_bits': ieee754.E_bits + ieee754.F_bits + 1,
-            'max_exponent': ieee754.base ** ieee754.E_bits - 1,
+            'total_bits': descriptor.total_digits,
+            'max_exponent': descriptor.E_max_encoded,
             'mantissa_precision': ieee754.F_bits,
+            'round_trip': round_trip,
         }
         
         return report
@@ -271,67 +397,160 @@ class RepresentationValidator:
         Returns:
             ValidationReport
         """
+        # BiquinaryGen usa total_bits / encode / decode; se aceptan también bits / encode_digit / decode_digit
+        bits = getattr(biquinary, 'bits', None) or getattr(biquinary, 'total_bits', 0)
+        encode = getattr(biquinary, 'encode_digit', None) or biquinary.encode
+        decode = getattr(biquinary, 'decode_digit', None) or biquinary.decode
+        
         report = ValidationReport(
-            representation_type=f"Biquinario {biquinary.bits} bits",
+            representation_type=f"Biquinario {bits} bits",
             is_valid=True
         )
         
         # Chequeo 1: Bits válido
-        if hasattr(biquinary, 'bits') and biquinary.bits > 0:
+        if bits > 0:
             report.checks_passed += 1
         else:
             report.add_issue(ValidationLevel.ERROR, "Bits no válido")
         report.checks_total += 1
         
-        # Chequeo 2: Regla de validez (2 bits = 1)
+        # Chequeo 2: Códigos distintos, que caben en los bits y se decodifican al mismo dígito
         try:
-            # Probar con valores 0-9
-            for digit in range(10):
-                code = biquinary.encode_digit(digit)
-                # Contar bits en 1
-                ones = bin(code).count('1')
-                if ones != 2:
-                    report.add_issue(
-                        ValidationLevel.ERROR,
-                        f"Dígito {digit}: código {code:0{biquinary.bits}b} tiene {ones} bits en 1 (esperado 2)"
-                    )
-                    report.is_valid = False
-            
-            report.checks_passed += 1
-            report.checks_total += 1
+            codes = [encode(digit) for digit in range(10)]
+            if (len(set(codes)) == 10 and all(0 <= code < (1 << bits) for code in codes)
+                    and [decode(code) for code in codes] == list(range(10))):
+                report.checks_passed += 1
+                report.checks_total += 1
+            else:
+                report.add_issue(ValidationLevel.ERROR, f"Códigos repetidos o fuera de {bits} bits: {codes}")
         except Exception as e:
+            codes = []
             report.add_issue(ValidationLevel.ERROR, f"Error en validación biquinaria: {e}")
-            report.checks_total += 1
         
-        # Chequeo 3: Decodificación inversa
+        # Regla biquinaria clásica (2 bits = 1): solo se avisa, las variantes no siempre la cumplen
+        weights = sorted({bin(code).count('1') for code in codes})
+        if weights and weights != [2]:
+            report.add_issue(
+                ValidationLevel.WARNING,
+                f"Pesos {weights}: no es un código de peso constante 2 (no detecta errores de un bit)"
+            )
+        
+        # Chequeo 3: Ida y vuelta de una muestra de dígitos
+        rng = random.Random(self.seed)
+        digits = [rng.randrange(10) for _ in range(self.samples)]
+        codec = getattr(biquinary, 'codec', None)
         try:
-            for digit in range(10):
-                code = biquinary.encode_digit(digit)
-                decoded = biquinary.decode_digit(code)
-                if decoded != digit:
-                    report.add_issue(
-                        ValidationLevel.ERROR,
-                        f"Decodificación falló: {digit} → {code} → {decoded}"
-                    )
-            report.checks_passed += 1
-            report.checks_total += 1
+            if codec is not None:
+                decoded = codec.decode_many(codec.encode_many(digits))
+            else:
+                decoded = [decode(encode(digit)) for digit in digits]
+            mismatches = sum(1 for a, b in zip(digits, decoded) if a != b)
+            if mismatches:
+                report.add_issue(ValidationLevel.ERROR,
+                                 f"Ida y vuelta: {mismatches} de {len(digits)} dígitos no se recuperan")
+            else:
+                report.checks_passed += 1
+                report.checks_total += 1
         except Exception as e:
-            report.add_issue(ValidationLevel.WARNING, f"Error en decodificación: {e}")
+            mismatches = None
+            report.add_issue(ValidationLevel.ERROR, f"Error en decodificación: {e}")
         
         # Recomendaciones
         report.add_recommendation(
-            f"Biquinario {biquinary.bits} bits: verifica si es estándar en tu aplicación."
+            f"Biquinario {bits} bits: verifica si es estándar en tu aplicación."
         )
         
         # Metadata
         report.metadata = {
-            'bits': biquinary.bits,
-            'max_codes': 2 ** biquinary.bits,
+            'bits': bits,
+            'max_codes': 2 ** bits,
             'valid_codes': 10,  # 0-9
+            'weights': weights,
+            'round_trip': {'samples': len(digits), 'mismatches': mismatches, 'vectorized': codec is not None},
         }
         
         return report
     
+    # ------------------------------------------------------------------
+    # Ida y vuelta sobre muestras
+    # ------------------------------------------------------------------
+    
+    def _round_trip_fixed(self, fp, descriptor, report: ValidationReport) -> Dict:
+        """
+        Valores representables → quantize_many → mismos valores, y error de
+        cuantización <= ε/2 en muestras uniformes del rango.
+        
+        Con crudos de hasta 2^53 todo va en float64 (vectorizado con NumPy);
+        si no, ida y vuelta exacta con Fraction sobre MAX_EXACT_SAMPLES crudos.
+        """
+        rng = random.Random(self.seed)
+        low, high = descriptor.raw_range
+        scale = descriptor.scale
+        
+        if max(-low, high) >= MAX_EXACT_FLOAT:
+            raws = [rng.randint(low, high) for _ in range(min(self.samples, MAX_EXACT_SAMPLES))]
+            mismatches = sum(1 for raw in raws if fp.raw_format.quantize(Fraction(raw, scale)) != raw)
+            self._check_round_trip(report, mismatches, len(raws), "valores")
+            return {'samples': len(raws), 'mismatches': mismatches, 'vectorized': False, 'max_abs_error': None}
+        
+        values = [rng.randint(low, high) / scale for _ in range(self.samples)]
+        quantized = quantize_many(fp, values)
+        mismatches = sum(1 for a, b in zip(values, quantized) if a != b)
+        self._check_round_trip(report, mismatches, len(values), "valores")
+        
+        # Cota de error: ε/2 más el redondeo de la propia resta en float
+        low_value, high_value = float(fp.min_value), float(fp.max_value)
+        uniform = [rng.uniform(low_value, high_value) for _ in range(self.samples)]
+        summary = error_summary(fp, uniform)
+        bound = descriptor.epsilon_float / 2 + 4 * math.ulp(max(abs(low_value), abs(high_value)))
+        max_error = float(summary['max_abs_error'])
+        if max_error <= bound and not summary['overflow']:
+            report.checks_passed += 1
+            report.checks_total += 1
+        else:
+            report.add_issue(ValidationLevel.ERROR,
+                             f"Error de cuantización {max_error} mayor que ε/2 = {descriptor.epsilon_float / 2}")
+        return {'samples': len(values), 'mismatches': mismatches, 'vectorized': HAS_NUMPY,
+                'max_abs_error': max_error}
+    
+    def _round_trip_ieee754(self, ieee754, report: ValidationReport) -> Dict:
+        """
+        Códigos finitos aleatorios → valor → código.
+        
+        Si todos los valores del formato son float64 exactos (base 2, F <= 52 y
+        exponentes dentro de binary64) va por decode_many / encode_many; si no,
+        por decode_exact / encode_exact sobre MAX_EXACT_SAMPLES códigos.
+        """
+        rng = random.Random(self.seed)
+        descriptor = descriptor_of(ieee754)
+        E_top, scale = descriptor.E_max_encoded - 1, descriptor.scale
+        float_exact = (ieee754.base == 2 and ieee754.F_bits <= 52
+                       and descriptor.min_positive >= Fraction(1, 2 ** 1074)
+                       and descriptor.max_positive <= Fraction(sys.float_info.max))
+        
+        if float_exact:
+            codes = [ieee754.pack(rng.randrange(2), rng.randint(0, E_top), rng.randrange(scale))
+                     for _ in range(self.samples)]
+            back = ieee754.encode_many(ieee754.decode_many(codes))
+            mismatches = sum(1 for a, b in zip(codes, back) if a != int(b))
+            n = len(codes)
+        else:
+            fields = [(rng.randrange(2), rng.randint(0, E_top), rng.randrange(scale))
+                      for _ in range(min(self.samples, MAX_EXACT_SAMPLES))]
+            fields = [f for f in fields if f != (1, 0, 0)]  # -0 vuelve como +0 en el valor exacto
+            mismatches = sum(1 for f in fields if ieee754.encode_exact(ieee754.decode_exact(*f)) != f)
+            n = len(fields)
+        self._check_round_trip(report, mismatches, n, "códigos")
+        return {'samples': n, 'mismatches': mismatches, 'vectorized': float_exact and HAS_NUMPY}
+    
+    @staticmethod
+    def _check_round_trip(report: ValidationReport, mismatches: int, total: int, what: str) -> None:
+        if mismatches:
+            report.add_issue(ValidationLevel.ERROR, f"Ida y vuelta: {mismatches} de {total} {what} no se recuperan")
+        else:
+            report.checks_passed += 1
+            report.checks_total += 1
+    
     def compare_error(self, value: float, fp1, fp2) -> Dict:
         """
         Compara error de representación entre dos sistemas.
@@ -377,27 +596,180 @@ class RepresentationValidator:
             }
         except Exception as e:
             return {'error': str(e)}
+    
+    def compare_error_many(self, values, fp1, fp2) -> Dict:
+        """
+        Versión por lotes de compare_error: toda la muestra en una pasada.
+        
+        Args:
+            values: muestra (lista o array de NumPy)
+            fp1, fp2: representaciones a comparar
+            
+        Returns:
+            dict con error_summary de cada sistema y recuento de muestras
+            en las que gana cada uno (menor error relativo)
+        """
+        from core.barrido_errores import error_many, summarize_errors
+        try:
+            errores1 = error_many(fp1, values)
+            errores2 = error_many(fp2, values)
+            gana1 = sum(bool(e1 < e2) for e1, e2 in zip(errores1['rel_error'], errores2['rel_error']))
+            gana2 = sum(bool(e2 < e1) for e1, e2 in zip(errores1['rel_error'], errores2['rel_error']))
+            total = len(errores1['value'])
+            return {
+                'count': total,
+                'fp1': {'name': str(fp1), **summarize_errors(errores1)},
+                'fp2': {'name': str(fp2), **summarize_errors(errores2)},
+                'wins': {'fp1': gana1, 'fp2': gana2, 'tie': total - gana1 - gana2},
+            }
+        except Exception as e:
+            return {'error': str(e)}
+
+
+# ----------------------------------------------------------------------
+# Validación por lotes
+# ----------------------------------------------------------------------
+
+def _config_key(rep) -> Tuple:
+    """
+    Clave de formato de una representación (None si no se sabe validar).
+    
+    Punto fijo e IEEE 754 usan la clave del descriptor; un biquinario, sus
+    bits y su tabla de códigos.
+    """
+    if hasattr(rep, 'E') and hasattr(rep, 'F'):
+        return descriptor_of(rep).key
+    if hasattr(rep, 'E_bits'):
+        return descriptor_of(rep).key
+    if hasattr(rep, 'bits') or hasattr(rep, 'total_bits'):
+        encode = getattr(rep, 'encode_digit', None) or rep.encode
+        bits = getattr(rep, 'bits', None) or rep.total_bits
+        return ('biquinary', bits, tuple(encode(d) for d in range(10)))
+    return None
 
 
-def batch_validate(representations: List[Any]) -> List[ValidationReport]:
+def _build(key: Tuple, rep):
+    """Instancia a validar: se reconstruye desde la clave salvo los biquinarios."""
+    kind, E, F, base, representation = key
+    if kind == 'ieee754':
+        return IEEE754Gen(E, F, base)
+    signed = representation != 'unsigned'
+    return FixedPointUnified(E, F, base, signed=signed, representation=representation if signed else 'complement')
+
+
+def _validate_task(task) -> Dict[str, Any]:
+    """Trabajo del pool: (clave, representación, samples, seed) → ValidationResult.to_dict()."""
+    key, rep, samples, seed = task
+    validator = RepresentationValidator(samples, seed)
+    try:
+        if key[0] == 'biquinary':
+            report = validator.validate_biquinary(rep)
+        elif key[0] == 'ieee754':
+            report = validator.validate_ieee754(_build(key, rep))
+        else:
+            report = validator.validate_fixed_point(_build(key, rep))
+    except Exception as e:  # Un formato que no se puede construir es inválido, no rompe el lote
+        report = ValidationReport(representation_type=f"{key[0]} {key[1:]}", is_valid=True)
+        report.add_issue(ValidationLevel.ERROR, f"No se pudo validar: {e}")
+    return ValidationResult.from_report(key, report).to_dict()
+
+
+class ValidationCache:
+    """
+    Resultados de validación por (versión, clave, samples, seed).
+    
+    Con path se carga de / guarda en un fichero JSON; sin path solo vive en memoria.
+    """
+    
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path is not None else None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if self.path is not None and self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get('version') == VALIDATION_VERSION:
+                self._entries = data.get('entries', {})
+    
+    @staticmethod
+    def _entry_key(key: Tuple, samples: int, seed: int) -> str:
+        return json.dumps([VALIDATION_VERSION, list(key), samples, seed])
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Tuple, samples: int, seed: int) -> Optional[ValidationResult]:
+        data = self._entries.get(self._entry_key(key, samples, seed))
+        return ValidationResult.from_dict(data) if data is not None else None
+    
+    def put(self, result: ValidationResult, samples: int, seed: int) -> None:
+        self._entries[self._entry_key(result.key, samples, seed)] = result.to_dict()
+    
+    def save(self) -> None:
+        if self.path is not None:
+            self.path.write_text(json.dumps({'version': VALIDATION_VERSION, 'entries': self._entries}),
+                                 encoding="utf-8")
+
+
+def validate_many(representations: List[Any], processes: Optional[int] = None,
+                  cache: Optional[ValidationCache] = None, samples: int = DEFAULT_SAMPLES,
+                  seed: int = 0) -> List[ValidationResult]:
     """
-    Valida múltiples representaciones.
+    Valida un lote de representaciones, una vez por formato distinto.
+    
+    Args:
+        representations: FixedPoint / FixedPointUnified / IEEE754Gen / biquinarios
+        processes: procesos del pool (None = os.cpu_count(), 1 = en serie)
+        cache: ValidationCache con resultados de ejecuciones anteriores
+        samples, seed: muestras de ida y vuelta de cada validación
+        
+    Returns:
+        un ValidationResult por representación, en el mismo orden
+        (las representaciones del mismo formato comparten el resultado)
+    """
+    keys = []
+    pending = {}
+    results: Dict[Tuple, ValidationResult] = {}
+    for rep in representations:
+        key = _config_key(rep)
+        if key is None:
+            raise TypeError(f"Representación no soportada: {type(rep).__name__}")
+        keys.append(key)
+        if key in results or key in pending:
+            continue
+        cached = cache.get(key, samples, seed) if cache is not None else None
+        if cached is not None:
+            results[key] = cached
+        else:
+            pending[key] = rep
+    
+    tasks = [(key, rep if key[0] == 'biquinary' else None, samples, seed) for key, rep in pending.items()]
+    if processes != 1 and len(tasks) >= MIN_PARALLEL:
+        with ProcessPoolExecutor(max_workers=processes or os.cpu_count()) as pool:
+            computed = list(pool.map(_validate_task, tasks))
+    else:
+        computed = [_validate_task(task) for task in tasks]
+    
+    for data in computed:
+        result = ValidationResult.from_dict(data)
+        results[result.key] = result
+        if cache is not None:
+            cache.put(result, samples, seed)
+    if cache is not None and computed:
+        cache.save()
+    
+    return [results[key] for key in keys]
+
+
+def batch_validate(representations: List[Any], processes: Optional[int] = None,
+                   cache: Optional[ValidationCache] = None) -> List[ValidationReport]:
+    """
+    Valida múltiples representaciones (las no soportadas se omiten).
     
     Args:
         representations: lista de representaciones
+        processes, cache: como en validate_many
         
     Returns:
         lista de reportes
     """
-    validator = RepresentationValidator()
-    reports = []
-    
-    for rep in representations:
-        if hasattr(rep, 'E') and hasattr(rep, 'F'):  # FixedPoint
-            reports.append(validator.validate_fixed_point(rep))
-        elif hasattr(rep, 'E_bits'):  # IEEE754
-            reports.append(validator.validate_ieee754(rep))
-        elif hasattr(rep, 'bits'):  # Biquinario
-            reports.append(validator.validate_biquinary(rep))
-    
-    return reports
+    supported = [rep for rep in representations if _config_key(rep) is not None]
+    return [result.to_report() for result in validate_many(supported, processes, cache)]
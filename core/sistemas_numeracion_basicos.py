@@ -12,6 +12,28 @@ Este modulo explora diferentes sistemas de numeracion y sus caracteristicas:
 from typing import Dict, Tuple, List, Union, Callable, Any
 from enum import Enum
 
+from functools import lru_cache
+
+from core.base_mixta import TIEMPO, base_mixta
+from core.capacidad_representacion import (
+    analisis,
+    capacidad,
+    longitud,
+    rango,
+    unicidad_posicional,
+    unicidad_romana,
+)
+from core.codigos import codigo
+from core.conversion_lotes import convertir_a_bases
+from core.conversiones_bases_relacionadas import tabla_grupos
+from core.numeros_romanos import ROMANO_MAX, a_romanos, indice_romanos, iterar_romanos, tabla_romanos
+from core.optimizador_empaquetado import frontera_pareto
+from core.conversion_enteros_grandes import (
+    digitos_a_entero,
+    entero_a_digitos,
+    primer_digito_invalido,
+)
+
 
 # ============================================================================
 # PARTE 0: CLASES BASE - ALFABETO Y LENGUAJE
@@ -447,7 +469,12 @@ def decimal_a_romano(numero: int) -> str:
     
     Ejemplo: 1994 = MCMXCIV
       M (1000) + CM (900) + XC (90) + IV (4) = 1994
+    
+    De 1 a 3999 es una búsqueda en la tabla precalculada (core.numeros_romanos).
     """
+    if 1 <= numero <= ROMANO_MAX:
+        return tabla_romanos()[numero]
+    
     resultado = ""
     
     for valor, simbolo in VALORES_ROMANOS_INVERSO.items():
@@ -471,8 +498,14 @@ def romano_a_decimal(romano_str: str) -> int:
     - I, X, C, M pueden aparecer hasta 3 veces seguidas
     - V, L, D aparecen como maximo una vez
     - Para restar: I antes de V o X, X antes de L o C, C antes de D o M
+    
+    Las formas canónicas se leen del índice precalculado; el resto (IIII,
+    variantes históricas) sigue sumando símbolos como siempre.
     """
     romano_str = romano_str.upper()
+    valor = indice_romanos().get(romano_str)
+    if valor is not None:
+        return valor
     
     # Reemplazar subtracciones por sus valores
     subtracciones = [
@@ -550,15 +583,10 @@ def decimal_a_base_5(numero: int) -> str:
     Resultado: 30434_5 (leyendo los restos de abajo a arriba)
     Verificacion: 3*5^4 + 0*5^3 + 4*5^2 + 3*5^1 + 4*5^0 = 1875 + 0 + 100 + 15 + 4 = 1994
     """
-    if numero == 0:
-        return "0"
-    
-    digitos = []
-    while numero > 0:
-        digitos.append(str(numero % 5))
-        numero //= 5
+    if numero <= 0:
+        return "0" if numero == 0 else ""
     
-    return ''.join(digitos[::-1])
+    return entero_a_digitos(numero, 5)
 
 
 def base_5_a_decimal(base_5_str: str) -> int:
@@ -641,24 +669,21 @@ def decimal_a_tiempo(segundos_totales: int) -> str:
     61 / 60 = 1 hora, 1 minuto
     
     Resultado: 01:01:01 (1 hora, 1 minuto, 1 segundo)
-    """
-    horas = segundos_totales // 3600
-    minutos = (segundos_totales % 3600) // 60
-    segundos = segundos_totales % 60
     
-    return f"{horas:02d}:{minutos:02d}:{segundos:02d}"
+    Es la base mixta (horas sin límite, 60, 60) de core.base_mixta.
+    """
+    return base_mixta(TIEMPO).formatear(segundos_totales)
 
 
 def tiempo_a_decimal(tiempo_str: str) -> int:
     """
     Convierte HH:MM:SS a segundos.
     """
-    partes = tiempo_str.split(':')
-    if len(partes) != 3:
+    if tiempo_str.count(':') != 2:
         raise ValueError("Formato debe ser HH:MM:SS")
     
-    horas, minutos, segundos = map(int, partes)
-    return horas * 3600 + minutos * 60 + segundos
+    # Sin exigir minutos / segundos < 60 ('00:75:00' → 4500)
+    return base_mixta(TIEMPO).parsear(tiempo_str, estricto=False)
 
 
 def explicar_tiempo(segundos_totales: int) -> Dict:
@@ -688,20 +713,27 @@ def explicar_tiempo(segundos_totales: int) -> Dict:
 # PARTE 4: COMPARACIÓN Y EJEMPLOS
 # ============================================================================
 
+@lru_cache(maxsize=4096)
+def _representaciones(numero: int) -> Tuple[str, str]:
+    """(romano, base 5) de un número, memorizado para comparar_sistemas."""
+    return decimal_a_romano(numero), decimal_a_base_5(numero)
+
+
 def comparar_sistemas(numero: int) -> Dict:
     """
     Muestra la representacion del mismo número en diferentes sistemas.
     """
+    romano, base_5 = _representaciones(numero)
     return {
         'número_decimal': numero,
         'sistemas': {
             'romano': {
-                'representacion': decimal_a_romano(numero),
+                'representacion': romano,
                 'tipo': 'No Posicional',
                 'descripcion': 'Cada simbolo tiene valor fijo'
             },
             'base_5': {
-                'representacion': decimal_a_base_5(numero),
+                'representacion': base_5,
                 'tipo': 'Posicional (potencias de 5)',
                 'descripcion': 'Valor depende de posicion'
             },
@@ -714,6 +746,52 @@ def comparar_sistemas(numero: int) -> Dict:
     }
 
 
+def decimal_a_romano_lote(numeros: List[int]) -> List[str]:
+    """decimal_a_romano de 1..3999 por lotes (una búsqueda en la tabla por número)."""
+    return a_romanos(numeros)
+
+
+def romano_a_decimal_lote(romanos: List[str], estricto: bool = True) -> List[int]:
+    """
+    Lee muchos números romanos canónicos de una pasada.
+    
+    Cada cadena se valida con el autómata de core.numeros_romanos; con
+    estricto=False las no canónicas dan None en lugar de ValueError.
+    """
+    return list(iterar_romanos((r.upper() for r in romanos), estricto))
+
+
+def decimal_a_base_5_lote(numeros: List[int]) -> List[str]:
+    """decimal_a_base_5 por lotes (conversión por lotes de core.conversion_lotes)."""
+    return convertir_a_bases(numeros, (5,))[5]
+
+
+def decimal_a_tiempo_lote(segundos: List[int]) -> List[str]:
+    """decimal_a_tiempo por lotes: MM:SS sale de una tabla de 3600 textos."""
+    return base_mixta(TIEMPO).formatear_lote(segundos)
+
+
+def tiempo_a_decimal_lote(tiempos: List[str]) -> List[int]:
+    """tiempo_a_decimal por lotes."""
+    return base_mixta(TIEMPO).parsear_lote(tiempos, estricto=False)
+
+
+def tabla_sistemas(numeros: List[int]) -> List[Dict]:
+    """
+    Representación de muchos números en romano, base 5 y base 10 (tablas
+    1..3999 de los ejercicios), con las conversiones por lotes.
+    
+    Returns:
+        una fila por número: {'número_decimal', 'romano', 'base_5', 'base_10'}
+    """
+    romanos = decimal_a_romano_lote(numeros)
+    base_5 = decimal_a_base_5_lote(numeros)
+    return [
+        {'número_decimal': n, 'romano': r, 'base_5': b5, 'base_10': str(n)}
+        for n, r, b5 in zip(numeros, romanos, base_5)
+    ]
+
+
 def demostrar_unicidad() -> Dict:
     """
     Demuestra que cada sistema tiene representacion ÚNICA.
@@ -723,6 +801,11 @@ def demostrar_unicidad() -> Dict:
     
     Sistema romano (moderno): Tambien existe una única representacion
     según las reglas de notacion.
+    
+    Además de los ejemplos, 'posicional' comprueba la unicidad en longitud
+    fija para varias bases (enumerando los espacios pequeños y por conteo
+    los grandes, ver core.capacidad_representacion) y 'romano' la de los
+    3999 romanos canónicos.
     """
     números = [4, 9, 27, 99, 1994]
     
@@ -751,6 +834,8 @@ def demostrar_unicidad() -> Dict:
         'titulo': 'Unicidad de Representacion',
         'descripcion': 'Cada sistema posicional tiene UNA única representacion para cada número',
         'ejemplos': ejemplos,
+        'posicional': [unicidad_posicional(base, n) for base, n in ((2, 8), (5, 5), (10, 4), (16, 64))],
+        'romano': unicidad_romana(),
         'conclusion': 'Todas las conversiones inversas son correctas: cada número tiene una única representacion en cada sistema'
     }
 
@@ -781,7 +866,7 @@ def capacidad_representacion(base: int, longitud: int) -> int:
         capacidad_representacion(10, 3) = 1000 (000 a 999)
         capacidad_representacion(16, 2) = 256 (00 a FF)
     """
-    return base ** longitud
+    return capacidad(base, longitud)
 
 
 def rango_representacion(base: int, longitud: int) -> Tuple[int, int]:
@@ -803,8 +888,7 @@ def rango_representacion(base: int, longitud: int) -> Tuple[int, int]:
         rango_representacion(10, 2) = (0, 99)
         rango_representacion(16, 2) = (0, 255)
     """
-    capacidad = base ** longitud
-    return (0, capacidad - 1)
+    return rango(base, longitud)
 
 
 def longitud_representacion(numero: int, base: int) -> int:
@@ -816,7 +900,9 @@ def longitud_representacion(numero: int, base: int) -> int:
     
     Fórmula: longitud(x, B) = ⌊log_B(x)⌋ + 1
     
-    Esto es el logaritmo entero en base B + 1.
+    Esto es el logaritmo entero en base B + 1, calculado con enteros
+    (bit_length y potencias cacheadas por base), sin logaritmos en coma
+    flotante: longitud_representacion(1000, 10) = 4.
     
     Args:
         numero: Número a representar (x)
@@ -834,25 +920,15 @@ def longitud_representacion(numero: int, base: int) -> int:
         longitud_representacion(1994, 5) = 5 (1994 = 30434₅)
         longitud_representacion(9, 10) = 1   (9 requiere 1 dígito)
     """
-    import math
-    
-    if numero < 1:
-        raise ValueError("El número debe ser positivo (≥ 1)")
-    if base < 2:
-        raise ValueError("La base debe ser ≥ 2")
-    
-    if numero == 0:
-        return 1
-    
-    # ⌊log_B(x)⌋ + 1
-    return math.floor(math.log(numero, base)) + 1
+    return longitud(numero, base)
 
 
 def analisis_representacion(numero: int, base: int, longitud: int = None) -> Dict:
     """
     Análisis completo de capacidad y rango de representación.
     
-    Combina: capacidad(B, n), rango(B, n), y longitud(x, B).
+    Combina: capacidad(B, n), rango(B, n), y longitud(x, B). El resultado
+    se memoriza por (numero, base, longitud).
     
     Args:
         numero: Número a analizar
@@ -862,28 +938,7 @@ def analisis_representacion(numero: int, base: int, longitud: int = None) -> Dic
     Returns:
         Dict con análisis completo
     """
-    if longitud is None:
-        longitud = longitud_representacion(numero, base)
-    
-    capacidad = capacidad_representacion(base, longitud)
-    rango_min, rango_max = rango_representacion(base, longitud)
-    longitud_min = longitud_representacion(numero, base)
-    
-    está_en_rango = rango_min <= numero <= rango_max
-    
-    return {
-        'número': numero,
-        'base': base,
-        'longitud_fija': longitud,
-        'longitud_mínima': longitud_min,
-        'capacidad': capacidad,
-        'rango': f'[{rango_min}, {rango_max}]',
-        'rango_min': rango_min,
-        'rango_max': rango_max,
-        'en_rango': está_en_rango,
-        'fórmula_capacidad': f'{base}^{longitud} = {capacidad}',
-        'fórmula_rango_máximo': f'{base}^{longitud} - 1 = {rango_max}'
-    }
+    return analisis(numero, base, longitud)
 
 
 # ============================================================================
@@ -903,6 +958,10 @@ def decimal_a_base_B(numero: int, base: int) -> str:
     - El resto es un dígito en base B
     - Repetir con el cociente hasta que sea 0
     
+    Implementación: divide y vencerás (core.conversion_enteros_grandes),
+    que agrupa las divisiones por potencias B^(2^k) cacheadas. Mismo
+    resultado, pero sub-cuadrático para números con miles de dígitos.
+    
     Parámetros:
         numero: Número decimal a convertir (>= 0)
         base: Base destino (2-36)
@@ -924,14 +983,7 @@ def decimal_a_base_B(numero: int, base: int) -> str:
     if not (2 <= base <= 36):
         raise ValueError("Base debe estar entre 2 y 36")
     
-    digitos = "0123456789abcdefghijklmnopqrstuvwxyz"
-    resultado = []
-    
-    while numero > 0:
-        resultado.append(digitos[numero % base])
-        numero //= base
-    
-    return ''.join(reversed(resultado))
+    return entero_a_digitos(numero, base)
 
 
 def base_B_a_decimal(numero_str: str, base: int) -> int:
@@ -941,6 +993,9 @@ def base_B_a_decimal(numero_str: str, base: int) -> int:
     Algoritmo: Evaluación del polinomio
     Número_B = d_n * B^n + d_(n-1) * B^(n-1) + ... + d_0 * B^0
     
+    Implementación: tabla de consulta de dígitos + evaluación por mitades
+    (valor = alto * B^len(bajo) + bajo) con potencias cacheadas.
+    
     Parámetros:
         numero_str: String con la representación en base B
         base: Base origen (2-36)
@@ -958,16 +1013,14 @@ def base_B_a_decimal(numero_str: str, base: int) -> int:
     if not (2 <= base <= 36):
         raise ValueError("Base debe estar entre 2 y 36")
     
-    digitos = "0123456789abcdefghijklmnopqrstuvwxyz"
     numero_str = numero_str.lower()
-    resultado = 0
-    
-    for i, digito in enumerate(reversed(numero_str)):
-        if digito not in digitos[:base]:
-            raise ValueError(f"Dígito '{digito}' inválido para base {base}")
-        resultado += digitos.index(digito) * (base ** i)
+    digito = primer_digito_invalido(numero_str, base, desde_derecha=True)
+    if digito is not None:
+        raise ValueError(f"Dígito '{digito}' inválido para base {base}")
+    if not numero_str:
+        return 0
     
-    return resultado
+    return digitos_a_entero(numero_str, base)
 
 
 def base_B_a_base_B_prima(numero_str: str, base_origen: int, base_destino: int) -> str:
@@ -1030,7 +1083,7 @@ def base_B_a_base_B_prima_potencias(numero_str: str, base_comun: int,
         base_B_a_base_B_prima_potencias("1111", 2, 1, 3) → "17"
         
         # Convertir base 3 (3^1) a base 27 (3^3)
-        base_B_a_base_B_prima_potencias("010021002", 3, 1, 3) → "122"
+        base_B_a_base_B_prima_potencias("010021002", 3, 1, 3) → "372"
         
     Referencias: 2.1.1.5.4 (Sistema de conversión entre representación de bases relacionadas)
     
@@ -1042,39 +1095,10 @@ def base_B_a_base_B_prima_potencias(numero_str: str, base_comun: int,
     if exponente_origen == exponente_destino:
         return numero_str
     
-    # Primero: Convertir a base b (expandir exponente_origen dígitos en exponente_origen*log(base) dígitos)
-    digitos_base_comun = []
-    for digito_char in numero_str:
-        # Convertir cada dígito de base B a su valor en base b
-        digito_valor = int(digito_char, base_comun ** exponente_origen)
-        
-        # Expandir a exponente_origen dígitos en base b
-        for _ in range(exponente_origen):
-            digitos_base_comun.append(digito_valor % base_comun)
-            digito_valor //= base_comun
-        digitos_base_comun.reverse()
-    
-    # Segundo: Convertir de base b a base B' (agrupar exponente_destino dígitos)
-    digitos_base_comun.reverse()  # Para procesar de derecha a izquierda
-    resultado_digitos = []
-    
-    while digitos_base_comun:
-        # Tomar exponente_destino dígitos de base b
-        grupo = []
-        for _ in range(exponente_destino):
-            if digitos_base_comun:
-                grupo.append(digitos_base_comun.pop())
-        
-        # Convertir grupo de base b a un dígito de base B'
-        valor_digito = 0
-        for digito in reversed(grupo):
-            valor_digito = valor_digito * base_comun + digito
-        
-        resultado_digitos.append(valor_digito)
-    
-    # Convertir a string usando dígitos 0-9, a-z
-    digitos_str = "0123456789abcdefghijklmnopqrstuvwxyz"
-    resultado = ''.join(digitos_str[d] for d in reversed(resultado_digitos))
+    # Tablas dígito → grupo en base b y grupo → dígito, precalculadas por par de bases:
+    # una sola pasada lineal sobre el número (core.conversiones_bases_relacionadas)
+    tabla = tabla_grupos(base_comun ** exponente_origen, base_comun ** exponente_destino)
+    resultado = tabla.convertir(numero_str).lower()
     
     return resultado if resultado else "0"
 
@@ -1344,6 +1368,52 @@ def explicar_eficacia_empaquetado(base_nativa: int, base_destino: int,
     }
 
 
+def optimizar_eficacias_empaquetado(base_nativa: int, base_destino: int,
+                                    max_digitos: int = 20, max_bits: int = None) -> Dict:
+    """
+    Frontera de Pareto eficacia / tamaño de palabra de los empaquetados
+    de k <= max_digitos dígitos de base_destino.
+
+    Cada opción de la frontera usa el mínimo de dígitos nativos
+    b = ceil(k · log_A B); ninguna otra opción tiene a la vez menos
+    dígitos nativos y más eficacia.
+
+    Args:
+        base_nativa: Base del sistema nativo (típicamente 2)
+        base_destino: Base a empaquetar (B)
+        max_digitos: Máximo de dígitos destino por grupo
+        max_bits: Tamaño máximo de palabra (None = sin límite)
+
+    Returns:
+        Dict: 'frontera' ordenada por tamaño de palabra y 'mejor' (la más eficiente)
+
+    Ejemplo:
+        optimizar_eficacias_empaquetado(2, 10, max_digitos=3)['frontera']
+            → 10 valores en 4 bits, 100 en 7 bits, 1000 en 10 bits
+    """
+    frontera = []
+    for opcion in frontera_pareto(base_destino, max_digitos, base_nativa, max_bits):
+        capacidad = base_nativa ** opcion.bits
+        frontera.append({
+            'base_destino': opcion.base_destino,
+            'n_digitos': opcion.n_digitos,
+            'bits_utilizados': opcion.bits,
+            'valores_representables': opcion.valores,
+            'eficacia': opcion.eficacia,
+            'porcentaje': opcion.eficacia * 100,
+            'desperdicio': capacidad - opcion.valores,
+            'description': f"{opcion.n_digitos} dígitos base {opcion.base_destino} "
+                           f"en {opcion.bits} dígitos base {base_nativa}"
+        })
+
+    return {
+        'base_nativa': base_nativa,
+        'base_destino': base_destino,
+        'frontera': frontera,
+        'mejor': frontera[-1] if frontera else None,
+    }
+
+
 # Estándar IEEE 754 (Punto Flotante)
 IEEE_754_STANDARDS = {
     'binary32': {
@@ -1514,13 +1584,11 @@ def biquinario_a_entero(codigo_biquinario: str) -> int:
     if codigo_biquinario.count('1') != 2:
         raise ValueError("Código biquinario debe tener exactamente 2 bits encendidos")
     
-    # Tabla inversa para lookup
-    tabla_inversa = {v: k for k, v in CODIGO_BIQUINARIO.items()}
-    
-    if codigo_biquinario in tabla_inversa:
-        return tabla_inversa[codigo_biquinario]
-    else:
-        raise ValueError("Código biquinario inválido")
+    # Tabla código → valor compilada una vez (core.codigos)
+    try:
+        return codigo('2entre5').decode(int(codigo_biquinario, 2))
+    except ValueError:
+        raise ValueError("Código biquinario inválido") from None
 
 
 def johnson_a_entero(codigo_johnson: str) -> int:
@@ -1558,13 +1626,11 @@ def johnson_a_entero(codigo_johnson: str) -> int:
     if not all(c in '01' for c in codigo_johnson):
         raise ValueError("Código Johnson debe contener solo '0' y '1'")
     
-    # Tabla inversa para lookup
-    tabla_inversa = {v: k for k, v in CODIGO_JOHNSON.items()}
-    
-    if codigo_johnson in tabla_inversa:
-        return tabla_inversa[codigo_johnson]
-    else:
-        raise ValueError("Código Johnson inválido: no es un código Johnson válido")
+    # Tabla código → valor compilada una vez (core.codigos)
+    try:
+        return codigo('johnson5').decode(int(codigo_johnson, 2))
+    except ValueError:
+        raise ValueError("Código Johnson inválido: no es un código Johnson válido") from None
 
 
 def entero_a_gray_4bits(valor: int) -> str:
@@ -1591,8 +1657,7 @@ def entero_a_gray_4bits(valor: int) -> str:
     if not 0 <= valor <= 15:
         raise ValueError("Valor debe estar entre 0 y 15")
     
-    gray = valor ^ (valor >> 1)
-    return format(gray, '04b')
+    return codigo('gray4').encode_bits([valor])
 
 
 def gray_4bits_a_entero(codigo_gray: str) -> int:
@@ -1617,16 +1682,8 @@ def gray_4bits_a_entero(codigo_gray: str) -> int:
     if len(codigo_gray) != 4:
         raise ValueError("Código Gray debe tener 4 bits")
     
-    gray = int(codigo_gray, 2)
-    
-    # Invertir la transformación Gray
-    valor = gray
-    gray >>= 1
-    while gray:
-        valor ^= gray
-        gray >>= 1
-    
-    return valor
+    # Tabla inversa de Gray de 4 bits (core.codigos)
+    return codigo('gray4').decode(int(codigo_gray, 2))
 
 
 def analisis_codigo_especializado(codigo: str, tipo: str) -> Dict:
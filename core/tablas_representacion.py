@@ -0,0 +1,247 @@
+"""
+Tablas de representación de enteros con signo: M&S, CB, CB-1 y Exceso a K.
+
+Una tabla es la lista de todas las palabras de longitud l en base B con su
+valor. Las filas no se guardan: la fila i se calcula al pedirla a partir
+del código i (valor natural de la palabra) con aritmética entera:
+
+    'cb'    valor = i           si i < B^(l-1), si no i - B^l
+    'cbm1'  valor = i           si i < B^(l-1), si no i - (B^l - 1)
+    'exck'  valor = i - K
+    'ms'    i = s · B^(l-1) + m con s ∈ {0, 1}: valor = (-1)^s · m
+            (en M&S solo hay 2 · B^(l-1) palabras válidas: el dígito de
+            signo es 0 ó 1)
+
+Las filas van en orden de código (el de generar_tabla_CB / _CBm1 / _ExcK).
+La tabla admite acceso aleatorio, slicing e iteración, se comparte por
+(representación, base, longitud, K) y se exporta a CSV / JSON / LaTeX en
+streaming: una tabla de 16 bits nunca se construye como una sola cadena.
+
+Ejemplo:
+    t = tabla_representacion('cb', 2, 4)
+    t[13]               → FilaRepresentacion(codigo=13, palabra='1101', valor=-3, nota='')
+    t[7].nota           → 'Maximo positivo'
+    t[8:10]             → filas de los códigos 8 y 9 (-8 y -7)
+    t.codigos_de(-3)    → (13,)
+    ''.join(t.exportar('csv'))
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+import json
+
+from core.conversion_enteros_grandes import entero_a_digitos
+
+REPRESENTACIONES = ('ms', 'cb', 'cbm1', 'exck')
+FORMATOS_EXPORTACION = ('csv', 'json', 'latex')
+
+_NOMBRES = {
+    'ms': 'M&S',
+    'cb': 'CB',
+    'cbm1': 'CB-1',
+    'exck': 'ExcK',
+}
+
+
+class FilaRepresentacion(NamedTuple):
+    """Una fila de la tabla: código natural, palabra, valor y nota."""
+    codigo: int
+    palabra: str
+    valor: int
+    nota: str
+
+
+def palabra_de_codigo(codigo: int, base: int, longitud: int) -> str:
+    """Código natural → palabra de longitud fija (dígitos 0-9a-z)."""
+    if base == 2:
+        return format(codigo, f'0{longitud}b')
+    if base == 10:
+        return str(codigo).zfill(longitud)
+    if base == 16:
+        return format(codigo, f'0{longitud}x')
+    return entero_a_digitos(codigo, base).zfill(longitud)
+
+
+class TablaRepresentacion(Sequence):
+    """
+    Tabla perezosa de una representación: len(), t[i], t[a:b] e iteración.
+
+    No se instancia directamente: usar tabla_representacion() (cacheada).
+    """
+
+    def __init__(self, representacion: str, base: int, longitud: int, K: Optional[int] = None):
+        if representacion not in REPRESENTACIONES:
+            raise ValueError(f"Representación desconocida: {representacion}. "
+                             f"Representaciones: {', '.join(REPRESENTACIONES)}")
+        if not 2 <= base <= 36:
+            raise ValueError(f"Base debe estar entre 2 y 36. base={base}")
+        if longitud < 1:
+            raise ValueError(f"La longitud debe ser positiva. longitud={longitud}")
+        if representacion == 'exck':
+            if K is None:
+                raise ValueError("Exceso a K requiere el sesgo K")
+        elif K is not None:
+            raise ValueError(f"K solo se usa en Exceso a K (representación {representacion})")
+
+        self.representacion = representacion
+        self.base = base
+        self.longitud = longitud
+        self.K = K
+        self.capacidad = base ** longitud
+        self._mitad = base ** (longitud - 1)
+        self._len = 2 * self._mitad if representacion == 'ms' else self.capacidad
+
+        if representacion == 'exck':
+            self.minimo, self.maximo = -K, self.capacidad - 1 - K
+        elif representacion == 'ms':
+            self.minimo, self.maximo = -(self._mitad - 1), self._mitad - 1
+        else:
+            # CB / CB-1: el código B^(l-1) es el más negativo (-90 en base 10 con l = 2)
+            self.maximo = self._mitad - 1
+            self.minimo = self.valor(self._mitad)
+
+    def __repr__(self) -> str:
+        sesgo = f", K={self.K}" if self.K is not None else ""
+        return (f"TablaRepresentacion('{self.representacion}', base={self.base}, "
+                f"longitud={self.longitud}{sesgo}, filas={self._len})")
+
+    @property
+    def nombre(self) -> str:
+        if self.representacion == 'cbm1':
+            return f"CB-{self.base - 1}"
+        return _NOMBRES[self.representacion]
+
+    # ------------------------------------------------------------------
+    # Filas
+    # ------------------------------------------------------------------
+
+    def valor(self, codigo: int) -> int:
+        """Valor del código natural (sin comprobar que esté en la tabla)."""
+        if self.representacion == 'exck':
+            return codigo - self.K
+        if self.representacion == 'ms':
+            signo, magnitud = divmod(codigo, self._mitad)
+            return -magnitud if signo else magnitud
+        if codigo < self._mitad:
+            return codigo
+        if self.representacion == 'cb':
+            return codigo - self.capacidad
+        return codigo - (self.capacidad - 1)
+
+    def _nota(self, codigo: int, valor: int) -> str:
+        representacion = self.representacion
+        if representacion == 'exck':
+            if valor == -self.K:
+                return "Minimo (00...0)"
+            if valor == 0:
+                return "Cero (representa 0)"
+            return "Maximo" if valor == self.maximo else ""
+        if valor == 0:
+            if representacion == 'cb':
+                return "Cero (unica representacion)"
+            if representacion == 'ms':
+                return "+0" if codigo == 0 else "-0 (duplicado)"
+            return "Cero positivo (+0)" if codigo == 0 else "Cero negativo (-0)"
+        if valor == self.maximo:
+            return "Maximo positivo"
+        return "Minimo negativo" if valor == self.minimo else ""
+
+    def _fila(self, codigo: int) -> FilaRepresentacion:
+        valor = self.valor(codigo)
+        return FilaRepresentacion(codigo, palabra_de_codigo(codigo, self.base, self.longitud),
+                                  valor, self._nota(codigo, valor))
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[FilaRepresentacion, List[FilaRepresentacion]]:
+        if isinstance(indice, slice):
+            return [self._fila(codigo) for codigo in range(*indice.indices(self._len))]
+        if indice < 0:
+            indice += self._len
+        if not 0 <= indice < self._len:
+            raise IndexError(f"Fila {indice} fuera de la tabla ({self._len} filas)")
+        return self._fila(indice)
+
+    def __iter__(self) -> Iterator[FilaRepresentacion]:
+        return self.filas()
+
+    def filas(self, inicio: int = 0, fin: Optional[int] = None) -> Iterator[FilaRepresentacion]:
+        """Filas [inicio, fin) en orden de código, generadas una a una."""
+        for codigo in range(*slice(inicio, fin).indices(self._len)):
+            yield self._fila(codigo)
+
+    def codigos_de(self, valor: int) -> Tuple[int, ...]:
+        """Códigos que representan el valor (dos para el cero en M&S y CB-1; vacío si no cabe)."""
+        if not self.minimo <= valor <= self.maximo:
+            return ()
+        if self.representacion == 'exck':
+            return (valor + self.K,)
+        if valor == 0 and self.representacion == 'ms':
+            return (0, self._mitad)
+        if valor == 0 and self.representacion == 'cbm1':
+            return (0, self.capacidad - 1)
+        if valor >= 0:
+            return (valor,)
+        if self.representacion == 'ms':
+            return (self._mitad - valor,)
+        if self.representacion == 'cb':
+            return (self.capacidad + valor,)
+        return (self.capacidad - 1 + valor,)
+
+    # ------------------------------------------------------------------
+    # Exportación en streaming
+    # ------------------------------------------------------------------
+
+    def exportar(self, formato: str = 'csv', chunk_size: int = 4096,
+                 inicio: int = 0, fin: Optional[int] = None) -> Iterator[str]:
+        """
+        Trozos de texto de chunk_size filas, sin construir el documento completo.
+
+        Args:
+            formato: 'csv' (cabecera codigo,palabra,valor,nota), 'json' (lista
+                de objetos) o 'latex' (entorno longtable)
+            inicio, fin: rango de filas a exportar
+        """
+        if formato not in FORMATOS_EXPORTACION:
+            raise ValueError(f"Formato de exportación desconocido: {formato}. "
+                             f"Formatos: {', '.join(FORMATOS_EXPORTACION)}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size debe ser positivo, recibido: {chunk_size}")
+        codigos = range(*slice(inicio, fin).indices(self._len))
+
+        if formato == 'csv':
+            yield "codigo,palabra,valor,nota\n"
+        elif formato == 'json':
+            yield "["
+        else:
+            yield ("\\begin{longtable}{rrl}\n"
+                   f"\\caption{{{_latex(self.nombre)} (base {self.base}, {self.longitud} d\\'igitos)}}\\\\\n"
+                   "\\hline\nPalabra & Decimal & Nota \\\\\n\\hline\n\\endhead\n")
+
+        for desde in range(0, len(codigos), chunk_size):
+            filas = [self._fila(codigo) for codigo in codigos[desde:desde + chunk_size]]
+            if formato == 'csv':
+                yield ''.join(f"{f.codigo},{f.palabra},{f.valor},{f.nota}\n" for f in filas)
+            elif formato == 'json':
+                separador = "" if desde == 0 else ","
+                yield separador + ",".join(json.dumps(f._asdict(), ensure_ascii=False) for f in filas)
+            else:
+                yield ''.join(f"\\texttt{{{f.palabra}}} & {f.valor} & {_latex(f.nota)} \\\\\n" for f in filas)
+
+        if formato == 'json':
+            yield "]"
+        elif formato == 'latex':
+            yield "\\hline\n\\end{longtable}\n"
+
+
+def _latex(texto: str) -> str:
+    return texto.replace('&', '\\&').replace('%', '\\%')
+
+
+@lru_cache(maxsize=128)
+def tabla_representacion(representacion: str, base: int, longitud: int,
+                         K: Optional[int] = None) -> TablaRepresentacion:
+    """Tabla compartida por (representación, base, longitud, K)."""
+    return TablaRepresentacion(representacion, base, longitud, K)
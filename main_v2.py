@@ -2,16 +2,26 @@ import os
 import argparse
 from core.exam_builder import ExamBuilder
 from renderers.latex.main_renderer import LatexExamRenderer
+from renderers.html.main_renderer import HtmlExamRenderer
+from renderers.latex.utils.build_manifest import BuildManifest
 
 def main():
     # Configuración por defecto para pruebas
     default_config = os.path.join("config", "test_exam.json")
     
+    parser = argparse.ArgumentParser(description="Generador de Exámenes V2")
+    parser.add_argument("--config", default=default_config, help="Configuración JSON del examen")
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="Re-renderiza solo los ejercicios cuyo JSON o renderer han cambiado"
+    )
+    args = parser.parse_args()
+    
     print("🚀 Iniciando Generador de Exámenes V2...")
     
     # 1. Construcción
     try:
-        builder = ExamBuilder(default_config)
+        builder = ExamBuilder(args.config)
         exercises = builder.build()
     except Exception as e:
         print(f"❌ Error al construir el examen: {e}")
@@ -24,15 +34,21 @@ def main():
     output_dir = os.path.join("build", "latex")
     os.makedirs(output_dir, exist_ok=True)
 
+    manifest = BuildManifest(output_dir) if args.incremental else None
+    exercises_json = builder.get_exercises_json() if args.incremental else None
+
     # 2. Renderizado EXAMEN (Enunciado)
     print("🎨 Renderizando Examen (Enunciado)...")
     try:
         renderer_exam = LatexExamRenderer(is_solution=False)
-        latex_code = renderer_exam.render(exercises)
-        
         output_file = os.path.join(output_dir, "Examen_V2.tex")
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.write(latex_code)
+        
+        if manifest is not None:
+            renderer_exam.render_incremental(exercises, exercises_json, output_file, manifest)
+        else:
+            latex_code = renderer_exam.render(exercises)
+            with open(output_file, "w", encoding="utf-8") as f:
+                f.write(latex_code)
         print(f"✅ Examen generado: {os.path.abspath(output_file)}")
         
     except Exception as e:
@@ -44,11 +60,14 @@ def main():
     print("🎨 Renderizando Solución...")
     try:
         renderer_sol = LatexExamRenderer(is_solution=True)
-        latex_code_sol = renderer_sol.render(exercises)
-        
         output_file_sol = os.path.join(output_dir, "Solucion_V2.tex")
-        with open(output_file_sol, "w", encoding="utf-8") as f:
-            f.write(latex_code_sol)
+        
+        if manifest is not None:
+            renderer_sol.render_incremental(exercises, exercises_json, output_file_sol, manifest)
+        else:
+            latex_code_sol = renderer_sol.render(exercises)
+            with open(output_file_sol, "w", encoding="utf-8") as f:
+                f.write(latex_code_sol)
         print(f"✅ Solución generada: {os.path.abspath(output_file_sol)}")
         
     except Exception as e:
@@ -56,5 +75,29 @@ def main():
         import traceback
         traceback.print_exc()
 
+    if manifest is not None:
+        manifest.save()
+        manifest.print_report()
+
+    # 4. Previsualización HTML (sin compilar LaTeX)
+    print("🌐 Renderizando previsualización HTML...")
+    try:
+        html_dir = os.path.join("build", "html")
+        os.makedirs(html_dir, exist_ok=True)
+        exam_json = {
+            "exam_metadata": {"title": builder.config.get("title", "Examen")},
+            "exercises": builder.get_exercises_json()
+        }
+        for is_solution, name in ((False, "Examen_V2.html"), (True, "Solucion_V2.html")):
+            output_file = HtmlExamRenderer(is_solution=is_solution).render_to_file(
+                exam_json, os.path.join(html_dir, name)
+            )
+            print(f"✅ Previsualización generada: {os.path.abspath(output_file)}")
+
+    except Exception as e:
+        print(f"❌ Error al renderizar HTML: {e}")
+        import traceback
+        traceback.print_exc()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,5 +1,8 @@
 import random
-from typing import Dict, Any
+from typing import Dict, Any, List
+from core.aritmetica_digitos import linea_acarreos, operar
+from core.conversion_enteros_grandes import entero_a_digitos
+from core.conversion_lotes import convertir_a_bases, convertir_lote, entero_a_binario
 from core.generator_base import ExerciseGenerator, ExerciseRandomizer
 from core.numeracion_utils import decimal_a_binario_con_pasos
 from modules.numeracion.models import ConversionExerciseData, ConversionRow, ArithmeticOp
@@ -17,51 +20,54 @@ class ConversionRowRandomizer(ExerciseRandomizer):
         Returns:
             Dict con los parámetros del problema, listo para pasar al generador.
         """
+        return self.randomize_many(1, seed)[0]
+    
+    def randomize_many(self, count: int, seed: int | None = None) -> List[Dict[str, Any]]:
+        """
+        Genera los parámetros de `count` filas (una tabla de examen completa).
+        
+        Los valores se sortean fila a fila (misma secuencia aleatoria que
+        `count` llamadas a randomize) y la representabilidad de todas las
+        filas se calcula con una sola conversión por lotes.
+        """
         if seed is not None:
             random.seed(seed)
         
         n_bits = 8
-        col_idx = random.choice([1, 1, 2, 3, 3, 4, 4, 5])
-        val = 0
-        text_val = ""
-        
-        es_signed = col_idx in [1, 3, 4]
-        sign = -1 if (es_signed and random.random() < 0.7) else 1
-        
-        if col_idx == 1:  # Decimal
-            val = sign * random.randint(0, 120)
-            text_val = str(val)
-        elif col_idx == 2:  # Binario Natural
-            val = random.randint(0, 255)
-            text_val = self._int_to_bin(val, n_bits)
-        elif col_idx == 3:  # C2
-            val = sign * random.randint(0, 127)
-            text_val = self._int_to_bin(val, n_bits)
-        elif col_idx == 4:  # SM
-            val = sign * random.randint(0, 127)
-            text_val = self._int_to_sm(val, n_bits)
-        elif col_idx == 5:  # BCD
-            val = random.randint(0, 99)
-            text_val = self._int_to_bcd(val)
+        draws = []
+        for _ in range(count):
+            col_idx = random.choice([1, 1, 2, 3, 3, 4, 4, 5])
+            val = 0
+            
+            es_signed = col_idx in [1, 3, 4]
+            sign = -1 if (es_signed and random.random() < 0.7) else 1
+            
+            if col_idx == 1:  # Decimal
+                val = sign * random.randint(0, 120)
+            elif col_idx == 2:  # Binario Natural
+                val = random.randint(0, 255)
+            elif col_idx in (3, 4):  # C2 / SM
+                val = sign * random.randint(0, 127)
+            elif col_idx == 5:  # BCD
+                val = random.randint(0, 99)
+            
+            draws.append((random.choice(['a', 'b', 'c', 'd']), val, col_idx))
+        
+        # Texto de la columna objetivo de todas las filas en una llamada
+        texts = convertir_lote([val for _, val, _ in draws], n_bits, ('c2', 'bin', 'sm', 'bcd'))
+        columns = {1: None, 2: texts['bin'], 3: texts['c2'], 4: texts['sm'], 5: texts['bcd']}
         
         # Retornar SOLO los parámetros del problema
-        return {
-            'label': random.choice(['a', 'b', 'c', 'd']),
-            'val_decimal': val,
-            'target_col_idx': col_idx,
-            'representable': text_val != "NR"
-        }
-    
-    def _int_to_bin(self, val: int, bits: int) -> str:
-        return format(val if val >= 0 else (1 << bits) + val, f'0{bits}b')
-    
-    def _int_to_bcd(self, val: int) -> str:
-        if not (0 <= val <= 99): return "NR"
-        return f"{val // 10:04b} {val % 10:04b}"
-    
-    def _int_to_sm(self, val: int, bits: int) -> str:
-        if val >= 0: return format(val, f'0{bits}b')
-        return '1' + format(abs(val), f'0{bits - 1}b')
+        problems = []
+        for i, (label, val, col_idx) in enumerate(draws):
+            column = columns[col_idx]
+            problems.append({
+                'label': label,
+                'val_decimal': val,
+                'target_col_idx': col_idx,
+                'representable': column is None or column[i] != "NR"
+            })
+        return problems
 
 
 class ConversionExerciseGenerator(ExerciseGenerator):
@@ -85,57 +91,54 @@ class ConversionExerciseGenerator(ExerciseGenerator):
         Returns:
             ConversionRow: Ejercicio completo (problema + solución).
         """
-        label = problem_dict['label']
-        val_decimal = problem_dict['val_decimal']
-        target_col_idx = problem_dict['target_col_idx']
-        representable = problem_dict['representable']
+        return self.generate_rows([problem_dict])[0]
+    
+    def generate_rows(self, problems: List[Dict[str, Any]]) -> List[ConversionRow]:
+        """
+        DETERMINISTA: Calcula las soluciones de todas las filas de una tabla.
         
+        Las cuatro columnas (binario, C2, SM, BCD) de todas las filas se
+        obtienen con una única conversión por lotes.
+        """
         n_bits = 8
         
         # CALCULAR SOLUCIÓN (determinista, basada en val_decimal)
-        sol_bin = self._int_to_bin(val_decimal, n_bits) if 0 <= val_decimal <= 255 else "NR"
-        sol_c2 = self._int_to_bin(val_decimal, n_bits) if -128 <= val_decimal <= 127 else "NR"
-        sol_sm = self._int_to_sm(val_decimal, n_bits) if -127 <= val_decimal <= 127 else "NR"
-        sol_bcd = self._int_to_bcd(val_decimal)
-        
-        # Determinar target_val_str según target_col_idx
-        if target_col_idx == 1:  # Decimal
-            target_val_str = str(val_decimal)
-        elif target_col_idx == 2:  # Binario Natural
-            target_val_str = sol_bin
-        elif target_col_idx == 3:  # C2
-            target_val_str = sol_c2
-        elif target_col_idx == 4:  # SM
-            target_val_str = sol_sm
-        elif target_col_idx == 5:  # BCD
-            target_val_str = sol_bcd
-        else:
-            target_val_str = "ERROR"
-        
-        return ConversionRow(
-            title="Conversión entre Bases Numéricas",
-            description=f"Convertir {val_decimal} a múltiples sistemas",
-            label=label,
-            val_decimal=val_decimal,
-            target_col_idx=target_col_idx,
-            representable=representable,
-            target_val_str=target_val_str,
-            sol_bin=sol_bin,
-            sol_c2=sol_c2,
-            sol_sm=sol_sm,
-            sol_bcd=sol_bcd
-        )
-    
-    def _int_to_bin(self, val: int, bits: int) -> str:
-        return format(val if val >= 0 else (1 << bits) + val, f'0{bits}b')
-    
-    def _int_to_bcd(self, val: int) -> str:
-        if not (0 <= val <= 99): return "NR"
-        return f"{val // 10:04b} {val % 10:04b}"
-    
-    def _int_to_sm(self, val: int, bits: int) -> str:
-        if val >= 0: return format(val, f'0{bits}b')
-        return '1' + format(abs(val), f'0{bits - 1}b')
+        sols = convertir_lote([p['val_decimal'] for p in problems], n_bits, ('bin', 'c2', 'sm', 'bcd'))
+        
+        rows = []
+        for i, problem_dict in enumerate(problems):
+            val_decimal = problem_dict['val_decimal']
+            target_col_idx = problem_dict['target_col_idx']
+            sol_bin, sol_c2, sol_sm, sol_bcd = sols['bin'][i], sols['c2'][i], sols['sm'][i], sols['bcd'][i]
+            
+            # Determinar target_val_str según target_col_idx
+            if target_col_idx == 1:  # Decimal
+                target_val_str = str(val_decimal)
+            elif target_col_idx == 2:  # Binario Natural
+                target_val_str = sol_bin
+            elif target_col_idx == 3:  # C2
+                target_val_str = sol_c2
+            elif target_col_idx == 4:  # SM
+                target_val_str = sol_sm
+            elif target_col_idx == 5:  # BCD
+                target_val_str = sol_bcd
+            else:
+                target_val_str = "ERROR"
+            
+            rows.append(ConversionRow(
+                title="Conversión entre Bases Numéricas",
+                description=f"Convertir {val_decimal} a múltiples sistemas",
+                label=problem_dict['label'],
+                val_decimal=val_decimal,
+                target_col_idx=target_col_idx,
+                representable=problem_dict['representable'],
+                target_val_str=target_val_str,
+                sol_bin=sol_bin,
+                sol_c2=sol_c2,
+                sol_sm=sol_sm,
+                sol_bcd=sol_bcd
+            ))
+        return rows
 
 
 class BinaryConversionGenerator(ExerciseGenerator):
@@ -143,17 +146,6 @@ class BinaryConversionGenerator(ExerciseGenerator):
     def topic(self) -> str:
         return "Representación Numérica"
 
-    def _int_to_bin(self, val: int, bits: int) -> str:
-        return format(val if val >= 0 else (1 << bits) + val, f'0{bits}b')
-
-    def _int_to_bcd(self, val: int) -> str:
-        if not (0 <= val <= 99): return "NR"
-        return f"{val // 10:04b} {val % 10:04b}"
-
-    def _int_to_sm(self, val: int, bits: int) -> str:
-        if val >= 0: return format(val, f'0{bits}b')
-        return '1' + format(abs(val), f'0{bits - 1}b')
-
     def generate_from_problem(self, problem_dict: Dict[str, Any]) -> ConversionExerciseData:
         """
         NOTA: Este método no se usa en BinaryConversionGenerator (opera a nivel de ejercicio completo).
@@ -166,22 +158,12 @@ class BinaryConversionGenerator(ExerciseGenerator):
         Utiliza aleatorizador internamente para mantener compatibilidad.
         """
         n_bits = 8
-        rows = []
         labels = ['a', 'b', 'c', 'd']
-        saved_vals = {}
         
-        randomizer = ConversionRowRandomizer()
-
-        for label in labels:
-            # Usar aleatorizador
-            problem = randomizer.randomize(seed=None)
-            
-            # Usar generador
-            generator = ConversionExerciseGenerator()
-            row = generator.generate_from_problem(problem)
-            
-            rows.append(row)
-            saved_vals[label] = problem['val_decimal']
+        # Usar aleatorizador y generador sobre la tabla completa
+        problems = ConversionRowRandomizer().randomize_many(len(labels))
+        rows = ConversionExerciseGenerator().generate_rows(problems)
+        saved_vals = {label: problem['val_decimal'] for label, problem in zip(labels, problems)}
 
         ops = []
         if len(saved_vals) >= 2:
@@ -205,7 +187,7 @@ class BinaryConversionGenerator(ExerciseGenerator):
                     val1_dec=v1,
                     val2_dec=v2,
                     result_dec=res,
-                    result_bin=self._int_to_bin(res, n_bits),
+                    result_bin=entero_a_binario(res, n_bits),
                     overflow=False,
                     underflow=False,
                     carry_bits=""
@@ -233,59 +215,70 @@ class MultiBaseExerciseGenerator(ExerciseGenerator):
     def topic(self) -> str:
         return "Sistemas Binarios, Octales y Hexadecimales"
     
+    BASE_NAMES = {2: "Binario", 8: "Octal", 16: "Hexadecimal"}
+    
     def generate_from_problem(self, problem_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Genera ejercicio de operaciones en múltiples bases."""
-        base = problem_dict.get('target_base', random.choice([2, 8, 16]))
-        operand1 = problem_dict.get('operand1', random.randint(10, 255))
-        operand2 = problem_dict.get('operand2', random.randint(10, 255))
-        operation = problem_dict.get('operation', random.choice(['add', 'subtract', 'multiply']))
-        
-        # Convertir a la base objetivo
-        if base == 2:
-            op1_str = bin(operand1)[2:]
-            op2_str = bin(operand2)[2:]
-            base_name = "Binario"
-        elif base == 8:
-            op1_str = oct(operand1)[2:]
-            op2_str = oct(operand2)[2:]
-            base_name = "Octal"
-        else:  # base == 16
-            op1_str = hex(operand1)[2:].upper()
-            op2_str = hex(operand2)[2:].upper()
-            base_name = "Hexadecimal"
-        
-        # Calcular resultado
-        if operation == 'add':
-            result = operand1 + operand2
-            op_symbol = '+'
-            op_name = 'suma'
-        elif operation == 'subtract':
-            result = max(0, operand1 - operand2)  # Evitar negativos para simplificar
-            op_symbol = '-'
-            op_name = 'resta'
-        else:  # multiply
-            result = operand1 * operand2
-            op_symbol = '*'
-            op_name = 'multiplicación'
-        
-        # Convertir resultado
-        if base == 2:
-            result_str = bin(result)[2:]
-        elif base == 8:
-            result_str = oct(result)[2:]
-        else:
-            result_str = hex(result)[2:].upper()
-        
-        return {
-            'title': f'Operación en {base_name}',
-            'description': f'Realiza la {op_name} en {base_name}: {op1_str} {op_symbol} {op2_str}',
-            'problem': f'{op1_str} {op_symbol} {op2_str} = ?',
-            'solution': result_str,
-            'base': base,
-            'base_name': base_name,
-            'decimal_operands': (operand1, operand2),
-            'decimal_result': result
+        return self.generate_many([problem_dict])[0]
+    
+    def generate_many(self, problems: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Genera varios ejercicios: los operandos de todos ellos se convierten a
+        su base con una conversión por lotes por cada base, y el resultado se
+        calcula en la propia base (core.aritmetica_digitos) con sus acarreos.
+        """
+        resolved = []
+        for problem_dict in problems:
+            base = problem_dict.get('target_base', random.choice([2, 8, 16]))
+            operand1 = problem_dict.get('operand1', random.randint(10, 255))
+            operand2 = problem_dict.get('operand2', random.randint(10, 255))
+            operation = problem_dict.get('operation', random.choice(['add', 'subtract', 'multiply']))
+            base = base if base in self.BASE_NAMES else 16
+            
+            # Calcular resultado
+            if operation == 'add':
+                result = operand1 + operand2
+                op_symbol, op_name = '+', 'suma'
+            elif operation == 'subtract':
+                result = max(0, operand1 - operand2)  # Evitar negativos para simplificar
+                op_symbol, op_name = '-', 'resta'
+            else:  # multiply
+                result = operand1 * operand2
+                op_symbol, op_name = '*', 'multiplicación'
+            resolved.append((base, operand1, operand2, result, op_symbol, op_name))
+        
+        # Convertir operandos a la base objetivo (un lote por base)
+        by_base: Dict[int, List[int]] = {}
+        for base, operand1, operand2, result, _, _ in resolved:
+            by_base.setdefault(base, []).extend((operand1, operand2))
+        converted = {
+            base: iter(convertir_a_bases(values, (base,))[base])
+            for base, values in by_base.items()
         }
+        
+        exercises = []
+        for base, operand1, operand2, result, op_symbol, op_name in resolved:
+            texts = converted[base]
+            op1_str, op2_str = next(texts), next(texts)
+            base_name = self.BASE_NAMES[base]
+            operation = {'+': 'add', '-': 'subtract', '*': 'multiply'}[op_symbol]
+            if operation == 'subtract' and operand1 < operand2:
+                result_str, carries = '0', None
+            else:
+                arithmetic = operar(op1_str, op2_str, base, operation, traza=operation != 'multiply')
+                result_str, carries = arithmetic.texto(), linea_acarreos(arithmetic)
+            exercises.append({
+                'title': f'Operación en {base_name}',
+                'description': f'Realiza la {op_name} en {base_name}: {op1_str} {op_symbol} {op2_str}',
+                'problem': f'{op1_str} {op_symbol} {op2_str} = ?',
+                'solution': result_str,
+                'carries': carries,
+                'base': base,
+                'base_name': base_name,
+                'decimal_operands': (operand1, operand2),
+                'decimal_result': result
+            })
+        return exercises
 
 
 class FixedLengthExerciseGenerator(ExerciseGenerator):
@@ -435,65 +428,69 @@ class ArithmeticOperationsExerciseGenerator(ExerciseGenerator):
     def topic(self) -> str:
         return "Operaciones Aritméticas"
     
+    BASE_NAMES = {2: 'binario', 8: 'octal', 10: 'decimal', 16: 'hexadecimal'}
+    OPERATIONS = {
+        'add': ('+', 'suma'),
+        'subtract': ('-', 'resta'),
+        'multiply': ('*', 'multiplicación'),
+        'divide': ('/', 'división'),
+    }
+    # Por encima de estos dígitos no se guardan los pasos (la traza fuerza la multiplicación escolar)
+    MAX_STEP_DIGITS = 64
+    
     def generate_from_problem(self, problem_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Genera ejercicio de operaciones aritméticas."""
+        """
+        Genera ejercicio de operaciones aritméticas.
+        
+        La operación se hace en la propia base sobre vectores de dígitos
+        (core.aritmetica_digitos): 'steps' trae un paso por columna (suma,
+        resta), por dígito del multiplicador o por dígito bajado (división),
+        y 'carries' la línea de acarreos / préstamos. Con operandos de más de
+        MAX_STEP_DIGITS dígitos solo se calcula el resultado.
+        """
         base = problem_dict.get('base', random.choice([2, 8, 10, 16]))
         operation = problem_dict.get('operation', random.choice(['add', 'subtract', 'multiply']))
         operand1 = problem_dict.get('operand1', random.randint(5, 100))
         operand2 = problem_dict.get('operand2', random.randint(5, 100))
+        if operation not in self.OPERATIONS:
+            raise ValueError(f"Operación desconocida: {operation}")
         
-        # Nombres de bases
-        base_names = {2: 'binario', 8: 'octal', 10: 'decimal', 16: 'hexadecimal'}
-        base_name = base_names[base]
-        
-        # Convertir operandos a la base
-        if base == 2:
-            op1_str = bin(operand1)[2:]
-            op2_str = bin(operand2)[2:]
-        elif base == 8:
-            op1_str = oct(operand1)[2:]
-            op2_str = oct(operand2)[2:]
-        elif base == 16:
-            op1_str = hex(operand1)[2:].upper()
-            op2_str = hex(operand2)[2:].upper()
-        else:
-            op1_str = str(operand1)
-            op2_str = str(operand2)
-        
-        # Calcular resultado
-        if operation == 'add':
-            result = operand1 + operand2
-            op_symbol = '+'
-            op_word = 'suma'
-        elif operation == 'subtract':
-            result = max(0, operand1 - operand2)
-            op_symbol = '-'
-            op_word = 'resta'
-        else:
-            result = operand1 * operand2
-            op_symbol = '*'
-            op_word = 'multiplicación'
-        
-        # Convertir resultado a la base
-        if base == 2:
-            result_str = bin(result)[2:]
-        elif base == 8:
-            result_str = oct(result)[2:]
-        elif base == 16:
-            result_str = hex(result)[2:].upper()
-        else:
-            result_str = str(result)
+        base_name = self.BASE_NAMES.get(base, f'base {base}')
+        op_symbol, op_word = self.OPERATIONS[operation]
         
-        return {
+        # Operandos en la base
+        op1_str = entero_a_digitos(operand1, base, mayusculas=True)
+        op2_str = entero_a_digitos(operand2, base, mayusculas=True)
+        
+        # Calcular resultado en la base (resta negativa → 0, para simplificar)
+        if operation == 'subtract' and operand1 < operand2:
+            result, result_str, steps, carries, remainder = 0, '0', [], None, None
+        else:
+            trace = max(len(op1_str), len(op2_str)) <= self.MAX_STEP_DIGITS
+            arithmetic = operar(op1_str, op2_str, base, operation, traza=trace)
+            result_str, steps, carries = arithmetic.texto(), arithmetic.pasos, linea_acarreos(arithmetic)
+            remainder = arithmetic.texto_resto()
+            result = operand1 // operand2 if operation == 'divide' else {
+                'add': operand1 + operand2,
+                'subtract': operand1 - operand2,
+                'multiply': operand1 * operand2,
+            }[operation]
+        
+        exercise = {
             'title': f'{op_word.capitalize()} en {base_name.capitalize()}',
             'problem': f'{op1_str} {op_symbol} {op2_str} = ?',
             'solution': result_str,
             'show_steps': True,
+            'steps': steps,
+            'carries': carries,
             'decimal_operands': (operand1, operand2),
             'decimal_result': result,
             'base': base,
             'operation': operation
         }
+        if remainder is not None:
+            exercise['remainder'] = remainder
+        return exercise
 
 
 class FixedPointExerciseGenerator(ExerciseGenerator):
@@ -7,6 +7,7 @@ import random
 from typing import Dict, Any, List
 from core.generator_base import ExerciseGenerator
 from modules.secuencial.models import SequentialExerciseData
+from modules.secuencial.waveform import Waveform
 
 
 class SequentialGenerator(ExerciseGenerator):
@@ -51,7 +52,8 @@ class SequentialGenerator(ExerciseGenerator):
             post_h = width_units - pre_h - pulse_len
             
             # Formato RLE para tikz-timing: "4H 2L 18H"
-            async_sequence = f"{pre_h}H {pulse_len}L {post_h}H"
+            async_wave = Waveform.constant('H', pre_h).append('L', pulse_len).append('H', post_h)
+            async_sequence = async_wave.to_tikz()
 
         return SequentialExerciseData(
             title="Sistemas Secuenciales",
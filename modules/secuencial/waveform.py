@@ -0,0 +1,346 @@
+"""
+Formas de onda digitales para cronogramas y simulación secuencial.
+
+Una Waveform es una secuencia de runs (nivel, duración) codificada en RLE
+sobre arrays compactos (array('B') para niveles, array('d') para
+duraciones y tiempos de fin acumulados). Todas las operaciones son
+lineales en el número de runs (o logarítmicas con bisect):
+
+    parse / to_tikz      → O(runs)        (cadenas tikz-timing "4H 2L 18H")
+    level_at / slice     → O(log runs)    (+ O(k) del trozo copiado)
+    merge / compare      → O(runs_a + runs_b)
+    sample(tiempos)      → O(runs + muestras) si los tiempos vienen ordenados
+
+El mismo objeto alimenta los renderers de cronogramas (LaTeX, SVG/HTML) y
+el cálculo de soluciones (muestreo en flancos de reloj).
+
+Niveles: 'L' (0), 'H' (1), 'Z' (alta impedancia), 'X' (indeterminado).
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+LEVELS = "LHZX"
+_LEVEL_CODE = {level: code for code, level in enumerate(LEVELS)}
+
+# Token tikz-timing: longitud opcional + carácter de nivel ("4H", "0.5L", "C")
+_TIMING_TOKEN = re.compile(r"(\d+(?:\.\d+)?)?([HLZXCTUD])", re.IGNORECASE)
+_TIMING_OPTIONS = re.compile(r"\[[^\]]*\]")
+_BIT_STRING = re.compile(r"[01\s]+")
+
+Run = Tuple[str, float]
+
+
+def _level_code(level: Union[str, int, bool]) -> int:
+    """Normaliza un nivel ('H', 'l', '1', 0, True...) a su código."""
+    if isinstance(level, (bool, int)):
+        return 1 if level else 0
+    level = level.upper()
+    if level == "1":
+        return 1
+    if level == "0":
+        return 0
+    if level in ("U", "D"):  # Datos (tikz-timing) → indeterminado
+        return 3
+    try:
+        return _LEVEL_CODE[level]
+    except KeyError:
+        raise ValueError(f"Nivel lógico no válido: {level!r}") from None
+
+
+def _format_duration(duration: float) -> str:
+    return f"{duration:g}"
+
+
+class Waveform:
+    """Forma de onda RLE respaldada por arrays."""
+
+    __slots__ = ("_levels", "_durations", "_ends")
+
+    def __init__(self, runs: Iterable[Tuple[Union[str, int], float]] = ()):
+        self._levels = array("B")
+        self._durations = array("d")
+        self._ends = array("d")
+        for level, duration in runs:
+            self.append(level, duration)
+
+    # ------------------------------------------------------------------
+    # Construcción
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def parse(cls, sequence: Optional[str]) -> "Waveform":
+        """
+        Convierte una cadena tikz-timing en Waveform.
+
+        Acepta tanto la forma RLE ("4H 2L 18H") como la expandida ("LLHH") y
+        cadenas de bits ("0110", una unidad por bit). Las opciones entre
+        corchetes ("[draw=none] ...") se ignoran. Los relojes "C" y toggles
+        "T" invierten el nivel en cada unidad (el primero pasa a H).
+        """
+        wave = cls()
+        sequence = _TIMING_OPTIONS.sub(" ", sequence or "")
+        if _BIT_STRING.fullmatch(sequence) and sequence.strip():
+            return cls.from_levels(sequence.replace(" ", ""))
+
+        toggle_level = 0
+        for count_str, char in _TIMING_TOKEN.findall(sequence):
+            count = float(count_str) if count_str else 1.0
+            level = char.upper()
+            if level in ("C", "T"):
+                # Reloj: cada unidad invierte el nivel
+                for _ in range(int(count)):
+                    toggle_level ^= 1
+                    wave._append_code(toggle_level, 1.0)
+                continue
+            code = _level_code(level)
+            wave._append_code(code, count)
+            if code < 2:
+                toggle_level = code
+        return wave
+
+    @classmethod
+    def from_levels(cls, levels: Iterable[Union[str, int, bool]], unit: float = 1.0) -> "Waveform":
+        """Una unidad (de duración unit) por nivel: "LLHH", "0110", [0, 1, 1]..."""
+        wave = cls()
+        for level in levels:
+            wave._append_code(_level_code(level), unit)
+        return wave
+
+    @classmethod
+    def constant(cls, level: Union[str, int], duration: float) -> "Waveform":
+        return cls([(level, duration)])
+
+    @classmethod
+    def clock(cls, cycles: int, half_period: float = 1.0, start: str = "H") -> "Waveform":
+        """Reloj de cycles periodos (2 semiperiodos cada uno) empezando en start."""
+        wave = cls()
+        first = _level_code(start)
+        for i in range(2 * cycles):
+            wave._append_code(first ^ (i & 1), half_period)
+        return wave
+
+    def append(self, level: Union[str, int], duration: float) -> "Waveform":
+        """Añade un run (fusionándolo con el último si tiene el mismo nivel)."""
+        return self._append_code(_level_code(level), duration)
+
+    def _append_code(self, code: int, duration: float) -> "Waveform":
+        if duration <= 0:
+            return self
+        end = (self._ends[-1] if self._ends else 0.0) + duration
+        if self._levels and self._levels[-1] == code:
+            self._durations[-1] += duration
+            self._ends[-1] = end
+        else:
+            self._levels.append(code)
+            self._durations.append(duration)
+            self._ends.append(end)
+        return self
+
+    def extend(self, other: "Waveform") -> "Waveform":
+        """Concatena other al final (in situ)."""
+        for code, duration in zip(other._levels, other._durations):
+            self._append_code(code, duration)
+        return self
+
+    def copy(self) -> "Waveform":
+        wave = Waveform()
+        wave._levels = array("B", self._levels)
+        wave._durations = array("d", self._durations)
+        wave._ends = array("d", self._ends)
+        return wave
+
+    def __add__(self, other: "Waveform") -> "Waveform":
+        return self.copy().extend(other)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    @property
+    def duration(self) -> float:
+        return self._ends[-1] if self._ends else 0.0
+
+    def __len__(self) -> int:
+        """Número de runs."""
+        return len(self._levels)
+
+    def __bool__(self) -> bool:
+        return bool(self._levels)
+
+    def runs(self) -> Iterator[Run]:
+        for code, duration in zip(self._levels, self._durations):
+            yield LEVELS[code], duration
+
+    def __iter__(self) -> Iterator[Run]:
+        return self.runs()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Waveform):
+            return NotImplemented
+        return self._levels == other._levels and self._durations == other._durations
+
+    def __repr__(self) -> str:
+        return f"Waveform({self.to_tikz()!r})"
+
+    def level_at(self, t: float) -> Optional[str]:
+        """Nivel en el instante t (None fuera de [0, duration))."""
+        if t < 0:
+            return None
+        i = bisect_right(self._ends, t)
+        return LEVELS[self._levels[i]] if i < len(self._levels) else None
+
+    def sample(self, times: Iterable[float]) -> List[Optional[str]]:
+        """Niveles en cada instante. Lineal si times está ordenado; si no, bisect."""
+        times = list(times)
+        if any(b < a for a, b in zip(times, times[1:])):
+            return [self.level_at(t) for t in times]
+        result: List[Optional[str]] = []
+        i, n = 0, len(self._levels)
+        for t in times:
+            if t < 0:
+                result.append(None)
+                continue
+            while i < n and self._ends[i] <= t:
+                i += 1
+            result.append(LEVELS[self._levels[i]] if i < n else None)
+        return result
+
+    def edges(self, kind: str = "rising") -> List[float]:
+        """Instantes de los flancos L→H ('rising'), H→L ('falling') o ambos ('any')."""
+        wanted = {"rising": ((0, 1),), "falling": ((1, 0),), "any": ((0, 1), (1, 0))}[kind]
+        return [
+            self._ends[i - 1]
+            for i in range(1, len(self._levels))
+            if (self._levels[i - 1], self._levels[i]) in wanted
+        ]
+
+    # ------------------------------------------------------------------
+    # Operaciones
+    # ------------------------------------------------------------------
+
+    def slice(self, start: float, end: Optional[float] = None) -> "Waveform":
+        """Trozo [start, end) (en unidades de tiempo)."""
+        end = self.duration if end is None else min(end, self.duration)
+        start = max(start, 0.0)
+        wave = Waveform()
+        if end <= start:
+            return wave
+        i = bisect_right(self._ends, start)
+        t = start
+        while i < len(self._levels) and t < end:
+            run_end = min(self._ends[i], end)
+            wave._append_code(self._levels[i], run_end - t)
+            t = run_end
+            i += 1
+        return wave
+
+    def __getitem__(self, key: slice) -> "Waveform":
+        if not isinstance(key, slice) or key.step is not None:
+            raise TypeError("Waveform solo admite cortes temporales wave[inicio:fin]")
+        return self.slice(key.start or 0.0, key.stop)
+
+    def _sweep(self, other: "Waveform") -> Iterator[Tuple[float, float, int, int]]:
+        """Recorre ambas ondas a la vez: (inicio, fin, código_self, código_other) en el tramo común."""
+        i = j = 0
+        t = 0.0
+        na, nb = len(self._levels), len(other._levels)
+        while i < na and j < nb:
+            end = min(self._ends[i], other._ends[j])
+            if end > t:
+                yield t, end, self._levels[i], other._levels[j]
+                t = end
+            if self._ends[i] <= end:
+                i += 1
+            if other._ends[j] <= end:
+                j += 1
+
+    def merge(self, other: "Waveform", op: Callable[[str, str], str]) -> "Waveform":
+        """
+        Combina dos ondas nivel a nivel en su tramo común.
+
+        Ejemplo: a.merge(b, lambda x, y: 'H' if 'H' in (x, y) else 'L')  (OR)
+        """
+        wave = Waveform()
+        for start, end, a, b in self._sweep(other):
+            wave.append(op(LEVELS[a], LEVELS[b]), end - start)
+        return wave
+
+    def compare(self, other: "Waveform") -> List[Tuple[float, float, Optional[str], Optional[str]]]:
+        """
+        Tramos donde las ondas difieren: [(inicio, fin, nivel_self, nivel_other)].
+
+        Si las duraciones difieren, el exceso aparece con None en la onda más corta.
+        """
+        diffs: List[Tuple[float, float, Optional[str], Optional[str]]] = []
+        for start, end, a, b in self._sweep(other):
+            if a != b:
+                if diffs and diffs[-1][1] == start and diffs[-1][2:] == (LEVELS[a], LEVELS[b]):
+                    diffs[-1] = (diffs[-1][0], end, LEVELS[a], LEVELS[b])
+                else:
+                    diffs.append((start, end, LEVELS[a], LEVELS[b]))
+        common = min(self.duration, other.duration)
+        longer, self_is_longer = (self, True) if self.duration > other.duration else (other, False)
+        for level, start, end in longer._runs_between(common, longer.duration):
+            diffs.append((start, end, level, None) if self_is_longer else (start, end, None, level))
+        return diffs
+
+    def _runs_between(self, start: float, end: float) -> Iterator[Tuple[str, float, float]]:
+        t = start
+        for level, duration in self.slice(start, end).runs():
+            yield level, t, t + duration
+            t += duration
+
+    # ------------------------------------------------------------------
+    # Exportación
+    # ------------------------------------------------------------------
+
+    def to_tikz(self, clock: bool = False) -> str:
+        """
+        Cadena tikz-timing RLE ("4H 2L 18H").
+
+        Con clock=True los tramos de semiperiodos unitarios alternos se
+        escriben como reloj ("24C"), la forma inversa de parse().
+        """
+        tokens = []
+        levels, durations = self._levels, self._durations
+        n = len(levels)
+        last_lh = 0  # Nivel desde el que conmuta "C" (igual que en parse)
+        i = 0
+        while i < n:
+            code = levels[i]
+            if clock and durations[i] == 1.0 and code == last_lh ^ 1:
+                j = i + 1
+                while j < n and durations[j] == 1.0 and levels[j] == levels[j - 1] ^ 1:
+                    j += 1
+                if j - i >= 2:
+                    tokens.append(f"{j - i}C")
+                    last_lh = levels[j - 1]
+                    i = j
+                    continue
+            tokens.append(f"{_format_duration(durations[i])}{LEVELS[code]}")
+            if code < 2:
+                last_lh = code
+            i += 1
+        return " ".join(tokens)
+
+    def to_levels(self, unit: float = 1.0) -> str:
+        """Forma expandida, un carácter por unidad ("LLHH"). Requiere duraciones múltiplo de unit."""
+        parts = []
+        for code, duration in zip(self._levels, self._durations):
+            count = duration / unit
+            if abs(count - round(count)) > 1e-9:
+                raise ValueError(f"Duración {duration:g} no es múltiplo de {unit:g}")
+            parts.append(LEVELS[code] * int(round(count)))
+        return "".join(parts)
+
+
+def as_waveform(signal: Union[None, str, Waveform, Sequence[Run]]) -> Waveform:
+    """Acepta Waveform, cadena tikz-timing/bits o lista de runs."""
+    if isinstance(signal, Waveform):
+        return signal
+    if signal is None or isinstance(signal, str):
+        return Waveform.parse(signal)
+    return Waveform(signal)
@@ -0,0 +1,337 @@
+"""
+Renderer HTML: previsualización instantánea de exámenes.
+
+ARQUITECTURA:
+- Entrada: JSON intermedio agnóstico (ExamBuilder.save_intermediate_json)
+  {"exam_metadata": {...}, "exercises": [...]} o directamente la lista de ejercicios
+- Salida: HTML autocontenido, generado en STREAMING (iter_render produce fragmentos)
+- Sin compilación: tablas como <table>, cronogramas como <svg> en línea
+
+A diferencia del renderer LaTeX (que consume objetos ExerciseData), este
+renderer solo lee JSON, de modo que la web puede previsualizar un examen
+guardado sin reconstruir los objetos Python.
+
+PARALELISMO:
+    render_variants() renderiza varias variantes (o enunciado + solución)
+    en un pool de procesos. Cada variante es independiente y determinista.
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from html import escape
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from modules.secuencial.waveform import Waveform
+from renderers.html import templates
+from renderers.html.utils.conversion_table import ConversionTableHtmlRenderer
+from renderers.html.utils.karnaugh import KarnaughMapHtmlRenderer
+from renderers.html.utils.timing import TimingDiagramSvgRenderer
+from renderers.html.utils.truth_table import TruthTableHtmlRenderer
+
+ExamJson = Union[Dict[str, Any], List[Dict[str, Any]]]
+
+
+class HtmlExamRenderer:
+    def __init__(self, is_solution: bool = False):
+        self.is_solution = is_solution
+        self.tt_renderer = TruthTableHtmlRenderer()
+        self.kmap_renderer = KarnaughMapHtmlRenderer()
+        self.timing_renderer = TimingDiagramSvgRenderer()
+        self.table_renderer = ConversionTableHtmlRenderer(is_solution)
+
+        # Despacho por metadata.exercise_type (nombre de la clase ExerciseData)
+        self._dispatch: Dict[str, Callable[[Dict[str, Any], int], Iterator[str]]] = {
+            'ConversionExerciseData': self._render_conversion,
+            'ConversionRow': self._render_conversion_row,
+            'ArithmeticOp': self._render_arithmetic_op,
+            'KarnaughExerciseData': self._render_karnaugh,
+            'LogicProblemExerciseData': self._render_logic_problem,
+            'MSIExerciseData': self._render_msi,
+            'SequentialExerciseData': self._render_sequential,
+        }
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def iter_render(self, exam_json: ExamJson) -> Iterator[str]:
+        """Genera el documento HTML fragmento a fragmento (streaming)."""
+        exam_metadata, exercises = self._split_exam(exam_json)
+
+        yield templates.DOCUMENT_HEAD.substitute(
+            title=escape(str(exam_metadata.get('title', 'Examen'))),
+            subtitle=escape(str(exam_metadata.get('description', ''))),
+            solution_tag=templates.SOLUTION_TAG if self.is_solution else "",
+            css=templates.EXAM_CSS,
+        )
+
+        for i, exercise_json in enumerate(exercises, 1):
+            yield from self.iter_render_exercise(exercise_json, i)
+
+        yield templates.DOCUMENT_FOOT
+
+    def render(self, exam_json: ExamJson) -> str:
+        return "".join(self.iter_render(exam_json))
+
+    def render_to_file(self, exam_json: ExamJson, output_file: str) -> str:
+        """Escribe el HTML en disco sin mantener el documento completo en memoria."""
+        with open(output_file, 'w', encoding='utf-8') as f:
+            for chunk in self.iter_render(exam_json):
+                f.write(chunk)
+        return output_file
+
+    def iter_render_exercise(self, exercise_json: Dict[str, Any], index: int) -> Iterator[str]:
+        title = exercise_json.get('title', '')
+        yield templates.EXERCISE_OPEN.substitute(index=index, title=escape(str(title)))
+
+        exercise_type = exercise_json.get('metadata', {}).get('exercise_type', '')
+        render_func = self._dispatch.get(exercise_type, self._render_generic)
+        yield from render_func(exercise_json, index)
+
+        yield templates.EXERCISE_CLOSE
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _split_exam(exam_json: ExamJson):
+        if isinstance(exam_json, list):
+            return {}, exam_json
+        return exam_json.get('exam_metadata', {}), exam_json.get('exercises', [])
+
+    @staticmethod
+    def _fields(exercise_json: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Unifica los campos del ejercicio en un solo dict.
+
+        Soporta las dos formas del JSON intermedio:
+        - ProblemSolutionExerciseData.asdict(): {"problem": {...}, "solution": {...}}
+        - Dataclasses sin separación explícita: {"data": {...}}
+        """
+        fields: Dict[str, Any] = {}
+        data = exercise_json.get('data')
+        if isinstance(data, dict):
+            fields.update(data)
+        for key in ('problem', 'solution'):
+            section = exercise_json.get(key)
+            if isinstance(section, dict):
+                fields.update(section)
+        return fields
+
+    def _statement(self, content: str) -> str:
+        return templates.STATEMENT.substitute(content=content)
+
+    def _tasks(self, items: List[str]) -> str:
+        return templates.TASK_LIST.substitute(items="\n".join(f"<li>{item}</li>" for item in items))
+
+    # ------------------------------------------------------------------
+    # Numeración
+    # ------------------------------------------------------------------
+
+    def _render_conversion(self, exercise_json: Dict[str, Any], index: int) -> Iterator[str]:
+        f = self._fields(exercise_json)
+        n_bits = f.get('n_bits', 8)
+
+        yield self._statement(
+            f"<p><strong>a)</strong> {escape(exercise_json.get('description', ''))}</p>\n"
+            f"<p>Registro de {n_bits} bits. Si no es representable, escribe 'NR'.</p>"
+        )
+        yield templates.PARAGRAPH.substitute(text="<strong>Respuesta:</strong>")
+        yield self.table_renderer.render(f.get('rows', []))
+
+        operations = f.get('operations', [])
+        if operations:
+            yield self._statement("<p><strong>b)</strong> Realice las siguientes operaciones aritméticas.</p>")
+            for i, op in enumerate(operations, 1):
+                yield from self._render_operation(op, n_bits, i)
+
+    def _render_conversion_row(self, exercise_json: Dict[str, Any], index: int) -> Iterator[str]:
+        f = self._fields(exercise_json)
+        yield self._statement(f"<p>{escape(exercise_json.get('description', ''))}</p>")
+        yield self.table_renderer.render([f])
+
+    def _render_arithmetic_op(self, exercise_json: Dict[str, Any], index: int) -> Iterator[str]:
+        f = self._fields(exercise_json)
+        # Suelta no lleva el n_bits del ejercicio de conversión: el ancho sale del resultado
+        n_bits = f.get('n_bits') or len(str(f.get('result_bin', ''))) or 8
+        yield from self._render_operation(f, n_bits, 1)
+
+    def _render_operation(self, op: Dict[str, Any], n_bits: int, number: int) -> Iterator[str]:
+        yield templates.PARAGRAPH.substitute(
+            text=f"<strong>{number}) {escape(str(op.get('op_type', '')))} en {escape(str(op.get('system', '')))}:</strong> "
+                 f"Fila {escape(str(op.get('operand1', '')))} {escape(str(op.get('operator_symbol', '')))} "
+                 f"Fila {escape(str(op.get('operand2', '')))}"
+        )
+        yield self.table_renderer.render_grid(n_bits, op if self.is_solution else None)
+
+        chk_ov = "☒" if (self.is_solution and op.get('overflow')) else "☐"
+        chk_un = "☒" if (self.is_solution and op.get('underflow')) else "☐"
+        yield f'<p class="checks">¿Overflow? {chk_ov} &emsp; ¿Underflow? {chk_un} &emsp; ¿Correcto? ☐</p>\n'
+
+    # ------------------------------------------------------------------
+    # Combinacional
+    # ------------------------------------------------------------------
+
+    def _render_karnaugh(self, exercise_json: Dict[str, Any], index: int) -> Iterator[str]:
+        f = self._fields(exercise_json)
+        vars_name = f.get('vars_name', ['A', 'B', 'C', 'D'])
+        out_name = f.get('out_name', 'F')
+
+        yield self._statement(
+            f"<p>{escape(exercise_json.get('description', ''))}</p>\n"
+            + self.tt_renderer.render(vars_name, out_name, f.get('truth_table_outputs'))
+            + self._tasks([
+                f"Obtener la expresión canónica ({escape(str(f.get('canon_type', '')))}).",
+                "Simplificar por Karnaugh.",
+                f"Implementar con puertas <strong>{escape(str(f.get('gate_type', '')))}</strong>.",
+            ])
+        )
+        yield templates.PARAGRAPH.substitute(text="<strong>Espacio de Resolución:</strong>")
+        values = f.get('truth_table_outputs') if self.is_solution else None
+        yield self.kmap_renderer.render_template("".join(vars_name[:2]), "".join(vars_name[2:]), out_name, values)
+
+        if self.is_solution and f.get('simplified_sop'):
+            yield templates.PARAGRAPH.substitute(text=f'<span class="sol">{escape(f["simplified_sop"])}</span>')
+
+    def _render_logic_problem(self, exercise_json: Dict[str, Any], index: int) -> Iterator[str]:
+        f = self._fields(exercise_json)
+        vars_clean = f.get('vars_clean', [])
+        out_clean = f.get('out_clean', 'S')
+
+        items = "".join(f"<li>{escape(str(v))}</li>" for v in f.get('variables_desc', []))
+        items += f"<li>Salida: {escape(str(f.get('output_desc', '')))}</li>"
+        yield self._statement(
+            f"<p><strong>Contexto: {escape(str(f.get('context_title', '')))}</strong></p>\n"
+            f"<ul>{items}</ul>\n"
+            f"<p><em>Lógica: {escape(str(f.get('logic_description', '')))}</em></p>"
+        )
+
+        outputs = f.get('truth_table_outputs') if self.is_solution else None
+        yield templates.SUBTITLE.substitute(text="1. Tabla de Verdad")
+        yield self.tt_renderer.render(vars_clean, out_clean, outputs)
+        yield templates.SUBTITLE.substitute(text="2. Mapa de Karnaugh")
+        yield self.kmap_renderer.render_template("".join(vars_clean[:2]), "".join(vars_clean[2:]), out_clean, outputs)
+        yield templates.SUBTITLE.substitute(text="3. Esquema Lógico")
+
+        if self.is_solution and f.get('simplified_solution'):
+            yield templates.PARAGRAPH.substitute(text=escape(str(f['simplified_solution'])))
+
+    def _render_msi(self, exercise_json: Dict[str, Any], index: int) -> Iterator[str]:
+        f = self._fields(exercise_json)
+        block_type = f.get('block_type', '')
+        params = f.get('params', {})
+
+        content = f"<p>{escape(exercise_json.get('description', ''))}</p>\n"
+        content += f"<p><strong>Bloque:</strong> {escape(str(block_type))}</p>\n"
+
+        if block_type == 'MUX':
+            content += f"<p>Entradas I0-I15: {escape(str(params.get('inputs', '')))}. Determine Y para:</p>\n<ol>"
+            for case in params.get('cases', []):
+                content += f"<li>Enable={escape(str(case.get('ena')))}, Dir={int(case.get('addr', 0)):04b}</li>"
+            content += "</ol>"
+        elif block_type in ('COMPARADOR', 'SUMADOR'):
+            a, b = int(params.get('A', 0)), int(params.get('B', 0))
+            content += f"<p><strong>A</strong> = {a} ({a:04b}), <strong>B</strong> = {b} ({b:04b})</p>"
+
+        yield self._statement(content)
+
+        if self.is_solution and f.get('expected_outputs'):
+            yield templates.PARAGRAPH.substitute(
+                text=f"Salidas esperadas: <strong>{escape(str(f['expected_outputs']))}</strong>"
+            )
+
+    # ------------------------------------------------------------------
+    # Secuencial
+    # ------------------------------------------------------------------
+
+    def _render_sequential(self, exercise_json: Dict[str, Any], index: int) -> Iterator[str]:
+        f = self._fields(exercise_json)
+        edge_txt = "Subida" if f.get('edge_type') == "Subida" else "Bajada"
+        async_txt = (
+            f"Async <strong>{escape(str(f.get('async_type', '')))}(asyn)</strong> a nivel {escape(str(f.get('async_level', '')))}"
+            if f.get('has_async') else "Sin Async"
+        )
+        yield self._statement(
+            f"<p>Síncrono ({escape(str(f.get('logic_type', '')))}) por {edge_txt}. "
+            f"FF {escape(str(f.get('ff_type', '')))}. {async_txt}.</p>"
+        )
+        yield self.timing_renderer.render(self._timing_signals(f))
+        yield self._tasks([
+            "Completar el cronograma (salidas Q0, Q1).",
+            "Determinar la secuencia de estados.",
+        ])
+
+    def _timing_signals(self, f: Dict[str, Any]) -> List[tuple]:
+        input_wave = Waveform.parse(f.get('input_sequence', ''))
+        clk_wave = Waveform.parse(f.get('clk_sequence'))
+        if not clk_wave:
+            units = max(input_wave.duration, 2 * f.get('total_cycles', 0))
+            clk_wave = Waveform.clock(int(units + 1) // 2 or 1).slice(0, units or None)
+
+        signals = [("CLK", clk_wave)]
+        if f.get('has_async'):
+            signals.append((f"{f.get('async_type', '')}(asyn)", Waveform.parse(f.get('async_sequence', ''))))
+        signals.append(("E", input_wave))
+        q0 = f.get('output_sequence') if self.is_solution else None
+        signals.append(("Q0", Waveform.parse(q0) if q0 else None))
+        signals.append(("Q1", None))
+        return signals
+
+    # ------------------------------------------------------------------
+    # Genérico
+    # ------------------------------------------------------------------
+
+    def _render_generic(self, exercise_json: Dict[str, Any], index: int) -> Iterator[str]:
+        """Ejercicios sin renderer específico: enunciado + (solución) en texto."""
+        yield self._statement(f"<p>{escape(str(exercise_json.get('description', '')))}</p>")
+
+        problem = exercise_json.get('problem')
+        if isinstance(problem, str):
+            yield templates.PARAGRAPH.substitute(text=escape(problem))
+        elif isinstance(exercise_json.get('data'), str):
+            yield f"<pre>{escape(exercise_json['data'])}</pre>\n"
+
+        solution = exercise_json.get('solution')
+        if self.is_solution and isinstance(solution, str):
+            yield templates.PARAGRAPH.substitute(text=f'<span class="sol">{escape(solution)}</span>')
+
+
+def _render_variant(args) -> str:
+    """Función de nivel de módulo para poder enviarse a un pool de procesos."""
+    exam_json, is_solution = args
+    return HtmlExamRenderer(is_solution=is_solution).render(exam_json)
+
+
+def render_variants(
+    variants: List[ExamJson],
+    is_solution: bool = False,
+    max_workers: Optional[int] = None,
+    use_processes: bool = True,
+) -> List[str]:
+    """
+    Renderiza varias variantes de examen en paralelo.
+
+    Args:
+        variants: Lista de JSON intermedios (uno por variante)
+        is_solution: Si renderizar soluciones
+        max_workers: Tamaño del pool (None = por defecto de concurrent.futures)
+        use_processes: Procesos (paralelismo real) o hilos (menor latencia de arranque,
+                       útil desde el servidor web)
+
+    Returns:
+        Lista de documentos HTML en el mismo orden que variants
+    """
+    jobs = [(variant, is_solution) for variant in variants]
+    if len(jobs) <= 1:
+        return [_render_variant(job) for job in jobs]
+
+    executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_cls(max_workers=max_workers) as executor:
+        return list(executor.map(_render_variant, jobs))
+
+
+def load_exam_json(json_file: str) -> Dict[str, Any]:
+    """Carga el JSON intermedio guardado por ExamBuilder.save_intermediate_json()."""
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,76 @@
+"""
+Plantillas del renderer HTML (previsualización rápida de exámenes).
+
+ARQUITECTURA:
+- Plantillas string.Template (librería estándar, sin dependencias)
+- Cada plantilla produce un fragmento HTML autocontenido
+- El renderer las concatena en streaming (no construye el documento entero)
+
+Los valores se escapan ANTES de sustituirse: las plantillas no escapan nada.
+"""
+
+from string import Template
+
+
+# Hoja de estilos embebida: la previsualización es un único fichero HTML
+# sin dependencias externas (se puede servir o abrir directamente).
+EXAM_CSS = """
+body { font-family: -apple-system, "Segoe UI", Roboto, sans-serif; margin: 2rem auto; max-width: 60rem; color: #222; }
+header.exam-header { text-align: center; border-bottom: 2px solid #444; margin-bottom: 1.5rem; }
+header.exam-header .solution-tag { color: #c00; }
+section.exercise { margin-bottom: 2.5rem; page-break-inside: avoid; }
+div.statement { background: #f5f5f5; border: 1px solid #999; border-radius: 6px; padding: 0.8rem 1rem; margin: 0.8rem 0; }
+table.grid { border-collapse: collapse; margin: 0.8rem auto; }
+table.grid th, table.grid td { border: 1px solid #555; padding: 0.25rem 0.6rem; text-align: center; font-family: monospace; }
+table.grid th { background: #e6e6e6; }
+table.grid td.sol, span.sol { color: #c00; font-weight: bold; }
+table.grid td.given { font-weight: bold; }
+table.kmap td.corner { font-size: 1.6rem; font-weight: bold; }
+ol.tasks { list-style-type: lower-alpha; }
+svg.timing { display: block; margin: 0.8rem 0; }
+svg.timing text { font-family: monospace; font-size: 12px; }
+p.checks { font-style: italic; }
+"""
+
+DOCUMENT_HEAD = Template("""<!DOCTYPE html>
+<html lang="es">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>$title</title>
+<style>$css</style>
+</head>
+<body>
+<header class="exam-header">
+<h1>$title$solution_tag</h1>
+<p>$subtitle</p>
+</header>
+""")
+
+SOLUTION_TAG = ' <span class="solution-tag">(SOLUCIÓN)</span>'
+
+DOCUMENT_FOOT = """</body>
+</html>
+"""
+
+EXERCISE_OPEN = Template("""<section class="exercise" id="ej$index">
+<!-- >>>>>> INICIO EJERCICIO $index: $title <<<<<< -->
+<h2>Ejercicio $index: $title</h2>
+""")
+
+EXERCISE_CLOSE = "</section>\n"
+
+STATEMENT = Template("""<div class="statement">
+$content
+</div>
+""")
+
+TASK_LIST = Template("""<p><strong>Se pide:</strong></p>
+<ol class="tasks">
+$items
+</ol>
+""")
+
+SUBTITLE = Template("<h3>$text</h3>\n")
+
+PARAGRAPH = Template("<p>$text</p>\n")
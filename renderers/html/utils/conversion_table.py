@@ -0,0 +1,66 @@
+from html import escape
+from typing import List, Dict, Any
+
+class ConversionTableHtmlRenderer:
+    """Tabla de conversión (Id, Decimal, Binario, C2, SM, BCD) en HTML plano."""
+
+    HEADERS = ["Id", "Decimal", "Binario Nat.", "Compl. 2", "Signo-Mag.", "BCD"]
+    SOLUTION_KEYS = ["sol_bin", "sol_c2", "sol_sm", "sol_bcd"]
+
+    def __init__(self, is_solution: bool = False):
+        self.is_solution = is_solution
+
+    def render(self, rows: List[Dict[str, Any]]) -> str:
+        parts = ['<table class="grid conversion-table">\n<tr>']
+        parts.extend(f"<th>{h}</th>" for h in self.HEADERS)
+        parts.append("</tr>\n")
+
+        for row in rows:
+            cells = [""] * 6
+            cells[0] = f"<td>{escape(str(row.get('label', '')))})</td>"
+
+            if self.is_solution:
+                # Todas las columnas con la solución (en rojo)
+                cells[1] = f'<td class="sol">{escape(str(row.get("val_decimal", "")))}</td>'
+                for j, key in enumerate(self.SOLUTION_KEYS, 2):
+                    cells[j] = f'<td class="sol">{escape(str(row.get(key, "")))}</td>'
+            else:
+                # Solo la columna activa; el resto queda para el alumno
+                for j in range(1, 6):
+                    cells[j] = "<td></td>"
+                # +2 porque col 0=label, col 1=decimal (igual que el renderer LaTeX)
+                target = row.get("target_col_idx")
+                if isinstance(target, int) and 0 <= target + 2 < 6:
+                    cells[target + 2] = f'<td class="given">{escape(str(row.get("target_val_str", "")))}</td>'
+
+            parts.append("<tr>" + "".join(cells) + "</tr>\n")
+
+        parts.append("</table>\n")
+        return "".join(parts)
+
+    def render_grid(self, n_bits: int, op: Dict[str, Any] = None) -> str:
+        """Rejilla de operación aritmética (acarreo, operandos, resultado)."""
+
+        def fill_cells(val_str: str, css: str = "sol") -> List[str]:
+            if not val_str:
+                return ["<td></td>"] * n_bits
+            bits = list(val_str)[-n_bits:]
+            bits = [""] * (n_bits - len(bits)) + bits
+            return [f'<td class="{css}">{escape(b)}</td>' for b in bits]
+
+        def to_bits(value: int) -> str:
+            return format(value if value >= 0 else (1 << n_bits) + value, f'0{n_bits}b')
+
+        if op:
+            c_carry = fill_cells(op.get("carry_bits", ""))
+            c_op1 = fill_cells(to_bits(op.get("val1_dec", 0)))
+            c_op2 = fill_cells(to_bits(op.get("val2_dec", 0)))
+            c_res = fill_cells(op.get("result_bin", ""))
+        else:
+            c_carry = c_op1 = c_op2 = c_res = ["<td></td>"] * n_bits
+
+        parts = ['<table class="grid op-grid">\n']
+        for label, cells in (("Acarreo", c_carry), ("Op. 1", c_op1), ("Op. 2", c_op2), ("<strong>Res.</strong>", c_res)):
+            parts.append(f"<tr><th>{label}</th>" + "".join(cells) + "</tr>\n")
+        parts.append("</table>\n")
+        return "".join(parts)
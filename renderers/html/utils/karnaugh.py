@@ -0,0 +1,35 @@
+from html import escape
+from typing import List, Optional
+
+class KarnaughMapHtmlRenderer:
+    # Mapeo de índices para 4 variables (Gray Code), igual que el renderer LaTeX
+    MAP_INDICES = [
+        [0,  1,  3,  2],   # AB=00
+        [4,  5,  7,  6],   # AB=01
+        [12, 13, 15, 14],  # AB=11
+        [8,  9,  11, 10]   # AB=10
+    ]
+    GRAY_LABELS = ["00", "01", "11", "10"]
+
+    def render_template(self, vars_left: str, vars_top: str, output_label: str, values: Optional[List[int]] = None) -> str:
+        parts = ['<table class="grid kmap">\n']
+        parts.append(
+            f'<tr><td class="corner" rowspan="2" colspan="2">{escape(output_label)}</td>'
+            f'<th colspan="4">{escape(vars_top)} =</th></tr>\n'
+        )
+        parts.append("<tr>" + "".join(f"<th>{g}</th>" for g in self.GRAY_LABELS) + "</tr>\n")
+
+        for i, row in enumerate(self.MAP_INDICES):
+            parts.append("<tr>")
+            if i == 0:
+                parts.append(f'<th rowspan="4">{escape(vars_left)} =</th>')
+            parts.append(f"<th>{self.GRAY_LABELS[i]}</th>")
+            for idx in row:
+                if values and idx < len(values):
+                    parts.append(f'<td class="given" title="m{idx}">{escape(str(values[idx]))}</td>')
+                else:
+                    parts.append(f'<td title="m{idx}"></td>')
+            parts.append("</tr>\n")
+
+        parts.append("</table>\n")
+        return "".join(parts)
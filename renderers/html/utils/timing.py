@@ -0,0 +1,95 @@
+from html import escape
+from typing import List, Tuple, Optional, Union
+
+from modules.secuencial.waveform import Waveform, as_waveform
+
+
+def parse_timing_sequence(sequence: str) -> List[Tuple[str, float]]:
+    """
+    Convierte una cadena tikz-timing en runs (nivel, duración).
+
+    Atajo sobre Waveform.parse (ver modules/secuencial/waveform.py).
+    """
+    return list(Waveform.parse(sequence).runs())
+
+
+class TimingDiagramSvgRenderer:
+    """Cronogramas como SVG en línea (equivalente HTML de tikztimingtable)."""
+
+    ROW_HEIGHT = 30
+    SIGNAL_HEIGHT = 18
+    LABEL_WIDTH = 80
+    UNIT_WIDTH = 18
+
+    def render(self, signals: List[Tuple[str, Union[None, str, Waveform]]],
+               total_units: Optional[float] = None) -> str:
+        """
+        Args:
+            signals: Lista (etiqueta, Waveform o secuencia tikz-timing). None = fila vacía
+                     (para que el alumno la complete).
+            total_units: Ancho del cronograma en unidades. Si None, el de la señal más larga.
+        """
+        parsed = [(label, as_waveform(seq)) for label, seq in signals]
+        if total_units is None:
+            total_units = max((wave.duration for _, wave in parsed), default=0) or 1
+
+        width = self.LABEL_WIDTH + int(total_units * self.UNIT_WIDTH) + 2
+        height = self.ROW_HEIGHT * len(parsed) + 2
+
+        parts = [
+            f'<svg class="timing" xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">\n'
+        ]
+        parts.append(self._render_grid(total_units, height))
+
+        for row, (label, wave) in enumerate(parsed):
+            y0 = row * self.ROW_HEIGHT + (self.ROW_HEIGHT - self.SIGNAL_HEIGHT) // 2
+            parts.append(
+                f'<text x="4" y="{y0 + self.SIGNAL_HEIGHT - 4}">{escape(label)}</text>\n'
+            )
+            if wave:
+                parts.append(self._render_runs(wave.slice(0, total_units), y0))
+        parts.append("</svg>\n")
+        return "".join(parts)
+
+    def _render_grid(self, total_units: float, height: int) -> str:
+        lines = []
+        for u in range(int(total_units) + 1):
+            x = self.LABEL_WIDTH + u * self.UNIT_WIDTH
+            lines.append(f"M{x} 0V{height}")
+        return f'<path d="{" ".join(lines)}" stroke="#ddd" stroke-width="1" fill="none"/>\n'
+
+    def _render_runs(self, wave: Waveform, y0: int) -> str:
+        y_high = y0
+        y_low = y0 + self.SIGNAL_HEIGHT
+        y_mid = y0 + self.SIGNAL_HEIGHT // 2
+        levels = {"H": y_high, "L": y_low, "Z": y_mid}
+
+        path: List[str] = []
+        extras: List[str] = []
+        x = float(self.LABEL_WIDTH)
+        prev_y: Optional[float] = None
+
+        for level, duration in wave.runs():
+            x_end = x + duration * self.UNIT_WIDTH
+            if level == "X":
+                # Valor indeterminado: banda rellena entre ambos niveles
+                extras.append(
+                    f'<rect x="{x:g}" y="{y_high}" width="{x_end - x:g}" height="{self.SIGNAL_HEIGHT}" '
+                    f'fill="#bbb" stroke="#000" stroke-width="1"/>\n'
+                )
+                prev_y = None
+            else:
+                y = levels[level]
+                if prev_y is None:
+                    path.append(f"M{x:g} {y}")
+                elif prev_y != y:
+                    path.append(f"V{y}")
+                path.append(f"H{x_end:g}")
+                prev_y = y
+            x = x_end
+
+        svg = "".join(extras)
+        if path:
+            svg += f'<path d="{"".join(path)}" stroke="#000" stroke-width="1.5" fill="none"/>\n'
+        return svg
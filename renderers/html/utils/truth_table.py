@@ -0,0 +1,25 @@
+from html import escape
+from typing import List, Optional
+
+class TruthTableHtmlRenderer:
+    def render(self, headers: List[str], output_label: str, output_values: Optional[List[int]]) -> str:
+        n_vars = len(headers)
+        n_rows = 2 ** n_vars
+
+        parts = ['<table class="grid truth-table">\n<tr>']
+        parts.extend(f"<th>{escape(str(h))}</th>" for h in headers)
+        parts.append(f"<th>{escape(str(output_label))}</th></tr>\n")
+
+        for i in range(n_rows):
+            bin_str = format(i, f'0{n_vars}b')
+            parts.append("<tr>")
+            parts.extend(f"<td>{b}</td>" for b in bin_str)
+
+            if output_values and i < len(output_values):
+                parts.append(f'<td class="given">{escape(str(output_values[i]))}</td>')
+            else:
+                parts.append("<td></td>")
+            parts.append("</tr>\n")
+
+        parts.append("</table>\n")
+        return "".join(parts)
@@ -5,6 +5,8 @@ from renderers.latex.utils.circuit import DigitalCircuitRenderer
 from renderers.latex.utils.asset_manager import LatexAssetManager
 
 class CombinacionalLatexRenderer:
+    RENDERER_VERSION = "1"
+
     def __init__(self, is_solution: bool = False):
         self.is_solution = is_solution
         self.tt_renderer = TruthTableRenderer()
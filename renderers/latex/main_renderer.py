@@ -1,6 +1,6 @@
 import json
 import os
-from typing import List
+from typing import Any, Dict, List, Optional
 from core.generator_base import ExerciseData
 from modules.numeracion.models import ConversionExerciseData
 from modules.combinacional.models import KarnaughExerciseData, LogicProblemExerciseData, MSIExerciseData
@@ -8,8 +8,11 @@ from modules.secuencial.models import SequentialExerciseData
 from renderers.latex.numeracion_renderer import NumeracionLatexRenderer
 from renderers.latex.combinacional_renderer import CombinacionalLatexRenderer
 from renderers.latex.secuencial_renderer import SecuencialLatexRenderer
+from renderers.latex.utils.build_manifest import BuildManifest
 
 class LatexExamRenderer:
+    RENDERER_VERSION = "1"
+
     def __init__(self, is_solution: bool = False):
         self.is_solution = is_solution
         self.numeracion_renderer = NumeracionLatexRenderer(is_solution)
@@ -29,19 +32,90 @@ class LatexExamRenderer:
         latex = self._get_preamble()
         
         for i, ex_data in enumerate(exercises, 1):
-            if isinstance(ex_data, ConversionExerciseData):
-                latex += self.numeracion_renderer.render(ex_data, i)
-            elif isinstance(ex_data, (KarnaughExerciseData, LogicProblemExerciseData, MSIExerciseData)):
-                latex += self.combinacional_renderer.render(ex_data, i)
-            elif isinstance(ex_data, SequentialExerciseData):
-                latex += self.secuencial_renderer.render(ex_data, i)
-            else:
-                latex += f"\\section*{{Ejercicio {i}: Tipo desconocido}}\n"
-                latex += f"No hay renderizador para {type(ex_data).__name__}\n"
+            latex += self.render_exercise(ex_data, i)
         
         latex += self._get_footer()
         return latex
 
+    def render_exercise(self, ex_data: ExerciseData, index: int) -> str:
+        renderer = self._renderer_for(ex_data)
+        if renderer is None:
+            latex = f"\\section*{{Ejercicio {index}: Tipo desconocido}}\n"
+            latex += f"No hay renderizador para {type(ex_data).__name__}\n"
+            return latex
+        return renderer.render(ex_data, index)
+
+    def _renderer_for(self, ex_data: ExerciseData) -> Optional[Any]:
+        if isinstance(ex_data, ConversionExerciseData):
+            return self.numeracion_renderer
+        elif isinstance(ex_data, (KarnaughExerciseData, LogicProblemExerciseData, MSIExerciseData)):
+            return self.combinacional_renderer
+        elif isinstance(ex_data, SequentialExerciseData):
+            return self.secuencial_renderer
+        return None
+
+    def _renderer_version(self, ex_data: ExerciseData) -> str:
+        renderer = self._renderer_for(ex_data)
+        if renderer is None:
+            return f"unknown:{self.RENDERER_VERSION}"
+        return f"{type(renderer).__name__}:{getattr(renderer, 'RENDERER_VERSION', '0')}"
+
+    def render_incremental(
+        self,
+        exercises: List[ExerciseData],
+        exercises_json: List[Dict[str, Any]],
+        output_file: str,
+        manifest: BuildManifest,
+    ) -> str:
+        """
+        Renderizado incremental: un .tex por ejercicio + documento principal con \\input{}.
+        
+        Cada ejercicio solo se re-renderiza si cambia su JSON intermedio, su
+        posición o la versión de su renderer. Los ficheros cuyo contenido no
+        cambia no se reescriben (se conserva su mtime) y los .tex de ejercicios
+        que ya no forman parte del examen se borran.
+        
+        Args:
+            exercises: Objetos ExerciseData (entrada de los renderers)
+            exercises_json: JSON intermedio de cada ejercicio (ExamBuilder.get_exercises_json())
+            output_file: Ruta del documento principal (ej: build/latex/Examen_V2.tex)
+            manifest: Manifiesto de construcción compartido
+        
+        Returns:
+            Ruta del documento principal
+        """
+        output_dir = os.path.dirname(output_file)
+        stem = os.path.splitext(os.path.basename(output_file))[0]
+        parts_dirname = f"{stem}_ejercicios"
+        parts_group = os.path.join(output_dir, parts_dirname)
+        part_paths = []
+        
+        latex = self._get_preamble()
+        
+        for i, ex_data in enumerate(exercises, 1):
+            ex_json = exercises_json[i - 1] if i - 1 < len(exercises_json) else repr(ex_data)
+            part_rel = f"{parts_dirname}/ej{i:02d}.tex"
+            part_path = os.path.join(output_dir, parts_dirname, f"ej{i:02d}.tex")
+            
+            input_hash = manifest.hash_input(ex_json, i, self.is_solution)
+            version = self._renderer_version(ex_data)
+            
+            if manifest.is_up_to_date(part_path, input_hash, version):
+                manifest.skip(part_path)
+            else:
+                manifest.write(part_path, self.render_exercise(ex_data, i), input_hash, version,
+                               group=parts_group, order=i)
+            part_paths.append(part_path)
+            
+            latex += fr"\input{{{part_rel}}}" + "\n"
+        
+        manifest.prune(parts_group, keep=part_paths)
+        latex += self._get_footer()
+        
+        # Documento principal: depende de la cabecera y de la lista de ejercicios
+        manifest.write(output_file, latex, manifest.hash_input(latex), f"main:{self.RENDERER_VERSION}")
+        return output_file
+
     def _get_preamble(self) -> str:
         h = self.header_config
         logo = h.get("logo_path", "")
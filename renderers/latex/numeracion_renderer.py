@@ -2,6 +2,8 @@ from typing import Optional
 from modules.numeracion.models import ConversionExerciseData, ArithmeticOp, COLUMN_NAMES
 
 class NumeracionLatexRenderer:
+    RENDERER_VERSION = "1"
+
     def __init__(self, is_solution: bool = False):
         self.is_solution = is_solution
 
@@ -6,13 +6,14 @@ Responsabilidad: Crear la estructura LaTeX de la tabla (filas, columnas, dimensi
 Entrada: JSON validado de Fase1DataValidator
 Salida: 
   - TEX: Tabla vacía pero correctamente dimensionada y estructurada
-  - JSON: JSON con metadata de Fase2 para siguiente fase
+  - JSON: JSON con metadata de Fase2 + IR de la tabla (table_ir, serializada) para siguiente fase
   
 Característica: Output TEX es compilable (tabla vacía pero válida).
 """
 
 from typing import Dict, Any, List
 from renderers.latex.renderer_base import ExerciseRendererPhase, PhaseOutput
+from renderers.latex.table_ir import TABLE_IR_KEY, TableIR
 
 
 class Phase2StructureGenerator(ExerciseRendererPhase):
@@ -23,7 +24,7 @@ class Phase2StructureGenerator(ExerciseRendererPhase):
     1. Determinar número de filas basado en problema
     2. Crear estructura LaTeX de tabla (tabular environment)
     3. Definir encabezados (Etiqueta, Decimal, Binario, C2, SM, BCD)
-    4. Generar filas vacías con estructura correcta
+    4. Generar filas vacías con estructura correcta (TableIR)
     5. Generar TEX compilable (tabla vacía)
     
     Esta fase NO:
@@ -62,8 +63,11 @@ class Phase2StructureGenerator(ExerciseRendererPhase):
         exercise_type = metadata.get('exercise_type', 'ConversionRow')
         num_rows = self._determine_num_rows(exercise_type, problem)
         
+        # IR de la tabla: se construye aquí una sola vez y la enriquecen Fases 3-4
+        table = TableIR.empty(self.CONVERSION_COLUMNS, num_rows, table_type='numeracion_conversion')
+        
         # Generar LaTeX de tabla
-        latex = self._generate_latex_table(num_rows, is_solution)
+        latex = self._generate_latex_table(table, is_solution)
         
         # Preparar JSON para siguiente fase con metadata de Fase2
         output_json = {
@@ -76,7 +80,8 @@ class Phase2StructureGenerator(ExerciseRendererPhase):
                 'columns': self.CONVERSION_COLUMNS,
                 'structure_defined': True,
                 'is_solution': is_solution
-            }
+            },
+            TABLE_IR_KEY: table.to_dict()
         }
         
         return PhaseOutput(
@@ -116,17 +121,17 @@ class Phase2StructureGenerator(ExerciseRendererPhase):
             # Default: una fila
             return 1
     
-    def _generate_latex_table(self, num_rows: int, is_solution: bool) -> str:
+    def _generate_latex_table(self, table: TableIR, is_solution: bool) -> str:
         """
         Genera código LaTeX de tabla vacía pero estructurada.
         
         La tabla tiene:
         - Encabezados: Etiqueta, Decimal, Binario, C2, SM, BCD
-        - Filas vacías: num_rows filas sin contenido
+        - Filas vacías: table.num_rows filas sin contenido
         - Bordes básicos: \hline para separación
         
         Args:
-            num_rows: Número de filas a generar
+            table: IR de la tabla (vacía)
             is_solution: Si es para enunciado o solución
         
         Returns:
@@ -141,23 +146,14 @@ class Phase2StructureGenerator(ExerciseRendererPhase):
 % ========================================
 
 % Tabla de conversión de bases numéricas
-% Estructura: {len(self.CONVERSION_COLUMNS)} columnas x {num_rows} filas
+% Estructura: {table.num_cols} columnas x {table.num_rows} filas
 
-\\begin{{tabular}}{{|c|c|c|c|c|c|}}
-\\hline
 """
         
-        # Encabezados
-        header = " & ".join(self.CONVERSION_COLUMNS) + " \\\\\n"
-        latex += header + "\\hline\n"
-        
-        # Filas vacías (estructura)
-        for i in range(num_rows):
-            # Cada fila tiene 6 celdas vacías
-            latex += " & " * (len(self.CONVERSION_COLUMNS) - 1) + " \\\\\n"
-            latex += "\\hline\n"
+        # Encabezados + filas vacías (formateadas desde la IR)
+        latex += table.to_latex()
         
-        latex += """\\end{tabular}
+        latex += """
 
 % ========================================
 % Salida de FASE 2
@@ -13,6 +13,7 @@ Característica: Tabla compilable pero aún vacía (contenido viene en Fase 4).
 
 from typing import Dict, Any
 from renderers.latex.renderer_base import ExerciseRendererPhase, PhaseOutput
+from renderers.latex.table_ir import TABLE_IR_KEY, TableIR, get_table_ir
 
 
 class Phase3Details(ExerciseRendererPhase):
@@ -47,6 +48,9 @@ class Phase3Details(ExerciseRendererPhase):
     # Fuente monoespaciada para alineación
     FONT_FAMILY = "ttfamily"  # typewriter/monospace
     
+    # Columnas si el JSON no trae IR ni metadata de Fase 2
+    DEFAULT_COLUMNS = ["Etiqueta", "Decimal", "Binario", "C2", "SM", "BCD"]
+    
     def render(self, exercise_json: Dict[str, Any], is_solution: bool = False) -> PhaseOutput:
         """
         Genera LaTeX con estilos visuales (colores, alineación, padding).
@@ -63,22 +67,24 @@ class Phase3Details(ExerciseRendererPhase):
             - tex_filename: "03_fase3_detalles.tex"
         """
         
-        # Extraer metadata de Fase 2
-        metadata = self._extract_metadata(exercise_json)
-        phase2_struct = exercise_json.get('phase2_structure', {})
-        
-        num_rows = phase2_struct.get('num_rows', 1)
-        num_cols = phase2_struct.get('num_cols', 6)
-        columns = phase2_struct.get('columns', [])
+        # IR de la tabla construida en Fase 2 (no se vuelve a dimensionar)
+        table = get_table_ir(exercise_json)
+        if table is None:
+            phase2_struct = exercise_json.get('phase2_structure', {})
+            table = TableIR.empty(
+                phase2_struct.get('columns') or self.DEFAULT_COLUMNS,
+                phase2_struct.get('num_rows', 1)
+            )
         
         # Determinar qué color usar para celdas
         cell_color = self._get_cell_color(is_solution)
         
+        # Aplicar estilos a la IR (una vez por tabla, no por celda)
+        table = table.with_styles('encabezado', self._get_row_color(0, is_solution))
+        
         # Generar LaTeX con estilos
         latex = self._generate_styled_latex(
-            num_rows=num_rows,
-            num_cols=num_cols,
-            columns=columns,
+            table=table,
             is_solution=is_solution,
             cell_color=cell_color
         )
@@ -96,7 +102,8 @@ class Phase3Details(ExerciseRendererPhase):
                 'font': self.FONT_FAMILY,
                 'styles_applied': True,
                 'is_solution': is_solution
-            }
+            },
+            TABLE_IR_KEY: table.to_dict()
         }
         
         return PhaseOutput(
@@ -115,9 +122,7 @@ class Phase3Details(ExerciseRendererPhase):
     
     def _generate_styled_latex(
         self,
-        num_rows: int,
-        num_cols: int,
-        columns: list,
+        table: TableIR,
         is_solution: bool,
         cell_color: str
     ) -> str:
@@ -132,9 +137,7 @@ class Phase3Details(ExerciseRendererPhase):
         - Fuente monoespaciada
         
         Args:
-            num_rows: Número de filas de datos
-            num_cols: Número de columnas
-            columns: Lista de nombres de columna
+            table: IR de la tabla con estilos aplicados (aún vacía)
             is_solution: Si es para solución o enunciado
             cell_color: Color RGB de celdas
         
@@ -156,44 +159,17 @@ class Phase3Details(ExerciseRendererPhase):
 \\definecolor{{encabezado}}{{RGB}}{{{self.ENCABEZADO_COLOR}}}
 
 % Tabla de conversión con estilos
-% Estructura: {num_cols} columnas x {num_rows} filas
+% Estructura: {table.num_cols} columnas x {table.num_rows} filas
 % Estilos: Colores, padding, alineación, fuente monoespaciada
 
 \\newcommand{{\\cellpadding}}[0]{{\\rule{{0pt}}{{{self.ROW_HEIGHT}}}}}
 
-\\begin{{tabular}}{{|c|c|c|c|c|c|}}
-\\hline
-\\textbf{{\\cellcolor{{encabezado}} Etiqueta}} & 
-\\textbf{{\\cellcolor{{encabezado}} Decimal}} & 
-\\textbf{{\\cellcolor{{encabezado}} Binario}} & 
-\\textbf{{\\cellcolor{{encabezado}} C2}} & 
-\\textbf{{\\cellcolor{{encabezado}} SM}} & 
-\\textbf{{\\cellcolor{{encabezado}} BCD}} \\\\
-\\hline
 """
         
-        # Generar filas estilizadas (aún vacías)
-        for i in range(num_rows):
-            # Usar fuente monoespaciada para mantener alineación
-            row_content = (
-                f"\\cellcolor{{{self._get_row_color(i, is_solution)}}} "
-                f"\\texttt{{\\cellpadding}} & "
-                f"\\cellcolor{{{self._get_row_color(i, is_solution)}}} "
-                f"\\texttt{{\\cellpadding}} & "
-                f"\\cellcolor{{{self._get_row_color(i, is_solution)}}} "
-                f"\\texttt{{\\cellpadding}} & "
-                f"\\cellcolor{{{self._get_row_color(i, is_solution)}}} "
-                f"\\texttt{{\\cellpadding}} & "
-                f"\\cellcolor{{{self._get_row_color(i, is_solution)}}} "
-                f"\\texttt{{\\cellpadding}} & "
-                f"\\cellcolor{{{self._get_row_color(i, is_solution)}}} "
-                f"\\texttt{{\\cellpadding}} "
-                f"\\\\\n"
-            )
-            latex += row_content
-            latex += "\\hline\n"
+        # Encabezado + filas estilizadas (aún vacías), formateadas desde la IR
+        latex += table.to_latex()
         
-        latex += f"""\\end{{tabular}}
+        latex += f"""
 
 % ========================================
 % Salida de FASE 3
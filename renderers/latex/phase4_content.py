@@ -13,6 +13,7 @@ Característica: Tabla compilable CON VALORES (listo para Fase 5 enunciados).
 
 from typing import Dict, Any, List
 from renderers.latex.renderer_base import ExerciseRendererPhase, PhaseOutput
+from renderers.latex.table_ir import TABLE_IR_KEY, TableIR, get_table_ir
 
 
 class Phase4Content(ExerciseRendererPhase):
@@ -45,6 +46,9 @@ class Phase4Content(ExerciseRendererPhase):
     ROW_HEIGHT = "0.8em"
     FONT_FAMILY = "ttfamily"
     
+    # Columnas si el JSON no trae IR de fases anteriores
+    DEFAULT_COLUMNS = ["Etiqueta", "Decimal", "Binario", "C2", "SM", "BCD"]
+    
     def render(self, exercise_json: Dict[str, Any], is_solution: bool = False) -> PhaseOutput:
         """
         Genera LaTeX con tabla llena de contenido.
@@ -65,25 +69,22 @@ class Phase4Content(ExerciseRendererPhase):
         metadata = self._extract_metadata(exercise_json)
         exercise_type = metadata.get('exercise_type', 'unknown')
         
-        phase2_struct = exercise_json.get('phase2_structure', {})
-        phase3_details = exercise_json.get('phase3_details', {})
-        
-        num_rows = phase2_struct.get('num_rows', 1)
-        num_cols = phase2_struct.get('num_cols', 6)
-        columns = phase2_struct.get('columns', [])
-        
-        # Determinar color según is_solution
-        cell_color = self.SOLUCION_COLOR if is_solution else self.PROBLEMA_COLOR
+        # IR con estructura (Fase 2) y estilos (Fase 3) ya resueltos
+        table = get_table_ir(exercise_json)
+        if table is None:
+            phase2_struct = exercise_json.get('phase2_structure', {})
+            table = TableIR.empty(
+                phase2_struct.get('columns') or self.DEFAULT_COLUMNS,
+                phase2_struct.get('num_rows', 1)
+            ).with_styles('encabezado', "solucion" if is_solution else "problema")
         
         # Extraer valores de JSON según exercise_type
         values = self._extract_values(exercise_json, exercise_type, is_solution)
+        table = table.with_values(values)
         
         # Generar LaTeX con contenido
         latex = self._generate_content_latex(
-            num_rows=num_rows,
-            num_cols=num_cols,
-            columns=columns,
-            values=values,
+            table=table,
             is_solution=is_solution,
             exercise_type=exercise_type
         )
@@ -98,7 +99,8 @@ class Phase4Content(ExerciseRendererPhase):
                 'values_extracted': True,
                 'content_added': True,
                 'is_solution': is_solution
-            }
+            },
+            TABLE_IR_KEY: table.to_dict()
         }
         
         return PhaseOutput(
@@ -209,14 +211,14 @@ class Phase4Content(ExerciseRendererPhase):
         
         if is_solution:
             rows = [
-                {'Etiqueta': op1_label, 'Valor': str(op1_val), 'Base': problem.get('operand1_base', '10')},
-                {'Etiqueta': op_symbol, 'Valor': str(op2_val), 'Base': problem.get('operand2_base', '10')},
+                {'Etiqueta': str(op1_label), 'Valor': str(op1_val), 'Base': problem.get('operand1_base', '10')},
+                {'Etiqueta': str(op_symbol), 'Valor': str(op2_val), 'Base': problem.get('operand2_base', '10')},
                 {'Etiqueta': '=', 'Valor': str(result_val), 'Base': problem.get('result_base', '10')}
             ]
         else:
             rows = [
-                {'Etiqueta': op1_label, 'Valor': str(op1_val), 'Base': problem.get('operand1_base', '10')},
-                {'Etiqueta': op_symbol, 'Valor': str(op2_val), 'Base': problem.get('operand2_base', '10')},
+                {'Etiqueta': str(op1_label), 'Valor': str(op1_val), 'Base': problem.get('operand1_base', '10')},
+                {'Etiqueta': str(op_symbol), 'Valor': str(op2_val), 'Base': problem.get('operand2_base', '10')},
                 {'Etiqueta': '=', 'Valor': '', 'Base': ''}  # Espacio para respuesta
             ]
         
@@ -224,10 +226,7 @@ class Phase4Content(ExerciseRendererPhase):
     
     def _generate_content_latex(
         self,
-        num_rows: int,
-        num_cols: int,
-        columns: List[str],
-        values: List[Dict[str, str]],
+        table: TableIR,
         is_solution: bool,
         exercise_type: str
     ) -> str:
@@ -237,10 +236,7 @@ class Phase4Content(ExerciseRendererPhase):
         Mantiene estilos de Fase 3 pero agrega valores.
         
         Args:
-            num_rows: Número de filas de datos
-            num_cols: Número de columnas
-            columns: Lista de nombres de columna
-            values: Lista de dicts {columna: valor}
+            table: IR de la tabla con estilos y valores
             is_solution: Si es solución o enunciado
             exercise_type: Tipo de ejercicio (para contexto)
         
@@ -249,7 +245,6 @@ class Phase4Content(ExerciseRendererPhase):
         """
         
         doc_type = "SOLUCION" if is_solution else "ENUNCIADO"
-        cell_color = "solucion" if is_solution else "problema"
         
         latex = f"""% ========================================
 % FASE 4: CONTENIDO - Valores numeral
@@ -264,47 +259,18 @@ class Phase4Content(ExerciseRendererPhase):
 \\definecolor{{encabezado}}{{RGB}}{{{self.ENCABEZADO_COLOR}}}
 
 % Tabla con contenido
-% Estructura: {num_cols} columnas x {len(values)} filas
+% Estructura: {table.num_cols} columnas x {table.num_rows} filas
 % Estilos: Colores, padding, alineación, fuente monoespaciada
 % Contenido: Valores del problema {'(solución)' if is_solution else '(para resolver)'}
 
 \\newcommand{{\\cellpadding}}[0]{{\\rule{{0pt}}{{{self.ROW_HEIGHT}}}}}
 
-\\begin{{tabular}}{{|c|c|c|c|c|c|}}
-\\hline
-\\textbf{{\\cellcolor{{encabezado}} Etiqueta}} & 
-\\textbf{{\\cellcolor{{encabezado}} Decimal}} & 
-\\textbf{{\\cellcolor{{encabezado}} Binario}} & 
-\\textbf{{\\cellcolor{{encabezado}} C2}} & 
-\\textbf{{\\cellcolor{{encabezado}} SM}} & 
-\\textbf{{\\cellcolor{{encabezado}} BCD}} \\\\
-\\hline
 """
         
-        # Generar filas CON CONTENIDO
-        for i, value_dict in enumerate(values):
-            # Obtener valor para cada columna
-            etiqueta = value_dict.get('Etiqueta', '')
-            decimal = value_dict.get('Decimal', '')
-            binario = value_dict.get('Binario', '')
-            c2 = value_dict.get('C2', '')
-            sm = value_dict.get('SM', '')
-            bcd = value_dict.get('BCD', '')
-            
-            # Construir fila con valores
-            row_content = (
-                f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {etiqueta}}} & "
-                f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {decimal}}} & "
-                f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {binario}}} & "
-                f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {c2}}} & "
-                f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {sm}}} & "
-                f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {bcd}}} "
-                f"\\\\\n"
-            )
-            latex += row_content
-            latex += "\\hline\n"
-        
-        latex += f"""\\end{{tabular}}
+        # Encabezado + filas CON CONTENIDO, formateadas desde la IR
+        latex += table.to_latex()
+        
+        latex += f"""
 
 % ========================================
 % Salida de FASE 4
@@ -319,7 +285,7 @@ class Phase4Content(ExerciseRendererPhase):
 % ========================================
 
 % Notas de contenido:
-% - Valores mostrados: {len(values)} fila(s) poblada(s)
+% - Valores mostrados: {table.num_rows} fila(s) poblada(s)
 % - Tipo documento: {'Solución (todos valores visibles)' if is_solution else 'Enunciado (problema a resolver)'}
 % - Ejercicio: {exercise_type}
 % - Color: {'verde' if is_solution else 'gris'} ({('solucion' if is_solution else 'problema')})
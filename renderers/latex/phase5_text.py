@@ -14,6 +14,7 @@ Característica: ÚLTIMA FASE. Produce documento compilable listo para PDF.
 
 from typing import Dict, Any, Optional
 from renderers.latex.renderer_base import ExerciseRendererPhase, PhaseOutput
+from renderers.latex.table_ir import get_table_ir
 
 
 class Phase5Text(ExerciseRendererPhase):
@@ -256,83 +257,27 @@ class Phase5Text(ExerciseRendererPhase):
         """
         Extrae la tabla compilada de Fase 4.
         
-        Si Fase 4 no se ejecutó o no hay metadata, retorna tabla vacía.
+        Reutiliza la IR (table_ir) que Fase 4 ya rellenó y formateó: no se
+        vuelve a extraer ningún valor ni a construir ninguna fila.
         
-        Nota: En implementación actual, se regenra la tabla aquí.
-        En versión futura, se podría reutilizar de fase anterior.
+        Si Fase 4 no se ejecutó o no hay IR, retorna tabla vacía.
         """
         
         phase4_metadata = exercise_json.get('phase4_content', {})
+        table = get_table_ir(exercise_json)
         
-        if not phase4_metadata:
+        if not phase4_metadata or table is None:
             # Si no hay metadata de Fase 4, retorna tabla vacía
             return self._generate_empty_table()
         
-        # En implementación actual, se regenra la tabla
-        # (Similar a cómo Fase 3 regenera la tabla de Fase 2)
-        return self._regenerate_table(exercise_json)
-    
-    def _regenerate_table(self, exercise_json: Dict[str, Any]) -> str:
-        """
-        Regenera la tabla de Fase 4.
-        
-        Esto asegura que la tabla en el documento final sea idéntica
-        a la que se esperaría de Fase 4.
-        """
-        
-        problem = exercise_json.get('problem', {})
-        solution = exercise_json.get('solution', {})
-        phase3_details = exercise_json.get('phase3_details', {})
-        
-        cell_color = "solucion" if phase3_details.get('is_solution') else "problema"
-        
-        table_tex = r"""
+        # to_latex() devuelve el tabular que Fase 4 guardó en el dict de la IR
+        return f"""
 % ========================================
 % Tabla poblada (de Fase 4)
 % ========================================
 
-\usepackage[usenames,dvipsnames]{xcolor}
-\definecolor{problema}{RGB}{240,240,240}
-\definecolor{solucion}{RGB}{200,255,200}
-\definecolor{encabezado}{RGB}{230,230,230}
-
-\newcommand{\cellpadding}[0]{\rule{0pt}{0.8em}}
-
-\begin{tabular}{|c|c|c|c|c|c|}
-\hline
-\textbf{\cellcolor{encabezado} Etiqueta} & 
-\textbf{\cellcolor{encabezado} Decimal} & 
-\textbf{\cellcolor{encabezado} Binario} & 
-\textbf{\cellcolor{encabezado} C2} & 
-\textbf{\cellcolor{encabezado} SM} & 
-\textbf{\cellcolor{encabezado} BCD} \\
-\hline
-"""
-        
-        # Llenar tabla (simplificado para Fase 5)
-        label = str(problem.get('label', '?'))
-        decimal = str(problem.get('val_decimal', '?'))
-        binario = str(solution.get('sol_bin', '?'))
-        c2 = str(solution.get('sol_c2', '?'))
-        sm = str(solution.get('sol_sm', '?'))
-        bcd = str(solution.get('sol_bcd', '?'))
-        
-        table_tex += (
-            f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {label}}} & "
-            f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {decimal}}} & "
-            f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {binario}}} & "
-            f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {c2}}} & "
-            f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {sm}}} & "
-            f"\\cellcolor{{{cell_color}}} \\texttt{{\\cellpadding {bcd}}} "
-            f"\\\\\n"
-        )
-        
-        table_tex += r"""
-\hline
-\end{tabular}
+{table.to_latex()}
 """
-        
-        return table_tex
     
     def _generate_empty_table(self) -> str:
         """Retorna tabla vacía si no hay data de Fase 4."""
@@ -22,13 +22,26 @@ FLUJO:
     ↓
   RendererPipeline
     └─ Compone: main.tex con \include{phase1.tex}...\include{phaseN.tex}
+
+INSTRUMENTACIÓN:
+  El pipeline mide cada fase (tiempo real, tiempo CPU, bytes de TEX y, con
+  track_memory=True, pico de memoria) y lo guarda en su PhaseOutput.
+  tracemalloc intercepta cada reserva y distorsiona los tiempos, así que la
+  memoria se mide aparte: un pipeline con track_memory para el pico y otro
+  sin él para los tiempos. pipeline.report() da el
+  informe JSON de un ejercicio y aggregate_pipeline_reports() el de un lote.
 """
 
+import json
+import time
+import tracemalloc
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Dict, Any, Tuple, Optional, List
 from pathlib import Path
 
+from renderers.latex.utils.build_manifest import BuildManifest
+
 
 @dataclass
 class PhaseOutput:
@@ -37,6 +50,23 @@ class PhaseOutput:
     output_json: Optional[Dict[str, Any]] = None  # Para siguiente fase (None si es última)
     phase_name: str = "unnamed"
     tex_filename: str = "phase.tex"
+    
+    # Métricas (las rellena RendererPipeline al ejecutar la fase)
+    wall_time_s: float = 0.0  # Tiempo real (perf_counter)
+    cpu_time_s: float = 0.0  # Tiempo CPU del proceso (process_time)
+    output_bytes: int = 0  # Tamaño del LaTeX en UTF-8
+    peak_memory_delta: int = 0  # Pico de memoria Python sobre el inicio de la fase (bytes)
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Métricas de la fase como diccionario serializable."""
+        return {
+            'phase_name': self.phase_name,
+            'tex_filename': self.tex_filename,
+            'wall_time_s': self.wall_time_s,
+            'cpu_time_s': self.cpu_time_s,
+            'output_bytes': self.output_bytes,
+            'peak_memory_delta': self.peak_memory_delta,
+        }
 
 
 class ExerciseRendererPhase(ABC):
@@ -49,6 +79,10 @@ class ExerciseRendererPhase(ABC):
     - Produce salida compilable + comunicación con siguiente fase
     """
     
+    # Versión del renderer: incrementar cuando cambie el TEX producido
+    # (invalida el renderizado incremental de esta fase)
+    renderer_version: str = "1"
+    
     @abstractmethod
     def render(self, exercise_json: Dict[str, Any], is_solution: bool = False) -> PhaseOutput:
         """
@@ -95,33 +129,68 @@ class RendererPipeline:
     - Recolectar TEX de cada fase
     - Componer TEX final con \include{}
     - Guardar archivos intermedios (opcional)
+    - Medir cada fase (tiempo, CPU, bytes, memoria)
     """
     
-    def __init__(self, exercise_type: str, output_dir: str = "build/latex"):
+    def __init__(self, exercise_type: str, output_dir: str = "build/latex",
+                 track_memory: bool = False):
+        """
+        Args:
+            exercise_type: Tipo de ejercicio (nombre del pipeline)
+            output_dir: Directorio de salida de los TEX de cada fase
+            track_memory: Medir el pico de memoria con tracemalloc. Ralentiza
+                          las fases, así que los tiempos de esa ejecución no
+                          son representativos; por defecto solo se miden tiempos
+        """
         self.exercise_type = exercise_type
         self.output_dir = Path(output_dir)
+        self.track_memory = track_memory
         self.phases: List[ExerciseRendererPhase] = []
         self.phase_outputs: List[PhaseOutput] = []
+        self.tex_files: List[str] = []
+        self.cached = False  # True si la última ejecución se omitió por el manifiesto
     
     def add_phase(self, phase: ExerciseRendererPhase) -> "RendererPipeline":
         """Agregar una fase al pipeline (orden importa)."""
         self.phases.append(phase)
         return self  # Fluent interface
     
-    def render(self, exercise_json: Dict[str, Any], is_solution: bool = False) -> Tuple[str, List[str]]:
+    @property
+    def renderer_version(self) -> str:
+        """Versión compuesta: cambia si cambia cualquier fase o su orden."""
+        return "+".join(f"{phase.phase_name}:{phase.renderer_version}" for phase in self.phases)
+    
+    def render(self, exercise_json: Dict[str, Any], is_solution: bool = False,
+               manifest: Optional[BuildManifest] = None) -> Tuple[str, List[str]]:
         """
         Renderiza el ejercicio a través de todas las fases.
         
         Args:
             exercise_json: Datos del ejercicio (problema + solución)
             is_solution: Si es para soluciones o enunciado
+            manifest: (Opcional) Manifiesto de construcción. Si el JSON y la versión
+                      de las fases no han cambiado desde la última ejecución, no se
+                      ejecuta ninguna fase ni se tocan los ficheros en disco.
         
         Returns:
             (main_latex_code, list_of_phase_tex_files)
         """
         self.phase_outputs = []
+        self.cached = False
         current_json = exercise_json
         
+        input_hash = None
+        if manifest is not None:
+            input_hash = manifest.hash_input(exercise_json, is_solution)
+            cached = manifest.cached_outputs(self._manifest_group(), input_hash, self.renderer_version)
+            if cached is not None:
+                print(f"♻️  {self.exercise_type}: sin cambios ({len(cached)} fases omitidas)")
+                for path in cached:
+                    manifest.skip(path)
+                self.tex_files = [Path(path).name for path in cached]
+                self.cached = True
+                return self._compose_main_tex(self.tex_files), self.tex_files
+        
         print(f"🎨 Renderizando {self.exercise_type} ({len(self.phases)} fases)...")
         
         # Ejecutar cada fase
@@ -129,32 +198,106 @@ class RendererPipeline:
             print(f"   Phase {i}/{len(self.phases)}: {phase.phase_name}...", end=" ")
             
             # Renderizar esta fase
-            output = phase.render(current_json, is_solution=is_solution)
+            output = self._run_phase(phase, current_json, is_solution)
             self.phase_outputs.append(output)
             
             # Pasar JSON intermedio a siguiente fase
             if output.output_json is not None:
                 current_json = output.output_json
             
-            print("✅")
+            print(f"✅ ({output.wall_time_s * 1000:.2f} ms, {output.output_bytes} B)")
         
         # Componer LaTeX final
-        tex_files = self._save_phase_files()
+        tex_files = self._save_phase_files(manifest, input_hash)
         main_tex = self._compose_main_tex(tex_files)
         
         return main_tex, tex_files
     
-    def _save_phase_files(self) -> List[str]:
-        """Guarda archivos TEX para cada fase."""
+    def _run_phase(self, phase: ExerciseRendererPhase, exercise_json: Dict[str, Any],
+                   is_solution: bool) -> PhaseOutput:
+        """Ejecuta una fase y anota sus métricas en el PhaseOutput."""
+        started_tracing = False
+        mem_start = 0
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            mem_start = tracemalloc.get_traced_memory()[0]
+        
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            output = phase.render(exercise_json, is_solution=is_solution)
+        finally:
+            cpu_time = time.process_time() - cpu_start
+            wall_time = time.perf_counter() - wall_start
+            peak = 0
+            if self.track_memory:
+                peak = tracemalloc.get_traced_memory()[1] - mem_start
+                if started_tracing:
+                    tracemalloc.stop()
+        
+        output.wall_time_s = wall_time
+        output.cpu_time_s = cpu_time
+        output.output_bytes = len(output.latex_content.encode('utf-8'))
+        output.peak_memory_delta = max(peak, 0)
+        return output
+    
+    def report(self) -> Dict[str, Any]:
+        """
+        Informe de la última ejecución (serializable a JSON).
+        
+        Returns:
+            {'exercise_type', 'cached', 'phases': [métricas por fase], 'totals': {...}}
+        """
+        phases = [output.metrics() for output in self.phase_outputs]
+        return {
+            'exercise_type': self.exercise_type,
+            'cached': self.cached,
+            'phases': phases,
+            'totals': {
+                'wall_time_s': sum(p['wall_time_s'] for p in phases),
+                'cpu_time_s': sum(p['cpu_time_s'] for p in phases),
+                'output_bytes': sum(p['output_bytes'] for p in phases),
+                'peak_memory_delta': max((p['peak_memory_delta'] for p in phases), default=0),
+            },
+        }
+    
+    def save_report(self, filename: str = "pipeline_report.json") -> Path:
+        """Guarda report() como JSON en output_dir."""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        report_path = self.output_dir / filename
+        report_path.write_text(json.dumps(self.report(), indent=2, ensure_ascii=False), encoding='utf-8')
+        return report_path
+    
+    def _manifest_group(self) -> str:
+        """Grupo del manifiesto: todas las fases de este pipeline en output_dir."""
+        return f"{self.output_dir.as_posix()}::{self.exercise_type}"
+    
+    def _save_phase_files(self, manifest: Optional[BuildManifest] = None,
+                          input_hash: Optional[str] = None) -> List[str]:
+        """Guarda archivos TEX para cada fase (solo los que cambian si hay manifiesto)."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
         tex_files = []
         
-        for output in self.phase_outputs:
+        for order, output in enumerate(self.phase_outputs):
             tex_file = self.output_dir / output.tex_filename
-            tex_file.write_text(output.latex_content, encoding='utf-8')
+            if manifest is None:
+                tex_file.write_text(output.latex_content, encoding='utf-8')
+                print(f"      💾 Guardado: {tex_file}")
+            elif manifest.write(tex_file, output.latex_content, input_hash, self.renderer_version,
+                                group=self._manifest_group(), order=order):
+                print(f"      💾 Guardado: {tex_file}")
+            else:
+                print(f"      ♻️  Sin cambios: {tex_file}")
             tex_files.append(output.tex_filename)
-            print(f"      💾 Guardado: {tex_file}")
         
+        if manifest is not None:
+            # Fases que ya no están en el pipeline: sus .tex dejarían el grupo siempre desactualizado
+            manifest.prune(self._manifest_group(), keep=[self.output_dir / name for name in tex_files])
+        
+        self.tex_files = tex_files
         return tex_files
     
     def _compose_main_tex(self, tex_files: List[str]) -> str:
@@ -179,12 +322,11 @@ class RendererPipeline:
     
     def save_main_file(self, filename: str = "main.tex") -> Path:
         """Guarda el archivo TEX principal."""
-        if not self.phase_outputs:
+        if not self.tex_files:
             raise RuntimeError("No hay fases renderizadas. Llama a render() primero.")
         
         main_path = self.output_dir / filename
-        tex_files = [o.tex_filename for o in self.phase_outputs]
-        main_tex = self._compose_main_tex(tex_files)
+        main_tex = self._compose_main_tex(self.tex_files)
         
         main_path.write_text(main_tex, encoding='utf-8')
         print(f"📄 Archivo principal guardado: {main_path}")
@@ -216,3 +358,51 @@ class SimpleRendererPhase(ExerciseRendererPhase):
     @property
     def phase_name(self) -> str:
         return self._phase_name
+
+def aggregate_pipeline_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Agrega los informes (RendererPipeline.report()) de un lote de ejercicios.
+    
+    Las fases se agrupan por nombre: por cada una se da número de ejecuciones,
+    totales, media y máximo de tiempo real/CPU, bytes y pico de memoria.
+    Los pipelines omitidos por el manifiesto (cached) solo se cuentan.
+    """
+    by_phase: Dict[str, Dict[str, Any]] = {}
+    order: List[str] = []
+    
+    for report in reports:
+        for phase in report.get('phases', []):
+            name = phase['phase_name']
+            if name not in by_phase:
+                order.append(name)
+                by_phase[name] = {
+                    'count': 0, 'wall_time_s': 0.0, 'cpu_time_s': 0.0, 'output_bytes': 0,
+                    'max_wall_time_s': 0.0, 'max_output_bytes': 0, 'max_peak_memory_delta': 0,
+                }
+            agg = by_phase[name]
+            agg['count'] += 1
+            agg['wall_time_s'] += phase['wall_time_s']
+            agg['cpu_time_s'] += phase['cpu_time_s']
+            agg['output_bytes'] += phase['output_bytes']
+            agg['max_wall_time_s'] = max(agg['max_wall_time_s'], phase['wall_time_s'])
+            agg['max_output_bytes'] = max(agg['max_output_bytes'], phase['output_bytes'])
+            agg['max_peak_memory_delta'] = max(agg['max_peak_memory_delta'], phase['peak_memory_delta'])
+    
+    phases = []
+    for name in order:
+        agg = by_phase[name]
+        agg['mean_wall_time_s'] = agg['wall_time_s'] / agg['count']
+        agg['mean_cpu_time_s'] = agg['cpu_time_s'] / agg['count']
+        phases.append({'phase_name': name, **agg})
+    
+    return {
+        'pipelines': len(reports),
+        'cached': sum(1 for r in reports if r.get('cached')),
+        'phases': phases,
+        'totals': {
+            'wall_time_s': sum(p['wall_time_s'] for p in phases),
+            'cpu_time_s': sum(p['cpu_time_s'] for p in phases),
+            'output_bytes': sum(p['output_bytes'] for p in phases),
+            'peak_memory_delta': max((p['max_peak_memory_delta'] for p in phases), default=0),
+        },
+    }
@@ -4,6 +4,8 @@ from renderers.latex.utils.timing import TimingDiagramRenderer
 from renderers.latex.utils.asset_manager import LatexAssetManager
 
 class SecuencialLatexRenderer:
+    RENDERER_VERSION = "1"
+
     def __init__(self, is_solution: bool = False):
         self.is_solution = is_solution
         self.circuit_renderer = DigitalCircuitRenderer()
@@ -0,0 +1,158 @@
+"""
+Representación intermedia (IR) tipada de la tabla del pipeline de fases.
+
+La tabla viaja por PhaseOutput.output_json (clave TABLE_IR_KEY) serializada
+con to_dict(): output_json sigue siendo JSON plano (se puede volcar a disco
+o auditar) y cada fase reconstruye la IR con get_table_ir(). Cada fase la
+enriquece sin recalcular lo anterior:
+
+  Fase 2 (estructura) → TableIR.empty(columnas, filas)
+  Fase 3 (detalles)   → ir.with_styles(encabezado, celdas)
+  Fase 4 (contenido)  → ir.with_values(valores)
+  Fase 5 (texto)      → ir.to_latex()  (el TEX que Fase 4 ya formateó)
+
+El dict incluye el tabular ya formateado ('latex'), así que Fase 5 no
+vuelve a formatear la tabla de Fase 4. Las instancias se tratan como
+inmutables: with_* devuelve una tabla nueva y to_latex() se memoiza por
+instancia.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Clave de la IR dentro de output_json
+TABLE_IR_KEY = 'table_ir'
+
+
+@dataclass
+class TableRow:
+    """Fila: textos de celda (ya formateados para LaTeX) + estilo (color) de la fila."""
+    cells: List[str]
+    style: Optional[str] = None  # Nombre de color LaTeX ('problema', 'solucion'...)
+
+
+@dataclass
+class TableIR:
+    """Tabla: columnas, filas, estilo de encabezado. Formateo a LaTeX memoizado."""
+    columns: Tuple[str, ...]
+    rows: List[TableRow]
+    header_style: Optional[str] = None  # Color de encabezado (None = encabezado plano)
+    table_type: str = "numeracion_conversion"
+    _latex: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    # ------------------------------------------------------------------
+    # Construcción (una vez por fase)
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def empty(cls, columns: Sequence[str], num_rows: int,
+              table_type: str = "numeracion_conversion") -> "TableIR":
+        """Tabla vacía dimensionada (Fase 2). Instancia compartida: no modificar."""
+        return _empty_table(tuple(columns), num_rows, table_type)
+
+    def with_styles(self, header_style: Optional[str], row_style: Optional[str]) -> "TableIR":
+        """Copia con colores de encabezado y filas (Fase 3)."""
+        rows = [TableRow(row.cells, row_style) for row in self.rows]
+        return TableIR(self.columns, rows, header_style, self.table_type)
+
+    def with_values(self, values: List[Dict[str, str]]) -> "TableIR":
+        """
+        Copia con contenido (Fase 4): una fila por dict {columna: valor}.
+
+        Los valores deben ser ya cadenas. El estilo de fila se hereda de la
+        primera fila existente.
+        """
+        style = self.rows[0].style if self.rows else None
+        columns = self.columns
+        rows = [
+            TableRow([value_dict.get(col, '') for col in columns], style)
+            for value_dict in values
+        ]
+        return TableIR(columns, rows, self.header_style, self.table_type)
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.rows)
+
+    @property
+    def num_cols(self) -> int:
+        return len(self.columns)
+
+    # ------------------------------------------------------------------
+    # Formateo
+    # ------------------------------------------------------------------
+
+    def to_latex(self) -> str:
+        """Entorno tabular (sin preámbulo). Se calcula una sola vez por instancia."""
+        if self._latex is None:
+            self._latex = self._format_tabular()
+        return self._latex
+
+    def _format_tabular(self) -> str:
+        parts = [_format_header(self.columns, self.header_style)]
+        for row in self.rows:
+            if row.style is None:
+                parts.append(" & ".join(row.cells))
+            else:
+                prefix = f"\\cellcolor{{{row.style}}} \\texttt{{\\cellpadding "
+                parts.append(prefix + ("} & " + prefix).join(row.cells) + "}")
+            parts.append(" \\\\\n\\hline\n")
+        parts.append("\\end{tabular}")
+        return "".join(parts)
+
+    # ------------------------------------------------------------------
+    # Serialización (output_json entre fases, JSON guardado en disco)
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dict JSON plano, con el tabular ya formateado para la fase siguiente."""
+        return {
+            'columns': list(self.columns),
+            'header_style': self.header_style,
+            'table_type': self.table_type,
+            'rows': [{'cells': list(row.cells), 'style': row.style} for row in self.rows],
+            'latex': self.to_latex(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TableIR":
+        rows = [TableRow(list(row.get('cells', [])), row.get('style')) for row in data.get('rows', [])]
+        table = cls(
+            columns=tuple(data.get('columns', [])),
+            rows=rows,
+            header_style=data.get('header_style'),
+            table_type=data.get('table_type', "numeracion_conversion"),
+        )
+        table._latex = data.get('latex')
+        return table
+
+
+def get_table_ir(exercise_json: Dict[str, Any]) -> Optional[TableIR]:
+    """IR de la tabla en el JSON de fase (dict de to_dict(); acepta también el objeto)."""
+    ir = exercise_json.get(TABLE_IR_KEY)
+    if ir is None or isinstance(ir, TableIR):
+        return ir
+    return TableIR.from_dict(ir)
+
+
+@lru_cache(maxsize=64)
+def _empty_table(columns: Tuple[str, ...], num_rows: int, table_type: str) -> TableIR:
+    # Las listas de celdas se tratan como inmutables: las filas vacías comparten una
+    blank = [""] * len(columns)
+    return TableIR(columns, [TableRow(blank) for _ in range(num_rows)], None, table_type)
+
+
+@lru_cache(maxsize=32)
+def _format_header(columns: Tuple[str, ...], header_style: Optional[str]) -> str:
+    """Apertura del tabular + encabezado (igual para todas las tablas del mismo tipo)."""
+    opening = f"\\begin{{tabular}}{{|{'c|' * len(columns)}}}\n\\hline\n"
+    if header_style:
+        header = " & \n".join(f"\\textbf{{\\cellcolor{{{header_style}}} {col}}}" for col in columns)
+    else:
+        header = " & ".join(columns)
+    return opening + header + " \\\\\n\\hline\n"
@@ -50,7 +50,17 @@ class LatexAssetManager:
         full_content = header + content
         
         draft_path = os.path.join(self.components_path, filename)
-        with open(draft_path, "w", encoding="utf-8") as f:
-            f.write(full_content)
+        
+        # Solo reescribir si cambia: mantiene el mtime para herramientas TeX incrementales
+        if not self._has_content(draft_path, full_content):
+            with open(draft_path, "w", encoding="utf-8") as f:
+                f.write(full_content)
             
         return fr"\input{{components/{filename}}}" + "\n"
+
+    @staticmethod
+    def _has_content(path: str, content: str) -> bool:
+        if not os.path.exists(path):
+            return False
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read() == content
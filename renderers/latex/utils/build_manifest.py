@@ -0,0 +1,193 @@
+"""
+Manifiesto de construcción para el renderizado incremental.
+
+Para cada fichero de salida (.tex de ejercicio, fase o documento principal)
+guarda el hash del JSON de entrada y la versión del renderer que lo produjo.
+Si ambos coinciden en la siguiente ejecución, el fichero no se regenera ni
+se reescribe: su mtime no cambia y las herramientas TeX basadas en mtime
+(latexmk, arara...) no recompilan lo que no ha cambiado.
+
+FLUJO:
+    manifest = BuildManifest("build/latex")
+    key = manifest.hash_input(exercise_json, is_solution)
+    if manifest.is_up_to_date(path, key, version):
+        manifest.skip(path)
+    else:
+        manifest.write(path, render(...), key, version, group="examen")
+    manifest.prune("examen", keep=[path, ...])   # Borra las salidas que ya no existen
+    manifest.save()
+    manifest.print_report()
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+PathLike = Union[str, Path]
+
+
+class BuildManifest:
+    """Registro persistente (JSON) de entradas → salidas del renderizado."""
+
+    MANIFEST_FILENAME = ".build_manifest.json"
+
+    def __init__(self, output_dir: PathLike = "build/latex", manifest_file: Optional[PathLike] = None):
+        self.output_dir = Path(output_dir)
+        self.manifest_path = Path(manifest_file) if manifest_file else self.output_dir / self.MANIFEST_FILENAME
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+
+        # Resultado de esta ejecución
+        self.rebuilt: List[str] = []      # Regenerados y reescritos en disco
+        self.identical: List[str] = []    # Regenerados, pero el contenido no cambió (no se tocan)
+        self.unchanged: List[str] = []    # No regenerados (hash y versión coinciden)
+        self.removed: List[str] = []      # Salidas obsoletas borradas del disco y del manifiesto
+
+    # ------------------------------------------------------------------
+    # Persistencia
+    # ------------------------------------------------------------------
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('outputs', {})
+        except (json.JSONDecodeError, OSError):
+            # Manifiesto corrupto: se reconstruye todo
+            return {}
+
+    def save(self) -> Path:
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({'outputs': self.entries}, f, ensure_ascii=False, indent=2, sort_keys=True)
+        return self.manifest_path
+
+    # ------------------------------------------------------------------
+    # Consultas
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def hash_input(*parts: Any) -> str:
+        """Hash estable (SHA-256) del JSON canónico de las entradas."""
+        canonical = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _key(output_file: PathLike) -> str:
+        return Path(output_file).as_posix()
+
+    def is_up_to_date(self, output_file: PathLike, input_hash: str, renderer_version: str) -> bool:
+        entry = self.entries.get(self._key(output_file))
+        return (
+            entry is not None
+            and entry.get('input_hash') == input_hash
+            and entry.get('renderer_version') == renderer_version
+            and Path(output_file).exists()
+        )
+
+    def cached_outputs(self, group: str, input_hash: str, renderer_version: str) -> Optional[List[str]]:
+        """
+        Ficheros de un grupo (ej: todas las fases de un pipeline) si TODOS están al día.
+
+        Returns:
+            Lista de rutas en orden de registro, o None si hay que regenerar el grupo.
+        """
+        outputs = [
+            (entry.get('order', 0), path) for path, entry in self.entries.items()
+            if entry.get('group') == group
+        ]
+        if not outputs:
+            return None
+        paths = [path for _, path in sorted(outputs)]
+        if all(self.is_up_to_date(path, input_hash, renderer_version) for path in paths):
+            return paths
+        return None
+
+    # ------------------------------------------------------------------
+    # Registro
+    # ------------------------------------------------------------------
+
+    def write(
+        self,
+        output_file: PathLike,
+        content: str,
+        input_hash: str,
+        renderer_version: str,
+        group: Optional[str] = None,
+        order: int = 0,
+    ) -> bool:
+        """
+        Escribe output_file solo si su contenido cambia y registra su procedencia.
+
+        Returns:
+            True si el fichero se escribió en disco.
+        """
+        path = Path(output_file)
+        key = self._key(path)
+
+        written = True
+        if path.exists() and path.read_text(encoding='utf-8') == content:
+            written = False
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding='utf-8')
+
+        self.entries[key] = {
+            'input_hash': input_hash,
+            'renderer_version': renderer_version,
+        }
+        if group is not None:
+            self.entries[key]['group'] = group
+            self.entries[key]['order'] = order
+
+        (self.rebuilt if written else self.identical).append(key)
+        return written
+
+    def skip(self, output_file: PathLike) -> None:
+        self.unchanged.append(self._key(output_file))
+
+    def prune(self, group: str, keep: List[PathLike]) -> List[str]:
+        """
+        Borra las salidas del grupo que no están en keep (ej: el .tex de un
+        ejercicio que ya no forma parte del examen) y sus entradas del manifiesto.
+
+        Returns:
+            Rutas eliminadas.
+        """
+        keep_keys = {self._key(path) for path in keep}
+        stale = [path for path, entry in self.entries.items()
+                 if entry.get('group') == group and path not in keep_keys]
+        for path in stale:
+            Path(path).unlink(missing_ok=True)
+            del self.entries[path]
+        self.removed.extend(stale)
+        return stale
+
+    # ------------------------------------------------------------------
+    # Informe
+    # ------------------------------------------------------------------
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'rebuilt': list(self.rebuilt),
+            'identical': list(self.identical),
+            'unchanged': list(self.unchanged),
+            'removed': list(self.removed),
+            'total': len(self.rebuilt) + len(self.identical) + len(self.unchanged),
+        }
+
+    def print_report(self) -> None:
+        report = self.report()
+        print("\n" + "=" * 70)
+        print("REPORTE DE RENDERIZADO INCREMENTAL")
+        print("=" * 70)
+        print(f"   • Reconstruidos:            {len(report['rebuilt'])}")
+        print(f"   • Regenerados sin cambios:  {len(report['identical'])}")
+        print(f"   • Sin cambios (omitidos):   {len(report['unchanged'])}")
+        print(f"   • Obsoletos (borrados):     {len(report['removed'])}")
+        for path in report['rebuilt']:
+            print(f"      [REBUILT] {path}")
+        for path in report['removed']:
+            print(f"      [REMOVED] {path}")
+        print("=" * 70 + "\n")
@@ -1,22 +1,35 @@
+from typing import List, Optional, Tuple
+
 from modules.secuencial.models import SequentialExerciseData
+from modules.secuencial.waveform import Waveform
 
 class TimingDiagramRenderer:
+    def signals(self, data: SequentialExerciseData) -> List[Tuple[str, Waveform, Optional[str]]]:
+        """Señales del cronograma: (etiqueta, forma de onda, opciones tikz-timing)."""
+        clk = Waveform.parse(data.clk_sequence)
+        if not clk and data.total_cycles:
+            clk = Waveform.clock(data.total_cycles)
+        placeholder = Waveform.parse(data.output_placeholder)
+
+        signals = [("CLK", clk, None)]
+        if data.has_async:
+            signals.append((f"{data.async_type}(asyn)", Waveform.parse(data.async_sequence), None))
+        signals.append(("E", Waveform.parse(data.input_sequence), None))
+        signals.append(("Q0", placeholder, "[draw=none, fill=none]"))
+        signals.append(("Q1", placeholder, "[draw=none, fill=none]"))
+        return signals
+
     def render(self, data: SequentialExerciseData) -> str:
         # Formateo basado en la plantilla definitiva de resources/latex/ej5_seq_timing.tex
         # Usamos espacios en lugar de \t para evitar problemas con LaTeX
 
         indent = "    " # 4 espacios
 
-        # Construcción de filas
+        # Construcción de filas (una Waveform por señal, exportada en RLE)
         rows = []
-        rows.append(fr"{indent}{indent}CLK & {data.clk_sequence} \\")
-        
-        if data.has_async:
-            rows.append(fr"{indent}{indent}{data.async_type}(asyn) & {data.async_sequence} \\")
-            
-        rows.append(fr"{indent}{indent}E & {data.input_sequence} \\")
-        rows.append(fr"{indent}{indent}Q0 & [draw=none, fill=none] {data.output_placeholder} \\")
-        rows.append(fr"{indent}{indent}Q1 & [draw=none, fill=none] {data.output_placeholder} \\")
+        for label, wave, options in self.signals(data):
+            prefix = f"{options} " if options else ""
+            rows.append(fr"{indent}{indent}{label} & {prefix}{wave.to_tikz(clock=label == 'CLK')} \\")
         
         rows_str = "\n".join(rows)
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+benchmark_capacidad.py
+
+Benchmark del análisis de capacidad, rango, longitud y unicidad
+(core.capacidad_representacion) frente a las implementaciones anteriores de
+core.sistemas_numeracion_basicos, en las bases 2-36 y longitudes 1-64:
+
+    longitud    ⌊log_B(x)⌋ + 1 con math.log (anterior) frente a la versión
+                entera, sobre los extremos B^(n-1) y B^n - 1 de cada longitud
+                y un valor aleatorio; cuenta los resultados erróneos del
+                logaritmo en coma flotante
+    analisis    recalcular potencias y fórmulas en cada llamada (anterior)
+                frente al análisis memorizado (segunda pasada, caché caliente)
+    unicidad    enumerar las B^n cadenas frente a la prueba por conteo (la
+                enumeración solo hasta --max-enumeracion cadenas)
+
+Uso:
+    python scripts/benchmark_capacidad.py [--bases 2 3 ... 36] [--max-longitud 64]
+        [--max-enumeracion 65536] [--seed 0] [--json informe.json]
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import capacidad_representacion as capacidad
+
+VERSION_INFORME = 1
+
+
+def longitud_legado(numero: int, base: int) -> int:
+    """Implementación anterior de longitud_representacion (logaritmo en coma flotante)."""
+    return math.floor(math.log(numero, base)) + 1
+
+
+def analisis_legado(numero: int, base: int, longitud: int) -> Dict:
+    """Implementación anterior de analisis_representacion (sin memorizar)."""
+    cap = base ** longitud
+    rango_min, rango_max = 0, cap - 1
+    return {
+        'número': numero,
+        'base': base,
+        'longitud_fija': longitud,
+        'longitud_mínima': longitud_legado(numero, base),
+        'capacidad': cap,
+        'rango': f'[{rango_min}, {rango_max}]',
+        'rango_min': rango_min,
+        'rango_max': rango_max,
+        'en_rango': rango_min <= numero <= rango_max,
+        'fórmula_capacidad': f'{base}^{longitud} = {cap}',
+        'fórmula_rango_máximo': f'{base}^{longitud} - 1 = {rango_max}'
+    }
+
+
+def cronometrar(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def casos_base(base: int, max_longitud: int) -> List[tuple]:
+    """(número, longitud esperada): extremos de cada longitud y un valor intermedio."""
+    casos = []
+    for n in range(1, max_longitud + 1):
+        bajo, alto = base ** (n - 1), base ** n - 1
+        casos.extend([(bajo, n), (alto, n), (random.randint(bajo, alto), n)])
+    return casos
+
+
+def medir_base(base: int, max_longitud: int, max_enumeracion: int) -> dict:
+    casos = casos_base(base, max_longitud)
+    numeros = [numero for numero, _ in casos]
+
+    legado, t_legado = cronometrar(lambda: [longitud_legado(x, base) for x in numeros])
+    exacto, t_exacto = cronometrar(lambda: [capacidad.longitud(x, base) for x in numeros])
+    errores_legado = sum(r != n for r, (_, n) in zip(legado, casos))
+    errores_exacto = sum(r != n for r, (_, n) in zip(exacto, casos))
+
+    analisis_casos = [(x, base, n) for x, n in casos]
+    _, t_analisis_legado = cronometrar(lambda: [analisis_legado(*c) for c in analisis_casos])
+    _, t_analisis_frio = cronometrar(lambda: [capacidad.analisis(*c) for c in analisis_casos])
+    _, t_analisis_caliente = cronometrar(lambda: [capacidad.analisis(*c) for c in analisis_casos])
+
+    unicidad = []
+    for n in range(1, max_longitud + 1):
+        conteo, t_conteo = cronometrar(capacidad.unicidad_posicional, base, n, 0)
+        fila = {'longitud': n, 'cadenas': conteo['cadenas'], 'unica': conteo['unica'],
+                'conteo_s': t_conteo, 'enumeracion_s': None}
+        if base ** n <= max_enumeracion:
+            enumeracion, t_enumeracion = cronometrar(capacidad.unicidad_posicional, base, n, max_enumeracion)
+            fila['enumeracion_s'] = t_enumeracion
+            fila['unica'] = fila['unica'] and enumeracion['unica']
+        unicidad.append(fila)
+
+    return {
+        'base': base,
+        'casos': len(casos),
+        'longitud': {'legado_s': t_legado, 'exacto_s': t_exacto,
+                     'errores_legado': errores_legado, 'errores_exacto': errores_exacto},
+        'analisis': {'legado_s': t_analisis_legado, 'frio_s': t_analisis_frio,
+                     'memorizado_s': t_analisis_caliente},
+        'unicidad': unicidad,
+    }
+
+
+def build_report(bases: List[int], max_longitud: int = 64, max_enumeracion: int = 1 << 16,
+                 seed: int = 0) -> dict:
+    random.seed(seed)
+    capacidad.limpiar_caches()
+    resultados = [medir_base(base, max_longitud, max_enumeracion) for base in bases]
+    return {
+        'version': VERSION_INFORME,
+        'python': platform.python_version(),
+        'parametros': {'bases': bases, 'max_longitud': max_longitud,
+                       'max_enumeracion': max_enumeracion, 'seed': seed},
+        'bases': resultados,
+        'errores_legado': sum(r['longitud']['errores_legado'] for r in resultados),
+        'errores_exacto': sum(r['longitud']['errores_exacto'] for r in resultados),
+        'no_unicas': [(r['base'], u['longitud']) for r in resultados for u in r['unicidad'] if not u['unica']],
+    }
+
+
+def _ms(segundos) -> str:
+    return "-" if segundos is None else f"{segundos * 1e3:.3f}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark del análisis de capacidad y unicidad")
+    parser.add_argument("--bases", type=int, nargs="+", default=list(range(2, 37)))
+    parser.add_argument("--max-longitud", type=int, default=64)
+    parser.add_argument("--max-enumeracion", type=int, default=1 << 16,
+                        help="Cadenas máximas para medir también la unicidad por enumeración")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Guardar el informe en este fichero")
+    args = parser.parse_args(argv)
+
+    report = build_report(args.bases, args.max_longitud, args.max_enumeracion, args.seed)
+
+    # Unicidad: enumeración y conteo en los espacios enumerados; conteo en todas las longitudes
+    print(f"{'base':>4} {'long. log ms':>13} {'long. int ms':>13} {'err. log':>9} {'anál. ms':>9} "
+          f"{'memo ms':>9} {'enum. ms':>10} {'conteo ms':>10} {'conteo total':>13}")
+    for r in report['bases']:
+        enumeradas = [u for u in r['unicidad'] if u['enumeracion_s'] is not None]
+        print(f"{r['base']:>4} {_ms(r['longitud']['legado_s']):>13} {_ms(r['longitud']['exacto_s']):>13} "
+              f"{r['longitud']['errores_legado']:>9} {_ms(r['analisis']['legado_s']):>9} "
+              f"{_ms(r['analisis']['memorizado_s']):>9} "
+              f"{_ms(sum(u['enumeracion_s'] for u in enumeradas) if enumeradas else None):>10} "
+              f"{_ms(sum(u['conteo_s'] for u in enumeradas) if enumeradas else None):>10} "
+              f"{_ms(sum(u['conteo_s'] for u in r['unicidad'])):>13}")
+
+    print(f"\nLongitudes erróneas con math.log: {report['errores_legado']}; "
+          f"con la versión entera: {report['errores_exacto']}")
+    for base, n in report['no_unicas']:
+        print(f"UNICIDAD NO VERIFICADA: base {base}, longitud {n}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    return 1 if report['errores_exacto'] or report['no_unicas'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
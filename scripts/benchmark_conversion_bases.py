@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+benchmark_conversion_bases.py
+
+Benchmark de la conversión de enteros grandes base 10 ↔ base B
+(core.conversion_enteros_grandes) frente a los métodos clásicos
+(divisiones sucesivas y suma de d_i · B^i), con números de hasta 100.000
+dígitos como los de los ejercicios de estrés y las tablas de capacidad.
+
+Los métodos clásicos son cuadráticos: solo se miden hasta --max-clasico dígitos.
+
+Uso:
+    python scripts/benchmark_conversion_bases.py [--digits 1000 10000 100000]
+        [--bases 2 7 10 16 36] [--max-clasico 10000] [--json salida.json]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.conversion_enteros_grandes import ALFABETO_MINUSCULAS, digitos_a_entero, entero_a_digitos
+from core.sistemas_numeracion_basicos import capacidad_representacion, rango_representacion
+
+
+def clasico_a_digitos(numero: int, base: int) -> str:
+    """Divisiones sucesivas (implementación anterior de decimal_a_base_B)."""
+    resultado = []
+    while numero > 0:
+        resultado.append(ALFABETO_MINUSCULAS[numero % base])
+        numero //= base
+    return ''.join(reversed(resultado)) or "0"
+
+
+def clasico_a_entero(numero_str: str, base: int) -> int:
+    """Suma de d_i · B^i (implementación anterior de base_B_a_decimal)."""
+    resultado = 0
+    for i, digito in enumerate(reversed(numero_str)):
+        resultado += ALFABETO_MINUSCULAS.index(digito) * (base ** i)
+    return resultado
+
+
+def cronometrar(funcion, *args):
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def run_case(digits: int, base: int, max_clasico: int) -> dict:
+    # Número con exactamente `digits` dígitos en base B (capacidad de la longitud)
+    _, maximo = rango_representacion(base, digits)
+    numero = random.randint(capacidad_representacion(base, digits - 1), maximo)
+
+    texto, t_a_digitos = cronometrar(entero_a_digitos, numero, base)
+    valor, t_a_entero = cronometrar(digitos_a_entero, texto, base)
+    assert valor == numero and len(texto) == digits
+
+    case = {
+        'digits': digits,
+        'base': base,
+        'a_digitos_s': t_a_digitos,
+        'a_entero_s': t_a_entero,
+        'clasico_a_digitos_s': None,
+        'clasico_a_entero_s': None,
+    }
+    if digits <= max_clasico:
+        texto_clasico, case['clasico_a_digitos_s'] = cronometrar(clasico_a_digitos, numero, base)
+        valor_clasico, case['clasico_a_entero_s'] = cronometrar(clasico_a_entero, texto, base)
+        assert texto_clasico == texto and valor_clasico == numero
+    return case
+
+
+def _ms(segundos) -> str:
+    return "-" if segundos is None else f"{segundos * 1e3:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de conversión de enteros grandes entre bases")
+    parser.add_argument("--digits", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--bases", type=int, nargs="+", default=[2, 7, 10, 16, 36])
+    parser.add_argument("--max-clasico", type=int, default=10000,
+                        help="Longitud máxima medida con los métodos clásicos (cuadráticos)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Guardar los resultados en este fichero")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    cases = [run_case(d, b, args.max_clasico) for d in args.digits for b in args.bases]
+
+    print(f"{'dígitos':>8} {'base':>5} {'→dígitos ms':>12} {'clásico ms':>11} "
+          f"{'→entero ms':>11} {'clásico ms':>11}")
+    for case in cases:
+        print(f"{case['digits']:>8} {case['base']:>5} {_ms(case['a_digitos_s']):>12} "
+              f"{_ms(case['clasico_a_digitos_s']):>11} {_ms(case['a_entero_s']):>11} "
+              f"{_ms(case['clasico_a_entero_s']):>11}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(cases, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
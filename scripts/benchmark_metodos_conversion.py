@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+benchmark_metodos_conversion.py
+
+Benchmark de todos los métodos de conversión entero ↔ base B del proyecto
+(numeracion_utils, conversion_algoritmos_detallados y
+sistemas_numeracion_basicos), por tamaño de entrada, base y modo
+(verbose = el método construye pasos / explicación).
+
+Para cada caso comprueba que todos los métodos dan el mismo resultado que
+la referencia (int() de Python y el motor de core.conversion_enteros_grandes)
+y guarda un informe JSON con los tiempos, las discrepancias y el método más
+rápido de cada dirección, modo y tamaño (para elegir los métodos por defecto
+de los generadores).
+
+Con --baseline compara contra un informe anterior: un método es una
+regresión si la media geométrica de (tiempo actual / tiempo anterior) en
+sus casos comunes supera --tolerancia. Caso a caso el ruido llega a ×1.5,
+pero la media de un método entre dos ejecuciones iguales no se aleja más
+de un ~5%. Sale con código 1 si hay regresiones o discrepancias.
+
+Los métodos cuadráticos (pasos detallados, sumas de potencias) solo se
+miden hasta --max-cuadratico dígitos.
+
+Uso:
+    python scripts/benchmark_metodos_conversion.py [--digits 10 100 1000 10000]
+        [--bases 2 8 10 16 36] [--repeat 3] [--max-cuadratico 2000]
+        [--json informe.json] [--baseline anterior.json] [--tolerancia 1.25]
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.conversion_algoritmos_detallados import decomposition_conversion, hybrid_conversion
+from core.conversion_enteros_grandes import ALFABETO_MAYUSCULAS, entero_a_digitos
+from core.numeracion_utils import (
+    base_b_a_decimal_con_horner,
+    base_b_a_decimal_con_polinomio,
+    base_b_a_decimal_simple,
+    decimal_a_base_b_con_pasos,
+    decimal_a_base_b_divisiones,
+)
+from core.sistemas_numeracion_basicos import base_B_a_decimal, decimal_a_base_B
+
+if hasattr(sys, 'set_int_max_str_digits'):
+    sys.set_int_max_str_digits(0)
+
+VERSION_INFORME = 1
+MIN_MEDICION_S = 0.02
+MAX_BUCLE = 10000
+SUBINDICES = '₀₁₂₃₄₅₆₇₈₉'
+
+
+class Metodo(NamedTuple):
+    nombre: str
+    direccion: str          # 'a_base' (int → texto) o 'a_decimal' (texto → int)
+    verbose: bool
+    cuadratico: bool
+    funcion: Callable
+
+
+def _sin_subindice(texto: str) -> str:
+    return texto.rstrip(SUBINDICES)
+
+
+def _texto(digitos: List[int]) -> str:
+    return ''.join(ALFABETO_MAYUSCULAS[d] for d in digitos)
+
+
+def _descomposicion(numero: int, base: int) -> str:
+    n = len(str(numero))
+    return _texto(decomposition_conversion(n, 0, 10, numero, base, 4 * n, 0)['int_digits'])
+
+
+def _hibrido(numero: int, base: int) -> str:
+    n = len(str(numero))
+    return _texto(hybrid_conversion(n, 0, 10, numero, base, 4 * n, 0)['digits'])
+
+
+METODOS = [
+    Metodo('decimal_a_base_b_divisiones', 'a_base', False, False,
+           lambda n, b: _sin_subindice(decimal_a_base_b_divisiones(n, b))),
+    Metodo('decimal_a_base_B', 'a_base', False, False,
+           lambda n, b: decimal_a_base_B(n, b).upper()),
+    Metodo('hybrid_conversion', 'a_base', False, True, _hibrido),
+    Metodo('decimal_a_base_b_con_pasos', 'a_base', True, True,
+           lambda n, b: _sin_subindice(decimal_a_base_b_con_pasos(n, b)['resultado'])),
+    Metodo('decomposition_conversion', 'a_base', True, True, _descomposicion),
+    Metodo('base_b_a_decimal_simple', 'a_decimal', False, False, base_b_a_decimal_simple),
+    Metodo('base_B_a_decimal', 'a_decimal', False, False, base_B_a_decimal),
+    Metodo('base_b_a_decimal_con_horner', 'a_decimal', True, False,
+           lambda t, b: base_b_a_decimal_con_horner(t, b)['decimal']),
+    Metodo('base_b_a_decimal_con_polinomio', 'a_decimal', True, True,
+           lambda t, b: base_b_a_decimal_con_polinomio(t, b)['decimal']),
+]
+
+
+def cronometrar(funcion, args, repeat: int, objetivo: float = None):
+    """
+    (resultado, segundos por llamada): mejor de repeat mediciones.
+
+    Como timeit.autorange, cada medición repite la llamada hasta durar al
+    menos objetivo segundos, para que los casos cortos no sean solo ruido.
+    """
+    objetivo = MIN_MEDICION_S if objetivo is None else objetivo
+    inicio = time.perf_counter()
+    resultado = funcion(*args)
+    primera = time.perf_counter() - inicio
+    bucle = max(1, min(MAX_BUCLE, int(objetivo / primera) if primera > 0 else MAX_BUCLE))
+
+    mejor = primera
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        for _ in range(bucle):
+            funcion(*args)
+        mejor = min(mejor, (time.perf_counter() - inicio) / bucle)
+    return resultado, mejor
+
+
+def run_case(digits: int, base: int, metodos: List[Metodo], repeat: int, max_cuadratico: int) -> List[dict]:
+    numero = random.randint(10 ** (digits - 1), 10 ** digits - 1)
+    texto = entero_a_digitos(numero, base, mayusculas=True)
+    esperado = {'a_base': texto, 'a_decimal': int(texto, base)}
+    assert esperado['a_decimal'] == numero
+
+    casos = []
+    for metodo in metodos:
+        if metodo.cuadratico and digits > max_cuadratico:
+            continue
+        entrada = numero if metodo.direccion == 'a_base' else texto
+        try:
+            resultado, segundos = cronometrar(metodo.funcion, (entrada, base), repeat)
+            correcto, error = resultado == esperado[metodo.direccion], None
+        except Exception as e:  # Un método que falla cuenta como discrepancia
+            segundos, correcto, error = None, False, f"{type(e).__name__}: {e}"
+        casos.append({
+            'metodo': metodo.nombre,
+            'direccion': metodo.direccion,
+            'verbose': metodo.verbose,
+            'digits': digits,
+            'base': base,
+            'segundos': segundos,
+            'correcto': correcto,
+            'error': error,
+        })
+    return casos
+
+
+def recomendados(casos: List[dict]) -> Dict:
+    """Método correcto más rápido por dirección, modo y tamaño (sumando todas las bases)."""
+    totales = {}
+    for caso in casos:
+        clave = (caso['direccion'], 'verbose' if caso['verbose'] else 'simple', caso['digits'])
+        por_metodo = totales.setdefault(clave, {})
+        if caso['correcto']:
+            por_metodo[caso['metodo']] = por_metodo.get(caso['metodo'], 0.0) + caso['segundos']
+        else:
+            por_metodo[caso['metodo']] = float('inf')
+
+    resultado = {}
+    for (direccion, modo, digits), por_metodo in sorted(totales.items()):
+        validos = {m: t for m, t in por_metodo.items() if t != float('inf')}
+        if validos:
+            resultado.setdefault(direccion, {}).setdefault(modo, {})[str(digits)] = min(validos, key=validos.get)
+    return resultado
+
+
+def build_report(digits: List[int], bases: List[int], repeat: int = 3, max_cuadratico: int = 2000,
+                 seed: int = 0, metodos: List[Metodo] = None) -> dict:
+    metodos = METODOS if metodos is None else metodos
+    random.seed(seed)
+    casos = [caso for d in digits for b in bases for caso in run_case(d, b, metodos, repeat, max_cuadratico)]
+    return {
+        'version': VERSION_INFORME,
+        'python': platform.python_version(),
+        'parametros': {'digits': digits, 'bases': bases, 'repeat': repeat,
+                       'max_cuadratico': max_cuadratico, 'seed': seed},
+        'casos': casos,
+        'discrepancias': [c for c in casos if not c['correcto']],
+        'recomendados': recomendados(casos),
+    }
+
+
+def _clave(caso: dict):
+    return (caso['metodo'], caso['direccion'], caso['verbose'], caso['digits'], caso['base'])
+
+
+def compare(report: dict, baseline: dict, tolerancia: float = 1.25) -> List[dict]:
+    """
+    Métodos de report más lentos que en baseline (solo casos medidos en ambos).
+
+    Un método empeora si la media geométrica de sus cocientes de tiempo
+    supera tolerancia; 'peor_caso' es el caso con mayor cociente.
+    """
+    anteriores = {_clave(c): c['segundos'] for c in baseline.get('casos', []) if c.get('segundos')}
+    cocientes = {}
+    for caso in report['casos']:
+        anterior = anteriores.get(_clave(caso))
+        if anterior and caso['segundos']:
+            cocientes.setdefault(caso['metodo'], []).append((caso['segundos'] / anterior, caso))
+
+    regresiones = []
+    for metodo, lista in cocientes.items():
+        factor = math.exp(sum(math.log(c) for c, _ in lista) / len(lista))
+        if factor > tolerancia:
+            peor_factor, peor = max(lista, key=lambda par: par[0])
+            regresiones.append({
+                'metodo': metodo,
+                'factor': factor,
+                'casos': len(lista),
+                'peor_caso': {'digits': peor['digits'], 'base': peor['base'], 'factor': peor_factor},
+            })
+    return regresiones
+
+
+def _ms(segundos) -> str:
+    return "-" if segundos is None else f"{segundos * 1e3:.2f}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de los métodos de conversión entre bases")
+    parser.add_argument("--digits", type=int, nargs="+", default=[10, 100, 1000, 10000],
+                        help="Dígitos decimales de la entrada")
+    parser.add_argument("--bases", type=int, nargs="+", default=[2, 8, 10, 16, 36])
+    parser.add_argument("--repeat", type=int, default=3, help="Ejecuciones por caso (se toma la menor)")
+    parser.add_argument("--max-cuadratico", type=int, default=2000,
+                        help="Longitud máxima medida con los métodos cuadráticos")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Guardar el informe en este fichero")
+    parser.add_argument("--baseline", help="Informe anterior para detectar regresiones")
+    parser.add_argument("--tolerancia", type=float, default=1.25,
+                        help="Factor de tiempo (media geométrica por método) admitido frente al baseline")
+    args = parser.parse_args(argv)
+
+    report = build_report(args.digits, args.bases, args.repeat, args.max_cuadratico, args.seed)
+
+    print(f"{'método':<32} {'verbose':>7} {'dígitos':>8} {'base':>5} {'ms':>10} {'ok':>3}")
+    for caso in report['casos']:
+        print(f"{caso['metodo']:<32} {'sí' if caso['verbose'] else 'no':>7} {caso['digits']:>8} "
+              f"{caso['base']:>5} {_ms(caso['segundos']):>10} {'✓' if caso['correcto'] else '✗':>3}")
+
+    print("\nMétodo más rápido por dirección / modo / dígitos:")
+    for direccion, modos in report['recomendados'].items():
+        for modo, por_tamano in modos.items():
+            for digits, metodo in por_tamano.items():
+                print(f"  {direccion:<10} {modo:<8} {digits:>8}: {metodo}")
+
+    fallos = len(report['discrepancias'])
+    for caso in report['discrepancias']:
+        print(f"DISCREPANCIA: {caso['metodo']} base {caso['base']} {caso['digits']} dígitos"
+              + (f" ({caso['error']})" if caso['error'] else ""))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regresiones = compare(report, baseline, args.tolerancia)
+        report['regresiones'] = regresiones
+        for regresion in regresiones:
+            peor = regresion['peor_caso']
+            print(f"REGRESIÓN: {regresion['metodo']} ×{regresion['factor']:.2f} en {regresion['casos']} casos "
+                  f"(peor: base {peor['base']}, {peor['digits']} dígitos, ×{peor['factor']:.2f})")
+        fallos += len(regresiones)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+benchmark_render_pipeline.py
+
+Benchmark del pipeline de fases LaTeX (Fase 1 → Fase 5) sobre un lote de
+ejercicios ConversionRow (tabla de 1 fila) o ArithmeticOp (tabla de 3
+filas). Usa la instrumentación de RendererPipeline y muestra el agregado
+por fase (tiempo real, CPU y bytes de TEX).
+
+Uso:
+    python scripts/benchmark_render_pipeline.py [--rows 1000] [--tipo ConversionRow|ArithmeticOp]
+        [--solution] [--json salida.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from renderers.latex.renderer_base import RendererPipeline, aggregate_pipeline_reports
+from renderers.latex.phase1_validator import Phase1DataValidator
+from renderers.latex.phase2_structure import Phase2StructureGenerator
+from renderers.latex.phase3_details import Phase3Details
+from renderers.latex.phase4_content import Phase4Content
+from renderers.latex.phase5_text import Phase5Text
+
+
+def make_conversion_row(index: int, n_bits: int = 8) -> dict:
+    """Ejercicio ConversionRow sintético (mismo formato que ExamBuilder)."""
+    value = random.randint(-(1 << (n_bits - 1)), (1 << (n_bits - 1)) - 1)
+    mask = (1 << n_bits) - 1
+    return {
+        "title": f"Conversión {index}",
+        "description": "Complete la fila de la tabla.",
+        "problem": {"label": f"r{index}", "val_decimal": value, "target_col_idx": 1, "representable": True},
+        "solution": {
+            "sol_bin": format(value, f"0{n_bits}b") if value >= 0 else "NR",
+            "sol_c2": format(value & mask, f"0{n_bits}b"),
+            "sol_sm": ("1" if value < 0 else "0") + format(abs(value), f"0{n_bits - 1}b"),
+            "sol_bcd": "NR",
+            "target_val_str": format(value & mask, f"0{n_bits}b"),
+        },
+        "metadata": {"exercise_type": "ConversionRow"},
+    }
+
+
+def make_arithmetic_op(index: int, n_bits: int = 8) -> dict:
+    """Ejercicio ArithmeticOp sintético: tabla de 3 filas (operandos y resultado)."""
+    a = random.randint(0, (1 << (n_bits - 2)) - 1)
+    b = random.randint(0, (1 << (n_bits - 2)) - 1)
+    a_bin, b_bin, result_bin = (format(v, f"0{n_bits}b") for v in (a, b, a + b))
+    return {
+        "title": f"Suma {index}",
+        "description": "Realice la suma.",
+        "problem": {
+            # Campos de ArithmeticOp (validados en Fase 1)
+            "op_type": "suma", "system": "binario", "operand1": f"A{index}", "operand2": f"B{index}",
+            "operator_symbol": "+", "val1_dec": a, "val2_dec": b,
+            # Campos que Fase 4 lleva a la tabla
+            "operand1_label": f"A{index}", "operand2_label": f"B{index}", "operation_symbol": "+",
+            "operand1_value": a_bin, "operand2_value": b_bin,
+            "operand1_base": "2", "operand2_base": "2", "result_base": "2",
+        },
+        "solution": {"result_dec": a + b, "result_bin": result_bin, "overflow": False, "underflow": False,
+                     "carry_bits": "", "result_value": result_bin},
+        "metadata": {"exercise_type": "ArithmeticOp"},
+    }
+
+
+MAKERS = {"ConversionRow": make_conversion_row, "ArithmeticOp": make_arithmetic_op}
+
+
+def run_batch(rows: int, is_solution: bool, output_dir: str, tipo: str = "ConversionRow") -> dict:
+    reports = []
+    for i in range(rows):
+        pipeline = RendererPipeline(tipo, output_dir=output_dir, track_memory=False)
+        for phase in (Phase1DataValidator(), Phase2StructureGenerator(), Phase3Details(),
+                      Phase4Content(), Phase5Text()):
+            pipeline.add_phase(phase)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pipeline.render(MAKERS[tipo](i), is_solution=is_solution)
+        reports.append(pipeline.report())
+    return aggregate_pipeline_reports(reports)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark del pipeline de fases LaTeX")
+    parser.add_argument("--rows", type=int, default=1000, help="Ejercicios del lote")
+    parser.add_argument("--tipo", choices=sorted(MAKERS), default="ConversionRow",
+                        help="Tipo de ejercicio (ArithmeticOp: tablas de 3 filas)")
+    parser.add_argument("--solution", action="store_true", help="Renderizar soluciones")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="Guardar el informe agregado en este fichero")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        batch = run_batch(args.rows, args.solution, tmp, args.tipo)
+
+    print(f"Lote: {batch['pipelines']} ejercicios {args.tipo} ({'solución' if args.solution else 'enunciado'})")
+    print(f"{'Fase':<12} {'total ms':>10} {'media µs':>10} {'máx µs':>10} {'KB TEX':>10}")
+    for phase in batch["phases"]:
+        print(
+            f"{phase['phase_name']:<12} {phase['wall_time_s'] * 1e3:>10.2f} "
+            f"{phase['mean_wall_time_s'] * 1e6:>10.1f} {phase['max_wall_time_s'] * 1e6:>10.1f} "
+            f"{phase['output_bytes'] / 1024:>10.1f}"
+        )
+    totals = batch["totals"]
+    print(f"{'TOTAL':<12} {totals['wall_time_s'] * 1e3:>10.2f} {'':>10} {'':>10} {totals['output_bytes'] / 1024:>10.1f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(batch, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Tests para la aritmética sobre vectores de dígitos (core.aritmetica_digitos)
+y su uso en los generadores de operaciones.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import random
+
+import pytest
+import core.aritmetica_digitos as aritmetica
+from core.aritmetica_digitos import (
+    a_texto,
+    desde_entero,
+    desde_texto,
+    dividir,
+    linea_acarreos,
+    multiplicar,
+    operar,
+    restar,
+    sumar,
+)
+from core.conversion_enteros_grandes import entero_a_digitos
+from modules.numeracion.generators import ArithmeticOperationsExerciseGenerator, MultiBaseExerciseGenerator
+
+
+def _texto(n, base):
+    return entero_a_digitos(n, base, mayusculas=True)
+
+
+class TestConversion:
+    """Texto / entero ↔ vector de dígitos"""
+
+    def test_ida_y_vuelta(self):
+        assert list(desde_texto('1aF', 16)) == [15, 10, 1]
+        assert a_texto(desde_texto('000Zz', 36)) == 'ZZ'
+        assert a_texto(desde_entero(0, 7)) == '0'
+
+    def test_errores(self):
+        with pytest.raises(ValueError):
+            desde_texto('12', 2)
+        with pytest.raises(ValueError):
+            desde_texto('', 10)
+        with pytest.raises(ValueError):
+            desde_texto('1', 37)
+
+
+class TestOperaciones:
+    """Resultados frente a los enteros de Python"""
+
+    @pytest.mark.parametrize("base", [2, 3, 7, 10, 16, 36])
+    @pytest.mark.parametrize("traza", [False, True])
+    def test_aleatorio(self, base, traza):
+        rng = random.Random(base)
+        for _ in range(60):
+            x = rng.randrange(base ** rng.choice([1, 3, 20, 90]))
+            y = rng.randrange(1, base ** rng.choice([1, 2, 20, 70]))
+            assert sumar(x, y, base, traza).texto() == _texto(x + y, base)
+            assert multiplicar(x, y, base, traza).texto() == _texto(x * y, base)
+            if x >= y:
+                assert restar(x, y, base, traza).texto() == _texto(x - y, base)
+            cociente = dividir(x, y, base, traza)
+            assert (cociente.texto(), cociente.texto_resto()) == (_texto(x // y, base), _texto(x % y, base))
+
+    def test_karatsuba_igual_que_escolar(self, monkeypatch):
+        rng = random.Random(5)
+        x, y = rng.randrange(10 ** 700), rng.randrange(10 ** 300)
+        karatsuba = multiplicar(x, y, 10)
+        monkeypatch.setattr(aritmetica, 'KARATSUBA_UMBRAL', 10 ** 6)
+        assert multiplicar(x, y, 10) == karatsuba
+        assert karatsuba.texto() == str(x * y)
+
+    @pytest.mark.parametrize("base", [7, 10])
+    def test_division_grande_sin_traza(self, base):
+        # Sin traza no hay división larga dígito a dígito: divmod sobre int
+        rng = random.Random(47)
+        x, y = rng.randrange(base ** 10000), rng.randrange(base ** 4999, base ** 5000)
+        cociente = dividir(_texto(x, base), _texto(y, base), base)
+        assert cociente.pasos is None
+        assert (cociente.texto(), cociente.texto_resto()) == (_texto(x // y, base), _texto(x % y, base))
+
+    def test_errores(self):
+        with pytest.raises(ValueError):
+            restar('10', '11', 2)
+        with pytest.raises(ValueError):
+            dividir('10', '0', 2)
+        with pytest.raises(ValueError):
+            operar('1', '1', 2, 'power')
+
+
+class TestTrazas:
+    """Acarreos, préstamos y pasos"""
+
+    def test_suma(self):
+        resultado = operar('1011', '111', 2, 'add', traza=True)
+        assert resultado.texto() == '10010'
+        assert linea_acarreos(resultado) == '1111'
+        assert resultado.pasos[0] == {'posicion': 0, 'digito1': 1, 'digito2': 1, 'acarreo_entrada': 0,
+                                      'suma': 2, 'digito': 0, 'acarreo_salida': 1}
+
+    def test_resta(self):
+        resultado = operar('1000', '1', 2, 'subtract', traza=True)
+        assert resultado.texto() == '111'
+        assert linea_acarreos(resultado) == '0111'
+
+    def test_multiplicacion_y_division(self):
+        producto = operar('12', '13', 10, 'multiply', traza=True)
+        assert [(p['parcial'], p['acumulado']) for p in producto.pasos] == [('36', '36'), ('12', '156')]
+        assert linea_acarreos(producto) is None
+        division = operar('FF', '10', 16, 'divide', traza=True)
+        assert [(p['digito'], p['resto']) for p in division.pasos] == [(0, 'F'), (15, 'F')]
+
+
+class TestGeneradores:
+    """Los generadores calculan en la base con el motor"""
+
+    def test_operaciones(self):
+        generator = ArithmeticOperationsExerciseGenerator()
+        suma = generator.generate_from_problem({'base': 16, 'operation': 'add', 'operand1': 173, 'operand2': 29})
+        assert suma['problem'] == 'AD + 1D = ?' and suma['solution'] == 'CA' and suma['carries'] == '01'
+        division = generator.generate_from_problem({'base': 7, 'operation': 'divide', 'operand1': 173, 'operand2': 29})
+        assert division['solution'] == '5' and division['remainder'] == '40' and division['decimal_result'] == 5
+        grande = generator.generate_from_problem({'base': 2, 'operation': 'multiply',
+                                                  'operand1': 3 ** 2000, 'operand2': 7 ** 900})
+        assert grande['solution'] == _texto(3 ** 2000 * 7 ** 900, 2)
+        assert grande['steps'] is None
+
+    def test_multibase(self):
+        exercise = MultiBaseExerciseGenerator().generate_from_problem(
+            {'target_base': 2, 'operand1': 12, 'operand2': 5, 'operation': 'add'})
+        assert exercise['solution'] == '10001' and exercise['carries'] == '1100'
@@ -0,0 +1,208 @@
+"""
+Tests para los barridos de error vectorizados (core.barrido_errores).
+
+Comparan la ruta NumPy con la ruta Python valor a valor y con los métodos
+escalares existentes (decode/encode, FixedFormat).
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import math
+import random
+import pytest
+from core import barrido_errores
+from core.barrido_errores import (
+    SUMMARY_KEYS,
+    compare_formats,
+    error_many,
+    error_summary,
+    quantize_many,
+)
+from core.ieee754 import IEEE754Gen, ROUNDING_MODES
+from core.punto_fijo_comparator import FixedPointComparator
+from core.punto_fijo_con_signo import FixedPointSignedComplement
+from core.punto_fijo_raw import FixedPointOverflowError, fixed_format
+from core.punto_fijo_unified import FixedPointUnified
+from core.punto_flotante import FixedPointFloating
+from core.representation_validator import RepresentationValidator
+
+
+def _muestra(n=2000, semilla=7):
+    rng = random.Random(semilla)
+    return ([rng.uniform(-20, 20) for _ in range(n)]
+            + [rng.uniform(-1e-3, 1e-3) for _ in range(n // 10)] + [0.0])
+
+
+def _decimales(n=600, semilla=11):
+    """Literales decimales y empates: donde x · B^F en float64 cae a un ulp de la frontera."""
+    rng = random.Random(semilla)
+    literales = [float(f"{rng.randint(-99999, 99999)}e{rng.randint(-6, 1)}") for _ in range(n)]
+    empates = [k / 1000 + 0.0005 for k in range(-20000, 20000, 97)] + [k + 0.5 for k in range(-20, 20)]
+    return literales + empates + [2.55, -2.55, 17.225, -17.225, 1.005, 2.675, 0.001, 9.995]
+
+
+def _grandes(n=400, semilla=12):
+    """Muestras con |x · B^F| >= 2^53: el crudo ya no es un entero exacto en float64."""
+    rng = random.Random(semilla)
+    return ([rng.uniform(-1e18, 1e18) for _ in range(n)]
+            + [2.0 ** 53 + 2, -2.0 ** 60, 1e300, -1e300, 5e-324])
+
+
+FORMATOS = {
+    'sin_signo': FixedPointUnified(4, 4, signed=False),
+    'ms': FixedPointUnified(4, 4, signed=True, representation='ms'),
+    'complemento': FixedPointUnified(4, 4, signed=True, representation='complement'),
+    'complemento_b10': FixedPointUnified(2, 2, base=10, signed=True, representation='complement'),
+    'con_signo_clasico': FixedPointSignedComplement(3, 3),
+    'complemento_ancho': FixedPointUnified(56, 4, signed=True, representation='complement'),
+    'ms_ancho': FixedPointUnified(56, 4, signed=True, representation='ms'),
+    'flotante': FixedPointFloating(4, 3),
+    'flotante_b10': FixedPointFloating(3, 2, base=10),
+    'flotante_sin_signo': FixedPointFloating(4, 3, signed=False),
+    'ieee': IEEE754Gen(4, 3),
+}
+
+
+class TestRutas:
+    """NumPy y Python dan exactamente lo mismo."""
+
+    @pytest.mark.parametrize('nombre', sorted(FORMATOS))
+    @pytest.mark.parametrize('overflow', ['saturate', 'wrap'])
+    def test_numpy_igual_a_python(self, nombre, overflow, monkeypatch):
+        pytest.importorskip('numpy')
+        fmt, x = FORMATOS[nombre], _muestra() + _decimales() + _grandes()
+        for rounding in ROUNDING_MODES:
+            con_numpy = error_many(fmt, x, rounding, overflow)
+            monkeypatch.setattr(barrido_errores, 'HAS_NUMPY', False)
+            sin_numpy = error_many(fmt, x, rounding, overflow)
+            monkeypatch.setattr(barrido_errores, 'HAS_NUMPY', True)
+            for a, b in zip(con_numpy['quantized'].tolist(), sin_numpy['quantized']):
+                assert a == b or (math.isnan(a) and math.isnan(b))
+            assert con_numpy['overflow'].tolist() == sin_numpy['overflow']
+            assert con_numpy['underflow'].tolist() == sin_numpy['underflow']
+
+    @pytest.mark.parametrize('nombre', sorted(FORMATOS))
+    def test_no_finitos(self, nombre, monkeypatch):
+        pytest.importorskip('numpy')
+        fmt = FORMATOS[nombre]
+        for valor in (math.inf, -math.inf, math.nan):
+            for con_numpy in (True, False):
+                monkeypatch.setattr(barrido_errores, 'HAS_NUMPY', con_numpy)
+                if isinstance(fmt, IEEE754Gen):
+                    q = error_many(fmt, [1.0, valor])['quantized']
+                    assert math.isnan(q[1]) if math.isnan(valor) else q[1] == valor
+                else:
+                    with pytest.raises(ValueError, match="no finito"):
+                        error_many(fmt, [1.0, valor], overflow='wrap')
+
+    @pytest.mark.parametrize('rounding,esperado', [
+        ('toward_zero', [2.55, 17.22, 1.0]),
+        ('nearest_even', [2.55, 17.22, 1.0]),
+        ('nearest_away', [2.55, 17.23, 1.01]),
+    ])
+    def test_decimal_exacto_en_base_10(self, rounding, esperado, monkeypatch):
+        pytest.importorskip('numpy')
+        # 2.55 · 100 = 254.99999999999997 en float64; como decimal es 255 exacto
+        fmt = FixedPointUnified(3, 2, base=10, signed=True, representation='complement')
+        x = [2.55, 17.225, 1.005]
+        assert quantize_many(fmt, x, rounding).tolist() == esperado
+        assert [float(fmt.raw_format.to_decimal(fmt.raw_format.quantize(v, rounding))) for v in x] == esperado
+        flotante = FixedPointFloating(3, 2, base=10)
+        con_numpy = quantize_many(flotante, [17.225, 2.675], rounding).tolist()
+        monkeypatch.setattr(barrido_errores, 'HAS_NUMPY', False)
+        assert quantize_many(flotante, [17.225, 2.675], rounding) == con_numpy
+
+    def test_resumen_sin_numpy(self, monkeypatch):
+        monkeypatch.setattr(barrido_errores, 'HAS_NUMPY', False)
+        resumen = error_summary(FORMATOS['complemento'], [0.0, 1.03, -2.5, 100.0])
+        assert set(resumen) == set(SUMMARY_KEYS)
+        assert resumen['count'] == 3
+        assert resumen['overflow'] == 1
+        assert resumen['max_abs_error'] == pytest.approx(0.03 - 0.0)
+
+
+class TestPuntoFijo:
+    """Cuantización de punto fijo frente a FixedFormat."""
+
+    def test_igual_que_fixed_format(self):
+        fmt = fixed_format(4, 4, 2, 'complement')
+        x = [v for v in _muestra() if -16 <= v < 15.9]
+        q = list(quantize_many(FORMATOS['complemento'], x))
+        assert q == [fmt.to_float(fmt.from_value(v)) for v in x]
+
+    def test_error_maximo_medio_epsilon(self):
+        resumen = error_summary(FORMATOS['complemento'], [v for v in _muestra() if -16 <= v < 15.9])
+        assert 0 < resumen['max_abs_error'] <= 2 ** -5
+        assert resumen['mean_abs_error'] <= resumen['rms_abs_error'] <= resumen['max_abs_error']
+        assert resumen['overflow'] == 0
+
+    def test_overflow(self):
+        fp = FORMATOS['complemento']
+        columnas = error_many(fp, [20.0, -20.0, 1.0])
+        assert list(columnas['quantized']) == [15.9375, -16.0, 1.0]
+        assert list(columnas['overflow']) == [True, True, False]
+        assert list(quantize_many(fp, [17.0], overflow='wrap')) == [-15.0]
+        assert list(quantize_many(FORMATOS['ms'], [-17.0], overflow='wrap')) == [-1.0]
+        with pytest.raises(FixedPointOverflowError):
+            quantize_many(fp, [1.0, 20.0], overflow='raise')
+
+    def test_modos_invalidos(self):
+        with pytest.raises(ValueError, match="Modo de redondeo desconocido"):
+            quantize_many(FORMATOS['ms'], [1.0], rounding='hacia_arriba')
+        with pytest.raises(ValueError, match="Modo de desbordamiento desconocido"):
+            quantize_many(FORMATOS['ms'], [1.0], overflow='ignorar')
+        with pytest.raises(TypeError):
+            quantize_many(object(), [1.0])
+
+
+class TestPuntoFlotante:
+    """Cuantización de la mantisa en FixedPointFloating."""
+
+    def test_error_relativo_acotado_por_epsilon(self):
+        fp = FORMATOS['flotante']
+        resumen = fp.error_summary([v for v in _muestra() if 1 < abs(v) < 15])
+        assert resumen['overflow'] == resumen['underflow'] == 0
+        assert 0 < resumen['max_rel_error'] <= fp.relative_error(3.0) / 2
+
+    def test_acarreo_y_extremos(self):
+        fp = FORMATOS['flotante']  # F_M = 4, E en [-4, 3]
+        assert list(fp.quantize_many([1.96875, 1.03125, 0.0])) == [2.0, 1.0, 0.0]
+        columnas = fp.error_many([1000.0, 0.001, -1000.0])
+        assert list(columnas['quantized']) == [float(fp.max_value), 0.0, -float(fp.max_value)]
+        assert list(columnas['overflow']) == [True, False, True]
+        assert list(columnas['underflow']) == [False, True, False]
+
+    def test_sin_signo(self):
+        columnas = error_many(FORMATOS['flotante_sin_signo'], [-3.0, 3.0])
+        assert list(columnas['quantized']) == [0.0, 3.0]
+        assert list(columnas['overflow']) == [True, False]
+
+    def test_ieee_igual_que_encode(self):
+        ieee = FORMATOS['ieee']
+        x = _muestra(300)
+        esperado = [ieee.decode(*ieee.unpack(ieee.encode(v))) for v in x]
+        assert list(quantize_many(ieee, x)) == esperado
+
+
+class TestComparador:
+    """Varios formatos sobre la misma muestra."""
+
+    def test_compare_formats(self):
+        x = _muestra()
+        resultado = compare_formats(FORMATOS, x)
+        assert list(resultado) == list(FORMATOS)
+        for nombre, fmt in FORMATOS.items():
+            assert resultado[nombre] == error_summary(fmt, x)
+
+    def test_comparator_y_validador(self):
+        a, b = FORMATOS['complemento'], FORMATOS['ms']
+        x = _muestra(200)
+        resultado = FixedPointComparator().compare_errors([a, b], x)
+        assert set(resultado) == {str(a), str(b)}
+
+        informe = RepresentationValidator().compare_error_many(x, a, b)
+        assert informe['count'] == len(x)
+        assert sum(informe['wins'].values()) == len(x)
+        assert informe['fp1']['max_abs_error'] == resultado[str(a)]['max_abs_error']
@@ -0,0 +1,90 @@
+"""
+Tests para el benchmark de métodos de conversión
+(scripts/benchmark_metodos_conversion.py): concordancia de resultados,
+informe JSON y puerta de regresión.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import copy
+import json
+from importlib.util import module_from_spec, spec_from_file_location
+
+import pytest
+from core.numeracion_utils import base_b_a_decimal_con_polinomio
+
+_spec = spec_from_file_location("benchmark_metodos_conversion",
+                                Path(__file__).parent.parent / "scripts" / "benchmark_metodos_conversion.py")
+bench = module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+
+@pytest.fixture
+def rapido(monkeypatch):
+    """Una sola llamada por medición: los tiempos no importan en estos tests."""
+    monkeypatch.setattr(bench, 'MIN_MEDICION_S', 0.0)
+
+
+@pytest.fixture
+def informe(rapido):
+    return bench.build_report([5, 60], [2, 10, 36], repeat=1, max_cuadratico=60)
+
+
+class TestInforme:
+    """Todos los métodos coinciden y el informe es serializable"""
+
+    def test_sin_discrepancias(self, informe):
+        assert informe['discrepancias'] == []
+        assert {c['metodo'] for c in informe['casos']} == {m.nombre for m in bench.METODOS}
+        assert json.loads(json.dumps(informe))['parametros']['bases'] == [2, 10, 36]
+
+    def test_recomendados(self, informe):
+        nombres = {m.nombre: m for m in bench.METODOS}
+        for direccion, modos in informe['recomendados'].items():
+            for modo, por_tamano in modos.items():
+                assert set(por_tamano) == {'5', '60'}
+                for metodo in por_tamano.values():
+                    assert nombres[metodo].direccion == direccion
+                    assert nombres[metodo].verbose == (modo == 'verbose')
+
+    def test_metodo_incorrecto(self, rapido):
+        roto = bench.Metodo('roto', 'a_decimal', False, False, lambda texto, base: 0)
+        informe = bench.build_report([5], [2], repeat=1, metodos=[roto])
+        assert [c['metodo'] for c in informe['discrepancias']] == ['roto']
+        assert informe['recomendados'] == {}
+
+    def test_polinomio_corregido(self):
+        resultado = base_b_a_decimal_con_polinomio("1101", 2)
+        assert resultado['decimal'] == 13
+        assert resultado['polinomio_str'] == "1×2^3 + 1×2^2 + 0×2^1 + 1×2^0"
+        assert base_b_a_decimal_con_polinomio("1A", 16)['decimal'] == 26
+
+
+class TestPuerta:
+    """Regresiones por método frente a un informe anterior"""
+
+    def test_sin_cambios(self, informe):
+        assert bench.compare(informe, copy.deepcopy(informe)) == []
+
+    def test_metodo_mas_lento(self, informe):
+        actual = copy.deepcopy(informe)
+        for caso in actual['casos']:
+            if caso['metodo'] == 'base_B_a_decimal':
+                caso['segundos'] *= 2
+        regresiones = bench.compare(actual, informe, tolerancia=1.25)
+        assert [r['metodo'] for r in regresiones] == ['base_B_a_decimal']
+        assert regresiones[0]['factor'] == pytest.approx(2)
+        assert bench.compare(actual, informe, tolerancia=2.5) == []
+
+    def test_codigo_de_salida(self, rapido, tmp_path, capsys):
+        salida = tmp_path / "informe.json"
+        argumentos = ["--digits", "5", "--bases", "2", "--repeat", "1", "--json", str(salida)]
+        assert bench.main(argumentos) == 0
+        anterior = json.loads(salida.read_text(encoding="utf-8"))
+        for caso in anterior['casos']:
+            caso['segundos'] /= 100
+        salida.write_text(json.dumps(anterior), encoding="utf-8")
+        assert bench.main(argumentos[:-2] + ["--baseline", str(salida)]) == 1
+        assert "REGRESIÓN" in capsys.readouterr().out
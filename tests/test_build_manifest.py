@@ -0,0 +1,152 @@
+"""
+Tests para el renderizado incremental (BuildManifest + RendererPipeline).
+
+Verifica que las salidas sin cambios no se regeneran ni se reescriben.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import os
+from renderers.latex.main_renderer import LatexExamRenderer
+from renderers.latex.renderer_base import RendererPipeline, SimpleRendererPhase
+from renderers.latex.utils.build_manifest import BuildManifest
+
+
+class CountingPhase(SimpleRendererPhase):
+    """Fase que cuenta cuántas veces se ejecuta."""
+
+    def __init__(self, phase_name_str: str):
+        super().__init__(phase_name_str)
+        self.calls = 0
+
+    def render(self, exercise_json, is_solution=False):
+        self.calls += 1
+        return super().render(exercise_json, is_solution)
+
+
+def _pipeline(tmp_path):
+    pipeline = RendererPipeline("demo", output_dir=str(tmp_path))
+    pipeline.add_phase(CountingPhase("fase1")).add_phase(CountingPhase("fase2"))
+    return pipeline
+
+
+class TestBuildManifest:
+    """Tests del manifiesto."""
+
+    def test_escritura_y_omision(self, tmp_path):
+        out = tmp_path / "ej01.tex"
+        manifest = BuildManifest(tmp_path)
+        key = manifest.hash_input({"a": 1}, False)
+        assert not manifest.is_up_to_date(out, key, "v1")
+        assert manifest.write(out, "contenido", key, "v1")
+        manifest.save()
+
+        manifest = BuildManifest(tmp_path)
+        assert manifest.is_up_to_date(out, key, "v1")
+        assert not manifest.is_up_to_date(out, key, "v2")
+        assert not manifest.is_up_to_date(out, manifest.hash_input({"a": 2}, False), "v1")
+
+    def test_contenido_identico_no_reescribe(self, tmp_path):
+        out = tmp_path / "ej01.tex"
+        manifest = BuildManifest(tmp_path)
+        manifest.write(out, "contenido", "h1", "v1")
+        os.utime(out, (0, 0))
+        assert not manifest.write(out, "contenido", "h2", "v1")
+        assert out.stat().st_mtime == 0
+        assert manifest.report()["identical"] == [out.as_posix()]
+
+    def test_hash_estable(self):
+        assert BuildManifest.hash_input({"b": 1, "a": 2}) == BuildManifest.hash_input({"a": 2, "b": 1})
+
+    def test_prune_borra_salidas_obsoletas(self, tmp_path):
+        manifest = BuildManifest(tmp_path)
+        for i in (1, 2, 3):
+            manifest.write(tmp_path / f"ej{i:02d}.tex", f"ej{i}", "h", "v1", group="examen", order=i)
+        manifest.write(tmp_path / "otro.tex", "otro", "h", "v1")
+        removed = manifest.prune("examen", keep=[tmp_path / "ej01.tex", tmp_path / "ej02.tex"])
+        assert removed == [(tmp_path / "ej03.tex").as_posix()]
+        assert not (tmp_path / "ej03.tex").exists()
+        assert (tmp_path / "otro.tex").exists()
+        assert set(manifest.entries) == {(tmp_path / name).as_posix() for name in ("ej01.tex", "ej02.tex", "otro.tex")}
+        assert manifest.report()["removed"] == removed
+
+    def test_manifiesto_corrupto(self, tmp_path):
+        (tmp_path / BuildManifest.MANIFEST_FILENAME).write_text("{no json", encoding="utf-8")
+        assert BuildManifest(tmp_path).entries == {}
+
+
+class TestIncrementalPipeline:
+    """Tests del pipeline con manifiesto."""
+
+    def test_segunda_ejecucion_omite_fases(self, tmp_path):
+        exercise = {"title": "Demo"}
+        manifest = BuildManifest(tmp_path)
+        main_tex, files = _pipeline(tmp_path).render(exercise, manifest=manifest)
+        manifest.save()
+        assert files == ["fase1.tex", "fase2.tex"]
+        assert len(manifest.report()["rebuilt"]) == 2
+
+        for name in files:
+            os.utime(tmp_path / name, (0, 0))
+
+        pipeline = _pipeline(tmp_path)
+        manifest = BuildManifest(tmp_path)
+        main_tex2, files2 = pipeline.render(exercise, manifest=manifest)
+        assert main_tex2 == main_tex and files2 == files
+        assert all(phase.calls == 0 for phase in pipeline.phases)
+        assert len(manifest.report()["unchanged"]) == 2
+        assert all((tmp_path / name).stat().st_mtime == 0 for name in files)
+
+    def test_cambio_de_entrada_regenera(self, tmp_path):
+        manifest = BuildManifest(tmp_path)
+        _pipeline(tmp_path).render({"title": "A"}, manifest=manifest)
+
+        pipeline = _pipeline(tmp_path)
+        pipeline.render({"title": "B"}, manifest=manifest)
+        assert all(phase.calls == 1 for phase in pipeline.phases)
+        assert "B" in (tmp_path / "fase1.tex").read_text(encoding="utf-8")
+
+    def test_cambio_de_version_regenera(self, tmp_path):
+        manifest = BuildManifest(tmp_path)
+        _pipeline(tmp_path).render({"title": "A"}, manifest=manifest)
+
+        pipeline = _pipeline(tmp_path)
+        pipeline.phases[1].renderer_version = "2"
+        pipeline.render({"title": "A"}, manifest=manifest)
+        assert pipeline.phases[0].calls == 1
+
+    def test_fase_eliminada_no_bloquea_la_cache(self, tmp_path):
+        manifest = BuildManifest(tmp_path)
+        _pipeline(tmp_path).render({"title": "A"}, manifest=manifest)
+
+        pipeline = RendererPipeline("demo", output_dir=str(tmp_path)).add_phase(CountingPhase("fase1"))
+        pipeline.render({"title": "A"}, manifest=manifest)
+        assert not (tmp_path / "fase2.tex").exists()
+
+        pipeline = RendererPipeline("demo", output_dir=str(tmp_path)).add_phase(CountingPhase("fase1"))
+        pipeline.render({"title": "A"}, manifest=manifest)
+        assert pipeline.cached and pipeline.phases[0].calls == 0
+
+
+class TestIncrementalExam:
+    """Tests del examen renderizado por ejercicios."""
+
+    def test_ejercicios_eliminados_se_borran(self, tmp_path):
+        output_file = str(tmp_path / "Examen.tex")
+        parts = tmp_path / "Examen_ejercicios"
+        renderer = LatexExamRenderer()
+
+        manifest = BuildManifest(tmp_path)
+        renderer.render_incremental(["a", "b", "c"], [{"n": 1}, {"n": 2}, {"n": 3}], output_file, manifest)
+        manifest.save()
+        assert sorted(p.name for p in parts.iterdir()) == ["ej01.tex", "ej02.tex", "ej03.tex"]
+
+        manifest = BuildManifest(tmp_path)
+        renderer.render_incremental(["a", "b"], [{"n": 1}, {"n": 2}], output_file, manifest)
+        manifest.save()
+        assert sorted(p.name for p in parts.iterdir()) == ["ej01.tex", "ej02.tex"]
+        assert manifest.report()["removed"] == [(parts / "ej03.tex").as_posix()]
+        assert len(manifest.report()["unchanged"]) == 2
+        assert (parts / "ej03.tex").as_posix() not in BuildManifest(tmp_path).entries
@@ -0,0 +1,137 @@
+"""
+Tests para el análisis memorizado de capacidad, longitud y unicidad
+(core.capacidad_representacion), su uso en core.sistemas_numeracion_basicos
+y el benchmark scripts/benchmark_capacidad.py.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+from importlib.util import module_from_spec, spec_from_file_location
+
+import pytest
+import core.capacidad_representacion as capacidad
+from core.capacidad_representacion import (
+    MAX_EXPONENTE_TABLA,
+    analisis,
+    longitud,
+    potencia,
+    tabla_potencias,
+    unicidad_posicional,
+    unicidad_romana,
+)
+from core.sistemas_numeracion_basicos import (
+    analisis_representacion,
+    capacidad_representacion,
+    comparar_sistemas,
+    demostrar_unicidad,
+    longitud_representacion,
+    rango_representacion,
+)
+
+_spec = spec_from_file_location("benchmark_capacidad",
+                                Path(__file__).parent.parent / "scripts" / "benchmark_capacidad.py")
+bench = module_from_spec(_spec)
+_spec.loader.exec_module(bench)
+
+
+class TestLongitud:
+
+    def test_extremos_de_cada_longitud(self):
+        for base in range(2, 37):
+            for n in range(1, 65):
+                assert longitud(base ** (n - 1), base) == n
+                assert longitud(base ** n - 1, base) == n
+
+    def test_casos_donde_el_logaritmo_falla(self):
+        # math.log(1000, 10) = 2.9999999999999996
+        assert longitud_representacion(1000, 10) == 4
+        assert longitud_representacion(10 ** 15, 10) == 16
+        assert longitud_representacion(3 ** 5, 3) == 6
+
+    def test_numeros_fuera_de_la_tabla(self):
+        for base in (2, 7, 10, 36):
+            n = 5 * MAX_EXPONENTE_TABLA
+            assert longitud(base ** n, base) == n + 1
+            assert longitud(base ** n - 1, base) == n
+
+    def test_errores(self):
+        with pytest.raises(ValueError, match="positivo"):
+            longitud_representacion(0, 10)
+        with pytest.raises(ValueError, match="base"):
+            longitud_representacion(5, 1)
+
+
+class TestAnalisisMemorizado:
+
+    def test_tabla_de_potencias_por_base(self):
+        assert tabla_potencias(7) is tabla_potencias(7)
+        assert len(tabla_potencias(7)) == MAX_EXPONENTE_TABLA + 1
+        assert potencia(7, 20) == 7 ** 20
+        assert potencia(7, MAX_EXPONENTE_TABLA + 3) == 7 ** (MAX_EXPONENTE_TABLA + 3)
+        assert capacidad_representacion(16, 2) == 256
+        assert rango_representacion(2, 8) == (0, 255)
+
+    def test_mismo_resultado_que_antes(self):
+        resultado = analisis_representacion(1994, 5, longitud=5)
+        assert resultado['capacidad'] == 3125
+        assert resultado['rango'] == '[0, 3124]'
+        assert resultado['en_rango'] is True
+        assert resultado['fórmula_rango_máximo'] == '5^5 - 1 = 3124'
+        assert analisis_representacion(1994, 5, longitud=4)['en_rango'] is False
+        assert analisis_representacion(255, 2)['longitud_fija'] == 8
+
+    def test_memorizado_y_sin_compartir_el_diccionario(self):
+        capacidad.limpiar_caches()
+        primero = analisis(10 ** 40, 3)
+        primero['capacidad'] = None
+        segundo = analisis(10 ** 40, 3)
+        assert segundo['capacidad'] == 3 ** segundo['longitud_fija']
+        assert capacidad._analisis.cache_info().hits == 1
+
+
+class TestUnicidad:
+
+    @pytest.mark.parametrize('base,n', [(2, 8), (3, 5), (10, 4), (36, 2)])
+    def test_enumeracion_y_conteo_coinciden(self, base, n):
+        enumeracion = unicidad_posicional(base, n)
+        conteo = unicidad_posicional(base, n, umbral=0)
+        assert enumeracion['metodo'] == 'enumeracion' and conteo['metodo'] == 'conteo'
+        assert enumeracion['unica'] and conteo['unica']
+        assert enumeracion['valores'] == conteo['valores'] == base ** n
+
+    def test_espacios_grandes_por_conteo(self):
+        resultado = unicidad_posicional(36, 64)
+        assert resultado['metodo'] == 'conteo'
+        assert resultado['unica']
+        assert resultado['cadenas'] == 36 ** 64
+
+    def test_romanos(self):
+        assert unicidad_romana() == {'unica': True, 'metodo': 'conteo', 'cadenas': 3999, 'valores': 3999}
+
+    def test_demostrar_unicidad(self):
+        resultado = demostrar_unicidad()
+        assert all(e['verificacion']['romano_inverso'] for e in resultado['ejemplos'])
+        assert all(p['unica'] for p in resultado['posicional'])
+        assert resultado['romano']['unica']
+
+    def test_comparar_sistemas(self):
+        sistemas = comparar_sistemas(27)['sistemas']
+        assert sistemas['romano']['representacion'] == 'XXVII'
+        assert sistemas['base_5']['representacion'] == '102'
+
+
+class TestBenchmark:
+
+    def test_informe(self, tmp_path):
+        salida = tmp_path / "capacidad.json"
+        codigo = bench.main(['--bases', '2', '10', '36', '--max-longitud', '12',
+                             '--max-enumeracion', '4096', '--json', str(salida)])
+        assert codigo == 0
+        informe = json.loads(salida.read_text(encoding="utf-8"))
+        assert informe['errores_exacto'] == 0
+        assert informe['errores_legado'] > 0  # El logaritmo en coma flotante falla en algún extremo
+        assert [r['base'] for r in informe['bases']] == [2, 10, 36]
+        assert informe['no_unicas'] == []
@@ -0,0 +1,120 @@
+"""
+Tests para el registro de códigos compilados a tablas (core.codigos) y las
+funciones que lo usan (biquinarios, Johnson y Gray).
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+from core import codigos as modulo_codigos
+from core.biquinarios import Biquinary5Bit, Biquinary6Bit, Biquinary7Bit
+from core.codigos import codigo, codigos_registrados, gray, johnson, registrar_codigo
+from core.sistemas_numeracion_basicos import (
+    CODIGO_BIQUINARIO,
+    CODIGO_GRAY_4BITS,
+    CODIGO_JOHNSON,
+    biquinario_a_entero,
+    entero_a_gray_4bits,
+    gray_4bits_a_entero,
+    johnson_a_entero,
+)
+
+
+class TestTablas:
+    """Contenido de las tablas compiladas"""
+
+    def test_bcd(self):
+        assert codigo('bcd8421').codigos == tuple(range(10))
+        assert codigo('bcd2421').encode_bits('59') == '1011 1111'
+        assert codigo('xs3').encode_bits('1995') == '0100 1100 1100 1000'
+
+    @pytest.mark.parametrize("clase, nombre", [
+        (Biquinary5Bit, 'biquinario5'),
+        (Biquinary6Bit, 'biquinario6'),
+        (Biquinary7Bit, 'biquinario7'),
+    ])
+    def test_biquinarios_coinciden_con_generador(self, clase, nombre):
+        generador = clase()
+        assert codigo(nombre).codigos == tuple(generador.encode(d) for d in range(10))
+
+    def test_tablas_de_sistemas_basicos(self):
+        assert codigo('2entre5').encode_bits(range(10)).split() == [CODIGO_BIQUINARIO[d] for d in range(10)]
+        assert codigo('johnson5').encode_bits(range(10)).split() == [CODIGO_JOHNSON[d] for d in range(10)]
+        assert codigo('gray4').encode_bits(range(16)).split() == [CODIGO_GRAY_4BITS[d] for d in range(16)]
+
+    def test_gray_y_johnson_cualquier_ancho(self):
+        for ancho in (3, 8, 16, 17, 40):
+            g = gray(ancho)
+            for n in (0, 1, 5, (1 << ancho) - 1):
+                c = g.encode(n)
+                assert g.decode(c) == n
+                assert bin(c ^ g.encode(max(n - 1, 0))).count('1') <= 1
+        for ancho in (2, 5, 16, 30):
+            j = johnson(ancho)
+            assert j.decode_many(j.encode_many(range(2 * ancho))) == list(range(2 * ancho))
+            assert j.invalid_positions([0b101, 0]) == [0]
+
+    def test_registro(self, monkeypatch):
+        monkeypatch.setattr(modulo_codigos, '_REGISTRO', dict(modulo_codigos._REGISTRO))
+        assert codigo('gray12') is codigo('gray12')
+        assert 'xs3' in codigos_registrados()
+        registrar_codigo('test_paridad', 2, [0b00, 0b11])
+        assert codigo('test_paridad').decode_bits('11 00') == [1, 0]
+        with pytest.raises(ValueError):
+            registrar_codigo('xs3', 4, range(10))
+        with pytest.raises(ValueError):
+            codigo('desconocido')
+
+
+class TestLotes:
+    """Codificación y decodificación de cadenas y buffers completos"""
+
+    def test_cadena_y_buffer(self):
+        xs3 = codigo('xs3')
+        buffer = xs3.encode_bytes('0123456789' * 100)
+        assert len(buffer) == 1000
+        assert xs3.decode_string(buffer) == '0123456789' * 100
+        assert xs3.decode_many(bytearray(buffer[:3])) == [0, 1, 2]
+        assert xs3.decode_string(list(buffer[:3])) == '012'
+
+    def test_errores_con_posicion(self):
+        bcd = codigo('bcd8421')
+        with pytest.raises(ValueError, match="posición 2"):
+            bcd.encode_many('12A4')
+        with pytest.raises(ValueError, match="posición 1"):
+            bcd.decode_many(b'\x01\x0c')
+        with pytest.raises(ValueError, match="posición 1"):
+            bcd.decode_many([1, 12])
+
+    @pytest.mark.parametrize("usar_numpy", [True, False])
+    def test_invalidos_vectorizado(self, monkeypatch, usar_numpy):
+        if usar_numpy and not modulo_codigos.HAS_NUMPY:
+            pytest.skip("NumPy no disponible")
+        monkeypatch.setattr(modulo_codigos, 'HAS_NUMPY', usar_numpy)
+        bcd = codigo('bcd2421')
+        assert bcd.invalid_positions([0, 5, 11, 7, 16, -1]) == [1, 3, 4, 5]
+        assert bcd.invalid_positions(bytes([0, 5, 15, 10])) == [1, 3]
+
+
+class TestUsuarios:
+    """BiquinaryGen y las funciones de sistemas_numeracion_basicos"""
+
+    def test_biquinary_numeros(self):
+        bq = Biquinary7Bit()
+        codes = bq.encode_number('31415')
+        assert codes == [bq.encode(int(d)) for d in '31415']
+        assert bq.decode_number(codes) == '31415'
+        assert bq.decode_number(bytes(codes)) == '31415'
+        with pytest.raises(ValueError):
+            bq.encode_number('12A45')
+
+    def test_funciones_basicas(self):
+        assert [biquinario_a_entero(CODIGO_BIQUINARIO[d]) for d in range(10)] == list(range(10))
+        assert [johnson_a_entero(CODIGO_JOHNSON[d]) for d in range(10)] == list(range(10))
+        assert all(gray_4bits_a_entero(entero_a_gray_4bits(v)) == v for v in range(16))
+        with pytest.raises(ValueError, match="exactamente 2"):
+            biquinario_a_entero('11100')
+        with pytest.raises(ValueError, match="Johnson inválido"):
+            johnson_a_entero('01010')
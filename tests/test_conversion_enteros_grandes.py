@@ -0,0 +1,117 @@
+"""
+Tests para la conversión divide y vencerás de enteros grandes entre bases.
+
+Compara con los métodos clásicos y con las funciones de
+sistemas_numeracion_basicos / numeracion_utils que la usan.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import random
+import pytest
+from core.conversion_enteros_grandes import (
+    HOJA,
+    digitos_a_entero,
+    entero_a_digitos,
+    primer_digito_invalido,
+)
+from core.numeracion_utils import (
+    MAX_DIGITOS_PASOS_HORNER,
+    base_b_a_decimal_con_horner,
+    base_b_a_decimal_simple,
+    decimal_a_base_b_divisiones,
+)
+from core.sistemas_numeracion_basicos import base_B_a_decimal, decimal_a_base_B
+
+
+def _clasico(numero, base):
+    digitos = "0123456789abcdefghijklmnopqrstuvwxyz"
+    resultado = []
+    while numero > 0:
+        resultado.append(digitos[numero % base])
+        numero //= base
+    return ''.join(reversed(resultado)) or "0"
+
+
+class TestMotor:
+    """Tests de entero_a_digitos / digitos_a_entero."""
+
+    def test_ida_y_vuelta_aleatoria(self):
+        rng = random.Random(31)
+        for _ in range(200):
+            base = rng.randint(2, 36)
+            numero = rng.getrandbits(rng.randint(0, 6000))
+            texto = entero_a_digitos(numero, base)
+            assert texto == _clasico(numero, base)
+            assert digitos_a_entero(texto, base) == numero
+            assert digitos_a_entero(texto.upper(), base) == numero
+
+    def test_fronteras_del_arbol(self):
+        """Potencias exactas y vecinos en los cortes de las hojas"""
+        for base in (3, 10, 36):
+            for exponente in (HOJA - 1, HOJA, HOJA + 1, 2 * HOJA, 4 * HOJA + 3):
+                for numero in (base ** exponente - 1, base ** exponente, base ** exponente + 1):
+                    texto = entero_a_digitos(numero, base)
+                    assert texto == _clasico(numero, base)
+                    assert digitos_a_entero(texto, base) == numero
+
+    def test_ceros_a_la_izquierda(self):
+        assert digitos_a_entero("0" * 1000 + "1", 7) == 1
+
+    def test_mayusculas(self):
+        assert entero_a_digitos(255, 16, mayusculas=True) == "FF"
+        assert entero_a_digitos(100, 36, mayusculas=True) == "2S"
+
+    def test_errores(self):
+        with pytest.raises(ValueError):
+            entero_a_digitos(10, 37)
+        with pytest.raises(ValueError):
+            entero_a_digitos(-1, 10)
+        with pytest.raises(ValueError):
+            digitos_a_entero("", 10)
+        with pytest.raises(ValueError):
+            digitos_a_entero("12a", 10)
+
+    def test_primer_digito_invalido(self):
+        assert primer_digito_invalido("1f", 16) is None
+        assert primer_digito_invalido("1gh", 16) == "g"
+        assert primer_digito_invalido("1gh", 16, desde_derecha=True) == "h"
+
+
+class TestFuncionesExistentes:
+    """Las funciones públicas conservan su formato y mensajes."""
+
+    def test_sistemas_numeracion_basicos(self):
+        assert decimal_a_base_B(1994, 5) == "30434"
+        assert decimal_a_base_B(255, 16) == "ff"
+        assert base_B_a_decimal("FF", 16) == 255
+        with pytest.raises(ValueError, match="Dígito 'g' inválido para base 16"):
+            base_B_a_decimal("1g", 16)
+
+    def test_numeracion_utils(self):
+        assert decimal_a_base_b_divisiones(173, 2) == "10101101₂"
+        assert decimal_a_base_b_divisiones(100, 36) == "2S₃₆"
+        assert decimal_a_base_b_divisiones(5, 2, bits=8) == "00000101₂"
+        assert base_b_a_decimal_simple("377", 8) == 255
+        with pytest.raises(ValueError, match="'G' no es un dígito válido en base 16"):
+            base_b_a_decimal_simple("1G", 16)
+
+    def test_numeros_de_miles_de_digitos(self):
+        """Más dígitos que el límite de int()/str() en base 10"""
+        texto = "9" * 20000
+        numero = 10 ** 20000 - 1
+        assert base_B_a_decimal(texto, 10) == numero
+        assert decimal_a_base_B(numero, 10) == texto
+        assert decimal_a_base_b_divisiones(texto, 10) == texto + "₁₀"
+
+    def test_horner(self):
+        resultado = base_b_a_decimal_con_horner("1101", 2)
+        assert resultado['decimal'] == 13
+        assert len(resultado['pasos_horner']) == 4
+
+        largo = "7" * (MAX_DIGITOS_PASOS_HORNER + 1)
+        resultado = base_b_a_decimal_con_horner(largo, 8)
+        assert resultado['decimal'] == 8 ** len(largo) - 1
+        assert resultado['pasos_horner'] == []
@@ -0,0 +1,104 @@
+"""
+Tests para la conversión por lotes (core.conversion_lotes).
+
+Verifica rangos/NR de cada formato, la equivalencia NumPy ↔ Python puro y
+que los generadores por lotes producen lo mismo que fila a fila.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import random
+import pytest
+from core.conversion_lotes import (
+    FORMATOS_LOTE,
+    HAS_NUMPY,
+    NR,
+    UMBRAL_NUMPY,
+    convertir_a_bases,
+    convertir_lote,
+)
+from modules.numeracion.generators import (
+    ConversionRowRandomizer,
+    MultiBaseExerciseGenerator,
+)
+
+
+class TestConvertirLote:
+    """Tests de formatos y rangos."""
+
+    def test_ejemplo(self):
+        resultado = convertir_lote([5, -3, 200], n_bits=8, formatos=('bin', 'c2', 'bcd'))
+        assert resultado == {
+            'bin': ['00000101', NR, '11001000'],
+            'c2': ['00000101', '11111101', NR],
+            'bcd': ['0000 0101', NR, NR],
+        }
+
+    def test_signados(self):
+        resultado = convertir_lote([-5, -128, 127], n_bits=8, formatos=('sm', 'c1', 'c2', 'exceso'))
+        assert resultado['sm'] == ['10000101', NR, '01111111']
+        assert resultado['c1'] == ['11111010', NR, '01111111']
+        assert resultado['c2'] == ['11111011', '10000000', '01111111']
+        assert resultado['exceso'] == ['01111011', '00000000', '11111111']
+
+    def test_exceso_k(self):
+        assert convertir_lote([-3, 0, 13], n_bits=4, formatos=('exceso',), K=3)['exceso'] == ['0000', '0011', NR]
+
+    def test_octal_hexadecimal(self):
+        resultado = convertir_lote([0, 255, -1], formatos=('oct', 'hex'))
+        assert resultado['oct'] == ['0', '377', NR]
+        assert resultado['hex'] == ['0', 'FF', NR]
+
+    def test_bcd_sin_digitos(self):
+        # Menos de 4 bits: ningún valor es representable, por encima y por debajo de UMBRAL_NUMPY
+        for n in (5, UMBRAL_NUMPY + 44):
+            for n_bits in (1, 2, 3):
+                assert convertir_lote(range(n), n_bits=n_bits, formatos=('bcd',))['bcd'] == [NR] * n
+
+    def test_formato_desconocido(self):
+        with pytest.raises(ValueError):
+            convertir_lote([1], formatos=('base64',))
+
+    @pytest.mark.skipif(not HAS_NUMPY, reason="NumPy no instalado")
+    @pytest.mark.parametrize("n_bits", [1, 3, 4, 7, 8, 16, 33])
+    def test_numpy_igual_a_python(self, n_bits):
+        rng = random.Random(n_bits)
+        valores = [rng.randint(-2 ** n_bits, 2 ** n_bits) for _ in range(1000)]
+        valores += [0, -1, 2 ** (n_bits - 1), -2 ** (n_bits - 1)]
+        vectorizado = convertir_lote(valores, n_bits, usar_numpy=True)
+        puro = convertir_lote(valores, n_bits, usar_numpy=False)
+        for formato in FORMATOS_LOTE:
+            assert vectorizado[formato] == puro[formato]
+
+    def test_convertir_a_bases(self):
+        assert convertir_a_bases([255, -10], (2, 8, 10, 16, 36)) == {
+            2: ['11111111', '-1010'],
+            8: ['377', '-12'],
+            10: ['255', '-10'],
+            16: ['FF', '-A'],
+            36: ['73', '-A'],
+        }
+
+
+class TestGeneradoresPorLotes:
+    """La tabla completa coincide con la generación fila a fila."""
+
+    def test_randomize_many_reproduce_secuencia(self):
+        randomizer = ConversionRowRandomizer()
+        uno_a_uno = [randomizer.randomize(seed=7)] + [randomizer.randomize() for _ in range(5)]
+        assert randomizer.randomize_many(6, seed=7) == uno_a_uno
+
+    def test_multibase_generate_many(self):
+        generator = MultiBaseExerciseGenerator()
+        problems = [
+            {'target_base': 2, 'operand1': 12, 'operand2': 5, 'operation': 'add'},
+            {'target_base': 16, 'operand1': 200, 'operand2': 100, 'operation': 'multiply'},
+            {'target_base': 8, 'operand1': 10, 'operand2': 50, 'operation': 'subtract'},
+        ]
+        batch = generator.generate_many(problems)
+        assert batch == [generator.generate_from_problem(p) for p in problems]
+        assert batch[0]['problem'] == '1100 + 101 = ?' and batch[0]['solution'] == '10001'
+        assert batch[1]['solution'] == '4E20'
+        assert batch[2]['solution'] == '0'
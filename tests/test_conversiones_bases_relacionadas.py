@@ -0,0 +1,106 @@
+"""
+Tests para la conversión entre bases relacionadas con tablas de grupos
+(core.conversiones_bases_relacionadas) y base_B_a_base_B_prima_potencias.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import random
+import types
+
+import pytest
+from core.conversion_enteros_grandes import ALFABETO_MAYUSCULAS, entero_a_digitos
+from core.conversiones_bases_relacionadas import (
+    convertir_bases_relacionadas,
+    encontrar_base_primitiva,
+    tabla_grupos,
+)
+from core.sistemas_numeracion_basicos import base_B_a_base_B_prima_potencias
+
+PARES = [(2, 16), (16, 2), (16, 8), (8, 16), (2, 32), (32, 8), (16, 32), (4, 16),
+         (16, 4), (3, 27), (27, 9), (9, 27), (5, 25), (36, 6), (6, 36)]
+
+
+def _aleatorio(rng, base, n):
+    return ''.join(rng.choices(ALFABETO_MAYUSCULAS[:base], k=n))
+
+
+class TestBasePrimitiva:
+    """Detección general de B, l y k"""
+
+    def test_pares(self):
+        assert encontrar_base_primitiva(2, 16) == (2, 1, 4)
+        assert encontrar_base_primitiva(32, 8) == (2, 5, 3)
+        assert encontrar_base_primitiva(36, 6) == (6, 2, 1)
+        assert encontrar_base_primitiva(27, 9) == (3, 3, 2)
+        assert encontrar_base_primitiva(10, 16) is None
+        assert encontrar_base_primitiva(6, 12) is None
+
+
+class TestTablaGrupos:
+    """Conversión lineal por tablas"""
+
+    @pytest.mark.parametrize("base_origen, base_destino", PARES)
+    def test_valor_aleatorio(self, base_origen, base_destino):
+        rng = random.Random(base_origen * 100 + base_destino)
+        tabla = tabla_grupos(base_origen, base_destino)
+        for n in (1, 2, 3, 7, 64, 1001, 20000):
+            numero = _aleatorio(rng, base_origen, n)
+            resultado = tabla.convertir(numero)
+            # La expansión conserva los ceros: ceil(n·l / k) dígitos
+            assert len(resultado) == -(-n * tabla.l // tabla.k)
+            if n <= 1001:
+                esperado = entero_a_digitos(int(numero, base_origen), base_destino, mayusculas=True)
+                assert resultado.lstrip('0') == esperado.lstrip('0')
+
+    def test_bloques_equivalen_a_una_pasada(self):
+        rng = random.Random(42)
+        numero = _aleatorio(rng, 16, 1000)
+        tabla = tabla_grupos(16, 8)
+        completo = tabla.convertir(numero)
+        for bloque in (1, 3, 10, 999):
+            assert ''.join(tabla.iterar(numero, bloque)) == completo
+
+    def test_minusculas_y_errores(self):
+        assert tabla_grupos(16, 2).convertir('fF') == '11111111'
+        with pytest.raises(ValueError):
+            tabla_grupos(16, 2).convertir('1G')
+        with pytest.raises(ValueError):
+            tabla_grupos(10, 16)
+
+    def test_pasos_perezosos(self):
+        pasos = tabla_grupos(2, 16).pasos('11111010')
+        assert isinstance(pasos, types.GeneratorType)
+        lista = list(pasos)
+        assert lista[2]['grupos'] == [list('1111'), list('1010')]
+        assert [p['dígito_destino'] for p in lista[3:]] == ['F', 'A']
+
+
+class TestFuncionesExistentes:
+    """convertir_bases_relacionadas y base_B_a_base_B_prima_potencias"""
+
+    def test_convertir_bases_relacionadas(self):
+        resultado = convertir_bases_relacionadas('11111010', 2, 16, verbose=True)
+        assert resultado['resultado'] == 'FA'
+        assert resultado['gcd_exponentes'] == 1 and resultado['k_prima'] == 4
+        assert resultado['pasos'][0]['paso'] == 'inicializacion'
+        assert convertir_bases_relacionadas('777', 8, 16)['resultado'] == '1FF'
+        assert convertir_bases_relacionadas('1A', 16, 2)['resultado'] == '00011010'
+
+    def test_base_comun_con_gcd_mayor_que_uno(self):
+        # 4 = 2^2 y 16 = 2^4: m = 2, la base común es 4
+        assert convertir_bases_relacionadas('33', 4, 16)['resultado'] == 'F'
+        assert convertir_bases_relacionadas('F', 16, 4)['resultado'] == '33'
+
+    @pytest.mark.parametrize("numero, base, origen, destino, esperado", [
+        ("11111111", 2, 1, 4, "ff"),
+        ("ff", 2, 4, 1, "11111111"),
+        ("1111", 2, 1, 3, "17"),
+        ("010021002", 3, 1, 3, "372"),
+        ("1a", 2, 4, 1, "00011010"),
+        ("123", 2, 3, 4, "053"),
+    ])
+    def test_potencias(self, numero, base, origen, destino, esperado):
+        assert base_B_a_base_B_prima_potencias(numero, base, origen, destino) == esperado
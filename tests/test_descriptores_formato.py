@@ -0,0 +1,119 @@
+"""
+Tests para los descriptores de formato compartidos (core.descriptores_formato)
+y su uso en IEEE754Gen, FixedPoint, FixedPointUnified y RepresentationValidator.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from collections import Counter
+from fractions import Fraction
+
+import pytest
+from core.descriptores_formato import (
+    MAX_DESCRIPTORS,
+    cache_info,
+    descriptor_of,
+    format_descriptor,
+)
+from core.ieee754 import CODE_CLASSES, IEEE754Gen
+from core.punto_fijo import FixedPoint
+from core.punto_fijo_unified import FixedPointUnified
+from core.representation_validator import RepresentationValidator
+
+
+class TestInternado:
+    """Un descriptor por formato, en una LRU acotada"""
+
+    def test_mismo_objeto(self):
+        d = format_descriptor('ieee754', 8, 23)
+        assert format_descriptor('ieee754', E=8, F=23, base=2) is d
+        assert IEEE754Gen(8, 23).descriptor is IEEE754Gen(E_bits=8, F_bits=23).descriptor is d
+        assert format_descriptor('fixed', 4, 4) is format_descriptor('fixed', 4, 4, 2, 'unsigned')
+        assert FixedPoint(4, 4, 2).descriptor is FixedPointUnified(4, 4, 2).descriptor
+
+    def test_lru_acotada(self):
+        assert cache_info().maxsize == MAX_DESCRIPTORS
+
+    def test_calculo_unico(self):
+        d = format_descriptor('ieee754', 15, 112)
+        assert d.max_positive is d.max_positive
+        assert IEEE754Gen(15, 112).max_positive is d.max_positive
+
+    def test_errores(self):
+        with pytest.raises(ValueError):
+            format_descriptor('decimal', 4, 4)
+        with pytest.raises(ValueError):
+            format_descriptor('fixed', 4, 4, 2, 'excess')
+        with pytest.raises(ValueError):
+            format_descriptor('ieee754', 0, 4)
+        with pytest.raises(ValueError):
+            format_descriptor('fixed', 4, 4, 1)
+
+
+class TestCaracteristicas:
+    """Valores exactos de los descriptores"""
+
+    @pytest.mark.parametrize("E, F, base", [(3, 2, 2), (4, 3, 2), (2, 2, 3), (2, 1, 10)])
+    def test_recuentos_ieee_coinciden_con_enumeracion(self, E, F, base):
+        d = format_descriptor('ieee754', E, F, base)
+        clases = Counter(IEEE754Gen(E, F, base).enumerate_codes()['class'])
+        conteo = {nombre: clases[i] for i, nombre in enumerate(CODE_CLASSES)}
+        assert conteo['normal'] == 2 * d.normal_count
+        assert conteo['subnormal'] == 2 * d.subnormal_count
+        assert conteo['qNaN'] + conteo['sNaN'] == 2 * d.nan_count
+
+    def test_binary32(self):
+        d = format_descriptor('ieee754', 8, 23)
+        assert d.min_positive == Fraction(1, 2 ** 149)
+        assert d.max_positive == (2 - Fraction(1, 2 ** 23)) * 2 ** 127
+        assert d.min_normal == Fraction(1, 2 ** 126)
+        caracteristicas = d.characteristics()
+        assert caracteristicas['E_min'] == -126 and caracteristicas['total_bits'] == 32
+        caracteristicas['E_min'] = 0
+        assert d.characteristics()['E_min'] == -126
+
+    def test_fuera_de_float_sin_magnitudes(self):
+        d = format_descriptor('ieee754', 26, 23)
+        assert not d.fits_float
+        with pytest.raises(ValueError, match="no cabe en float"):
+            d.characteristics()
+        # Las magnitudes exactas (megabytes) no quedan guardadas en el descriptor
+        assert 'max_positive' not in vars(d) and 'min_positive' not in vars(d)
+        assert not format_descriptor('ieee754', 10 ** 6, 1).fits_float
+        assert format_descriptor('ieee754', 11, 52).fits_float
+
+    @pytest.mark.parametrize("representation, rango", [
+        ('unsigned', (0, 255)),
+        ('ms', (-255, 255)),
+        ('complement', (-256, 255)),
+    ])
+    def test_punto_fijo(self, representation, rango):
+        d = format_descriptor('fixed', 4, 4, 2, representation)
+        assert d.raw_range == rango
+        assert d.value_range == (Fraction(rango[0], 16), Fraction(rango[1], 16))
+        assert d.value_count == rango[1] - rango[0] + 1
+
+
+class TestUsuarios:
+    """Clases de formato y validador sobre el descriptor"""
+
+    def test_clases(self):
+        fp = FixedPointUnified(4, 4, 2, signed=True, representation='ms')
+        assert (fp.min_value, fp.max_value, fp.total_bits) == (-15.9375, 15.9375, 9)
+        assert 'M_max = 10^5 - 1 = 99999' in FixedPoint.format_info(2, 3, 10)
+        assert str(FixedPoint(2, 3, 10).max_value) == '99.999'
+        assert IEEE754Gen(5, 10).get_range_normalized()[0] == 2.0 ** -14
+        assert IEEE754Gen(5, 10).max_positive == 65504
+
+    def test_descriptor_of(self):
+        assert descriptor_of(IEEE754Gen(5, 10)) is format_descriptor('ieee754', 5, 10)
+        assert descriptor_of(FixedPointUnified(3, 2, 10, True)) is format_descriptor('fixed', 3, 2, 10, 'complement')
+
+    def test_validador(self):
+        validator = RepresentationValidator()
+        reporte = validator.validate_fixed_point(FixedPointUnified(4, 4, 2, True, 'complement'))
+        assert reporte.is_valid and reporte.checks_passed == reporte.checks_total
+        metadata = validator.validate_ieee754(IEEE754Gen(11, 52)).metadata
+        assert metadata['total_bits'] == 64 and metadata['max_exponent'] == 2047
@@ -0,0 +1,93 @@
+"""
+Tests para los histogramas exactos de core.distribucion.
+
+Compara los recuentos analíticos con el recuento por fuerza bruta sobre
+todos los valores representables de formatos pequeños.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fractions import Fraction
+import pytest
+from core.distribucion import ESCALAS, histograma_ieee754, histograma_punto_fijo
+from core.ieee754 import IEEE754Gen
+from core.punto_fijo_unified import FixedPointUnified
+
+
+def _fuerza_bruta(valores, histograma):
+    bordes = histograma.edges
+    ultimo = len(bordes) - 2
+    return tuple(
+        sum(1 for v in valores if bordes[i] <= v and (v <= bordes[i + 1] if i == ultimo else v < bordes[i + 1]))
+        for i in range(len(bordes) - 1)
+    )
+
+
+def _valores_ieee(ieee):
+    positivos = [ieee._magnitude(*divmod(i, ieee._scale)) for i in range(1, ieee.E_max_encoded * ieee._scale)]
+    return positivos, sorted(positivos + [-v for v in positivos] + [Fraction(0)])
+
+
+class TestFlotante:
+    """Tests de histograma_ieee754."""
+
+    @pytest.mark.parametrize("E_bits,F_bits,base", [(4, 3, 2), (1, 1, 2), (3, 2, 3), (2, 2, 10)])
+    @pytest.mark.parametrize("bins", [1, 7, 50])
+    @pytest.mark.parametrize("escala", ESCALAS)
+    def test_contra_fuerza_bruta(self, E_bits, F_bits, base, bins, escala):
+        ieee = IEEE754Gen(E_bits, F_bits, base)
+        positivos, todos = _valores_ieee(ieee)
+        valores = positivos if escala == 'log' else todos
+        histograma = histograma_ieee754(ieee, bins=bins, escala=escala)
+        assert histograma.counts == _fuerza_bruta(valores, histograma)
+        assert sum(histograma.counts) == histograma.total == len(valores)
+
+    def test_formatos_de_64_bits_y_mas(self):
+        for E_bits, F_bits in ((11, 52), (15, 112)):
+            ieee = IEEE754Gen(E_bits, F_bits)
+            histograma = histograma_ieee754(ieee, bins=50, escala='log')
+            assert sum(histograma.counts) == ieee.E_max_encoded * 2 ** F_bits - 1
+            lineal = histograma_ieee754(ieee, bins=50, escala='lineal')
+            assert lineal.total == 2 * histograma.total + 1
+            assert sum(lineal.counts) == lineal.total
+
+    def test_cache(self):
+        a = histograma_ieee754(IEEE754Gen(5, 10), bins=20)
+        assert histograma_ieee754(IEEE754Gen(5, 10), bins=20) is a
+        assert histograma_ieee754(IEEE754Gen(5, 10), bins=21) is not a
+
+
+class TestPuntoFijo:
+    """Tests de histograma_punto_fijo."""
+
+    @pytest.mark.parametrize("E,F,base,signed,representation,n_min", [
+        (2, 2, 2, False, 'complement', 0),
+        (2, 2, 2, True, 'ms', -15),
+        (2, 1, 2, True, 'complement', -8),
+        (1, 2, 10, True, 'complement', -1000),
+        (2, 1, 3, True, 'ms', -26),
+    ])
+    @pytest.mark.parametrize("escala", ESCALAS)
+    def test_contra_fuerza_bruta(self, E, F, base, signed, representation, n_min, escala):
+        fp = FixedPointUnified(E, F, base, signed, representation)
+        valores = [Fraction(n, base ** F) for n in range(n_min, base ** (E + F))]
+        if escala == 'log':
+            valores = [v for v in valores if v > 0]
+        for bins in (1, 7, 50):
+            histograma = histograma_punto_fijo(fp, bins=bins, escala=escala)
+            assert histograma.counts == _fuerza_bruta(valores, histograma)
+            assert sum(histograma.counts) == histograma.total == len(valores)
+
+    def test_no_uniforme_en_bordes(self):
+        """3 bins sobre 16 valores: los recuentos reales no son 16/3"""
+        histograma = histograma_punto_fijo(FixedPointUnified(2, 2), bins=3)
+        assert histograma.counts == (5, 5, 6)
+        assert histograma.rango == (0.0, 3.75)
+
+    def test_errores(self):
+        with pytest.raises(ValueError):
+            histograma_punto_fijo(FixedPointUnified(2, 2), bins=0)
+        with pytest.raises(ValueError):
+            histograma_ieee754(IEEE754Gen(2, 2), escala='cuadratica')
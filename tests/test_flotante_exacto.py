@@ -0,0 +1,203 @@
+"""
+Tests para la aritmética de punto flotante exacta (core.flotante_exacto) y
+su uso en FixedPointFloating.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import math
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from itertools import product
+
+import pytest
+from core.flotante_exacto import HAS_NUMPY, OPERACIONES, Flotante, FormatoFlotante, verificar_binary32
+from core.ieee754 import IEEE754Gen, ROUNDING_MODES
+from core.punto_flotante import FixedPointFloating
+
+BINARY32 = FormatoFlotante.de_ieee754(IEEE754Gen(E_bits=8, F_bits=23))
+BINARY16 = FormatoFlotante.de_ieee754(IEEE754Gen(E_bits=5, F_bits=10))
+
+
+def _representables(fmt):
+    """{valor >= 0: significando} de todos los finitos del formato (por fuerza bruta)."""
+    valores = {Fraction(0): 0}
+    for e in range(fmt.E_min, fmt.E_max + 1):
+        desde = 0 if fmt.subnormales and e == fmt.E_min else fmt.base ** fmt.F
+        for m in range(desde, fmt.base ** (fmt.F + 1)):
+            valores.setdefault(m * Fraction(fmt.base) ** (e - fmt.F), m)
+    return valores
+
+
+def _referencia(valores, orden, x, rounding):
+    """Redondeo de x (|x| <= máximo) eligiendo entre los vecinos representables."""
+    if x < 0:
+        espejo = {'toward_positive': 'toward_negative', 'toward_negative': 'toward_positive'}
+        return -_referencia(valores, orden, -x, espejo.get(rounding, rounding))
+    bajo = orden[bisect_right(orden, x) - 1]
+    alto = orden[bisect_left(orden, x)]
+    if bajo == alto or rounding in ('toward_zero', 'toward_negative'):
+        return bajo
+    if rounding == 'toward_positive':
+        return alto
+    if x - bajo != alto - x:
+        return bajo if x - bajo < alto - x else alto
+    if rounding == 'nearest_away':
+        return alto
+    return bajo if valores[bajo] % 2 == 0 else alto
+
+
+class TestRedondeoExhaustivo:
+    """Las cuatro operaciones en todos los modos, contra el vecino representable correcto."""
+
+    @pytest.mark.parametrize('fmt', [
+        FormatoFlotante(2, 2, -2, 2, subnormales=True, desbordamiento='infinito'),
+        FormatoFlotante(10, 1, -1, 1, subnormales=True, desbordamiento='infinito'),
+        FormatoFlotante(3, 2, -1, 1, subnormales=False),
+    ])
+    def test_un_solo_redondeo(self, fmt):
+        valores = _representables(fmt)
+        orden = sorted(valores)
+        maximo = fmt.a_fraccion(fmt.maximo())
+        minimo_normal = Fraction(fmt.base) ** fmt.E_min
+        operandos = sorted(set(valores) | {-v for v in valores})
+        operandos = operandos[::max(1, len(operandos) // 50)]  # Unos 50 operandos por formato
+        exactas = {'add': lambda a, b: a + b, 'subtract': lambda a, b: a - b,
+                   'multiply': lambda a, b: a * b, 'divide': lambda a, b: a / b}
+        for a, b, operacion in product(operandos, operandos, OPERACIONES):
+            if operacion == 'divide' and b == 0:
+                continue
+            exacto = exactas[operacion](a, b)
+            if abs(exacto) > maximo or (not fmt.subnormales and 0 < abs(exacto) < minimo_normal):
+                continue
+            for rounding in ROUNDING_MODES:
+                obtenido = fmt.operar(operacion, a, b, rounding)
+                if not fmt.subnormales and obtenido.clase == 'cero' and exacto:
+                    continue  # Se anula al redondear por debajo de B^E_min
+                assert fmt.a_fraccion(obtenido) == _referencia(valores, orden, exacto, rounding), \
+                    (operacion, a, b, rounding)
+
+
+class TestFormatoIEEE:
+
+    def test_empate_a_par_con_guarda_y_sticky(self):
+        traza = BINARY32.operar_traza('add', 1, 2 ** -24)
+        assert (traza['guarda'], traza['redondeo'], traza['sticky']) == (1, 0, False)
+        assert traza['valor'] == 1.0
+        traza = BINARY32.operar_traza('add', 1, 2 ** -24 + 2 ** -40)
+        assert traza['sticky'] is True
+        assert traza['valor'] == 1 + 2 ** -23
+        assert BINARY32.a_float(BINARY32.sumar(1, 2 ** -24, 'nearest_away')) == 1 + 2 ** -23
+
+    def test_desbordamiento_segun_modo(self):
+        maximo = BINARY16.a_float(BINARY16.maximo())
+        assert maximo == 65504.0
+        assert BINARY16.a_float(BINARY16.sumar(maximo, maximo)) == math.inf
+        assert BINARY16.a_float(BINARY16.sumar(maximo, maximo, 'toward_zero')) == maximo
+        assert BINARY16.a_float(BINARY16.multiplicar(-maximo, 2, 'toward_positive')) == -maximo
+        assert BINARY16.a_float(BINARY16.multiplicar(-maximo, 2, 'toward_negative')) == -math.inf
+        assert BINARY16.operar_traza('multiply', maximo, 2)['desbordamiento'] is True
+
+    def test_subnormales(self):
+        minimo = 2.0 ** -24
+        assert BINARY16.a_float(BINARY16.dividir(minimo, 2)) == 0.0  # Empate con 0: a par
+        assert BINARY16.a_float(BINARY16.dividir(minimo, 2, 'toward_positive')) == minimo
+        assert BINARY16.a_float(BINARY16.multiplicar(minimo, 3)) == 3 * minimo
+
+    def test_especiales_y_ceros_con_signo(self):
+        assert BINARY32.restar(1.5, 1.5) == Flotante(0, 0, 0, 'cero')
+        assert BINARY32.restar(1.5, 1.5, 'toward_negative').signo == 1
+        assert BINARY32.sumar(-0.0, -0.0).signo == 1
+        assert BINARY32.dividir(1, 0) == Flotante(0, 0, 0, 'infinito')
+        assert BINARY32.dividir(-1, 0.0).signo == 1
+        assert BINARY32.dividir(0, 0).clase == 'nan'
+        assert BINARY32.sumar(math.inf, -math.inf).clase == 'nan'
+        assert BINARY32.multiplicar(math.inf, 0).clase == 'nan'
+        assert BINARY32.dividir(1, math.inf).clase == 'cero'
+
+    def test_operandos_exactos_en_texto(self):
+        # '0.1' es el decimal exacto: se redondea una vez al cargarlo
+        assert BINARY32.a_float(BINARY32.redondear('0.1')) == BINARY32.a_float(BINARY32.redondear(0.1))
+        assert BINARY32.texto(BINARY32.redondear(1.5)) == '+1.10000000000000000000000 × 2^0'
+
+    def test_contraste_con_struct(self):
+        informe = verificar_binary32(n=2000, seed=1)
+        assert informe['casos'] == 8000
+        assert informe['discrepancias'] == []
+
+    def test_operacion_desconocida(self):
+        with pytest.raises(ValueError, match="Operación desconocida"):
+            BINARY32.operar('power', 2, 3)
+        with pytest.raises(ValueError, match="Modo de redondeo"):
+            BINARY32.sumar(1, 2, 'hacia_arriba')
+
+
+def _iguales(a, b):
+    return all((x == y and math.copysign(1, x) == math.copysign(1, y)) or (math.isnan(x) and math.isnan(y))
+               for x, y in zip(a, b))
+
+
+class TestLotes:
+
+    MUESTRAS = [0.0, -0.0, 1.0, -1.5, 3.14159, 1e-6, -2.5e-8, 65504.0, 1e5, 7.0, 1 / 3, -1e-30]
+
+    @pytest.mark.parametrize('fmt', [BINARY32, BINARY16,
+                                     FormatoFlotante.de_punto_flotante(FixedPointFloating(4, 5)),
+                                     FormatoFlotante.de_punto_flotante(FixedPointFloating(3, 4, signed=False))])
+    def test_lote_igual_que_valor_a_valor(self, fmt):
+        xs = [x for x in self.MUESTRAS for _ in self.MUESTRAS]
+        ys = [y for _ in self.MUESTRAS for y in self.MUESTRAS]
+        for operacion in OPERACIONES:
+            if operacion == 'divide' and fmt.desbordamiento == 'saturar':
+                pares = [(x, y) for x, y in zip(xs, ys) if fmt.redondear(y).clase != 'cero']
+                xs_op, ys_op = [x for x, _ in pares], [y for _, y in pares]
+            else:
+                xs_op, ys_op = xs, ys
+            lote = list(fmt.operar_lote(operacion, xs_op, ys_op))
+            uno_a_uno = [fmt.a_float(fmt.operar(operacion, x, y)) for x, y in zip(xs_op, ys_op)]
+            assert _iguales(lote, uno_a_uno), operacion
+
+    @pytest.mark.skipif(not HAS_NUMPY, reason="NumPy no disponible")
+    def test_camino_vectorizado(self):
+        assert BINARY32.vectorizable('nearest_even')
+        assert not BINARY32.vectorizable('toward_zero')
+        assert not FormatoFlotante.de_ieee754(IEEE754Gen(E_bits=11, F_bits=52)).vectorizable('nearest_even')
+        assert not FormatoFlotante(10, 3, -5, 5).vectorizable('nearest_even')
+
+    def test_lote_en_base_10(self):
+        fmt = FormatoFlotante(10, 2, -5, 5)
+        assert list(fmt.operar_lote('divide', [1, 2], [3, 3])) == [0.333, 0.667]
+
+
+class TestFixedPointFloating:
+
+    def test_resultados_redondeados_a_F_M(self):
+        fp = FixedPointFloating(F_M=4, E_bits=5)
+        assert fp.add(5.5, 0.125) == 5.5  # 5.625 = 1.01101 × 2^2: empate, a par
+        assert fp.add(5.5, 0.125, rounding='toward_positive') == 5.75
+        assert fp.multiply(3.5, 2.25) == 8.0  # 7.875 necesita 5 cifras
+        assert fp.divide(1, 3) == 0.328125
+        assert fp.subtract(1, 1) == 0.0
+
+    def test_saturacion_anulacion_y_division_por_cero(self):
+        fp = FixedPointFloating(F_M=4, E_bits=5)
+        assert fp.multiply(1000, 1000) == float(fp.max_value)
+        assert fp.multiply(-1000, 1000) == -float(fp.max_value)
+        assert fp.multiply(2 ** -10, 2 ** -10) == 0.0
+        with pytest.raises(ValueError, match="División por cero"):
+            fp.divide(1, 0)
+        assert FixedPointFloating(4, 5, signed=False).subtract(1, 2) == 0.0
+
+    def test_traza_y_lotes(self):
+        fp = FixedPointFloating(F_M=6, E_bits=6)
+        traza = fp.operate_traced('add', 5.5, 0.125)
+        assert traza['valor'] == fp.add(5.5, 0.125)
+        assert any(paso.startswith('Alinear') for paso in traza['pasos'])
+        assert list(fp.operate_many('multiply', [1.1, 2.2], [3, 3])) == [fp.multiply(1.1, 3), fp.multiply(2.2, 3)]
+
+    def test_operandos_cuantizados_como_en_barrido(self):
+        fp = FixedPointFloating(F_M=4, E_bits=3)
+        for valor in [0.1, 1.7, -3.3, 100.0, 1e-4]:
+            assert fp.add(valor, 0) == pytest.approx(float(fp.quantize_many([valor])[0]))
@@ -0,0 +1,134 @@
+"""
+Tests para las expansiones periódicas exactas (core.fracciones_periodicas) y
+su uso en convert_fractional_part y convert_fixed_point_base.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import random
+from decimal import Decimal
+from fractions import Fraction
+
+import pytest
+from core.conversion_algoritmos_detallados import convert_fractional_part
+from core.conversion_bases_punto_fijo import convert_fixed_point_base
+from core.fracciones_periodicas import (
+    digitos_fraccion,
+    expansion_periodica,
+    fraccion_desde_cadena,
+    longitud_anteperiodo,
+)
+from core.punto_fijo import FixedPoint
+
+
+class TestExpansionPeriodica:
+    """Anteperiodo, periodo y texto de la expansión"""
+
+    @pytest.mark.parametrize("x, base, texto", [
+        (Fraction(1, 10), 2, '0.0(0011)'),
+        (Fraction(1, 3), 10, '0.(3)'),
+        (Fraction(1, 7), 10, '0.(142857)'),
+        (Fraction(5, 12), 6, '0.23'),
+        (Fraction(1, 6), 10, '0.1(6)'),
+        (Decimal('-3.25'), 10, '-3.25'),
+        (Fraction(255, 256), 16, '0.FF'),
+        (42, 2, '101010'),
+    ])
+    def test_texto(self, x, base, texto):
+        assert str(expansion_periodica(x, base)) == texto
+
+    def test_longitudes_analiticas(self):
+        assert longitud_anteperiodo(8, 10) == (3, 1)
+        assert longitud_anteperiodo(12, 6) == (2, 1)
+        assert longitud_anteperiodo(70, 10) == (1, 7)
+
+    def test_periodo_largo(self):
+        e = expansion_periodica(Fraction(1, 1000003), 10)
+        assert len(e.periodo) == 166667
+        assert e.digito(10 ** 12) == e.periodo[10 ** 12 % len(e.periodo)]
+        assert e.digito(len(e.periodo)) == e.digito(0)
+
+    def test_max_digitos(self):
+        with pytest.raises(ValueError):
+            expansion_periodica(Fraction(1, 1000003), 10, max_digitos=1000)
+
+    def test_digitos_y_truncar(self):
+        rng = random.Random(40)
+        for _ in range(200):
+            x = Fraction(rng.randint(0, 500), rng.randint(1, 500))
+            base = rng.randint(2, 16)
+            n = rng.randint(0, 40)
+            e = expansion_periodica(x, base)
+            digitos = e.digitos(n)
+            assert digitos == digitos_fraccion(x, base, n)
+            assert digitos == [e.digito(i) for i in range(n)]
+            fraccionaria = sum(Fraction(d, base ** (i + 1)) for i, d in enumerate(digitos))
+            assert e.truncar(n) == x.numerator // x.denominator + fraccionaria
+
+    def test_pasos_bajo_demanda(self):
+        pasos = list(expansion_periodica(Fraction(1, 10), 2).pasos())
+        assert [p['digit'] for p in pasos] == [0, 0, 0, 1, 1]
+        assert pasos[-1]['remainder'] == pasos[1]['fraction']
+
+
+class TestFraccionDesdeCadena:
+    """Lectura de la notación con periodo entre paréntesis"""
+
+    def test_ida_y_vuelta(self):
+        rng = random.Random(41)
+        for _ in range(200):
+            x = Fraction(rng.randint(-1000, 1000), rng.randint(1, 300))
+            base = rng.randint(2, 36)
+            assert fraccion_desde_cadena(str(expansion_periodica(x, base)), base) == x
+
+    def test_invalidos(self):
+        for texto in ('0.2', '', '0.()', '1.(x)'):
+            with pytest.raises(ValueError):
+                fraccion_desde_cadena(texto, 2)
+
+
+class TestConversores:
+    """convert_fractional_part y convert_fixed_point_base"""
+
+    def test_fraccion_decimal_periodica(self):
+        digits, fractions, steps = convert_fractional_part(Decimal('0.1'), 10, 2, 12)
+        assert digits == [0, 0, 0, 1, 1, 0, 0, 1, 1, 0, 0, 1]
+        assert len(steps) == 12 and len(fractions) == 13
+        assert steps[11]['iteration'] == 12
+        assert steps[11]['fraction'] == Decimal('0.8')
+
+    def test_fraccion_terminante(self):
+        digits, _, steps = convert_fractional_part(Decimal('0.625'), 10, 2, 8)
+        assert digits == [1, 0, 1, 0, 0, 0, 0, 0]
+        assert len(steps) == 3
+
+    def test_fraccion_exacta_muchos_digitos(self):
+        digits, _, steps = convert_fractional_part(Fraction(1, 3), 10, 10, 5000, with_steps=False)
+        assert digits == [3] * 5000 and steps == []
+
+    def test_punto_fijo_informa_periodo(self):
+        _, info = convert_fixed_point_base(FixedPoint(4, 4, 10, value='0.1'), 4, 2, 14)
+        assert info['exact_expansion'] == '0.0(0011)'
+        assert info['periodic'] and not info['exact']
+        _, info = convert_fixed_point_base(FixedPoint(4, 4, 2, value='0.5'), 4, 10)
+        assert info['exact'] and not info['periodic']
+
+    def test_periodo_enorme_acotado(self):
+        # 1/3^40 en base 10: el periodo tiene 2·3^39 dígitos y no se recorre
+        x = Fraction(1, 3 ** 40)
+        digits, fractions, steps = convert_fractional_part(x, 3, 10, 64)
+        assert digits == digitos_fraccion(x, 10, 64)
+        assert len(steps) == 64 and len(fractions) == 65
+        fp = FixedPoint(2, 40, 3, value=Decimal(1) / Decimal(3) ** 40)
+        _, info = convert_fixed_point_base(fp, 2, 10)
+        assert info['periodic'] and not info['exact']
+        assert info['exact_expansion'] is None
+
+    def test_base_destino_mayor_que_36(self):
+        digits, _, _ = convert_fractional_part(Fraction(1, 3), 10, 60, 4)
+        assert digits == [20, 0, 0, 0]
+        fp_prime, info = convert_fixed_point_base(FixedPoint(4, 4, 10, value='0.1'), 4, 60)
+        assert fp_prime.B == 60
+        assert info['exact_expansion'] is None and info['exact']
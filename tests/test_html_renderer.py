@@ -0,0 +1,142 @@
+"""
+Tests para el renderer HTML de previsualización.
+
+Verifica streaming, escapado, tablas, cronogramas SVG y render en paralelo.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from renderers.html.main_renderer import HtmlExamRenderer, render_variants
+from renderers.html.utils.timing import parse_timing_sequence
+
+
+def _exam():
+    return {
+        "exam_metadata": {"title": "Examen <Prueba>"},
+        "exercises": [
+            {
+                "title": "Sistemas de Representación",
+                "description": "Complete la tabla.",
+                "data": {
+                    "n_bits": 8,
+                    "rows": [{
+                        "label": "a", "val_decimal": -5, "target_col_idx": 1,
+                        "target_val_str": "11111011", "sol_bin": "NR", "sol_c2": "11111011",
+                        "sol_sm": "10000101", "sol_bcd": "NR"
+                    }],
+                    "operations": []
+                },
+                "metadata": {"exercise_type": "ConversionExerciseData"}
+            },
+            {
+                "title": "Karnaugh",
+                "description": "Dada la función:",
+                "data": {
+                    "vars_name": ["A", "B", "C", "D"], "out_name": "F",
+                    "truth_table_outputs": [0, 1] * 8,
+                    "canon_type": "Minitérminos", "gate_type": "NAND"
+                },
+                "metadata": {"exercise_type": "KarnaughExerciseData"}
+            },
+            {
+                "title": "Secuencial",
+                "description": "",
+                "data": {
+                    "ff_type": "JK", "edge_type": "Subida", "logic_type": "SHIFT",
+                    "has_async": True, "async_type": "Set", "async_level": "0",
+                    "input_sequence": "LLHHLLHH", "async_sequence": "2H 2L 4H"
+                },
+                "metadata": {"exercise_type": "SequentialExerciseData"}
+            },
+        ]
+    }
+
+
+class TestHtmlExamRenderer:
+    """Tests del documento completo."""
+
+    def test_streaming_equivale_a_render(self):
+        """iter_render produce los mismos fragmentos que render"""
+        renderer = HtmlExamRenderer()
+        chunks = list(renderer.iter_render(_exam()))
+        assert len(chunks) > 3
+        assert "".join(chunks) == renderer.render(_exam())
+
+    def test_documento_bien_formado(self):
+        html = HtmlExamRenderer().render(_exam())
+        assert html.startswith("<!DOCTYPE html>")
+        assert html.rstrip().endswith("</html>")
+        assert html.count("<section") == html.count("</section>") == 3
+
+    def test_escapado(self):
+        html = HtmlExamRenderer().render(_exam())
+        assert "Examen &lt;Prueba&gt;" in html
+        assert "<Prueba>" not in html
+
+    def test_enunciado_oculta_soluciones(self):
+        html = HtmlExamRenderer(is_solution=False).render(_exam())
+        assert "10000101" not in html
+        assert "11111011" in html  # columna activa
+
+    def test_solucion_muestra_soluciones(self):
+        html = HtmlExamRenderer(is_solution=True).render(_exam())
+        assert "10000101" in html
+        assert "(SOLUCIÓN)" in html
+
+    def test_cronograma_svg(self):
+        html = HtmlExamRenderer().render(_exam())
+        assert "<svg" in html
+        assert "Set(asyn)" in html
+
+    def test_lista_de_ejercicios(self):
+        """Acepta también la lista de ejercicios sin exam_metadata"""
+        html = HtmlExamRenderer().render(_exam()["exercises"])
+        assert html.count("<section") == 3
+
+    def test_operacion_suelta_usa_su_ancho(self):
+        op = {"title": "Operación", "description": "",
+              "problem": {"op_type": "suma", "system": "binario", "operand1": "a", "operand2": "b",
+                          "operator_symbol": "+", "val1_dec": 3, "val2_dec": 2},
+              "solution": {"result_dec": 5, "result_bin": "000101", "overflow": False,
+                           "underflow": False, "carry_bits": ""},
+              "metadata": {"exercise_type": "ArithmeticOp"}}
+        html = HtmlExamRenderer(is_solution=True).render([op])
+        assert html.count('<td class="sol">') == 3 * 6  # operandos y resultado, 6 bits
+        op["problem"]["n_bits"] = 4
+        assert HtmlExamRenderer(is_solution=True).render([op]).count('<td class="sol">') == 3 * 4
+
+    def test_tipo_desconocido(self):
+        exam = [{"title": "X", "description": "d", "problem": "1+1", "solution": "10"}]
+        assert "10" not in HtmlExamRenderer(False).render(exam).split("<body>")[1]
+        assert "10" in HtmlExamRenderer(True).render(exam)
+
+
+class TestRenderVariants:
+    """Tests del render en paralelo."""
+
+    def test_orden_y_contenido(self):
+        variants = [_exam(), _exam()]
+        variants[1]["exam_metadata"]["title"] = "Variante B"
+        results = render_variants(variants, use_processes=False)
+        assert len(results) == 2
+        assert "Variante B" in results[1]
+        assert results[0] == HtmlExamRenderer().render(variants[0])
+
+
+class TestParseTiming:
+    """Tests del parser de secuencias tikz-timing."""
+
+    def test_rle(self):
+        assert parse_timing_sequence("4H 2L 18H") == [("H", 4.0), ("L", 2.0), ("H", 18.0)]
+
+    def test_expandida(self):
+        assert parse_timing_sequence("LLHH") == [("L", 2.0), ("H", 2.0)]
+
+    def test_reloj(self):
+        runs = parse_timing_sequence("4C")
+        assert [level for level, _ in runs] == ["H", "L", "H", "L"]
+
+    def test_opciones_ignoradas(self):
+        assert parse_timing_sequence("[draw=none, fill=none] 3Z") == [("Z", 3.0)]
@@ -0,0 +1,119 @@
+"""
+Tests para la enumeración exhaustiva de códigos de IEEE754Gen.
+
+Compara cada columna de enumerate_codes con decode/_magnitude, con y sin
+NumPy, y comprueba la memoización y la exportación en streaming.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import math
+import pytest
+import core.ieee754 as ieee754
+from core.ieee754 import CODE_CLASSES, MAX_CACHED_CODES, MAX_ENUMERATED_CODES, IEEE754Gen
+
+FORMATOS = [(4, 3, 2), (1, 1, 2), (3, 2, 3), (2, 2, 10)]
+
+
+def _campos(ieee, code):
+    half = ieee.code_count // 2
+    sign, resto = divmod(code, half)
+    return (sign,) + divmod(resto, ieee._scale)
+
+
+def _comprobar_columnas(ieee, columns):
+    assert len(columns['code']) == ieee.code_count
+    for code in range(ieee.code_count):
+        sign, E, M = _campos(ieee, code)
+        assert columns['code'][code] == code
+        expected = ieee.decode(sign, E, M)
+        value = columns['value'][code]
+        cls = CODE_CLASSES[columns['class'][code]]
+        if isinstance(expected, str):
+            assert math.isnan(value) and cls == expected
+            continue
+        assert value == expected and math.copysign(1, value) == math.copysign(1, expected)
+        if math.isinf(expected):
+            assert cls == 'infinity'
+            continue
+        assert cls == ('zero' if (E, M) == (0, 0) else 'subnormal' if E == 0 else 'normal')
+        # Hueco exacto hasta el siguiente código de mayor magnitud
+        siguiente = divmod(E * ieee._scale + M + 1, ieee._scale)
+        assert columns['ulp'][code] == float(ieee._magnitude(*siguiente) - ieee._magnitude(E, M))
+
+
+class TestEnumeracion:
+    """Tests de enumerate_codes."""
+
+    @pytest.mark.parametrize("E_bits,F_bits,base", FORMATOS)
+    def test_columnas_contra_decode(self, E_bits, F_bits, base):
+        ieee = IEEE754Gen(E_bits, F_bits, base)
+        _comprobar_columnas(ieee, ieee.enumerate_codes())
+
+    @pytest.mark.parametrize("E_bits,F_bits,base", FORMATOS)
+    def test_sin_numpy(self, E_bits, F_bits, base, monkeypatch):
+        monkeypatch.setattr(ieee754, 'HAS_NUMPY', False)
+        ieee = IEEE754Gen(E_bits, F_bits, base)
+        columns = ieee.enumerate_codes()
+        assert not hasattr(columns['value'], 'dtype')
+        _comprobar_columnas(ieee, columns)
+
+    def test_codigo_coincide_con_pack_en_base_2(self):
+        ieee = IEEE754Gen(5, 10)
+        columns = ieee.enumerate_codes()
+        for code in (0, 1, 0x3C00, 0x7C00, 0xFBFF):
+            assert ieee.pack(*ieee.unpack(code)) == columns['code'][code]
+            assert columns['value'][code] == ieee.decode(*ieee.unpack(code))
+
+    def test_memoizado_por_formato(self):
+        a = IEEE754Gen(4, 3).enumerate_codes()
+        b = IEEE754Gen(4, 3).enumerate_codes()
+        assert a['value'] is b['value']
+        assert IEEE754Gen(4, 4).enumerate_codes()['value'] is not a['value']
+
+    def test_formatos_grandes_no_se_memorizan(self):
+        ieee = IEEE754Gen(6, 11)
+        assert ieee.code_count > MAX_CACHED_CODES
+        ieee754._cached_code_space.cache_clear()
+        a = ieee.enumerate_codes()
+        assert ieee.enumerate_codes()['value'] is not a['value']
+        assert ieee754._cached_code_space.cache_info().currsize == 0
+
+    def test_demasiados_codigos(self):
+        ieee = IEEE754Gen(8, 23)
+        assert ieee.code_count > MAX_ENUMERATED_CODES
+        with pytest.raises(ValueError):
+            ieee.enumerate_codes()
+
+
+class TestExportacion:
+    """Tests de export_codes."""
+
+    def test_csv(self):
+        ieee = IEEE754Gen(2, 1)
+        trozos = list(ieee.export_codes('csv', chunk_size=5))
+        assert len(trozos) == 1 + 4
+        lineas = ''.join(trozos).splitlines()
+        assert lineas[0] == "code,value,ulp,class"
+        assert lineas[1:4] == ["0,0.0,0.5,zero", "1,0.5,0.5,subnormal", "2,1.0,0.5,normal"]
+        assert lineas[7] == "6,inf,nan,infinity"
+        assert len(lineas) == 1 + ieee.code_count
+
+    def test_jsonl(self):
+        ieee = IEEE754Gen(3, 2)
+        filas = [json.loads(linea) for linea in ''.join(ieee.export_codes('jsonl')).splitlines()]
+        assert len(filas) == ieee.code_count
+        assert filas[4] == {'code': 4, 'value': 0.25, 'ulp': 0.0625, 'class': 'normal'}
+        assert filas[28]['value'] is None and filas[28]['class'] == 'infinity'
+
+    def test_formato_desconocido(self):
+        with pytest.raises(ValueError):
+            next(IEEE754Gen(2, 1).export_codes('xml'))
+
+    def test_validacion_antes_del_primer_trozo(self):
+        # /api/ieee754/codes responde 400 sin haber empezado el streaming
+        with pytest.raises(ValueError):
+            IEEE754Gen(8, 23).export_codes('csv')
@@ -0,0 +1,137 @@
+"""
+Tests para la codificación exacta de IEEE754Gen (enteros + Fraction).
+
+Verifica redondeo en todos los modos contra búsqueda exhaustiva, lotes
+(encode_many/decode_many) y coincidencia bit a bit con struct.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import math
+import random
+import struct
+from fractions import Fraction
+import pytest
+from core.ieee754 import IEEE754Gen, ROUNDING_MODES
+
+
+def _random_doubles(n, seed):
+    rng = random.Random(seed)
+    values = []
+    while len(values) < n:
+        value = struct.unpack('>d', struct.pack('>Q', rng.getrandbits(64)))[0]
+        if not math.isnan(value):
+            values.append(value)
+    return values + [rng.uniform(-1e4, 1e4) for _ in range(n)]
+
+
+def _finite_codes(ieee):
+    """(valor exacto, E, M) de todos los códigos finitos positivos."""
+    return [
+        (ieee._magnitude(E, M), E, M)
+        for E in range(ieee.E_max_encoded)
+        for M in range(ieee._scale)
+    ]
+
+
+class TestRedondeo:
+    """Tests del redondeo exacto."""
+
+    @pytest.mark.parametrize("mode", ROUNDING_MODES)
+    def test_contra_busqueda_exhaustiva(self, mode):
+        """E=3, F=2: el código elegido es el vecino correcto según el modo"""
+        ieee = IEEE754Gen(E_bits=3, F_bits=2)
+        table = _finite_codes(ieee)
+        max_value = table[-1][0]
+        rng = random.Random(33)
+        for _ in range(500):
+            x = Fraction(rng.randint(1, 4000), rng.randint(1, 400))
+            if x >= max_value:
+                continue
+            lower = max(entry for entry in table if entry[0] <= x)
+            upper = min(entry for entry in table if entry[0] >= x)
+            if mode in ('toward_zero', 'toward_negative'):
+                expected = lower
+            elif mode == 'toward_positive':
+                expected = upper
+            elif x - lower[0] != upper[0] - x:
+                expected = lower if x - lower[0] < upper[0] - x else upper
+            elif mode == 'nearest_away':
+                expected = upper
+            else:
+                expected = lower if lower[2] % 2 == 0 else upper
+            assert ieee.encode_exact(x, mode) == (0, expected[1], expected[2])
+
+    def test_potencias_de_la_base(self):
+        """Sin logaritmos en coma flotante: B^k y su predecesor caen en el exponente correcto"""
+        ieee = IEEE754Gen(E_bits=8, F_bits=23)
+        for k in range(-125, 128):
+            power = Fraction(2) ** k
+            assert ieee.encode_exact(power) == (0, k + 127, 0)
+            assert ieee.encode_exact(power - power / 2 ** 30, 'toward_zero') == (0, k + 126, 2 ** 23 - 1)
+        decimal = IEEE754Gen(E_bits=3, F_bits=4, base=10)
+        assert decimal.encode_exact(1000) == (0, 102, 0)
+        assert decimal.decode_exact(0, 102, 0) == 1000
+
+    def test_decimal_exacto(self):
+        """'0.1' se redondea desde 1/10, no desde el float 0.1"""
+        ieee = IEEE754Gen(E_bits=11, F_bits=52)
+        assert ieee.encode("0.1") == struct.unpack('>Q', struct.pack('>d', 0.1))[0]
+        assert ieee.encode("0.1", 'toward_zero') == ieee.encode("0.1") - 1
+
+    def test_desbordamiento(self):
+        ieee = IEEE754Gen(E_bits=8, F_bits=23)
+        assert ieee.encode_exact(1e39) == ieee.encode_infinity()
+        assert ieee.encode_exact(1e39, 'toward_zero') == (0, 254, 2 ** 23 - 1)
+        assert ieee.encode_exact(-1e39, 'toward_positive') == (1, 254, 2 ** 23 - 1)
+        assert ieee.max_positive == (2 - Fraction(1, 2 ** 23)) * 2 ** 127
+
+    def test_modo_desconocido(self):
+        with pytest.raises(ValueError):
+            IEEE754Gen(E_bits=8, F_bits=23).encode(1.0, 'stochastic')
+
+
+class TestStruct:
+    """Coincidencia bit a bit con struct."""
+
+    @pytest.mark.parametrize("E_bits,F_bits", [(5, 10), (8, 23), (11, 52)])
+    def test_encode_many(self, E_bits, F_bits):
+        ieee = IEEE754Gen(E_bits=E_bits, F_bits=F_bits)
+        values = _random_doubles(3000, E_bits) + [0.0, -0.0, math.inf, -math.inf, 65520.0, 3.4028236e38]
+        assert ieee.struct_check(values) == []
+
+    @pytest.mark.parametrize("E_bits,F_bits", [(5, 10), (8, 23), (11, 52)])
+    def test_nan_por_clase(self, E_bits, F_bits):
+        # struct conserva el signo y la carga útil del NaN; encode_many da el qNaN canónico
+        ieee = IEEE754Gen(E_bits=E_bits, F_bits=F_bits)
+        con_carga = struct.unpack('>d', bytes.fromhex('7ff8000000000123'))[0]
+        assert ieee.struct_check([math.nan, -math.nan, con_carga]) == []
+
+    @pytest.mark.parametrize("E_bits,F_bits", [(5, 10), (8, 23), (11, 52)])
+    def test_decode_many(self, E_bits, F_bits):
+        ieee = IEEE754Gen(E_bits=E_bits, F_bits=F_bits)
+        fmt = ieee.struct_format
+        int_fmt = {'e': '>H', 'f': '>I', 'd': '>Q'}[fmt]
+        codes = [int(c) for c in ieee.encode_many(_random_doubles(1000, F_bits))]
+        for code, value in zip(codes, ieee.decode_many(codes)):
+            expected = struct.unpack('>' + fmt, struct.pack(int_fmt, code))[0]
+            assert value == expected and math.copysign(1, value) == math.copysign(1, expected)
+
+
+class TestLotes:
+    """Lotes vs codificación valor a valor."""
+
+    @pytest.mark.parametrize("E_bits,F_bits", [(3, 2), (4, 3), (6, 40)])
+    @pytest.mark.parametrize("mode", ROUNDING_MODES)
+    def test_encode_many_igual_a_encode(self, E_bits, F_bits, mode):
+        ieee = IEEE754Gen(E_bits=E_bits, F_bits=F_bits)
+        values = _random_doubles(500, F_bits)
+        assert [int(c) for c in ieee.encode_many(values, mode)] == [ieee.encode(v, mode) for v in values]
+
+    def test_especiales(self):
+        ieee = IEEE754Gen(E_bits=4, F_bits=3)
+        decoded = ieee.decode_many(ieee.encode_many([math.nan, math.inf, -0.0]))
+        assert math.isnan(decoded[0]) and decoded[1] == math.inf
+        assert decoded[2] == 0 and math.copysign(1, decoded[2]) == -1
@@ -0,0 +1,107 @@
+"""
+Tests para el optimizador de empaquetados (core.optimizador_empaquetado) y
+optimizar_eficacias_empaquetado.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import time
+
+import pytest
+from core.optimizador_empaquetado import (
+    candidatos,
+    digitos_nativos_minimos,
+    frontera_pareto,
+    fronteras_pareto,
+    limpiar_cache,
+    mejor_agrupacion,
+)
+from core.sistemas_numeracion_basicos import (
+    comparar_eficacias_empaquetado,
+    eficacia_bcd_mejorada,
+    optimizar_eficacias_empaquetado,
+)
+
+
+def _fuerza_bruta(base_destino, max_digitos, max_bits, base_nativa=2):
+    """Prueba todos los (k, b) y se queda con las opciones no dominadas."""
+    opciones = []
+    for k in range(1, max_digitos + 1):
+        for b in range(1, max_bits + 1):
+            if base_nativa ** b >= base_destino ** k:
+                opciones.append((b, base_destino ** k / base_nativa ** b, k))
+    opciones.sort(key=lambda o: (o[0], -o[1], o[2]))
+    frontera, mejor = [], -1.0
+    for b, eficacia, k in opciones:
+        if eficacia > mejor:
+            frontera.append((k, b))
+            mejor = eficacia
+    return frontera
+
+
+class TestCandidatos:
+    """Cota cerrada de dígitos nativos y poda por tamaño de palabra"""
+
+    def test_digitos_nativos_minimos(self):
+        for base_nativa in (2, 3, 10, 16):
+            for valores in (2, 9, 10, 1000, 3 ** 40, 10 ** 50 + 1):
+                b = digitos_nativos_minimos(valores, base_nativa)
+                assert base_nativa ** b >= valores > base_nativa ** (b - 1)
+
+    def test_eficacia_coincide_con_bcd_mejorada(self):
+        for opcion in candidatos(bases_destino=[3, 10, 36], max_digitos=30):
+            assert opcion.eficacia == eficacia_bcd_mejorada(opcion.valores, opcion.bits)
+
+    def test_max_bits_y_min_eficacia(self):
+        opciones = candidatos(bases_destino=range(2, 37), max_digitos=20, max_bits=16)
+        assert all(o.bits <= 16 for o in opciones)
+        assert (10, 4, 14) in [(o.base_destino, o.n_digitos, o.bits) for o in opciones]
+        assert all(o.eficacia >= 0.9 for o in candidatos(max_digitos=20, min_eficacia=0.9))
+
+    def test_errores(self):
+        with pytest.raises(ValueError):
+            candidatos(base_nativa=1)
+        with pytest.raises(ValueError):
+            candidatos(max_digitos=0)
+        with pytest.raises(ValueError):
+            mejor_agrupacion(10, max_bits=3)
+
+
+class TestFrontera:
+    """Frontera de Pareto eficacia / tamaño de palabra"""
+
+    def test_decimal(self):
+        assert [(o.n_digitos, o.bits) for o in frontera_pareto(10)] == [(1, 4), (2, 7), (3, 10)]
+        assert mejor_agrupacion(10).eficacia == 1000 / 1024
+        assert mejor_agrupacion(16) == frontera_pareto(16)[0]
+
+    def test_mismos_bits_no_se_repiten(self):
+        # En base nativa 10 un dígito guarda hasta 3 bits: k = 1, 2, 3 ocupan b = 1
+        frontera = frontera_pareto(2, 6, base_nativa=10)
+        assert [(o.n_digitos, o.bits, o.eficacia) for o in frontera] == [(3, 1, 0.8)]
+        assert mejor_agrupacion(2, 6, base_nativa=10) == frontera[0]
+
+    @pytest.mark.parametrize("base_nativa", [2, 3, 10])
+    def test_coincide_con_fuerza_bruta(self, base_nativa):
+        for base_destino in range(2, 37):
+            max_bits = 40
+            frontera = frontera_pareto(base_destino, 12, base_nativa, max_bits)
+            esperado = _fuerza_bruta(base_destino, 12, max_bits, base_nativa)
+            assert [(o.n_digitos, o.bits) for o in frontera] == esperado
+
+    def test_espacio_grande_rapido(self):
+        limpiar_cache()
+        inicio = time.perf_counter()
+        fronteras = fronteras_pareto(range(2, 37), max_digitos=500)
+        assert time.perf_counter() - inicio < 1.0
+        assert fronteras_pareto(range(2, 37), max_digitos=500)[10] is fronteras[10]
+        assert all(f[-1].eficacia > 0.99 for f in fronteras.values())
+
+    def test_optimizar_eficacias_empaquetado(self):
+        resultado = optimizar_eficacias_empaquetado(2, 10, max_digitos=3)
+        assert [o['bits_utilizados'] for o in resultado['frontera']] == [4, 7, 10]
+        assert resultado['mejor']['desperdicio'] == 24
+        opciones = [o.como_opcion() for o in frontera_pareto(10)]
+        assert comparar_eficacias_empaquetado(2, opciones)['mejor']['bits_utilizados'] == 10
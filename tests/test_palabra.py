@@ -0,0 +1,123 @@
+"""
+Tests para Word (core.palabra) y las operaciones de CB, CB-1, M&S y ExcK
+que la usan.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import random
+import pytest
+from core.cb_representacion import (
+    CB_a_decimal,
+    multiplicacion_CB,
+    opCB_palabra,
+    repr_CB,
+    resta_CB,
+    suma_CB,
+)
+from core.enteros_signados import (
+    CBm1_a_decimal,
+    explicar_operacion_CBm1,
+    negacion_ms,
+    opCBm1_palabra,
+    repr_CBm1,
+    suma_CBm1,
+)
+from core.exceso_k_representacion import multiplicacion_ExcK, resta_ExcK, suma_ExcK
+from core.palabra import Word
+
+
+class TestWord:
+    """Interpretaciones y operaciones sobre el entero."""
+
+    def test_parse_y_str(self):
+        assert str(Word.parse('0101', 2)) == '0101'
+        assert str(Word.parse('00ff', 16)) == '00ff'
+        assert str(Word.parse('021', 3)) == '021'
+        assert Word.parse('0101', 2).code == 5
+        for texto in ('', '-101', '1_0', ' 10', '12'):
+            with pytest.raises(ValueError):
+                Word.parse(texto, 2)
+
+    def test_interpretaciones(self):
+        w = Word.parse('1101', 2)
+        assert (w.to_cb(), w.to_cbm1(), w.to_ms(), w.to_excess(8)) == (-3, -2, -5, 5)
+        assert Word.from_cb(-3, 2, 4) == w
+        assert Word.from_cbm1(-2, 2, 4) == w
+        assert Word.from_ms(-5, 2, 4) == w
+        assert Word.from_excess(5, 2, 4, 8) == w
+        assert repr(Word.from_excess(-5, 2, 8, 127)) == "Word('01111010', base=2)"
+
+    def test_rangos(self):
+        with pytest.raises(ValueError, match="fuera de rango"):
+            Word.from_ms(8, 2, 4)
+        with pytest.raises(ValueError, match="no representable en ExcK"):
+            Word.from_excess(9, 2, 4, 8)
+        with pytest.raises(ValueError, match="no es M&S"):
+            Word.parse('25', 10).to_ms()
+
+    def test_complementos(self):
+        rng = random.Random(11)
+        for _ in range(500):
+            base, longitud = rng.choice([2, 3, 8, 10, 16]), rng.randint(1, 8)
+            w = Word(rng.randrange(base ** longitud), base, longitud)
+            assert (w.complement().code + w.code) % base ** longitud == 0
+            assert w.complement().complement() == w
+            assert w.complement_m1().complement_m1() == w
+            assert (w.complement_m1().code + w.code) == base ** longitud - 1
+
+    def test_suma_y_carry(self):
+        a, b = Word.parse('1100', 2), Word.parse('0110', 2)
+        suma, carry = a.add(b)
+        assert (str(suma), carry) == ('0010', True)
+        suma, carry = a.add_end_around(b)
+        assert (str(suma), carry) == ('0011', True)
+        with pytest.raises(ValueError, match="formatos distintos"):
+            a.add(Word.parse('011', 2))
+
+    def test_negacion_ms(self):
+        assert str(Word.parse('0000', 2).negate_ms()) == '1000'
+        assert Word.parse('105', 10).negate_ms().to_ms() == 5
+
+
+class TestOperacionesExistentes:
+    """Las funciones de cadenas dan lo mismo que la aritmética de valores."""
+
+    def test_cb_aleatorio(self):
+        rng = random.Random(3)
+        for _ in range(300):
+            base, longitud = rng.choice([2, 10, 16]), rng.randint(1, 6)
+            a = repr_CB(rng.randrange(base ** longitud), base, longitud)
+            b = repr_CB(rng.randrange(base ** longitud), base, longitud)
+            va, vb = CB_a_decimal(a, base), CB_a_decimal(b, base)
+            assert suma_CB(a, b, base)['resultado'] == repr_CB(va + vb, base, longitud)
+            assert resta_CB(a, b, base)['resultado'] == repr_CB(va - vb, base, longitud)
+            assert multiplicacion_CB(a, b, base)['valor_exacto'] == va * vb
+            assert opCB_palabra(a, base) == repr_CB(-va, base, longitud)
+
+    def test_ejemplos_documentados(self):
+        assert opCB_palabra('01239', 10) == '98761'
+        assert opCB_palabra('0101', 2) == '1011'
+        assert suma_CB('95', '03', 10) == {'resultado': '98', 'llevo': False, 'valor_decimal': -2}
+        assert opCBm1_palabra('01239', 10) == '98760'
+        assert negacion_ms('01010110') == '11010110'
+        assert suma_ExcK('48', '49', 10, 47)['resultado'] == '50'
+        assert suma_ExcK('47', '47', 10, 47)['valor_decimal'] == 0
+
+    def test_cbm1_end_around(self):
+        resultado = suma_CBm1(repr_CBm1(5, 2, 4), repr_CBm1(-3, 2, 4), 2)
+        assert resultado['carry'] and resultado['valor_decimal'] == 2
+        assert CBm1_a_decimal(resultado['resultado'], 2) == 2
+        assert suma_CBm1('1100', '0011', 2)['valor_decimal'] == 0  # -0
+
+    def test_exceso_desborda(self):
+        resultado = suma_ExcK('1111', '1111', 2, 8)
+        assert resultado == {'resultado': '0110', 'llevo': True, 'valor_decimal': -2, 'valor_exacto': 14}
+        assert resta_ExcK('0000', '1111', 2, 8)['llevo']
+        assert multiplicacion_ExcK('1001', '1010', 2, 8)['resultado'] == '1010'
+
+    def test_explicacion_fuera_de_rango(self):
+        texto = explicar_operacion_CBm1(-35, 38, 'suma', 2, 3)
+        assert "ERROR:" in texto
@@ -0,0 +1,133 @@
+"""
+Tests para la aritmética entera de punto fijo (core.punto_fijo_raw) y su
+uso en FixedPoint, FixedPointUnified y las clases con signo.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import math
+import random
+from decimal import Decimal
+from fractions import Fraction
+import pytest
+from core.ieee754 import ROUNDING_MODES
+from core.punto_fijo import FixedPoint
+from core.punto_fijo_con_signo import FixedPointSignedComplement, FixedPointSignedMS
+from core.punto_fijo_raw import FixedPointOverflowError, fixed_format, round_div
+from core.punto_fijo_unified import FixedPointUnified
+
+
+def _redondeo_referencia(x: Fraction, rounding: str) -> int:
+    suelo, techo = math.floor(x), math.ceil(x)
+    if rounding == 'toward_negative':
+        return suelo
+    if rounding == 'toward_positive':
+        return techo
+    if rounding == 'toward_zero':
+        return int(x)
+    if x - suelo != Fraction(1, 2):
+        return round(x)  # Sin empate: el más cercano
+    if rounding == 'nearest_away':
+        return techo if x > 0 else suelo
+    return suelo if suelo % 2 == 0 else techo
+
+
+class TestRoundDiv:
+    """Tests de round_div."""
+
+    @pytest.mark.parametrize("rounding", ROUNDING_MODES)
+    def test_contra_fraction(self, rounding):
+        rng = random.Random(36)
+        for _ in range(2000):
+            n = rng.randint(-1000, 1000)
+            d = rng.choice([-8, -3, -2, 1, 2, 3, 4, 7, 10])
+            assert round_div(n, d, rounding) == _redondeo_referencia(Fraction(n, d), rounding)
+
+    def test_errores(self):
+        with pytest.raises(ZeroDivisionError):
+            round_div(1, 0)
+        with pytest.raises(ValueError):
+            round_div(1, 2, 'hacia_arriba')
+
+
+class TestFixedFormat:
+    """Tests de FixedFormat."""
+
+    def test_rangos(self):
+        assert (fixed_format(2, 1, 10).raw_min, fixed_format(2, 1, 10).raw_max) == (0, 999)
+        assert fixed_format(2, 1, 10, 'ms').raw_min == -999
+        assert fixed_format(2, 1, 10, 'complement').raw_min == -1000
+
+    def test_modos_de_desbordamiento(self):
+        fmt = fixed_format(4, 4, 2, 'complement')
+        a, b = fmt.from_value(15), fmt.from_value(2)
+        assert fmt.to_float(fmt.add(a, b, 'saturate')) == 15.9375
+        assert fmt.to_float(fmt.add(a, b, 'wrap')) == -15.0
+        with pytest.raises(FixedPointOverflowError):
+            fmt.add(a, b)
+        ms = fixed_format(4, 4, 2, 'ms')
+        assert ms.to_float(ms.sub(ms.from_value(-15), ms.from_value(2), 'wrap')) == -1.0
+        assert ms.to_float(ms.mul(ms.from_value(-8), ms.from_value(4), overflow='saturate')) == -15.9375
+
+    def test_sin_error_de_float(self):
+        fmt = fixed_format(2, 4, 10, 'complement')
+        producto = fmt.mul(fmt.from_value(0.1), fmt.from_value(0.3))
+        assert fmt.to_decimal(producto) == Decimal('0.03')
+        assert fmt.to_float(fmt.add(fmt.from_value(0.1), fmt.from_value(0.2))) == 0.3
+
+    def test_redondeo_de_la_division(self):
+        fmt = fixed_format(4, 2, 10, 'complement')
+        uno, tres = fmt.from_value(1), fmt.from_value(3)
+        assert fmt.div(uno, tres) == 33
+        assert fmt.div(uno, tres, 'toward_positive') == 34
+        assert fmt.div(-uno, tres, 'toward_zero') == -33
+        assert fmt.div(-uno, tres, 'toward_negative') == -34
+
+    def test_excepcion_compatible(self):
+        """FixedPoint esperaba OverflowError; FixedPointUnified, ValueError"""
+        assert issubclass(FixedPointOverflowError, OverflowError)
+        assert issubclass(FixedPointOverflowError, ValueError)
+
+
+class TestClases:
+    """Las clases de punto fijo usan la aritmética entera."""
+
+    def test_fixed_point(self):
+        a = FixedPoint(4, 4, 2, 5.25)
+        b = FixedPoint(4, 4, 2, 1.5)
+        assert a.raw_value == 84 and a.value == Decimal('5.25')
+        assert (a * b).value == Decimal('7.875')
+        assert (a / b).value == Decimal('3.5')
+        assert (a + b) > a and a == 5.25
+        assert not hasattr(a, '__dict__')
+        assert a.mul(FixedPoint(4, 4, 2, 0.0625), rounding='toward_positive').raw_value == 6
+        assert a.sub(b * 4, overflow='saturate').raw_value == 0
+        with pytest.raises(OverflowError):
+            FixedPoint(4, 4, 2, 15) + FixedPoint(4, 4, 2, 1)
+        with pytest.raises(ValueError):
+            a - FixedPoint(4, 4, 2, 6)
+        with pytest.raises(ValueError):
+            FixedPoint(4, 4, 2, -0.001)
+        with pytest.raises(ValueError):
+            a + FixedPoint(4, 3, 2, 1)
+
+    def test_fixed_point_unified(self):
+        fp = FixedPointUnified(E=4, F=4, base=2, signed=True, representation='complement')
+        assert fp.add(12, 5, overflow='wrap') == -15.0
+        assert fp.multiply(0.1, 3) == 0.375  # 0.1 → 0.125 (ε = 1/16), exacto después
+        assert fp.divide(1, 3) == 0.3125
+        with pytest.raises(ValueError):
+            fp.multiply(8, 2)
+        with pytest.raises(ValueError):
+            fp.divide(1, 0)
+
+    def test_clases_con_signo(self):
+        ms = FixedPointSignedMS(E=4, F=4, base=2)
+        comp = FixedPointSignedComplement(E=4, F=4, base=2)
+        assert ms.add(3.5, 2.25) == 5.75
+        assert ms.multiply(-4.0, -2.5) == 10.0
+        assert comp.subtract(-15.9375, 0.5625, overflow='saturate') == -16.0
+        with pytest.raises(ValueError):
+            ms.subtract(-15.9375, 0.5625)
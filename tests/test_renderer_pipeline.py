@@ -0,0 +1,151 @@
+"""
+Tests del pipeline de fases LaTeX (Fase 1 → Fase 5).
+
+Verifica el encadenado de fases, la IR de tabla compartida entre fases y la
+instrumentación (métricas por fase, informe JSON por pipeline y agregado de un lote).
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+from renderers.latex.renderer_base import RendererPipeline, aggregate_pipeline_reports
+from renderers.latex.phase1_validator import Phase1DataValidator
+from renderers.latex.phase2_structure import Phase2StructureGenerator
+from renderers.latex.phase3_details import Phase3Details
+from renderers.latex.phase4_content import Phase4Content
+from renderers.latex.phase5_text import Phase5Text
+from renderers.latex.table_ir import TABLE_IR_KEY, TableIR, get_table_ir
+
+
+def _conversion_row(label="a", value=-5):
+    return {
+        "title": "Conversión",
+        "description": "Complete la fila.",
+        "problem": {"label": label, "val_decimal": value, "target_col_idx": 1, "representable": True},
+        "solution": {
+            "sol_bin": "NR", "sol_c2": "11111011", "sol_sm": "10000101",
+            "sol_bcd": "NR", "target_val_str": "11111011"
+        },
+        "metadata": {"exercise_type": "ConversionRow"},
+    }
+
+
+def _pipeline(tmp_path, **kwargs):
+    pipeline = RendererPipeline("ConversionRow", output_dir=str(tmp_path), **kwargs)
+    for phase in (Phase1DataValidator(), Phase2StructureGenerator(), Phase3Details(),
+                  Phase4Content(), Phase5Text()):
+        pipeline.add_phase(phase)
+    return pipeline
+
+
+class TestPipelineMetrics:
+    """Tests de la instrumentación por fase."""
+
+    def test_metricas_por_fase(self, tmp_path):
+        pipeline = _pipeline(tmp_path)
+        pipeline.render(_conversion_row(), is_solution=True)
+
+        assert len(pipeline.phase_outputs) == 5
+        for output in pipeline.phase_outputs:
+            assert output.wall_time_s > 0
+            assert output.cpu_time_s >= 0
+            assert output.output_bytes == len(output.latex_content.encode("utf-8"))
+            assert output.peak_memory_delta == 0  # Sin tracemalloc por defecto
+
+    def test_memoria_en_pasada_aparte(self, tmp_path):
+        pipeline = _pipeline(tmp_path, track_memory=True)
+        pipeline.render(_conversion_row())
+        assert all(o.peak_memory_delta > 0 for o in pipeline.phase_outputs)
+
+    def test_informe_json(self, tmp_path):
+        pipeline = _pipeline(tmp_path)
+        pipeline.render(_conversion_row())
+        report = json.loads(pipeline.save_report().read_text(encoding="utf-8"))
+
+        assert report["exercise_type"] == "ConversionRow"
+        assert [p["phase_name"] for p in report["phases"]] == [
+            "validador", "estructura", "detalles", "contenido", "texto"
+        ]
+        assert report["totals"]["output_bytes"] == sum(p["output_bytes"] for p in report["phases"])
+
+    def test_agregado_lote(self, tmp_path):
+        reports = []
+        for i in range(3):
+            pipeline = _pipeline(tmp_path)
+            pipeline.render(_conversion_row(label=chr(ord("a") + i), value=i))
+            reports.append(pipeline.report())
+
+        batch = aggregate_pipeline_reports(reports)
+        assert batch["pipelines"] == 3
+        assert len(batch["phases"]) == 5
+        texto = batch["phases"][-1]
+        assert texto["phase_name"] == "texto"
+        assert texto["count"] == 3
+        assert texto["max_wall_time_s"] >= texto["mean_wall_time_s"]
+        assert batch["totals"]["output_bytes"] == sum(r["totals"]["output_bytes"] for r in reports)
+
+    def test_agregado_vacio(self):
+        assert aggregate_pipeline_reports([])["totals"]["wall_time_s"] == 0
+
+
+class TestTableIR:
+    """Tests de la IR de tabla compartida entre fases."""
+
+    def test_fase5_reutiliza_tabla_de_fase4(self, tmp_path):
+        pipeline = _pipeline(tmp_path)
+        pipeline.render(_conversion_row(), is_solution=True)
+        phase4 = pipeline.phase_outputs[3]
+        table = get_table_ir(phase4.output_json)
+
+        assert table.num_rows == 1 and table.num_cols == 6
+        assert table.to_latex() in phase4.latex_content
+        assert table.to_latex() in pipeline.phase_outputs[4].latex_content
+        assert "10000101" in table.to_latex()
+
+    def test_enunciado_no_muestra_soluciones(self, tmp_path):
+        pipeline = _pipeline(tmp_path)
+        pipeline.render(_conversion_row(), is_solution=False)
+        final_tex = pipeline.phase_outputs[4].latex_content
+        assert "10000101" not in final_tex
+        assert final_tex.count("\\newcommand{\\cellpadding}") == 1
+
+    def test_output_json_es_json_plano(self, tmp_path):
+        pipeline = _pipeline(tmp_path)
+        pipeline.render(_conversion_row(), is_solution=True)
+        for output in pipeline.phase_outputs[:4]:
+            restored = json.loads(json.dumps(output.output_json))
+            assert restored == output.output_json
+        assert isinstance(pipeline.phase_outputs[3].output_json[TABLE_IR_KEY], dict)
+
+    def test_tabla_de_varias_filas(self, tmp_path):
+        exercise = {
+            "title": "Suma", "description": "Sume.",
+            "problem": {"operand1_label": "A", "operand2_label": "B", "operation_symbol": "+",
+                        "operand1_value": "0101", "operand2_value": "0011"},
+            "solution": {"result_value": "1000"},
+            "metadata": {"exercise_type": "ArithmeticOp"},
+        }
+        pipeline = RendererPipeline("ArithmeticOp", output_dir=str(tmp_path))
+        for phase in (Phase2StructureGenerator(), Phase3Details(), Phase4Content(), Phase5Text()):
+            pipeline.add_phase(phase)
+        pipeline.render(exercise, is_solution=True)
+        table = get_table_ir(pipeline.phase_outputs[2].output_json)
+        assert table.num_rows == 3
+        assert table.to_latex().count("\\cellcolor{solucion}") == 3 * table.num_cols
+        assert table.to_latex() in pipeline.phase_outputs[3].latex_content
+
+    def test_serializacion(self):
+        table = TableIR.empty(["A", "B"], 2).with_styles("encabezado", "problema")
+        table = table.with_values([{"A": "1", "B": "0"}])
+        restored = get_table_ir({TABLE_IR_KEY: table.to_dict()})
+        assert restored == table
+        assert restored.to_latex() == table.to_latex()
+
+    def test_formato(self):
+        table = TableIR.empty(["A", "B"], 1)
+        assert table.to_latex() == (
+            "\\begin{tabular}{|c|c|}\n\\hline\nA & B \\\\\n\\hline\n"
+            " &  \\\\\n\\hline\n\\end{tabular}"
+        )
@@ -0,0 +1,138 @@
+"""
+Tests para los números romanos por tablas y autómata (core.numeros_romanos),
+la base mixta (core.base_mixta) y las conversiones por lotes de
+sistemas_numeracion_basicos.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import itertools
+import random
+
+import pytest
+from core.base_mixta import DIAS_TIEMPO, TIEMPO, BaseMixta, base_mixta
+from core.numeros_romanos import (
+    ROMANO_MAX,
+    a_romano,
+    indice_romanos,
+    romano_a_entero,
+    romanos_a_enteros,
+    tabla_romanos,
+)
+from core.sistemas_numeracion_basicos import (
+    decimal_a_base_5,
+    decimal_a_base_5_lote,
+    decimal_a_romano,
+    decimal_a_tiempo,
+    decimal_a_tiempo_lote,
+    romano_a_decimal,
+    romano_a_decimal_lote,
+    tabla_sistemas,
+    tiempo_a_decimal,
+    tiempo_a_decimal_lote,
+)
+
+
+class TestTablaRomanos:
+    """Tabla 1..3999 e índice inverso"""
+
+    def test_tabla(self):
+        tabla = tabla_romanos()
+        assert len(tabla) == ROMANO_MAX + 1
+        assert tabla[1994] == 'MCMXCIV' and tabla[3999] == 'MMMCMXCIX' and tabla[4] == 'IV'
+        assert a_romano(2024) == 'MMXXIV'
+
+    def test_fuera_de_rango(self):
+        with pytest.raises(ValueError):
+            a_romano(0)
+        with pytest.raises(ValueError):
+            a_romano(4000)
+
+
+class TestAutomata:
+    """Validación de la forma canónica"""
+
+    def test_todas_las_canonicas(self):
+        tabla = tabla_romanos()
+        assert all(romano_a_entero(tabla[n]) == n for n in range(1, ROMANO_MAX + 1))
+        assert romano_a_entero('mcmxciv') == 1994
+
+    def test_acepta_solo_canonicas(self):
+        indice = indice_romanos()
+        for longitud in range(1, 5):
+            for simbolos in itertools.product('IVXLCDM', repeat=longitud):
+                texto = ''.join(simbolos)
+                if texto in indice:
+                    assert romano_a_entero(texto) == indice[texto]
+                else:
+                    with pytest.raises(ValueError):
+                        romano_a_entero(texto)
+
+    def test_posicion_del_error(self):
+        with pytest.raises(ValueError, match="posición 3"):
+            romano_a_entero('IIII')
+        with pytest.raises(ValueError):
+            romano_a_entero('')
+
+    def test_lote(self):
+        assert romanos_a_enteros(['X', 'IC', 'MMM'], estricto=False) == [10, None, 3000]
+        with pytest.raises(ValueError):
+            romanos_a_enteros(['X', 'IC'])
+
+
+class TestBaseMixta:
+    """Motor de base mixta y lotes"""
+
+    @pytest.mark.parametrize("bases", [TIEMPO, DIAS_TIEMPO, (7, 24), (3,), (None, 1000, 1000), (1000, 1000, 5)])
+    def test_lotes_igual_que_uno_a_uno(self, bases):
+        sistema = base_mixta(bases)
+        alto = sistema.maximo if sistema.maximo is not None else 10 ** 12
+        rng = random.Random(len(bases))
+        valores = [rng.randint(0, alto) for _ in range(600)] + [0, alto]
+        textos = sistema.formatear_lote(valores)
+        assert textos == [sistema.formatear(v) for v in valores]
+        assert sistema.a_digitos_lote(valores) == [sistema.a_digitos(v) for v in valores]
+        assert sistema.parsear_lote(textos) == valores
+
+    def test_digitos_y_pesos(self):
+        sistema = BaseMixta(DIAS_TIEMPO)
+        assert sistema.pesos == (86400, 3600, 60, 1)
+        assert sistema.a_digitos(90061) == (1, 1, 1, 1)
+        assert sistema.a_entero((1, 1, 1, 1)) == 90061
+
+    def test_errores(self):
+        semana = base_mixta((7, 24))
+        with pytest.raises(ValueError):
+            semana.formatear(168)
+        with pytest.raises(ValueError):
+            semana.formatear_lote([1, -1])
+        with pytest.raises(ValueError):
+            base_mixta(TIEMPO).parsear('00:75:00')
+        assert base_mixta(TIEMPO).parsear('00:75:00', estricto=False) == 4500
+        with pytest.raises(ValueError):
+            BaseMixta((None, None))
+
+
+class TestSistemasBasicos:
+    """Funciones existentes y sus versiones por lotes"""
+
+    def test_funciones_existentes(self):
+        assert decimal_a_romano(1994) == 'MCMXCIV'
+        assert decimal_a_romano(4000) == 'MMMM'
+        assert romano_a_decimal('IIII') == 4
+        assert decimal_a_base_5(1994) == '30434' and decimal_a_base_5(0) == '0'
+        assert decimal_a_tiempo(3661) == '01:01:01' and decimal_a_tiempo(360000) == '100:00:00'
+        assert tiempo_a_decimal('1:2:3') == 3723
+        with pytest.raises(ValueError, match="HH:MM:SS"):
+            tiempo_a_decimal('01:01')
+
+    def test_lotes(self):
+        numeros = list(range(1, ROMANO_MAX + 1))
+        assert romano_a_decimal_lote(tabla_romanos()[1:]) == numeros
+        assert decimal_a_base_5_lote(numeros) == [decimal_a_base_5(n) for n in numeros]
+        segundos = list(range(0, 200000, 37))
+        assert decimal_a_tiempo_lote(segundos) == [decimal_a_tiempo(s) for s in segundos]
+        assert tiempo_a_decimal_lote(decimal_a_tiempo_lote(segundos)) == segundos
+        assert tabla_sistemas([4])[0] == {'número_decimal': 4, 'romano': 'IV', 'base_5': '4', 'base_10': '4'}
@@ -0,0 +1,170 @@
+"""
+Tests para el motor de tablas de representación (M&S, CB, CB-1, Exceso a K).
+
+Compara las filas con las funciones repr_* / *_a_decimal existentes y
+comprueba el acceso perezoso y la exportación en streaming.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+import pytest
+from core.cb_representacion import CB_a_decimal, generar_tabla_CB, repr_CB
+from core.enteros_signados import (
+    CBm1_a_decimal,
+    decimal_a_ms,
+    generar_tabla_CBm1,
+    generar_tabla_ms,
+    ms_a_decimal,
+    repr_CBm1,
+)
+from core.exceso_k_representacion import ExcK_a_decimal, generar_tabla_ExcK, repr_ExcK
+from core.tablas_representacion import (
+    FilaRepresentacion,
+    TablaRepresentacion,
+    palabra_de_codigo,
+    tabla_representacion,
+)
+
+
+class TestFilas:
+    """Las filas coinciden con las conversiones de cada representación."""
+
+    @pytest.mark.parametrize('base,longitud', [(2, 1), (2, 6), (10, 2), (16, 2)])
+    def test_cb(self, base, longitud):
+        for fila in tabla_representacion('cb', base, longitud):
+            assert CB_a_decimal(fila.palabra, base) == fila.valor
+            assert repr_CB(fila.valor, base, longitud) == fila.palabra
+
+    @pytest.mark.parametrize('base,longitud', [(2, 1), (2, 6), (10, 2)])
+    def test_cbm1(self, base, longitud):
+        for fila in tabla_representacion('cbm1', base, longitud):
+            assert CBm1_a_decimal(fila.palabra, base) == fila.valor
+            if fila.codigo != base ** longitud - 1:  # -0 se escribe como +0
+                assert repr_CBm1(fila.valor, base, longitud) == fila.palabra
+
+    @pytest.mark.parametrize('base,longitud,K', [(2, 4, 8), (2, 8, 127), (10, 2, 47), (16, 2, 100)])
+    def test_exceso(self, base, longitud, K):
+        for fila in tabla_representacion('exck', base, longitud, K):
+            assert ExcK_a_decimal(fila.palabra, base, K) == fila.valor
+            assert repr_ExcK(fila.valor, base, longitud, K) == fila.palabra
+
+    def test_ms_binario(self):
+        tabla = tabla_representacion('ms', 2, 6)
+        assert len(tabla) == 64
+        for fila in tabla:
+            assert ms_a_decimal(fila.palabra) == fila.valor
+            if fila.palabra != '100000':
+                assert decimal_a_ms(fila.valor, 6) == fila.palabra
+
+    def test_ms_otra_base(self):
+        tabla = tabla_representacion('ms', 10, 3)
+        assert len(tabla) == 200  # Dígito de signo 0 ó 1
+        assert tabla[105] == FilaRepresentacion(105, '105', -5, '')
+        assert [tabla[0].nota, tabla[100].nota] == ['+0', '-0 (duplicado)']
+
+    def test_notas(self):
+        tabla = tabla_representacion('cb', 2, 4)
+        assert tabla[0].nota == "Cero (unica representacion)"
+        assert tabla[7].nota == "Maximo positivo"
+        assert tabla[8].nota == "Minimo negativo"
+        assert tabla_representacion('cbm1', 2, 3)[7].nota == "Cero negativo (-0)"
+        assert tabla_representacion('exck', 2, 3, 3)[3].nota == "Cero (representa 0)"
+
+    def test_minimo_en_base_10(self):
+        # l = 2: los códigos 10..99 son negativos y el 10 es el más negativo
+        cb = tabla_representacion('cb', 10, 2)
+        assert (cb.minimo, cb.maximo) == (-90, 9)
+        assert cb[10] == FilaRepresentacion(10, '10', -90, 'Minimo negativo')
+        assert [f.nota for f in cb].count('Minimo negativo') == 1
+        cbm1 = tabla_representacion('cbm1', 10, 2)
+        assert (cbm1.minimo, cbm1[10].valor, cbm1[10].nota) == (-89, -89, 'Minimo negativo')
+        assert cb.codigos_de(-90) == (10,) and cb.codigos_de(-91) == ()
+
+    def test_palabras_cualquier_base(self):
+        assert palabra_de_codigo(35, 36, 3) == '00z'
+        assert [f.palabra for f in tabla_representacion('cb', 3, 2)[:4]] == ['00', '01', '02', '10']
+
+
+class TestAccesoPerezoso:
+    """Acceso aleatorio, slicing, búsqueda por valor y caché."""
+
+    def test_tabla_enorme_sin_materializar(self):
+        tabla = tabla_representacion('cb', 2, 40)
+        assert len(tabla) == 2 ** 40
+        assert tabla[-1].valor == -1
+        assert tabla[2 ** 39].valor == -2 ** 39
+        assert [f.valor for f in tabla[2 ** 39 - 1:2 ** 39 + 1]] == [2 ** 39 - 1, -2 ** 39]
+
+    def test_indices(self):
+        tabla = tabla_representacion('exck', 10, 2, 50)
+        assert tabla[::25] == [tabla[0], tabla[25], tabla[50], tabla[75]]
+        assert list(tabla.filas(98)) == [tabla[98], tabla[99]]
+        with pytest.raises(IndexError):
+            tabla[100]
+
+    def test_codigos_de(self):
+        assert tabla_representacion('cb', 2, 4).codigos_de(-3) == (13,)
+        assert tabla_representacion('cbm1', 2, 4).codigos_de(0) == (0, 15)
+        assert tabla_representacion('ms', 2, 4).codigos_de(-3) == (11,)
+        assert tabla_representacion('ms', 2, 4).codigos_de(8) == ()
+        tabla = tabla_representacion('cb', 10, 2)
+        assert all(fila.codigo in tabla.codigos_de(fila.valor) for fila in tabla)
+
+    def test_cache(self):
+        assert tabla_representacion('cb', 2, 8) is tabla_representacion('cb', 2, 8)
+
+    def test_errores(self):
+        with pytest.raises(ValueError, match="Representación desconocida"):
+            TablaRepresentacion('c3', 2, 4)
+        with pytest.raises(ValueError, match="requiere el sesgo K"):
+            TablaRepresentacion('exck', 2, 4)
+        with pytest.raises(ValueError):
+            TablaRepresentacion('cb', 37, 4)
+
+
+class TestExportacion:
+    """Exportación en trozos."""
+
+    def test_csv_por_trozos(self):
+        trozos = list(tabla_representacion('cb', 2, 16).exportar('csv', chunk_size=1000))
+        assert len(trozos) == 1 + 66
+        assert trozos[0] == "codigo,palabra,valor,nota\n"
+        assert trozos[1].startswith("0,0000000000000000,0,Cero (unica representacion)\n")
+
+    def test_json(self):
+        tabla = tabla_representacion('cbm1', 2, 4)
+        datos = json.loads(''.join(tabla.exportar('json', chunk_size=3)))
+        assert [d['valor'] for d in datos] == [f.valor for f in tabla]
+
+    def test_latex_rango(self):
+        texto = ''.join(tabla_representacion('ms', 2, 8).exportar('latex', inicio=126, fin=130))
+        assert texto.startswith("\\begin{longtable}")
+        assert "M\\&S" in texto
+        assert texto.count("\\texttt{") == 4
+
+    def test_formato_desconocido(self):
+        with pytest.raises(ValueError, match="Formato de exportación desconocido"):
+            next(tabla_representacion('cb', 2, 4).exportar('xml'))
+
+
+class TestGeneradoresExistentes:
+    """generar_tabla_* usan el motor y conservan su formato."""
+
+    def test_texto(self):
+        texto = generar_tabla_CB(2, 3)
+        assert "      -4 |             100 | Minimo negativo" in texto
+        assert "       3 |             011 | Maximo positivo" in texto
+        assert "      -3 |             100 | Minimo negativo" in generar_tabla_CBm1(2, 3)
+        assert "       0 |            1000 |               8 | Cero (representa 0)" in generar_tabla_ExcK(2, 4, 8)
+        assert generar_tabla_CB(3, 2).count('\n') == 4 + 9
+
+    def test_ms(self):
+        assert generar_tabla_ms(2) == [
+            {'decimal': -1, 'ms': '11', 'signo': '-', 'magnitud': 1},
+            {'decimal': 0, 'ms': '00', 'signo': '+', 'magnitud': 0, 'nota': '+0'},
+            {'decimal': 0, 'ms': '10', 'signo': '-', 'magnitud': 0, 'nota': '-0 (duplicado)'},
+            {'decimal': 1, 'ms': '01', 'signo': '+', 'magnitud': 1},
+        ]
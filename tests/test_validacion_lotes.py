@@ -0,0 +1,120 @@
+"""
+Tests para la validación por lotes de core.representation_validator
+(validate_many, ValidationResult, ValidationCache e ida y vuelta).
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import json
+
+import pytest
+from core.biquinarios import Biquinary5Bit, Biquinary6Bit, Biquinary7Bit
+from core.ieee754 import IEEE754Gen
+from core.punto_fijo import FixedPoint
+from core.punto_fijo_con_signo import FixedPointSignedComplement, FixedPointSignedMS
+from core.punto_fijo_unified import FixedPointUnified
+from core.representation_validator import (
+    RepresentationValidator,
+    ValidationCache,
+    ValidationResult,
+    batch_validate,
+    validate_many,
+)
+
+
+def _lote():
+    fijos = [FixedPointUnified(E, F, 2, signed=True) for E in range(1, 5) for F in range(0, 3)]
+    return fijos + [IEEE754Gen(5, 10), IEEE754Gen(8, 23), Biquinary7Bit(), FixedPointUnified(1, 0, 2, signed=True)]
+
+
+class TestIdaYVuelta:
+    """Muestras de ida y vuelta dentro de cada validación"""
+
+    @pytest.mark.parametrize("fp, vectorized", [
+        (FixedPointUnified(4, 4, 2, signed=True, representation='ms'), True),
+        (FixedPointUnified(8, 8), True),
+        (FixedPointUnified(16, 16, 10, signed=True, representation='ms'), False),
+    ])
+    def test_punto_fijo(self, fp, vectorized):
+        report = RepresentationValidator().validate_fixed_point(fp)
+        round_trip = report.metadata['round_trip']
+        assert report.is_valid
+        assert round_trip['mismatches'] == 0
+        assert (round_trip['max_abs_error'] is not None) == vectorized
+
+    @pytest.mark.parametrize("E, F, base", [(5, 10, 2), (11, 52, 2), (15, 112, 2), (3, 4, 10)])
+    def test_ieee754(self, E, F, base):
+        report = RepresentationValidator(samples=64).validate_ieee754(IEEE754Gen(E, F, base))
+        assert report.is_valid
+        assert report.metadata['round_trip']['mismatches'] == 0
+
+    @pytest.mark.parametrize("cls", [Biquinary5Bit, Biquinary6Bit, Biquinary7Bit])
+    def test_biquinarios_reales(self, cls):
+        report = RepresentationValidator().validate_biquinary(cls())
+        assert report.is_valid
+        assert report.metadata['round_trip'] == {'samples': 256, 'mismatches': 0, 'vectorized': True}
+
+
+class TestValidateMany:
+    """Deduplicación, pool y resultados estructurados"""
+
+    def test_deduplica_por_formato(self):
+        lote = _lote()
+        resultados = validate_many(lote, processes=1)
+        assert len(resultados) == len(lote)
+        assert resultados[0] is resultados[-1]  # Q(1,0) aparece dos veces
+        assert len({r.key for r in resultados}) == len(lote) - 1
+        assert all(r.is_valid for r in resultados)
+
+    def test_clases_con_signo_por_representacion(self):
+        lote = [FixedPointSignedMS(3, 2), FixedPointSignedComplement(3, 2), FixedPoint(3, 2),
+                FixedPointUnified(3, 2, signed=True, representation='ms')]
+        resultados = validate_many(lote, processes=1)
+        assert [r.key[-1] for r in resultados] == ['ms', 'complement', 'unsigned', 'ms']
+        assert resultados[0] is resultados[3]
+        assert all(r.is_valid for r in resultados)
+
+    def test_pool_igual_que_serie(self):
+        lote = _lote()
+        assert validate_many(lote, processes=2) == validate_many(lote, processes=1)
+
+    def test_resultado_json(self):
+        resultado = validate_many([IEEE754Gen(8, 23)])[0]
+        data = json.loads(json.dumps(resultado.to_dict()))
+        assert ValidationResult.from_dict(data) == resultado
+        assert resultado.key == ('ieee754', 8, 23, 2, None)
+
+    def test_no_soportada(self):
+        with pytest.raises(TypeError):
+            validate_many([object()])
+        assert batch_validate([object()]) == []
+
+
+class TestCache:
+    """ValidationCache entre ejecuciones"""
+
+    def test_fichero(self, tmp_path):
+        path = tmp_path / "validacion.json"
+        primera = validate_many(_lote(), processes=1, cache=ValidationCache(path))
+        cache = ValidationCache(path)
+        assert len(cache) == len(primera) - 1
+        assert validate_many(_lote(), processes=1, cache=cache) == primera
+
+    def test_otras_muestras_no_reutilizan(self):
+        cache = ValidationCache()
+        validate_many([IEEE754Gen(5, 10)], cache=cache, samples=16)
+        assert cache.get(('ieee754', 5, 10, 2, None), 32, 0) is None
+        assert cache.get(('ieee754', 5, 10, 2, None), 16, 0).is_valid
+
+
+class TestBatchValidate:
+    """Forma heredada: lista de ValidationReport"""
+
+    def test_reportes(self):
+        reports = batch_validate([FixedPointUnified(4, 4, 2, signed=True), IEEE754Gen(5, 10), Biquinary5Bit()])
+        directo = RepresentationValidator().validate_fixed_point(FixedPointUnified(4, 4, 2, signed=True))
+        assert reports[0].issues == directo.issues
+        assert reports[0].summary() == directo.summary()
+        assert reports[2].representation_type == "Biquinario 5 bits"
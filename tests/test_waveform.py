@@ -0,0 +1,104 @@
+"""
+Tests para Waveform (formas de onda RLE de los cronogramas).
+
+Verifica parseo tikz-timing, exportación, corte, combinación, comparación
+y muestreo en flancos.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import time
+import pytest
+from modules.secuencial.waveform import Waveform, as_waveform
+
+
+class TestParse:
+    """Tests de construcción y exportación."""
+
+    def test_rle(self):
+        wave = Waveform.parse("4H 2L 18H")
+        assert list(wave) == [("H", 4.0), ("L", 2.0), ("H", 18.0)]
+        assert wave.duration == 24
+        assert wave.to_tikz() == "4H 2L 18H"
+
+    def test_expandida_y_bits(self):
+        assert Waveform.parse("LLHH") == Waveform.parse("0011") == Waveform.parse("2L 2H")
+        assert Waveform.parse("LLHH").to_levels() == "LLHH"
+
+    def test_reloj(self):
+        wave = Waveform.parse("4C")
+        assert [level for level, _ in wave] == ["H", "L", "H", "L"]
+        assert wave == Waveform.clock(2)
+        assert wave.to_tikz(clock=True) == "4C"
+        assert Waveform.parse(Waveform.parse("2L 6C 3H").to_tikz(clock=True)) == Waveform.parse("2L 6C 3H")
+
+    def test_opciones_y_datos(self):
+        assert list(Waveform.parse("[draw=none, fill=none] 3Z 2D")) == [("Z", 3.0), ("X", 2.0)]
+
+    def test_vacia(self):
+        assert not Waveform.parse("")
+        assert Waveform.parse(None).duration == 0
+
+    def test_nivel_invalido(self):
+        with pytest.raises(ValueError):
+            Waveform().append("Q", 1)
+
+
+class TestOperaciones:
+    """Tests de corte, concatenación, combinación y comparación."""
+
+    def test_slice(self):
+        wave = Waveform.parse("4H 2L 18H")
+        assert wave.slice(3, 7).to_tikz() == "1H 2L 1H"
+        assert wave[20:] == Waveform.constant("H", 4)
+        assert wave.slice(30, 40).duration == 0
+
+    def test_concatenacion_fusiona(self):
+        wave = Waveform.parse("2H") + Waveform.parse("3H 1L")
+        assert wave.to_tikz() == "5H 1L"
+
+    def test_level_at_y_sample(self):
+        wave = Waveform.parse("4H 2L 18H")
+        assert wave.level_at(0) == "H"
+        assert wave.level_at(4) == "L"
+        assert wave.level_at(24) is None
+        assert wave.sample([0.5, 4.5, 6.5]) == ["H", "L", "H"]
+        assert wave.sample([6.5, 0.5]) == ["H", "H"]
+
+    def test_merge_or(self):
+        a = Waveform.parse("2H 2L")
+        b = Waveform.parse("1L 2H 1L")
+        wave = a.merge(b, lambda x, y: "H" if "H" in (x, y) else "L")
+        assert wave.to_tikz() == "3H 1L"
+
+    def test_compare(self):
+        a = Waveform.parse("LLHH")
+        assert a.compare(Waveform.parse("LLHH")) == []
+        assert a.compare(Waveform.parse("LHHH")) == [(1.0, 2.0, "L", "H")]
+        assert a.compare(Waveform.parse("LLHHL")) == [(4.0, 5.0, None, "L")]
+
+    def test_flancos_y_solucion(self):
+        """Muestreo de la entrada en flancos de subida del reloj (registro D)."""
+        clk = Waveform.clock(4, start="L")
+        data = Waveform.parse("LLHHHHLL")
+        assert clk.edges("rising") == [1.0, 3.0, 5.0, 7.0]
+        assert data.sample(clk.edges("rising")) == ["L", "H", "H", "L"]
+
+    def test_as_waveform(self):
+        wave = Waveform.parse("2H")
+        assert as_waveform(wave) is wave
+        assert as_waveform([("L", 1), ("H", 2)]).to_tikz() == "1L 2H"
+
+
+class TestEscala:
+    """Ondas largas: construcción y exportación lineales."""
+
+    def test_reloj_largo(self):
+        start = time.perf_counter()
+        clk = Waveform.clock(50_000)
+        tikz = clk.to_tikz(clock=True)
+        assert tikz == "100000C"
+        assert clk.slice(99_990, 100_000) == Waveform.clock(5)
+        assert time.perf_counter() - start < 2.0
@@ -14,11 +14,12 @@ Uso:
     # Accede a http://localhost:5000
 """
 
+import math
 import os
 import sys
 from pathlib import Path
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, Response, stream_with_context
 from flask_cors import CORS
 
 # Agregar core/ al path para importar módulos
@@ -29,7 +30,14 @@ sys.path.insert(0, str(WEB_DIR))
 
 try:
     from core.ieee754 import IEEE754Gen
+    from core.descriptores_formato import format_descriptor
     from core.punto_fijo_unified import FixedPointUnified
+    from core.conversion_lotes import convertir_a_bases
+    from core.aritmetica_digitos import linea_acarreos, operar
+    from core.flotante_exacto import FormatoFlotante
+    from core.fracciones_periodicas import expansion_periodica, fraccion_desde_cadena
+    from core.codigos import codigo
+    from core.distribucion import histograma_ieee754, histograma_punto_fijo
 except ImportError as e:
     print(f"Error importando módulos core: {e}")
     sys.exit(1)
@@ -154,34 +162,38 @@ def language_order():
 
 @app.route('/api/ieee754/encode', methods=['POST'])
 def ieee754_encode():
-    """Codificar número decimal a IEEE754"""
+    """
+    Codificar número decimal a IEEE754.
+    
+    'value' puede enviarse como texto ("0.1") para codificar el decimal exacto;
+    'rounding' elige el modo de redondeo (por defecto al más cercano, empates a par).
+    """
     try:
         data = request.get_json()
-        value = float(data.get('value'))
+        raw_value = data.get('value')
+        value = str(raw_value).strip() if isinstance(raw_value, str) else float(raw_value)
         base = int(data.get('base', 2))
         E_bits = int(data.get('E_bits', 8))
         F_bits = int(data.get('F_bits', 23))
+        rounding = data.get('rounding', 'nearest_even')
         
         ieee = IEEE754Gen(E_bits=E_bits, F_bits=F_bits, base=base)
-        encoded = ieee.encode(value)
+        sign_bit, E_encoded, M_encoded = ieee.encode_exact(value, rounding)
+        encoded = ieee.pack(sign_bit, E_encoded, M_encoded)
         
         # Extraer componentes del entero codificado
         total_bits = 1 + E_bits + F_bits
         bits_str = bin(encoded)[2:].zfill(total_bits)
-        
-        sign_bit = int(bits_str[0])
         exponent_bits = bits_str[1:1+E_bits]
         mantissa_bits = bits_str[1+E_bits:]
         
-        E_encoded = int(exponent_bits, 2) if exponent_bits else 0
-        M_encoded = int(mantissa_bits, 2) if mantissa_bits else 0
-        
         # Decodificar para obtener el valor
         decoded = ieee.decode(sign_bit, E_encoded, M_encoded)
         
         return jsonify({
             'success': True,
             'value': value,
+            'rounding': rounding,
             'bits': bits_str,
             'hex': hex(encoded),
             'sign': str(sign_bit),
@@ -197,6 +209,12 @@ def ieee754_encode():
             'error': str(e)
         }), 400
 
+# Límites de /api/ieee754/characteristics: los descriptores quedan en una LRU
+# y sus magnitudes exactas crecen como B^(B^E_bits) y B^F_bits
+MAX_CHARACTERISTICS_BASE = 36
+MAX_CHARACTERISTICS_E_BITS = 16
+MAX_CHARACTERISTICS_F_BITS = 1024
+
 @app.route('/api/ieee754/characteristics', methods=['POST'])
 def ieee754_characteristics():
     """Obtener características de IEEE754"""
@@ -205,20 +223,18 @@ def ieee754_characteristics():
         base = int(data.get('base', 2))
         E_bits = int(data.get('E_bits', 8))
         F_bits = int(data.get('F_bits', 23))
+        if not 2 <= base <= MAX_CHARACTERISTICS_BASE:
+            raise ValueError(f"Base debe estar entre 2 y {MAX_CHARACTERISTICS_BASE}. base={base}")
+        if E_bits > MAX_CHARACTERISTICS_E_BITS or F_bits > MAX_CHARACTERISTICS_F_BITS:
+            raise ValueError(f"Formato demasiado grande: E_bits <= {MAX_CHARACTERISTICS_E_BITS} "
+                             f"y F_bits <= {MAX_CHARACTERISTICS_F_BITS}")
         
-        ieee = IEEE754Gen(base=base, E_bits=E_bits, F_bits=F_bits)
+        # Descriptor compartido: las características se calculan una vez por formato
+        descriptor = format_descriptor('ieee754', E_bits, F_bits, base)
         
         return jsonify({
             'success': True,
-            'base': base,
-            'E_bits': E_bits,
-            'F_bits': F_bits,
-            'total_bits': 1 + E_bits + F_bits,
-            'E_min': ieee.E_min,
-            'E_max': ieee.E_max,
-            'min_positive': float(ieee.min_positive),
-            'max_positive': float(ieee.max_positive),
-            'epsilon': float(ieee.epsilon_machine)
+            **descriptor.characteristics()
         })
     
     except Exception as e:
@@ -270,59 +286,165 @@ def ieee754_special():
             'error': str(e)
         }), 400
 
+@app.route('/api/ieee754/operate', methods=['POST'])
+def ieee754_operate():
+    """
+    Operar dos valores en el formato IEEE754 con redondeo exacto.
+    
+    Body: {'a', 'b', 'operation': add|subtract|multiply|divide, 'rounding',
+    'base', 'E_bits', 'F_bits'}. La respuesta incluye los pasos (alineación,
+    resultado exacto, normalización) y las cifras de guarda, redondeo y sticky.
+    """
+    try:
+        data = request.get_json()
+        base = int(data.get('base', 2))
+        E_bits = int(data.get('E_bits', 8))
+        F_bits = int(data.get('F_bits', 23))
+        operation = data.get('operation', 'add')
+        rounding = data.get('rounding', 'nearest_even')
+        a, b = (str(data.get(k, '0')).strip() for k in ('a', 'b'))
+        
+        formato = FormatoFlotante.de_ieee754(IEEE754Gen(E_bits=E_bits, F_bits=F_bits, base=base))
+        trace = formato.operar_traza(operation, a, b, rounding)
+        value = trace['valor']
+        
+        return jsonify({
+            'success': True,
+            'operation': operation,
+            'rounding': rounding,
+            'a': trace['a'],
+            'b': trace['b'],
+            'exact': trace['exacto'],
+            'result': trace['resultado'],
+            'value': value if math.isfinite(value) else str(value),
+            'guard': trace['guarda'],
+            'round': trace['redondeo'],
+            'sticky': trace['sticky'],
+            'overflow': trace['desbordamiento'],
+            'underflow': trace['subdesbordamiento'],
+            'steps': trace['pasos']
+        })
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+@app.route('/api/ieee754/codes', methods=['POST'])
+def ieee754_codes():
+    """
+    Exportar todos los patrones del formato (code, value, ulp, class) en streaming.
+    
+    Body: {'base', 'E_bits', 'F_bits', 'format': csv|jsonl}. Solo formatos de
+    hasta MAX_ENUMERATED_CODES códigos; el documento se envía por trozos.
+    """
+    try:
+        data = request.get_json()
+        base = int(data.get('base', 2))
+        E_bits = int(data.get('E_bits', 5))
+        F_bits = int(data.get('F_bits', 10))
+        fmt = data.get('format', 'csv')
+        
+        ieee = IEEE754Gen(E_bits=E_bits, F_bits=F_bits, base=base)
+        chunks = ieee.export_codes(fmt)  # Valida formato y tamaño antes de responder
+        
+        return Response(
+            stream_with_context(chunks),
+            mimetype='text/csv' if fmt == 'csv' else 'application/x-ndjson',
+            headers={'Content-Disposition': f'attachment; filename=ieee754_b{base}_e{E_bits}_f{F_bits}.{fmt}'}
+        )
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
 # ============================================================================
 # API: Convertidor de Bases
 # ============================================================================
 
+# Cota de anteperiodo + periodo por expansión (evita periodos de millones de dígitos)
+MAX_EXPANSION_DIGITS = 100000
+
+
+def _convert_fractions(values, from_base, to_bases):
+    """Números con parte fraccionaria: expansión exacta (periódica) en cada base."""
+    batch = []
+    for value in values:
+        exact = fraccion_desde_cadena(value, from_base)
+        decimal = expansion_periodica(exact, 10, max_digitos=MAX_EXPANSION_DIGITS)
+        results = {}
+        for target_base in to_bases:
+            expansion = expansion_periodica(exact, target_base, max_digitos=MAX_EXPANSION_DIGITS)
+            results[str(target_base)] = {
+                'value': str(expansion),
+                'decimal': str(decimal),
+                'periodic': not expansion.es_finita,
+                'preperiod_length': len(expansion.anteperiodo),
+                'period_length': len(expansion.periodo),
+            }
+        batch.append({
+            'value': value,
+            'decimal_equivalent': str(decimal),
+            'fraction': f"{exact.numerator}/{exact.denominator}",
+            'results': results
+        })
+    return batch
+
+
 @app.route('/api/convert', methods=['POST'])
 def convert_bases():
-    """Convertir número entre múltiples bases"""
+    """
+    Convertir número(s) entre múltiples bases.
+    
+    Acepta 'value' (un número) o 'values' (lista); con 'values' la respuesta
+    incluye 'batch' con un resultado por número, todos convertidos en un lote.
+    Los números con parte fraccionaria ('0.1', '0.0(0011)') se convierten de
+    forma exacta: el resultado marca el periodo entre paréntesis.
+    """
     try:
         data = request.get_json()
-        value = str(data.get('value')).strip()
         from_base = int(data.get('from_base', 10))
-        to_bases = data.get('to_bases', [2, 8, 10, 16])
+        to_bases = [int(b) for b in data.get('to_bases', [2, 8, 10, 16])]
+        is_batch = 'values' in data
+        values = [str(v).strip() for v in (data['values'] if is_batch else [data.get('value')])]
+        
+        if any('.' in v for v in values):
+            batch = _convert_fractions(values, from_base, to_bases)
+            if is_batch:
+                return jsonify({'success': True, 'from_base': from_base, 'batch': batch})
+            return jsonify({'success': True, 'from_base': from_base, **batch[0]})
         
         # Convertir a decimal
-        if from_base == 10:
-            decimal_value = int(value)
-        else:
-            decimal_value = int(value, from_base)
+        decimal_values = [int(v) if from_base == 10 else int(v, from_base) for v in values]
         
-        # Convertir a cada base solicitada
-        results = {}
-        for target_base in to_bases:
-            if target_base == 10:
-                result_value = str(decimal_value)
-            elif target_base == 2:
-                result_value = bin(decimal_value)[2:]
-            elif target_base == 8:
-                result_value = oct(decimal_value)[2:]
-            elif target_base == 16:
-                result_value = hex(decimal_value)[2:].upper()
-            else:
-                # Conversión genérica
-                if decimal_value == 0:
-                    result_value = '0'
-                else:
-                    digits = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-                    result_value = ''
-                    temp = decimal_value
-                    while temp > 0:
-                        result_value = digits[temp % target_base] + result_value
-                        temp //= target_base
-            
-            results[str(target_base)] = {
-                'value': result_value,
-                'decimal': decimal_value
+        # Convertir todos los números a cada base solicitada (una llamada por lote)
+        converted = convertir_a_bases(decimal_values, to_bases)
+        
+        batch = []
+        for i, (value, decimal_value) in enumerate(zip(values, decimal_values)):
+            results = {
+                str(target_base): {
+                    'value': converted[target_base][i],
+                    'decimal': decimal_value
+                }
+                for target_base in to_bases
             }
+            batch.append({
+                'value': value,
+                'decimal_equivalent': decimal_value,
+                'results': results
+            })
+        
+        if is_batch:
+            return jsonify({'success': True, 'from_base': from_base, 'batch': batch})
         
         return jsonify({
             'success': True,
-            'value': value,
             'from_base': from_base,
-            'decimal_equivalent': decimal_value,
-            'results': results
+            **batch[0]
         })
     
     except Exception as e:
@@ -331,6 +453,54 @@ def convert_bases():
             'error': str(e)
         }), 400
 
+# Dígitos máximos de cada operando, y de los operandos con traza (los pasos
+# se calculan con los algoritmos escolares, cuadráticos)
+MAX_ARITHMETIC_DIGITS = 4096
+MAX_ARITHMETIC_STEP_DIGITS = 64
+
+@app.route('/api/convert/arithmetic', methods=['POST'])
+def arithmetic_in_base():
+    """
+    Operar dos números en una base (2-36) sin pasar por decimal.
+    
+    Body: {'a', 'b', 'base', 'operation': add|subtract|multiply|divide, 'trace'}
+    Con 'trace' la respuesta incluye los pasos y la línea de acarreos /
+    préstamos (suma y resta). Operandos de hasta MAX_ARITHMETIC_DIGITS
+    dígitos; con 'trace', de hasta MAX_ARITHMETIC_STEP_DIGITS.
+    """
+    try:
+        data = request.get_json()
+        base = int(data.get('base', 10))
+        operation = data.get('operation', 'add')
+        trace = bool(data.get('trace', False))
+        a, b = str(data.get('a', '')).strip(), str(data.get('b', '')).strip()
+        digits = max(len(a), len(b))
+        if digits > MAX_ARITHMETIC_DIGITS:
+            raise ValueError(f"Operandos demasiado largos: {digits} dígitos (máximo {MAX_ARITHMETIC_DIGITS})")
+        if trace and digits > MAX_ARITHMETIC_STEP_DIGITS:
+            raise ValueError(f"La traza solo se calcula con operandos de hasta "
+                             f"{MAX_ARITHMETIC_STEP_DIGITS} dígitos (recibidos {digits})")
+        result = operar(a, b, base, operation, traza=trace)
+        
+        response = {
+            'success': True,
+            'base': base,
+            'operation': operation,
+            'result': result.texto(),
+        }
+        if result.resto is not None:
+            response['remainder'] = result.texto_resto()
+        if trace:
+            response['steps'] = result.pasos
+            response['carries'] = linea_acarreos(result)
+        return jsonify(response)
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
 # ============================================================================
 # API: Distribución
 # ============================================================================
@@ -436,34 +606,15 @@ def distribution_chart_data():
             total_numbers = 2 ** total_bits
             
             # Generar datos de frecuencia para gráfica de distribución
-            # Dividir rango en 50 bins para visualización
+            # Dividir rango en 50 bins para visualización (recuentos exactos)
             min_val = float(fp.min_value)
             max_val = float(fp.max_value)
             epsilon = float(fp.epsilon)
             
-            # Crear bins
             num_bins = min(50, total_numbers)
-            if max_val > min_val:
-                bin_width = (max_val - min_val) / num_bins
-            else:
-                bin_width = 1.0
-            
-            labels = []
-            frequencies = []
-            
-            for i in range(num_bins):
-                bin_start = min_val + (i * bin_width)
-                bin_end = bin_start + bin_width
-                bin_center = (bin_start + bin_end) / 2
-                
-                # Estimar frecuencia (uniforme en punto fijo)
-                if max_val > min_val:
-                    frequency = total_numbers / num_bins
-                else:
-                    frequency = total_numbers
-                
-                labels.append(f"{bin_center:.2f}")
-                frequencies.append(frequency)
+            histogram = histograma_punto_fijo(fp, bins=num_bins, escala='lineal')
+            labels = [f"{center:.2f}" for center in histogram.centers]
+            frequencies = list(histogram.counts)
             
             return jsonify({
                 'success': True,
@@ -488,7 +639,7 @@ def distribution_chart_data():
                     'min': min_val,
                     'max': max_val,
                     'epsilon': epsilon,
-                    'total_numbers': total_numbers,
+                    'total_numbers': histogram.total,
                     'total_bits': total_bits,
                     'uniform': True,
                     'gap_type': 'uniforme'
@@ -528,71 +679,13 @@ def distribution_chart_data():
             total_bits = 1 + E + F  # sign + exponent + mantissa
             
             # Para IEEE754, la distribución es no-uniforme (logarítmica en magnitud)
-            # Generar valores representables
-            representable_values = []
-            
-            # Generar valores positivos
-            # El rango de exponente depende de la base y E bits
-            exp_min = 1 - ieee.bias
-            exp_max = ieee.bias - 1
-            
-            for exponent in range(exp_min, exp_max + 1):
-                for mantissa in range(0, min(base**F, 100)):  # Limitar para rendimiento
-                    try:
-                        # Normalizado: 1.M × B^E
-                        val = (1 + mantissa / (base**F)) * (base ** exponent)
-                        representable_values.append(val)
-                        representable_values.append(-val)
-                    except (OverflowError, ValueError, ZeroDivisionError):
-                        pass
-            
-            representable_values = sorted(set([v for v in representable_values if v != 0]))
-            
-            # Crear bins logarítmicos para valores positivos
+            # Recuentos exactos por bin logarítmico sobre los valores positivos finitos
             num_bins = 50
-            if representable_values:
-                min_val = min([v for v in representable_values if v > 0])
-                max_val = max([v for v in representable_values if v > 0])
-                
-                # Escala logarítmica en base correspondiente
-                import math
-                if base == 10:
-                    log_func = math.log10
-                elif base == 2:
-                    log_func = math.log2
-                else:
-                    # Para otras bases, usar cambio de base
-                    log_func = lambda x: math.log(x) / math.log(base)
-                
-                try:
-                    log_min = log_func(min_val) if min_val > 0 else -10
-                    log_max = log_func(max_val) if max_val > 0 else 10
-                except (ValueError, ZeroDivisionError):
-                    log_min = -10
-                    log_max = 10
-                
-                labels = []
-                frequencies = []
-                
-                for i in range(num_bins):
-                    log_start = log_min + (i / num_bins) * (log_max - log_min)
-                    log_end = log_min + ((i + 1) / num_bins) * (log_max - log_min)
-                    
-                    # Convertir de log a valor lineal según la base
-                    try:
-                        bin_start = base ** log_start
-                        bin_end = base ** log_end
-                        bin_center = (bin_start + bin_end) / 2
-                        
-                        # Contar valores en este bin
-                        count = len([v for v in representable_values 
-                                   if bin_start <= v < bin_end])
-                    except (OverflowError, ValueError):
-                        bin_center = 0
-                        count = 0
-                    
-                    labels.append(f"{bin_center:.2e}")
-                    frequencies.append(count)
+            histogram = histograma_ieee754(ieee, bins=num_bins, escala='log')
+            if histogram.total:
+                min_val, max_val = histogram.rango
+                labels = [f"{center:.2e}" for center in histogram.centers]
+                frequencies = list(histogram.counts)
                 
                 return jsonify({
                     'success': True,
@@ -616,7 +709,7 @@ def distribution_chart_data():
                         'min': min_val,
                         'max': max_val,
                         'epsilon': 2**(-F),
-                        'total_numbers': total_bits,
+                        'total_numbers': ieee.code_count,
                         'total_bits': total_bits,
                         'uniform': False,
                         'gap_type': 'logarítmica'
@@ -646,12 +739,17 @@ def distribution_chart_data():
 # API: Representaciones Especiales - BCD y Biquinarios
 # ============================================================================
 
+BCD_CODES = ('bcd8421', 'bcd2421', 'xs3')
+BIQUINARY_CODES = ('biquinario5', 'biquinario6', 'biquinario7', '2entre5')
+
+
 @app.route('/api/representations/bcd', methods=['POST'])
 def bcd_conversion():
-    """Convertir número decimal a BCD (Binary Coded Decimal)"""
+    """Convertir número decimal a BCD (8421 por defecto; 'code' admite bcd2421 y xs3)"""
     try:
         data = request.get_json()
         number = int(data.get('number', 0))
+        code_name = data.get('code', 'bcd8421')
         
         # Validar rango
         if number < 0 or number > 9999:
@@ -659,29 +757,29 @@ def bcd_conversion():
                 'success': False,
                 'error': 'BCD soporta números de 0 a 9999'
             }), 400
+        if code_name not in BCD_CODES:
+            return jsonify({
+                'success': False,
+                'error': f"Código BCD desconocido: {code_name}. Códigos: {', '.join(BCD_CODES)}"
+            }), 400
         
-        # Convertir a BCD
-        bcd_str = ''
-        temp = number
-        for _ in range(4):
-            digit = temp % 10
-            bcd_str = format(digit, '04b') + bcd_str
-            temp //= 10
-        
-        bcd_str = bcd_str.lstrip('0') or '0000'
+        # Convertir a BCD: los 4 dígitos de una vez con la tabla del código
+        codec = codigo(code_name)
+        digits = str(number).zfill(4)
+        codes = codec.encode_many(digits)
+        bcd_str = codec.encode_bits(digits, separador='').lstrip('0') or '0000'
         
         # Generar visualización de nibbles
-        nibbles = []
-        for digit in str(number).zfill(4):
-            nibbles.append({
-                'digit': int(digit),
-                'binary': format(int(digit), '04b'),
-                'hex': format(int(digit), 'x')
-            })
+        nibbles = [{
+            'digit': int(digit),
+            'binary': format(code, '04b'),
+            'hex': format(code, 'x')
+        } for digit, code in zip(digits, codes)]
         
         return jsonify({
             'success': True,
             'number': number,
+            'code': code_name,
             'bcd_binary': bcd_str,
             'bcd_hex': hex(int(bcd_str, 2)),
             'bcd_decimal': int(bcd_str, 2),
@@ -720,6 +818,15 @@ def biquinario_conversion():
                 'error': 'Biquinario soporta números de 0 a 99'
             }), 400
         
+        # Código biquinario de cada dígito decimal (tabla compilada)
+        code_name = data.get('code', 'biquinario7')
+        if code_name not in BIQUINARY_CODES:
+            return jsonify({
+                'success': False,
+                'error': f"Código biquinario desconocido: {code_name}. Códigos: {', '.join(BIQUINARY_CODES)}"
+            }), 400
+        codec = codigo(code_name)
+        
         # Sistema Biquinario: 7 bits (5, 4, 3, 2, 1, 0)
         # Primeros 2 bits: quinario (0-4), últimos 5 bits: binario (0-1)
         
@@ -751,6 +858,8 @@ def biquinario_conversion():
                 }
             },
             'total_bits': len(biquia_full),
+            'digit_codes': codec.encode_bits(str(number)).split(),
+            'digit_code': code_name,
             'info': {
                 'name': 'Biquinario',
                 'description': 'Sistema de 2 dígitos: uno quinario (base 5) y otro binario',
@@ -830,6 +939,37 @@ def compare_representations():
             'error': str(e)
         }), 400
 
+# ============================================================================
+# API: Previsualización HTML de exámenes
+# ============================================================================
+
+@app.route('/api/preview/html', methods=['POST'])
+def exam_preview_html():
+    """Previsualizar un examen (JSON intermedio de ExamBuilder) como HTML en streaming"""
+    try:
+        from renderers.html.main_renderer import HtmlExamRenderer
+        
+        exam_json = request.get_json()
+        if not isinstance(exam_json, (dict, list)):
+            return jsonify({
+                'success': False,
+                'error': 'Se esperaba el JSON intermedio del examen'
+            }), 400
+        
+        is_solution = request.args.get('solution', 'false').lower() in ['1', 'true', 'si', 'yes']
+        renderer = HtmlExamRenderer(is_solution=is_solution)
+        
+        return Response(
+            stream_with_context(renderer.iter_render(exam_json)),
+            mimetype='text/html'
+        )
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
 # ============================================================================
 # API: Health Check
 # ============================================================================
@@ -69,6 +69,15 @@ def run_tests():
             'data': {'base': 2, 'E_bits': 8, 'F_bits': 23}
         },
         
+        # IEEE754 arithmetic
+        {
+            'name': 'IEEE754 Operate',
+            'method': 'POST',
+            'path': '/api/ieee754/operate',
+            'data': {'a': '1', 'b': '0.1', 'operation': 'add', 'rounding': 'nearest_even',
+                     'base': 2, 'E_bits': 8, 'F_bits': 23}
+        },
+        
         # IEEE754 special numbers
         {
             'name': 'IEEE754 Special Numbers',
@@ -85,6 +94,14 @@ def run_tests():
             'data': {'value': '1234', 'from_base': 10, 'to_bases': [2, 8, 16]}
         },
         
+        # Arithmetic in base
+        {
+            'name': 'Arithmetic in Base',
+            'method': 'POST',
+            'path': '/api/convert/arithmetic',
+            'data': {'a': '1011', 'b': '111', 'base': 2, 'operation': 'add', 'trace': True}
+        },
+        
         # Fixed-point distribution
         {
             'name': 'Fixed-Point Distribution',